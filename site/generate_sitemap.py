@@ -2,16 +2,50 @@
 """
 Bio-Clinic Sitemap Generator
 Scans site directory for HTML files and generates sitemap.xml
+
+- lastmod is the date a page's content last changed (content hash tracked
+  in data/cache/sitemap-lastmod.json, seeded from git commit dates), so
+  crawlers can skip unchanged pages
+- URLs are streamed into sitemap files; past the protocol limits (50,000
+  URLs or 50 MB per file) the output is split into gzipped child sitemaps
+  (sitemap-1.xml.gz, ...) listed by sitemap-index.xml, and robots.txt is
+  pointed at the index
+- every file is written through bioclinic.writes: only when its content
+  changes, atomically, and not at all with --dry-run (--diff shows changes)
 """
 
+import gzip
+import hashlib
+import json
 import os
-from datetime import datetime
+import subprocess
+import sys
+from datetime import date, datetime
 from pathlib import Path
+from xml.sax.saxutils import escape
 
 # Configuration
 SITE_DIR = Path(__file__).parent
 BASE_URL = "https://bio-clinic.it"
 OUTPUT_FILE = SITE_DIR / "sitemap.xml"
+INDEX_NAME = "sitemap-index.xml"
+CHILD_NAME = "sitemap-{}.xml.gz"
+LASTMOD_RELPATH = "data/cache/sitemap-lastmod.json"
+ROBOTS_FILE = SITE_DIR / "robots.txt"
+
+# Shared modules live in scripts/bioclinic (this script sits in the site root)
+sys.path.insert(0, str(SITE_DIR / "scripts"))
+from bioclinic import writes  # noqa: E402
+
+# Sitemap protocol limits (per file, uncompressed)
+MAX_URLS_PER_SITEMAP = 50000
+MAX_BYTES_PER_SITEMAP = 50 * 1024 * 1024
+
+URLSET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+)
+URLSET_FOOTER = "\n</urlset>"
 
 # Priority rules
 PRIORITY_RULES = {
@@ -103,6 +137,27 @@ def get_changefreq(rel_path: str) -> str:
     return "monthly"
 
 
+def is_sitemap_page(rel_path: str) -> bool:
+    """True if a site-relative path belongs in the sitemap"""
+    parts = rel_path.split("/")
+    if not parts[-1].endswith(".html") or parts[-1] in EXCLUDE_FILES:
+        return False
+    if any(d in EXCLUDE_DIRS or d.startswith('.') for d in parts[:-1]):
+        return False
+    # Skip if in excluded directory
+    return not any(excl in rel_path for excl in EXCLUDE_DIRS)
+
+
+def sort_sitemap_paths(html_files) -> list:
+    """Sort with homepage first"""
+    def sort_key(path):
+        if path == "index.html":
+            return "0_" + path
+        return "1_" + path
+    
+    return sorted(html_files, key=sort_key)
+
+
 def scan_html_files() -> list:
     """Scan directory for HTML files"""
     html_files = []
@@ -112,81 +167,209 @@ def scan_html_files() -> list:
         dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS and not d.startswith('.')]
         
         for file in files:
-            if not file.endswith('.html'):
-                continue
-            if file in EXCLUDE_FILES:
-                continue
-            
             full_path = Path(root) / file
-            rel_path = str(full_path.relative_to(SITE_DIR))
-            
-            # Skip if in excluded directory
-            if any(excl in rel_path for excl in EXCLUDE_DIRS):
-                continue
-            
-            html_files.append(rel_path)
+            rel_path = full_path.relative_to(SITE_DIR).as_posix()
+            if is_sitemap_page(rel_path):
+                html_files.append(rel_path)
     
-    # Sort with homepage first
-    def sort_key(path):
-        if path == "index.html":
-            return "0_" + path
-        return "1_" + path
-    
-    return sorted(html_files, key=sort_key)
+    return sort_sitemap_paths(html_files)
+
+
+def page_url(rel_path: str) -> str:
+    """Public URL of a site-relative path"""
+    if rel_path == "index.html":
+        return f"{BASE_URL}/"
+    return f"{BASE_URL}/{rel_path}"
+
+
+def render_url(rel_path: str, lastmod: str) -> str:
+    """<url> entry for a page"""
+    return (
+        "\n  <url>"
+        f"\n    <loc>{escape(page_url(rel_path))}</loc>"
+        f"\n    <lastmod>{lastmod}</lastmod>"
+        f"\n    <changefreq>{get_changefreq(rel_path)}</changefreq>"
+        f"\n    <priority>{get_priority(rel_path):.1f}</priority>"
+        "\n  </url>"
+    )
+
+
+def render_sitemap(html_files, lastmods) -> str:
+    """Render a single sitemap.xml for the given (sorted) paths and {path: lastmod}"""
+    parts = [URLSET_HEADER]
+    parts.extend(render_url(rel_path, lastmods[rel_path]) for rel_path in html_files)
+    parts.append(URLSET_FOOTER)
+    return ''.join(parts)
+
+
+def render_sitemap_index(children) -> str:
+    """Render sitemap-index.xml for [(file name, newest lastmod)]"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>']
+    lines.append('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+    for name, lastmod in children:
+        lines.append("  <sitemap>")
+        lines.append(f"    <loc>{escape(f'{BASE_URL}/{name}')}</loc>")
+        lines.append(f"    <lastmod>{lastmod}</lastmod>")
+        lines.append("  </sitemap>")
+    lines.append("</sitemapindex>")
+    return '\n'.join(lines)
+
+
+def iter_sitemap_files(entries, max_urls=MAX_URLS_PER_SITEMAP, max_bytes=MAX_BYTES_PER_SITEMAP):
+    """Stream (rel_path, lastmod) entries into sitemap files.
+
+    Yields (file name, bytes) one file at a time, so at most one sitemap is
+    held in memory: just 'sitemap.xml' if everything fits in one file,
+    otherwise gzipped 'sitemap-N.xml.gz' children followed by 'sitemap-index.xml'.
+    """
+    header = URLSET_HEADER.encode('utf-8')
+    footer = URLSET_FOOTER.encode('utf-8')
+    children = []
+    chunks, count, size, newest = [header], 0, len(header) + len(footer), ''
+
+    for rel_path, lastmod in entries:
+        data = render_url(rel_path, lastmod).encode('utf-8')
+        if count and (count >= max_urls or size + len(data) > max_bytes):
+            name = CHILD_NAME.format(len(children) + 1)
+            yield name, gzip.compress(b''.join(chunks) + footer, mtime=0)
+            children.append((name, newest))
+            chunks, count, size, newest = [header], 0, len(header) + len(footer), ''
+        chunks.append(data)
+        count += 1
+        size += len(data)
+        newest = max(newest, lastmod)
+
+    chunks.append(footer)
+    if not children:
+        yield OUTPUT_FILE.name, b''.join(chunks)
+        return
+
+    name = CHILD_NAME.format(len(children) + 1)
+    yield name, gzip.compress(b''.join(chunks), mtime=0)
+    children.append((name, newest))
+    yield INDEX_NAME, render_sitemap_index(children).encode('utf-8')
+
+
+def stale_sitemap_files(written) -> list:
+    """Sitemap files on disk left over from a previous run with a different layout"""
+    candidates = [OUTPUT_FILE.name, INDEX_NAME] + [p.name for p in SITE_DIR.glob("sitemap-*.xml.gz")]
+    return sorted(name for name in set(candidates)
+                  if name not in written and (SITE_DIR / name).exists())
+
+
+def update_robots(robots_text: str, sitemap_name: str) -> str:
+    """Point the Sitemap: line of robots.txt at the entry file (sitemap.xml or the index)"""
+    lines = robots_text.split('\n')
+    for i, line in enumerate(lines):
+        if line.startswith("Sitemap: ") and line.rstrip().endswith((".xml", ".xml.gz")):
+            lines[i] = f"Sitemap: {BASE_URL}/{sitemap_name}"
+    return '\n'.join(lines)
+
+
+class LastmodTracker:
+    """Date of the last content change of each page, keyed by content hash"""
+
+    def __init__(self, site_dir=SITE_DIR, today=None):
+        self.site_dir = Path(site_dir)
+        self.path = self.site_dir / LASTMOD_RELPATH
+        self.today = today or date.today().isoformat()
+        self.pages = {}
+        self._git = None
+        if self.path.exists():
+            try:
+                self.pages = json.loads(self.path.read_text(encoding='utf-8')).get('pages', {})
+            except (json.JSONDecodeError, OSError):
+                self.pages = {}
+
+    def _git_dates(self):
+        """{path: last commit date} for committed, unmodified files (one git log + status)"""
+        if self._git is not None:
+            return self._git
+        self._git = {}
+        try:
+            log = subprocess.run(
+                ['git', 'log', '--format=%x00%cs', '--name-only', '--relative', '--', '.'],
+                cwd=self.site_dir, capture_output=True, text=True, check=True).stdout
+            prefix = subprocess.run(
+                ['git', 'rev-parse', '--show-prefix'],
+                cwd=self.site_dir, capture_output=True, text=True, check=True).stdout.strip()
+            status = subprocess.run(
+                ['git', 'status', '--porcelain', '--', '.'],
+                cwd=self.site_dir, capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return self._git
+        for block in log.split('\x00')[1:]:
+            lines = block.strip().split('\n')
+            for rel_path in lines[1:]:
+                self._git.setdefault(rel_path, lines[0])
+        for line in status.splitlines():
+            self._git.pop(line[3:].strip('"')[len(prefix):], None)
+        return self._git
+
+    def lastmod(self, rel_path: str, content) -> str:
+        """lastmod for a page: unchanged content keeps its date, changed content gets today"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        entry = self.pages.get(rel_path)
+        if entry and entry['hash'] == digest:
+            return entry['lastmod']
+        if entry is None:
+            # First time this page is seen: its last commit date, if untouched since
+            lastmod = min(self._git_dates().get(rel_path, self.today), self.today)
+        else:
+            lastmod = self.today
+        self.pages[rel_path] = {'hash': digest, 'lastmod': lastmod}
+        return lastmod
+
+    def dumps(self) -> str:
+        return json.dumps({'pages': dict(sorted(self.pages.items()))}, indent=2) + '\n'
+
+    def save(self):
+        writes.write_text(self.path, self.dumps())
 
 
 def generate_sitemap():
-    """Generate sitemap.xml"""
+    """Generate sitemap.xml (or sitemap-index.xml + gzipped children)"""
     html_files = scan_html_files()
-    today = datetime.now().strftime("%Y-%m-%d")
-    
-    xml_content = ['<?xml version="1.0" encoding="UTF-8"?>']
-    xml_content.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
-    
-    for rel_path in html_files:
-        # Build URL
-        if rel_path == "index.html":
-            url = f"{BASE_URL}/"
-        else:
-            url = f"{BASE_URL}/{rel_path}"
-        
-        priority = get_priority(rel_path)
-        changefreq = get_changefreq(rel_path)
-        
-        xml_content.append("  <url>")
-        xml_content.append(f"    <loc>{url}</loc>")
-        xml_content.append(f"    <lastmod>{today}</lastmod>")
-        xml_content.append(f"    <changefreq>{changefreq}</changefreq>")
-        xml_content.append(f"    <priority>{priority:.1f}</priority>")
-        xml_content.append("  </url>")
-    
-    xml_content.append("</urlset>")
-    
-    # Write sitemap
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(xml_content))
-    
-    return len(html_files)
+    tracker = LastmodTracker()
+    entries = ((rel_path, tracker.lastmod(rel_path, (SITE_DIR / rel_path).read_bytes()))
+               for rel_path in html_files)
+
+    written = []
+    for name, data in iter_sitemap_files(entries):
+        writes.write_bytes(SITE_DIR / name, data)
+        written.append(name)
+    for name in stale_sitemap_files(written):
+        writes.remove(SITE_DIR / name)
+    if ROBOTS_FILE.exists():
+        robots = ROBOTS_FILE.read_text(encoding='utf-8')
+        writes.write_text(ROBOTS_FILE, update_robots(robots, written[-1]))
+    tracker.save()
+
+    return html_files, written
 
 
 def main():
+    dry_run = writes.setup('generate-sitemap', SITE_DIR)
     print("=" * 60)
     print("BIO-CLINIC SITEMAP GENERATOR")
     print("=" * 60)
     
     # Scan and generate
-    count = generate_sitemap()
+    html_files, written = generate_sitemap()
     
-    print(f"\n✅ Sitemap generated: {OUTPUT_FILE}")
-    print(f"📄 Total URLs: {count}")
-    print(f"📅 Last modified: {datetime.now().strftime('%Y-%m-%d')}")
+    verb = "would be generated (dry-run)" if dry_run else "generated"
+    print(f"\n✅ Sitemap {verb}: {SITE_DIR / written[-1]}")
+    if len(written) > 1:
+        print(f"🗂️  Split into {len(written) - 1} gzipped sitemaps")
+    print(f"📄 Total URLs: {len(html_files)}")
+    print(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d')}")
     
     # Show first 10 URLs as sample
     print("\n📋 Sample URLs (first 10):")
-    html_files = scan_html_files()[:10]
-    for f in html_files:
-        url = f"{BASE_URL}/{f}" if f != "index.html" else f"{BASE_URL}/"
-        print(f"   - {url}")
+    for f in html_files[:10]:
+        print(f"   - {page_url(f)}")
     
     print("\n" + "=" * 60)
     print("COMPLETED!")
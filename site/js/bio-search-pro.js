@@ -983,13 +983,22 @@ const BioSearchPro = (function() {
       }
 
       debounceTimer = setTimeout(() => {
-        const results = search(query);
-        state.lastResults = results;
-        
-        dropdownEl.innerHTML = renderClusteredDropdown(results);
-        showDropdown(dropdownEl);
-        
-        bindDropdownEvents(dropdownEl, input);
+        // Il listino esami è in shard scaricati al primo utilizzo
+        const ready = window.BioClinicDB?.loadListino
+          ? BioClinicDB.loadListino().catch(() => null)
+          : Promise.resolve();
+
+        ready.then(() => {
+          if (input.value.trim() !== query) return; // l'utente ha continuato a digitare
+
+          const results = search(query);
+          state.lastResults = results;
+          
+          dropdownEl.innerHTML = renderClusteredDropdown(results);
+          showDropdown(dropdownEl);
+          
+          bindDropdownEvents(dropdownEl, input);
+        });
       }, CONFIG.limits.debounceMs);
     });
 
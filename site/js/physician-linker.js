@@ -33,6 +33,12 @@ const PhysicianLinker = (function() {
     // Base URL per profili
     profileBaseUrl: '/equipe/profilo.html',
     
+    // Indice compilato delle varianti dei nomi
+    nameIndexUrl: '/data/entities/physician-name-index.json',
+    
+    // Forme dell'indice da linkare (nome completo, con titolo, senza titolo, cognome-nome)
+    linkForms: ['full_name', 'title', 'name', 'reversed'],
+    
     // Abilita hover card preview
     enableHoverCard: true,
     
@@ -46,6 +52,8 @@ const PhysicianLinker = (function() {
 
   let physicians = [];
   let physicianPatterns = [];
+  let slugsByKey = new Map();
+  let titlePrefix = null;
   let isLoaded = false;
 
   /**
@@ -55,51 +63,44 @@ const PhysicianLinker = (function() {
     if (isLoaded) return;
 
     try {
-      const response = await fetch('/data/entities/physicians-complete.json');
-      const data = await response.json();
+      // Indice compilato delle varianti (scripts/build-name-index.py):
+      // stesse varianti e stessa risoluzione degli autolinker Python
+      const response = await fetch(CONFIG.nameIndexUrl);
+      const index = await response.json();
       
-      physicians = data.physicians || [];
+      physicians = Object.values(index.physicians || {});
       
-      // Crea pattern di ricerca per ogni medico
-      physicianPatterns = physicians.map(p => {
-        // Varianti del nome da cercare
-        const variants = [
-          p.full_name,                          // "Dott. Francesco Dessole"
-          p.name,                               // "Francesco Dessole"
-          `Dr. ${p.name}`,                      // "Dr. Francesco Dessole"
-          `${p.title} ${p.name}`,               // "Dott. Francesco Dessole"
-          p.name.split(' ').reverse().join(' ') // "Dessole Francesco"
-        ].filter(Boolean);
-
-        // Aggiungi varianti con titoli alternativi
-        if (p.title === 'Dott.') {
-          variants.push(`Dr. ${p.name}`);
-          variants.push(`Dottor ${p.name}`);
-        }
-        if (p.title === 'Dott.ssa') {
-          variants.push(`Dr.ssa ${p.name}`);
-          variants.push(`Dottoressa ${p.name}`);
-        }
-        if (p.title === 'Prof.') {
-          variants.push(`Professor ${p.name}`);
-          variants.push(`Professore ${p.name}`);
-        }
-
-        return {
-          physician: p,
-          variants: [...new Set(variants)], // Rimuovi duplicati
-          regex: new RegExp(
-            `\\b(${variants.map(v => escapeRegex(v)).join('|')})\\b`,
-            'gi'
-          )
-        };
+      // Raggruppa per medico le varianti non ambigue (già ordinate dalla più lunga)
+      const variantsBySlug = new Map();
+      (index.variants || []).forEach(v => {
+        if (!slugsByKey.has(v.key)) slugsByKey.set(v.key, new Set());
+        slugsByKey.get(v.key).add(v.slug);
+        
+        if (v.ambiguous || !CONFIG.linkForms.includes(v.form)) return;
+        if (!variantsBySlug.has(v.slug)) variantsBySlug.set(v.slug, []);
+        variantsBySlug.get(v.slug).push(v.text);
       });
+      
+      const titles = [...(index.titles || [])].sort((a, b) => b.length - a.length);
+      titlePrefix = new RegExp(`^(?:${titles.map(escapeRegex).join('|')})\\s+`);
+      
+      // Crea pattern di ricerca per ogni medico
+      physicianPatterns = physicians
+        .filter(p => variantsBySlug.has(p.slug))
+        .map(p => {
+          const variants = variantsBySlug.get(p.slug);
+          return {
+            physician: p,
+            variants,
+            regex: new RegExp(
+              `\\b(${variants.map(v => escapeRegex(v)).join('|')})\\b`,
+              'gi'
+            )
+          };
+        });
 
       // Ordina per lunghezza nome (più lungo prima per evitare match parziali)
-      physicianPatterns.sort((a, b) => 
-        Math.max(...b.variants.map(v => v.length)) - 
-        Math.max(...a.variants.map(v => v.length))
-      );
+      physicianPatterns.sort((a, b) => b.variants[0].length - a.variants[0].length);
 
       isLoaded = true;
       console.log(`[PhysicianLinker] Loaded ${physicians.length} physicians`);
@@ -109,6 +110,28 @@ const PhysicianLinker = (function() {
     }
   }
 
+  /**
+   * Chiave di confronto dei nomi (uguale a normalize_name in bioclinic/namevariants.py)
+   */
+  function normalizeName(text) {
+    return text.normalize('NFC').split(/\s+/).filter(Boolean).join(' ').toLowerCase();
+  }
+
+  /**
+   * Slug del medico per un nome (con o senza titolo), null se sconosciuto o ambiguo
+   * (stessa logica di resolve_name in bioclinic/namevariants.py)
+   */
+  function resolveName(name) {
+    if (!name || !titlePrefix) return null;
+    const compact = name.split(/\s+/).filter(Boolean).join(' ');
+    const keys = [normalizeName(name), normalizeName(compact.replace(titlePrefix, ''))];
+    for (const key of keys) {
+      const slugs = slugsByKey.get(key);
+      if (slugs && slugs.size === 1) return [...slugs][0];
+    }
+    return null;
+  }
+
   /**
    * Escape special regex characters
    */
@@ -522,6 +545,8 @@ const PhysicianLinker = (function() {
     
     // Utilities
     getPhysicians: () => physicians,
+    resolveName,
+    normalizeName,
     isLoaded: () => isLoaded,
     
     // Config
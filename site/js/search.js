@@ -15,7 +15,7 @@
 class BioClinicSearch {
   constructor() {
     this.searchIndex = null;
-    this.synonyms = null;
+    this.wordIds = null;
     this.entities = {
       tests: null,
       procedures: null,
@@ -132,11 +132,11 @@ class BioClinicSearch {
   async preloadData() {
     // Load search index immediately
     try {
-      const indexResponse = await fetch(`${this.config.dataBasePath}/search/index.json`);
+      // Indice invertito compilato (scripts/bioclinic/searchindex.py):
+      // alias, sinonimi e correzioni sono già espansi nelle chiavi
+      const indexResponse = await fetch(`${this.config.dataBasePath}/search/compiled.json`);
       this.searchIndex = await indexResponse.json();
-      
-      const synonymsResponse = await fetch(`${this.config.dataBasePath}/search/synonyms.json`);
-      this.synonyms = await synonymsResponse.json();
+      this.wordIds = new Map(this.searchIndex.words.map((word, i) => [word, i]));
       
       this.isLoaded = true;
       console.log('[BioClinicSearch] Search index loaded');
@@ -262,7 +262,7 @@ class BioClinicSearch {
     const autocomplete = context === 'hero' ? this.heroAutocomplete : this.headerAutocomplete;
     if (!autocomplete) return;
     
-    const results = this.search(query);
+    const results = this.search(query, { prefix: true });
     
     if (results.length === 0) {
       this.hideAutocomplete(context);
@@ -331,112 +331,26 @@ class BioClinicSearch {
     `;
   }
   
-  search(query) {
+  search(query, { prefix = false } = {}) {
     if (!this.searchIndex) return [];
     
     const normalizedQuery = this.normalizeQuery(query);
-    const expandedTerms = this.expandSynonyms(normalizedQuery);
+    const termIds = this.lookupTerms(normalizedQuery, prefix);
     
     const results = [];
     const seenIds = new Set();
+    const { entities, terms } = this.searchIndex;
     
-    // Search in index
-    for (const term of expandedTerms) {
-      const termData = this.searchIndex.terms[term];
-      if (termData) {
-        // Add results with priority
-        if (termData.pathways) {
-          termData.pathways.forEach(id => {
-            if (!seenIds.has(`pathway:${id}`)) {
-              seenIds.add(`pathway:${id}`);
-              results.push({
-                type: 'pathway',
-                id,
-                name: this.formatId(id),
-                subtitle: 'Percorso clinico completo',
-                priority: 100,
-                uplink: termData.uplink
-              });
-            }
-          });
-        }
-        
-        if (termData.packs) {
-          termData.packs.forEach(id => {
-            if (!seenIds.has(`pack:${id}`)) {
-              seenIds.add(`pack:${id}`);
-              results.push({
-                type: 'pack',
-                id,
-                name: this.formatId(id),
-                subtitle: 'Pacchetto esami',
-                priority: 90,
-                uplink: termData.uplink
-              });
-            }
-          });
-        }
-        
-        if (termData.procedures) {
-          termData.procedures.forEach(id => {
-            if (!seenIds.has(`procedure:${id}`)) {
-              seenIds.add(`procedure:${id}`);
-              results.push({
-                type: 'procedure',
-                id,
-                name: this.formatId(id),
-                subtitle: termData.clinical_context || '',
-                priority: 80
-              });
-            }
-          });
-        }
-        
-        if (termData.tests) {
-          termData.tests.forEach(id => {
-            if (!seenIds.has(`test:${id}`)) {
-              seenIds.add(`test:${id}`);
-              results.push({
-                type: 'test',
-                id,
-                name: this.formatId(id),
-                subtitle: 'Esame di laboratorio',
-                priority: 70,
-                uplink: termData.uplink
-              });
-            }
-          });
-        }
-        
-        if (termData.physicians) {
-          termData.physicians.forEach(id => {
-            if (!seenIds.has(`physician:${id}`)) {
-              seenIds.add(`physician:${id}`);
-              results.push({
-                type: 'physician',
-                id,
-                name: this.formatId(id),
-                subtitle: termData.specialties?.[0] ? this.formatId(termData.specialties[0]) : 'Specialista',
-                priority: 60
-              });
-            }
-          });
-        }
-        
-        if (termData.specialties) {
-          termData.specialties.forEach(id => {
-            if (!seenIds.has(`specialty:${id}`)) {
-              seenIds.add(`specialty:${id}`);
-              results.push({
-                type: 'specialty',
-                id,
-                name: this.formatId(id),
-                subtitle: 'Specialità medica',
-                priority: 50
-              });
-            }
-          });
-        }
+    for (const termId of termIds) {
+      const termData = terms[termId];
+      
+      // Posting list già ordinata per tipo: percorsi, pacchetti, prestazioni, esami, medici, specialità
+      for (const entityId of termData.p) {
+        const [type, id] = entities[entityId];
+        const key = `${type}:${id}`;
+        if (seenIds.has(key)) continue;
+        seenIds.add(key);
+        results.push(this.buildResult(type, id, termData));
       }
     }
     
@@ -446,6 +360,79 @@ class BioClinicSearch {
     return results;
   }
   
+  /**
+   * Termini per una query normalizzata: una lookup sulla chiave esatta;
+   * con `prefix` (autocomplete) anche le chiavi che la completano
+   */
+  lookupTerms(normalizedQuery, prefix) {
+    const { hits, words, prefixes } = this.searchIndex;
+    
+    const wordId = this.wordIds.get(normalizedQuery);
+    if (wordId !== undefined) return hits[wordId];
+    if (!prefix) return [];
+    
+    // I gruppi più lunghi del prefisso massimo vengono filtrati (pochi elementi)
+    const prefixLength = this.searchIndex.prefix_length;
+    let completions = prefixes[normalizedQuery.slice(0, prefixLength)] || [];
+    if (normalizedQuery.length > prefixLength) {
+      completions = completions
+        .filter(i => words[i].startsWith(normalizedQuery))
+        .slice(0, 5);
+    }
+    
+    return [...new Set(completions.flatMap(i => hits[i]))];
+  }
+  
+  buildResult(type, id, termData) {
+    switch (type) {
+      case 'pathway':
+        return {
+          type, id,
+          name: this.formatId(id),
+          subtitle: 'Percorso clinico completo',
+          priority: 100,
+          uplink: termData.u
+        };
+      case 'pack':
+        return {
+          type, id,
+          name: this.formatId(id),
+          subtitle: 'Pacchetto esami',
+          priority: 90,
+          uplink: termData.u
+        };
+      case 'procedure':
+        return {
+          type, id,
+          name: this.formatId(id),
+          subtitle: termData.c || '',
+          priority: 80
+        };
+      case 'test':
+        return {
+          type, id,
+          name: this.formatId(id),
+          subtitle: 'Esame di laboratorio',
+          priority: 70,
+          uplink: termData.u
+        };
+      case 'physician':
+        return {
+          type, id,
+          name: this.formatId(id),
+          subtitle: termData.s ? this.formatId(termData.s) : 'Specialista',
+          priority: 60
+        };
+      default:
+        return {
+          type, id,
+          name: this.formatId(id),
+          subtitle: 'Specialità medica',
+          priority: 50
+        };
+    }
+  }
+  
   normalizeQuery(query) {
     return query
       .toLowerCase()
@@ -455,38 +442,6 @@ class BioClinicSearch {
       .trim();
   }
   
-  expandSynonyms(query) {
-    const terms = [query];
-    
-    // Check aliases
-    if (this.searchIndex?.aliases) {
-      for (const [alias, target] of Object.entries(this.searchIndex.aliases)) {
-        if (query.includes(alias)) {
-          terms.push(query.replace(alias, target));
-        }
-      }
-    }
-    
-    // Check synonyms
-    if (this.synonyms?.synonyms) {
-      for (const [key, data] of Object.entries(this.synonyms.synonyms)) {
-        if (data.alternatives?.includes(query)) {
-          terms.push(data.primary);
-        }
-      }
-    }
-    
-    // Check common misspellings
-    if (this.synonyms?.common_misspellings) {
-      const correction = this.synonyms.common_misspellings[query];
-      if (correction) {
-        terms.push(correction);
-      }
-    }
-    
-    return [...new Set(terms)];
-  }
-  
   formatId(id) {
     return id
       .split('-')
@@ -11,6 +11,8 @@ import re
 from pathlib import Path
 from html import escape
 
+from bioclinic import snapshots, writes
+
 def load_extended_data(site_path):
     """Carica i dati estesi dei medici"""
     ext_path = site_path / 'data' / 'entities' / 'physicians-extended.json'
@@ -143,15 +145,17 @@ def process_profile(html_path, extended_data, default_symptoms, physicians):
 '''
         html = html.replace('</head>', css + '</head>')
     
-    # Salva
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Salva (solo se cambiato)
+    if not writes.write_text(html_path, html):
+        return False, "Already up to date"
     
     has_pubs = "📚" if publications else ""
     return True, f"Updated {has_pubs}"
 
 def main():
     site_path = Path(__file__).parent.parent
+    writes.setup('add-publications-sections')
+    snapshots.before_write('add-publications-sections')
     equipe_path = site_path / 'equipe'
     
     print("=" * 60)
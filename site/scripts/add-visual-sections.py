@@ -7,6 +7,8 @@ import json
 import re
 from pathlib import Path
 
+from bioclinic import snapshots, writes
+
 SITE_ROOT = Path(__file__).parent.parent
 DATA_DIR = SITE_ROOT / "data" / "entities"
 EQUIPE_DIR = SITE_ROOT / "equipe"
@@ -203,6 +205,8 @@ def add_css_to_page(content):
     return content
 
 def main():
+    writes.setup('add-visual-sections')
+    snapshots.before_write('add-visual-sections')
     print("=" * 60)
     print("ADDING VISUAL SECTIONS TO PHYSICIAN PROFILES")
     print("=" * 60)
@@ -280,8 +284,7 @@ def main():
             # Add CSS if needed
             content = add_css_to_page(content)
             
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            writes.write_text(html_path, content)
             
             has_pub = "📚" if ext.get('pubblicazioni') else "  "
             print(f"  ✅ {has_pub} {physician['full_name']}")
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC BENCHMARK                                                        ║
+║                                                                               ║
+║  Misura tempo e picco di memoria (RSS) di generatori, mutatori e             ║
+║  validatori su un sito sintetico scalato (1×, 10×, 100× il corpus reale:     ║
+║  pagine, medici, esami). Ogni scala parte da una copia fresca del sito in    ║
+║  una cartella temporanea: il sito reale non viene mai modificato.            ║
+║                                                                               ║
+║  Il report JSON (default reports/benchmark.json) si confronta tra commit;    ║
+║  con --baseline lo script fallisce se uno stage rallenta oltre la soglia     ║
+║  o se non termina più con exit 0 (errore o timeout).                         ║
+║                                                                               ║
+║  Uso: python3 scripts/benchmark.py [--scales 1,10,100] [--only a,b]          ║
+║           [--output FILE] [--baseline FILE] [--threshold 0.25]               ║
+║           [--timeout 900] [--keep]                                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bioclinic.synthetic import build_synthetic_site
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+REPORT_VERSION = 1
+DEFAULT_OUTPUT = 'reports/benchmark.json'
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_TIMEOUT = 900
+
+# Sotto queste soglie una differenza è rumore, non una regressione
+MIN_DELTA_SECONDS = 0.2
+MIN_DELTA_RSS_KB = 8 * 1024
+
+# (nome, tipo, comando relativo al sito), nell'ordine di esecuzione.
+# Generatori prima, poi mutatori (sulle pagine generate), poi validatori.
+BENCHMARKS = [
+    ('generate-physician-pages-jinja', 'generator', ['scripts/generate-physician-pages-jinja.py']),
+    ('generate-physician-pages', 'generator', ['scripts/generate-physician-pages.py']),
+    ('generate-procedure-pages', 'generator', ['scripts/generate-procedure-pages.py']),
+    ('generate-equipe-index', 'generator', ['scripts/generate-equipe-index.py']),
+    ('build-name-index', 'generator', ['scripts/build-name-index.py']),
+    ('update-search-index', 'generator', ['scripts/update-search-index.py']),
+    ('build-listino', 'generator', ['scripts/build-listino.py']),
+    ('build-lab-shards', 'generator', ['scripts/build-lab-shards.py']),
+    ('generate-sitemap', 'generator', ['generate_sitemap.py']),
+    ('build', 'generator', ['scripts/build.py', '--force']),
+    ('propagate-header', 'mutator', ['scripts/propagate-header.py']),
+    ('physician-autolink-v3', 'mutator', ['scripts/physician-autolink-v3.py']),
+    ('physician-autolink-v2', 'mutator', ['scripts/physician-autolink-v2.py']),
+    ('link-physicians', 'mutator', ['scripts/link-physicians.py']),
+    ('update-all-profiles', 'mutator', ['scripts/update-all-profiles.py']),
+    ('enhance-physician-profiles', 'mutator', ['scripts/enhance-physician-profiles.py']),
+    ('add-publications-sections', 'mutator', ['scripts/add-publications-sections.py']),
+    ('add-visual-sections', 'mutator', ['scripts/add-visual-sections.py']),
+    ('clean-and-rebuild-publications', 'mutator', ['scripts/clean-and-rebuild-publications.py']),
+    ('complete-publications-update', 'mutator', ['scripts/complete-publications-update.py']),
+    ('fix-all-specialist-cards', 'mutator', ['scripts/fix-all-specialist-cards.py']),
+    ('fix-header-tags', 'mutator', ['scripts/fix-header-tags.py']),
+    ('fix-json-ld-errors', 'mutator', ['scripts/fix-json-ld-errors.py']),
+    ('fix-orphan-content', 'mutator', ['scripts/fix-orphan-content.py']),
+    ('fix-seo-issues', 'mutator', ['scripts/fix-seo-issues.py']),
+    ('fix-team-cards', 'mutator', ['scripts/fix-team-cards.py']),
+    ('make-team-cards-clickable', 'mutator', ['scripts/make-team-cards-clickable.py']),
+    ('optimize-images', 'mutator', ['scripts/optimize-images.py']),
+    ('critical-css', 'mutator', ['scripts/critical-css.py']),
+    ('fingerprint-assets', 'mutator', ['scripts/fingerprint-assets.py']),
+    ('validate-site-v2', 'validator', ['scripts/validate-site-v2.py']),
+    ('validate-site', 'validator', ['scripts/validate-site.py']),
+    ('validate-physician-profiles', 'validator', ['scripts/validate-physician-profiles.py']),
+    ('validate-schema', 'validator', ['build/validate_schema.py']),
+    ('comprehensive-seo-audit', 'validator', ['scripts/comprehensive-seo-audit.py']),
+    ('health-check', 'validator', ['scripts/health-check.py']),
+]
+
+
+def parse_option(argv, name, default=None):
+    """Valore di --name X / --name=X"""
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(name + '='):
+            return arg.split('=', 1)[1]
+    return default
+
+
+def _peak_rss_kb(pid):
+    """VmHWM (KB) del processo da /proc; None dove /proc non esiste (es. macOS)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def run_benchmark(site_dir, command, timeout):
+    """Esegue un comando nel sito sintetico; ritorna secondi, picco RSS (KB) ed exit code"""
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable] + command, cwd=site_dir,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               stdin=subprocess.DEVNULL)
+    deadline = started + timeout
+    peak = None
+    timed_out = False
+    while True:
+        # ru_maxrss di wait4 include la memoria del padre copiata dal fork:
+        # dove possibile si usa il VmHWM del processo dopo l'exec, letto in polling
+        hwm = _peak_rss_kb(process.pid)
+        if hwm is not None:
+            peak = max(peak or 0, hwm)
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        if time.perf_counter() > deadline:
+            process.kill()
+            pid, status, usage = os.wait4(process.pid, 0)
+            timed_out = True
+            break
+        time.sleep(0.005)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    result = {
+        'seconds': round(time.perf_counter() - started, 3),
+        'peak_rss_kb': peak if peak is not None else usage.ru_maxrss,
+        'exit_code': None if timed_out else process.returncode,
+    }
+    if timed_out:
+        result['timeout'] = True
+    return result
+
+
+def outcome(result):
+    """Esito di un benchmark: 'timeout' o l'exit code"""
+    return 'timeout' if result.get('timeout') else result.get('exit_code')
+
+
+def compare(report, baseline, threshold):
+    """Regressioni rispetto al baseline: [(scala, stage, metrica, prima, dopo)]
+
+    Uno script che nel baseline terminava con exit 0 e ora fallisce o va in
+    timeout è una regressione ('exit_code'): i suoi tempi non si confrontano,
+    altrimenti un crash precoce sembrerebbe un'accelerazione.
+    """
+    regressions = []
+    for scale, results in report['scales'].items():
+        base_results = baseline.get('scales', {}).get(scale, {}).get('results', {})
+        for name, result in results['results'].items():
+            base = base_results.get(name)
+            if not base:
+                continue
+            if outcome(base) == 0 and outcome(result) != 0:
+                regressions.append((scale, name, 'exit_code', outcome(base), outcome(result)))
+                continue
+            for metric, min_delta in (('seconds', MIN_DELTA_SECONDS),
+                                      ('peak_rss_kb', MIN_DELTA_RSS_KB)):
+                before, after = base.get(metric), result.get(metric)
+                if before is None or after is None:
+                    continue
+                if after > before * (1 + threshold) and after - before > min_delta:
+                    regressions.append((scale, name, metric, before, after))
+    return regressions
+
+
+def main():
+    argv = sys.argv[1:]
+    scales = [int(s) for s in parse_option(argv, '--scales', '').split(',') if s] or DEFAULT_SCALES
+    only = parse_option(argv, '--only')
+    only = set(only.split(',')) if only else None
+    output = SITE_ROOT / parse_option(argv, '--output', DEFAULT_OUTPUT)
+    baseline_path = parse_option(argv, '--baseline')
+    threshold = float(parse_option(argv, '--threshold', DEFAULT_THRESHOLD))
+    timeout = float(parse_option(argv, '--timeout', DEFAULT_TIMEOUT))
+    keep = '--keep' in argv
+
+    # Letto subito: il baseline può essere lo stesso file del report
+    baseline = None
+    if baseline_path:
+        baseline = json.loads((SITE_ROOT / baseline_path).read_text(encoding='utf-8'))
+
+    benchmarks = [b for b in BENCHMARKS if not only or b[0] in only]
+    if only and len(benchmarks) != len(only):
+        known = {b[0] for b in BENCHMARKS}
+        raise SystemExit(f"❌ Benchmark sconosciuti: {', '.join(sorted(only - known))}")
+
+    print("=" * 70)
+    print("BIO-CLINIC BENCHMARK")
+    print(f"Esecuzione: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+
+    report = {
+        'version': REPORT_VERSION,
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'threshold': threshold,
+        'scales': {},
+    }
+    work_dir = Path(tempfile.mkdtemp(prefix='bioclinic-bench-'))
+    try:
+        for scale in scales:
+            site_dir = work_dir / f"scale-{scale}"
+            started = time.perf_counter()
+            corpus = build_synthetic_site(SITE_ROOT, site_dir, scale)
+            print(f"\n📦 Scala {scale}×: {corpus['pages']} pagine, {corpus['physicians']} medici, "
+                  f"{corpus['tests']} esami ({time.perf_counter() - started:.1f}s)")
+            results = {}
+            for name, kind, command in benchmarks:
+                result = run_benchmark(site_dir, command, timeout)
+                result['kind'] = kind
+                results[name] = result
+                status = '⏱️ ' if result.get('timeout') else ('✅' if result['exit_code'] == 0 else '⚠️ ')
+                print(f"  {status} {name:<34} {result['seconds']:>8.2f}s "
+                      f"{result['peak_rss_kb'] / 1024:>8.1f} MB  (exit {result['exit_code']})")
+            report['scales'][str(scale)] = {'corpus': corpus, 'results': results}
+            if not keep:
+                shutil.rmtree(site_dir, ignore_errors=True)
+    finally:
+        if keep:
+            print(f"\n📁 Siti sintetici conservati in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+    print(f"\n📊 Report: {output.relative_to(SITE_ROOT) if output.is_relative_to(SITE_ROOT) else output}")
+
+    if baseline is None:
+        return 0
+    regressions = compare(report, baseline, threshold)
+    if not regressions:
+        print(f"✅ Nessuna regressione oltre il {threshold:.0%} rispetto a {baseline_path}")
+        return 0
+    print(f"❌ {len(regressions)} regressioni rispetto a {baseline_path} (soglia {threshold:.0%}):")
+    for scale, name, metric, before, after in regressions:
+        if metric == 'exit_code':
+            print(f"   → {scale}× {name}: exit {before} -> {after}")
+        else:
+            print(f"   → {scale}× {name} {metric}: {before} -> {after} (+{(after / before - 1):.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
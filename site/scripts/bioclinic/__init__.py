@@ -0,0 +1,7 @@
+"""
+Bio-Clinic - moduli condivisi dagli script di build e validazione.
+
+Gli script in scripts/ hanno nomi con trattino e non sono importabili:
+il codice comune vive qui e viene importato come `bioclinic.<modulo>`
+(scripts/ è già in sys.path quando si lancia `python3 scripts/<script>.py`).
+"""
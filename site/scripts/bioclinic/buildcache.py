@@ -0,0 +1,119 @@
+"""
+Cache di build incrementale basata su hash dei contenuti.
+
+Il manifest (data/cache/build-manifest.json) registra, per ogni file di
+output, gli hash degli input da cui dipende: record delle entità, template,
+master header, sorgente del generatore. Un generatore rigenera una pagina
+solo se almeno una dipendenza è cambiata o se l'output non esiste più.
+
+Uso tipico in un generatore:
+
+    manifest = BuildManifest(BASE_DIR)
+    deps = {'physician': hash_record(physician), 'template': hash_file(tpl)}
+    if not force and manifest.is_fresh(output_file, deps):
+        continue
+    ... render e scrittura ...
+    manifest.record(output_file, deps)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from bioclinic import trace
+
+MANIFEST_VERSION = 1
+MANIFEST_RELPATH = Path('data') / 'cache' / 'build-manifest.json'
+
+_file_hash_cache = {}
+
+
+def hash_bytes(data):
+    """SHA-256 (troncato a 16 hex) di una stringa o di bytes"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def hash_file(path):
+    """Hash del contenuto di un file, memoizzato per processo ('missing' se assente)"""
+    path = Path(path).resolve()
+    cached = _file_hash_cache.get(path)
+    if cached is None:
+        cached = hash_bytes(path.read_bytes()) if path.exists() else 'missing'
+        _file_hash_cache[path] = cached
+    return cached
+
+
+def hash_record(record):
+    """Hash stabile di un record YAML/JSON (chiavi ordinate)"""
+    return hash_bytes(json.dumps(record, sort_keys=True, ensure_ascii=False, default=str))
+
+
+def force_requested(argv=None):
+    """True se lo script è stato lanciato con --force (rigenera tutto)"""
+    argv = sys.argv[1:] if argv is None else argv
+    return '--force' in argv
+
+
+class BuildManifest:
+    """Manifest output -> hash delle dipendenze, condiviso da tutti i generatori"""
+
+    def __init__(self, site_dir, path=None):
+        self.site_dir = Path(site_dir).resolve()
+        self.path = Path(path) if path else self.site_dir / MANIFEST_RELPATH
+        self.outputs = {}
+        self.skipped = 0
+        self.built = 0
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == MANIFEST_VERSION:
+                    self.outputs = data.get('outputs', {})
+            except (json.JSONDecodeError, OSError):
+                # Manifest corrotto: si riparte da zero (build completa)
+                self.outputs = {}
+
+    def _key(self, output):
+        output = Path(output).resolve()
+        try:
+            return output.relative_to(self.site_dir).as_posix()
+        except ValueError:
+            return output.as_posix()
+
+    def is_fresh(self, output, deps):
+        """True se `output` esiste ed è stato generato con esattamente queste dipendenze"""
+        entry = self.outputs.get(self._key(output))
+        fresh = entry is not None and entry.get('deps') == deps and Path(output).exists()
+        if fresh:
+            self.skipped += 1
+        trace.count('cache_hit' if fresh else 'cache_miss')
+        return fresh
+
+    def record(self, output, deps):
+        """Registra le dipendenze di un output appena scritto"""
+        self.outputs[self._key(output)] = {'deps': deps}
+        self.built += 1
+
+    def save(self):
+        """Salva il manifest (fonde con le voci scritte da altri generatori nel frattempo)"""
+        merged = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == MANIFEST_VERSION:
+                    merged = data.get('outputs', {})
+            except (json.JSONDecodeError, OSError):
+                merged = {}
+        merged.update(self.outputs)
+        self.outputs = merged
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'outputs': dict(sorted(merged.items()))},
+                      f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    def summary(self):
+        return f"{self.built} rigenerate, {self.skipped} invariate (cache)"
@@ -0,0 +1,163 @@
+"""
+Componenti condivisi (header, footer) renderizzati in fase di build.
+
+Un componente è un file in components/ con segnaposto {{NOME}}. I valori
+dipendono solo dalla posizione della pagina (path relativi) e dalla voce di
+menu attiva: page_context() li calcola dal path della pagina. Il testo del
+componente viene compilato una volta in segmenti, e ogni variante
+renderizzata è memoizzata per valori dei segnaposto: per il master header
+le varianti distinte sono una decina, non una per pagina.
+
+I generatori includono header e footer già renderizzati (include()), quindi
+le pagine generate escono con i componenti definitivi; propagate-header.py
+usa lo stesso rendering per l'header delle pagine scritte a mano (il footer
+di queste pagine non ha marcatori di regione e resta scritto a mano).
+"""
+
+import re
+from pathlib import Path
+
+from bioclinic import headerregion, trace
+
+COMPONENTS_DIR = 'components'
+MASTER_HEADER = 'master-header'
+MASTER_FOOTER = 'master-footer'
+
+PLACEHOLDER = re.compile(r'\{\{([A-Z_]+)\}\}')
+DOC_COMMENT = re.compile(r'<!--\s*╔.*?╚[^>]*-->\s*', re.DOTALL)
+
+# Pagine con la voce "Specialisti" attiva (oltre a quelle in equipe/)
+SPECIALTY_PAGES = {
+    'cardiologia.html', 'endocrinologia.html', 'dermatologia.html', 'neurologia.html',
+    'oculistica.html', 'ortopedia.html', 'specialita.html', 'chi-siamo.html',
+}
+
+# Preparazione del testo per componente (il master header porta i marcatori di regione)
+PREPARE = {
+    MASTER_HEADER: headerregion.wrap,
+}
+
+
+def page_paths(rel):
+    """Path relativi (ROOT_PATH, PAGES_PATH, ...) per una pagina relativa al sito"""
+    rel = Path(rel)
+    depth = len(rel.parts) - 1
+    if depth == 0:
+        # Pagina nella root (es. index.html)
+        return {
+            "ROOT_PATH": "",
+            "PAGES_PATH": "pages/",
+            "IMAGES_PATH": "images/",
+            "JS_PATH": "js/",
+            "CSS_PATH": "css/"
+        }
+    if depth == 1:
+        # Pagina in una sottocartella (es. pages/cardiologia.html, laboratorio/index.html)
+        return {
+            "ROOT_PATH": "../",
+            "PAGES_PATH": "" if "pages" in str(rel) else "../pages/",
+            "IMAGES_PATH": "../images/",
+            "JS_PATH": "../js/",
+            "CSS_PATH": "../css/"
+        }
+    prefix = "../" * depth
+    return {
+        "ROOT_PATH": prefix,
+        "PAGES_PATH": f"{prefix}pages/",
+        "IMAGES_PATH": f"{prefix}images/",
+        "JS_PATH": f"{prefix}js/",
+        "CSS_PATH": f"{prefix}css/"
+    }
+
+
+def active_section(rel):
+    """Classi ACTIVE_* del menu per una pagina relativa al sito"""
+    rel = Path(rel)
+    page_name = rel.name.lower()
+    page_dir = rel.parent.name.lower()
+
+    active = {
+        "ACTIVE_HOME": "",
+        "ACTIVE_SLIMCARE": "",
+        "ACTIVE_LAB": "",
+        "ACTIVE_DONNA": "",
+        "ACTIVE_SPEC": "",
+        "ACTIVE_SHOP": "",
+        "ACTIVE_CONTATTI": ""
+    }
+
+    if page_name == "index.html" and page_dir == "":
+        active["ACTIVE_HOME"] = "active"
+    elif "slim-care" in page_name:
+        active["ACTIVE_SLIMCARE"] = "active"
+    elif "laboratorio" in page_name or page_dir == "laboratorio":
+        active["ACTIVE_LAB"] = "active"
+    elif page_name in ["ginecologia.html", "pma-fertilita.html"]:
+        active["ACTIVE_DONNA"] = "active"
+    elif page_dir == "shop" or "shop" in page_name:
+        active["ACTIVE_SHOP"] = "active"
+    elif page_name == "contatti.html":
+        active["ACTIVE_CONTATTI"] = "active"
+    elif page_name in SPECIALTY_PAGES or page_dir == "equipe":
+        active["ACTIVE_SPEC"] = "active"
+
+    return active
+
+
+def page_context(rel):
+    """Valori dei segnaposto per una pagina relativa al sito (es. 'pages/x.html')"""
+    return {**page_paths(rel), **active_section(rel)}
+
+
+class Component:
+    """Testo compilato in segmenti letterali e segnaposto, con varianti memoizzate"""
+
+    def __init__(self, text):
+        parts = PLACEHOLDER.split(text)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+        self.keys = tuple(dict.fromkeys(self.names))
+        self.variants = {}
+
+    def render(self, context):
+        """Testo con i segnaposto sostituiti (quelli senza valore restano invariati)"""
+        key = tuple(context.get(name) for name in self.keys)
+        rendered = self.variants.get(key)
+        if rendered is not None:
+            trace.count('variant_hit')
+            return rendered
+        trace.count('variant_miss')
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            value = context.get(name)
+            parts.append(f"{{{{{name}}}}}" if value is None else value)
+            parts.append(literal)
+        rendered = self.variants[key] = ''.join(parts)
+        return rendered
+
+
+_compiled = {}
+_sources = {}
+
+
+def compile_component(text):
+    """Component per un testo (compilato una volta per processo)"""
+    component = _compiled.get(text)
+    if component is None:
+        component = _compiled[text] = Component(text)
+    return component
+
+
+def load_source(site_dir, name):
+    """Testo di components/<name>.html senza il commento di documentazione"""
+    path = Path(site_dir) / COMPONENTS_DIR / f"{name}.html"
+    source = _sources.get(path)
+    if source is None:
+        source = DOC_COMMENT.sub('', path.read_text(encoding='utf-8'))
+        source = _sources[path] = PREPARE.get(name, str.strip)(source)
+    return source
+
+
+def include(site_dir, name, rel):
+    """Componente `name` renderizzato per la pagina `rel` (relativa al sito)"""
+    return compile_component(load_source(site_dir, name)).render(page_context(rel))
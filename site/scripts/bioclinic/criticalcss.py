@@ -0,0 +1,459 @@
+"""
+CSS critico inline e fogli di stile potati per famiglia di pagine.
+
+Ogni pagina carica per intero style.css, tailwind-utilities.css, search.css,
+search-fix.css, header-spacing-fix.css (più physician.css o
+bio-search-pro.css), tutti bloccanti per il rendering. Le pagine sono
+raggruppate in famiglie (profili equipe, prestazioni, specialità, ...) e per
+ogni famiglia e ogni foglio di stile:
+
+- il foglio potato tiene solo le regole i cui selettori possono corrispondere
+  a qualcosa nelle pagine della famiglia o negli script del sito
+  (css/pruned/<famiglia>-<foglio>.<hash>.css);
+- il sottoinsieme critico sono le regole usate dal markup above the fold
+  (header e primi CRITICAL_BYTES dopo l'header), inline in un <style>.
+
+Ogni <link rel="stylesheet"> locale viene sostituito, nella stessa posizione
+(l'ordine della cascata non cambia), da
+
+    <!-- BEGIN CRITICAL CSS css/style.css -->
+    <style>...regole critiche...</style>
+    <link rel="preload" href="../css/pruned/equipe-style.<hash>.css" as="style" onload="...">
+    <noscript><link rel="stylesheet" href="..."></noscript>
+    <!-- END CRITICAL CSS -->
+
+I marcatori ricordano il foglio sorgente: alla build successiva la regione
+viene rigenerata dai sorgenti correnti.
+
+La potatura è conservativa: un selettore resta se tutte le sue classi, id e
+tag compaiono come parola nella pagina o negli script (anche le classi
+aggiunte da JavaScript); pseudo-classi, selettori di attributo e :not()/:is()
+non escludono mai una regola; i prefissi di classe composti negli script
+('bg-' + colore) tengono tutte le classi con quel prefisso.
+"""
+
+import re
+from pathlib import Path
+
+from bioclinic import fingerprint, headerregion, writes
+
+PRUNED_DIR = 'css/pruned'
+SOURCE_DIR = 'css'
+FAMILY_SOURCES = (
+    'data/v2/entities/procedures.yaml',
+    'data/v2/entities/specialties.yaml',
+)
+
+# Markup dopo l'header considerato above the fold (primo viewport su mobile)
+CRITICAL_BYTES = 6000
+
+BEGIN_TEMPLATE = '<!-- BEGIN CRITICAL CSS {source} -->'
+END_MARKER = '<!-- END CRITICAL CSS -->'
+
+_REGION = re.compile(r'<!-- BEGIN CRITICAL CSS (css/[\w.-]+\.css) -->.*?<!-- END CRITICAL CSS -->', re.S)
+_STYLESHEET = re.compile(_REGION.pattern + r'|<link\b[^>]*>', re.S)
+_ATTRIBUTE = re.compile(r'([\w-]+)\s*=\s*(["\'])(.*?)\2', re.S)
+_LOCAL_HREF = re.compile(r'^(?:\.\./)*/?css/([\w-]+?)(?:\.[0-9a-f]{16})?\.css(?:\?.*)?$')
+
+_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_PSEUDO = re.compile(r'(?<!\\)::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?')
+_ATTRIBUTE_SELECTOR = re.compile(r'(?<!\\)\[(?:\\.|[^\]\\])*\]')
+_IDENTIFIER = re.compile(r'([.#]?)((?:\\.|[\w-])+)')
+_ESCAPE = re.compile(r'\\(.)')
+_URL = re.compile(r'url\(\s*(["\']?)(?!data:|https?:|//|/|#)([^"\')]+)\1\s*\)')
+_KEYFRAMES_NAME = re.compile(r'@(?:-[\w]+-)?keyframes\s+([\w-]+)')
+
+_WORD = re.compile(r'[\w-]+')
+_CLASS_ATTRIBUTE = re.compile(r'\b(?:class|id)\s*=\s*(["\'])(.*?)\1', re.S)
+_STRING = re.compile(r'"([^"\n]*)"|\'([^\'\n]*)\'|`([^`]*)`')
+
+# At-rule con regole annidate (potate ricorsivamente); le altre restano intere
+GROUP_RULES = ('@media', '@supports', '@layer', '@container')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PARSING CSS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _scan(text, pos, stops):
+    """Primo carattere in `stops` da `pos`, saltando le stringhe; len(text) se assente"""
+    quote = None
+    while pos < len(text):
+        char = text[pos]
+        if quote:
+            if char == '\\':
+                pos += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in stops:
+            return pos
+        pos += 1
+    return pos
+
+
+def _block_end(text, pos):
+    """Indice della graffa che chiude il blocco aperto prima di `pos`"""
+    depth = 1
+    while depth:
+        pos = _scan(text, pos, '{}')
+        if pos >= len(text):
+            return pos
+        depth += 1 if text[pos] == '{' else -1
+        pos += 1
+    return pos - 1
+
+
+def _parse(text, pos=0):
+    nodes = []
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            return nodes, pos
+        if text[pos] == '}':
+            return nodes, pos + 1
+        stop = _scan(text, pos, '{;}')
+        if stop >= len(text) or text[stop] != '{':
+            # Istruzione (@import, @charset) o testo spurio fino a ';'
+            statement = text[pos:stop + 1].strip()
+            if statement.startswith('@'):
+                nodes.append(('statement', statement, None))
+            pos = stop + 1 if stop < len(text) and text[stop] == ';' else stop
+            continue
+        prelude = ' '.join(text[pos:stop].split())
+        if prelude.startswith(GROUP_RULES):
+            children, pos = _parse(text, stop + 1)
+            nodes.append(('group', prelude, children))
+        else:
+            end = _block_end(text, stop + 1)
+            body = ' '.join(text[stop + 1:end].split())
+            nodes.append(('block' if prelude.startswith('@') else 'rule', prelude, body))
+            pos = end + 1
+
+
+def parse_css(text):
+    """Nodi (tipo, prelude, corpo o figli): 'rule', 'group' (@media...), 'block' (@keyframes...), 'statement'"""
+    return _parse(_COMMENT.sub('', text))[0]
+
+
+def serialize(nodes):
+    parts = []
+    for kind, prelude, body in nodes:
+        if kind == 'statement':
+            parts.append(prelude)
+        elif kind == 'group':
+            parts.append(f"{prelude}{{\n{serialize(body)}\n}}")
+        else:
+            parts.append(f"{prelude}{{{body}}}")
+    return '\n'.join(parts)
+
+
+def rebase_urls(css, depth=1):
+    """url() relativi riscritti per un foglio spostato `depth` cartelle più in basso"""
+    prefix = '../' * depth
+    return _URL.sub(lambda m: f"url({m.group(1)}{prefix}{m.group(2)}{m.group(1)})", css)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SELETTORI E PAROLE USATE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class UsedWords:
+    """Parole (classi, id, tag, testo) che compaiono nel markup o negli script"""
+
+    def __init__(self, words=(), prefixes=()):
+        self.words = set(words)
+        self.prefixes = set(prefixes)
+
+    def update(self, other):
+        self.words |= other.words
+        self.prefixes |= other.prefixes
+
+    def __contains__(self, name):
+        return name in self.words or any(name.startswith(p) for p in self.prefixes)
+
+
+def html_words(html):
+    words = set(_WORD.findall(html))
+    for _, value in _CLASS_ATTRIBUTE.findall(html):
+        words.update(value.split())
+    return UsedWords(words | {'html', 'body'})
+
+
+def script_words(js):
+    """Parole di uno script; le stringhe che finiscono con '-' sono prefissi di classe"""
+    words = set(_WORD.findall(js))
+    prefixes = set()
+    for groups in _STRING.findall(js):
+        for token in ''.join(groups).split():
+            words.add(token)
+            if token.endswith('-') and len(token) > 2:
+                prefixes.add(token)
+    return UsedWords(words, prefixes)
+
+
+def _split_selectors(prelude):
+    selectors, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:i])
+            start = i + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def selector_may_match(selector, used):
+    """False solo se il selettore nomina una classe, un id o un tag mai usato"""
+    bare = _ATTRIBUTE_SELECTOR.sub(' ', _PSEUDO.sub(' ', selector))
+    for prefix, name in _IDENTIFIER.findall(bare):
+        name = _ESCAPE.sub(r'\1', name)
+        if not prefix and name[0].isdigit():
+            continue  # es. selettori di @keyframes (0%, 100%)
+        if (name.lower() if not prefix else name) not in used:
+            return False
+    return True
+
+
+def prune(nodes, used):
+    """Nodi con le sole regole che possono corrispondere; @keyframes solo se referenziati"""
+    kept = _prune(nodes, used)
+    text = serialize([n for n in kept if n[0] != 'block'])
+    result = []
+    for node in kept:
+        if node[0] == 'block' and node[1].startswith(('@keyframes', '@-webkit-keyframes')):
+            match = _KEYFRAMES_NAME.match(node[1])
+            if match and not re.search(rf'(?<![\w-]){re.escape(match.group(1))}(?![\w-])', text):
+                continue
+        result.append(node)
+    return result
+
+
+def _prune(nodes, used):
+    kept = []
+    for kind, prelude, body in nodes:
+        if kind == 'rule':
+            if any(selector_may_match(s, used) for s in _split_selectors(prelude)):
+                kept.append((kind, prelude, body))
+        elif kind == 'group':
+            children = _prune(body, used)
+            if children:
+                kept.append((kind, prelude, children))
+        else:
+            kept.append((kind, prelude, body))
+    return kept
+
+
+def critical_rules(nodes, used):
+    """Sottoinsieme critico: solo regole di stile (niente @font-face/@import)"""
+    return [node for node in prune(nodes, used)
+            if node[0] in ('rule', 'group')
+            or node[1].startswith(('@keyframes', '@-webkit-keyframes'))]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PAGINE E FAMIGLIE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def load_family_index(read):
+    """(slug delle prestazioni, slug delle specialità); `read(rel)` ritorna il testo YAML"""
+    import yaml
+    procedures = yaml.safe_load(read(FAMILY_SOURCES[0]) or '') or {}
+    specialties = yaml.safe_load(read(FAMILY_SOURCES[1]) or '') or {}
+    return (
+        {p.get('slug') or p.get('id') for p in procedures.get('procedures', [])},
+        {s.get('slug') or s.get('id') for s in specialties.get('specialties', [])},
+    )
+
+
+def page_family(rel, family_index):
+    """Famiglia di una pagina: equipe, prestazione, specialita, pagine, home, <cartella>"""
+    procedures, specialties = family_index
+    parts = Path(rel).parts
+    if len(parts) == 1:
+        return 'home'
+    if parts[0] != 'pages':
+        return parts[0]
+    slug = Path(rel).stem
+    if slug in procedures:
+        return 'prestazione'
+    if slug in specialties:
+        return 'specialita'
+    return 'pagine'
+
+
+def strip_regions(html):
+    """Pagina con le regioni critiche svuotate (per contare le parole usate)"""
+    return _REGION.sub(lambda m: BEGIN_TEMPLATE.format(source=m.group(1)) + END_MARKER, html)
+
+
+def _body_start(html):
+    start = html.find('<body')
+    return 0 if start == -1 else start
+
+
+def fold_offset(html):
+    """Offset della fine del primo viewport: CRITICAL_BYTES dopo la fine dell'header"""
+    start = _body_start(html)
+    region = headerregion.find_region(html)
+    return (region[1] if region and region[1] > start else start) + CRITICAL_BYTES
+
+
+def above_the_fold(html):
+    """Markup dall'apertura di <body> alla fine del primo viewport"""
+    return html[_body_start(html):fold_offset(html)]
+
+
+def stylesheet_links(html, sources):
+    """Sorgenti dei fogli locali collegati dalla pagina (nell'ordine), regioni comprese"""
+    found = []
+    for match in _STYLESHEET.finditer(html):
+        source = match.group(1) or _link_source(match.group(0), sources)
+        if source:
+            found.append(source)
+    return found
+
+
+def _link_source(tag, sources):
+    """Sorgente di un <link rel="stylesheet"> locale senza altri attributi, altrimenti None"""
+    attrs = {name.lower(): value for name, _, value in _ATTRIBUTE.findall(tag)}
+    if attrs.get('rel', '').lower() != 'stylesheet' or set(attrs) - {'rel', 'href', 'type'}:
+        return None
+    match = _LOCAL_HREF.match(attrs.get('href', ''))
+    if not match:
+        return None
+    source = f"{SOURCE_DIR}/{match.group(1)}.css"
+    return source if source in sources else None
+
+
+def render_region(source, href, critical, indent=''):
+    lines = [BEGIN_TEMPLATE.format(source=source)]
+    if critical:
+        lines.append(f"<style>\n{critical}\n</style>")
+    lines.append(f'<link rel="preload" href="{href}" as="style" '
+                 f'onload="this.onload=null;this.rel=\'stylesheet\'">')
+    lines.append(f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+    lines.append(END_MARKER)
+    return f"\n{indent}".join(lines)
+
+
+def rewrite_page(html, rel, sources, bundles):
+    """Link ai fogli locali sostituiti dalle regioni della famiglia; ritorna l'html"""
+    prefix = '../' * (len(Path(rel).parts) - 1)
+
+    def replace(match):
+        source = match.group(1) or _link_source(match.group(0), sources)
+        bundle = bundles.get(source)
+        if bundle is None:
+            return match.group(0)
+        pruned, critical = bundle
+        line_start = html.rfind('\n', 0, match.start()) + 1
+        indent = html[line_start:match.start()]
+        return render_region(source, prefix + pruned, critical, indent if not indent.strip() else '')
+
+    return _STYLESHEET.sub(replace, html)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BUILD
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def find_sources(site_dir):
+    """Fogli di stile sorgente in css/ (senza le copie con hash)"""
+    return [rel for rel in fingerprint.find_sources(site_dir) if rel.endswith('.css')]
+
+
+def find_scripts(site_dir):
+    """Script sorgente in js/ (le classi che aggiungono contano come usate)"""
+    return [rel for rel in fingerprint.find_sources(site_dir) if rel.endswith('.js')]
+
+
+def build_critical_css(pages, sources, scripts, family_index):
+    """Fogli potati e pagine riscritte
+
+    pages: {pagina: html}, sources: {css/x.css: testo}, scripts: [testo JS].
+    Ritorna ({css/pruned/...: testo}, {pagina: html riscritto}, statistiche per famiglia).
+    """
+    script_used = UsedWords()
+    for js in scripts:
+        script_used.update(script_words(js))
+
+    families = {}
+    for rel, html in pages.items():
+        html = strip_regions(html)
+        links = stylesheet_links(html, sources)
+        if not links:
+            continue
+        family = families.setdefault(page_family(rel, family_index), {
+            'pages': [], 'used': UsedWords(), 'fold': UsedWords(), 'sources': set()})
+        family['pages'].append(rel)
+        family['used'].update(html_words(html))
+        family['fold'].update(html_words(above_the_fold(html)))
+        family['sources'].update(links)
+
+    parsed = {rel: parse_css(text) for rel, text in sources.items()}
+    files, rewritten, stats = {}, {}, {}
+    for name, family in sorted(families.items()):
+        family['used'].update(script_used)
+        bundles = {}
+        before = after = inline = 0
+        for source in sorted(family['sources']):
+            nodes = parsed[source]
+            pruned = rebase_urls(serialize(prune(nodes, family['used']))) + '\n'
+            critical = serialize(critical_rules(nodes, family['fold']))
+            target = fingerprint.fingerprinted_name(f"{PRUNED_DIR}/{name}-{Path(source).stem}.css", pruned)
+            files[target] = pruned
+            bundles[source] = (target, critical)
+            before += len(sources[source].encode('utf-8'))
+            after += len(pruned.encode('utf-8'))
+            inline += len(critical.encode('utf-8'))
+        for rel in family['pages']:
+            html = rewrite_page(pages[rel], rel, sources, bundles)
+            if html != pages[rel]:
+                rewritten[rel] = html
+        stats[name] = {'pages': len(family['pages']), 'sheets': len(bundles),
+                       'bytes': before, 'pruned': after, 'critical': inline}
+    return files, rewritten, stats
+
+
+def stale_pruned(site_dir, keep):
+    """Fogli in css/pruned/ non più prodotti (path relativi)"""
+    folder = Path(site_dir) / PRUNED_DIR
+    if not folder.is_dir():
+        return []
+    keep = set(keep)
+    return sorted(rel for rel in (f"{PRUNED_DIR}/{p.name}" for p in folder.glob('*.css'))
+                  if rel not in keep)
+
+
+def write_critical_css(site_dir):
+    """Scrive fogli potati e pagine, cancella i fogli obsoleti
+
+    Ritorna (statistiche per famiglia, fogli nuovi, obsoleti, pagine riscritte).
+    """
+    site_dir = Path(site_dir)
+
+    def read(rel):
+        path = site_dir / rel
+        return path.read_bytes().decode('utf-8') if path.exists() else None
+
+    pages = {rel: read(rel) for rel in fingerprint.find_pages(site_dir)}
+    sources = {rel: read(rel) for rel in find_sources(site_dir)}
+    scripts = [read(rel) for rel in find_scripts(site_dir)]
+    files, rewritten, stats = build_critical_css(pages, sources, scripts, load_family_index(read))
+
+    # Scritture tramite bioclinic.writes (atomiche, solo se cambiate, --dry-run/--diff)
+    written = [rel for rel in files if not (site_dir / rel).exists()]
+    stale = stale_pruned(site_dir, files)
+    for rel in written:
+        writes.write_text(site_dir / rel, files[rel])
+    for rel, html in rewritten.items():
+        writes.write_text(site_dir / rel, html)
+    for rel in stale:
+        writes.remove(site_dir / rel)
+    return stats, written, stale, sorted(rewritten)
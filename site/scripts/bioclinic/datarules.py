@@ -0,0 +1,399 @@
+"""
+Validazione dei dati v2 (data/v2/entities/*.yaml) con le regole di
+data/v2/config/schema.yaml.
+
+schema.yaml dichiara required_fields e validation_rules per ogni entità
+("specialty_id must exist in specialties", "id must be unique across all
+physicians", ...) e build.validation.checks, ma nessuno script li eseguiva:
+una specialità sbagliata emergeva solo come warning del generatore, a pagine
+già costruite. Qui:
+
+    from bioclinic import datarules
+
+    report = datarules.validate_site(SITE_ROOT)
+    for issue in report.issues:
+        print(issue)            # data/v2/entities/physicians.yaml:42: ...
+    if not report.ok:
+        ...
+
+- le regole sono compilate una volta sola in controlli per campo
+  (compile_schema); una regola non riconosciuta è un errore dello schema,
+  non viene ignorata in silenzio;
+- le chiavi esterne usano un set di id per ogni entità di destinazione,
+  costruito prima della passata: ogni record viene visitato una volta sola
+  con tutti i controlli della sua entità;
+- ogni problema porta file e riga YAML del valore (o del record, se il campo
+  manca), presi dai nodi del parser senza una seconda lettura.
+"""
+
+import re
+import time
+from pathlib import Path
+
+import yaml
+
+SCHEMA_RELPATH = 'data/v2/config/schema.yaml'
+ENTITIES_DIR = 'data/v2/entities'
+
+SITE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Valori ammessi per status (documentati nei commenti di schema.yaml)
+STATUS_VALUES = ('active', 'inactive', 'hidden')
+
+SLUG_RE = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class SchemaRuleError(ValueError):
+    """Regola di schema.yaml che il validatore non sa compilare"""
+
+
+class Issue:
+    """Un problema nei dati: livello, file, riga (1-based) e messaggio"""
+
+    def __init__(self, level, path, line, message):
+        self.level = level
+        self.path = path
+        self.line = line
+        self.message = message
+
+    def __str__(self):
+        return f"{self.path}:{self.line}: {self.message}"
+
+    def __repr__(self):
+        return f"Issue({self.level!r}, {str(self)!r})"
+
+
+def plural(entity):
+    """physician -> physicians, specialty -> specialties (nomi delle collezioni)"""
+    return entity[:-1] + 'ies' if entity.endswith('y') else entity + 's'
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LETTURA CON POSIZIONI
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _node_lines(node):
+    """(riga del nodo, {campo: riga del valore}, {campo: [righe degli elementi]})"""
+    fields = {}
+    items = {}
+    for key_node, value_node in node.value:
+        fields[key_node.value] = value_node.start_mark.line + 1
+        if isinstance(value_node, yaml.SequenceNode):
+            items[key_node.value] = [item.start_mark.line + 1 for item in value_node.value]
+    return node.start_mark.line + 1, fields, items
+
+
+class Located:
+    """Documento YAML con le righe di ogni record della collezione"""
+
+    def __init__(self, path, data, root):
+        self.path = path
+        self.data = data
+        self.root = root
+
+    def records(self, key):
+        """(record, riga del record, {campo: riga}, {campo: [righe]}) della collezione key"""
+        if not isinstance(self.root, yaml.MappingNode):
+            return
+        for key_node, value_node in self.root.value:
+            if key_node.value != key or not isinstance(value_node, yaml.SequenceNode):
+                continue
+            for record, node in zip(self.data.get(key) or [], value_node.value):
+                if isinstance(node, yaml.MappingNode) and isinstance(record, dict):
+                    yield (record, *_node_lines(node))
+
+    def line_of(self, *keys):
+        """Riga del valore al percorso keys (es. 'entities', 'physician'), 1 se assente"""
+        node = self.root
+        for key in keys:
+            found = None
+            if isinstance(node, yaml.MappingNode):
+                found = next((v for k, v in node.value if k.value == key), None)
+            elif isinstance(node, yaml.SequenceNode) and isinstance(key, int) and key < len(node.value):
+                found = node.value[key]
+            if found is None:
+                return node.start_mark.line + 1 if node is not None else 1
+            node = found
+        return node.start_mark.line + 1
+
+
+def load_located(path, display=None):
+    """Legge un file YAML in una sola passata: dati + nodi con le posizioni"""
+    text = Path(path).read_text(encoding='utf-8')
+    loader = _Loader(text)
+    try:
+        root = loader.get_single_node()
+        data = loader.construct_document(root) if root is not None else None
+    finally:
+        loader.dispose()
+    return Located(display or str(path), data or {}, root)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILAZIONE DELLE REGOLE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _present(value):
+    return value not in (None, '', [], {})
+
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def check_required(field):
+    def check(record, line, fields, items, ctx):
+        if not _present(record.get(field)):
+            yield fields.get(field, line), f"campo obbligatorio '{field}' mancante"
+    return check
+
+
+def check_foreign_key(field, target, many):
+    def check(record, line, fields, items, ctx):
+        value = record.get(field)
+        if not _present(value):
+            return
+        known = ctx.ids[target]
+        values = _as_list(value) if many else [value]
+        lines = items.get(field, []) if many else []
+        for i, ref in enumerate(values):
+            if not isinstance(ref, str) or ref not in known:
+                at = lines[i] if i < len(lines) else fields.get(field, line)
+                yield at, f"{field}: '{ref}' non esiste in {target}"
+    return check
+
+
+def check_unique(entity, field):
+    def check(record, line, fields, items, ctx):
+        value = record.get(field)
+        if not _present(value) or not isinstance(value, (str, int)):
+            return
+        seen = ctx.seen.setdefault((entity, field), {})
+        at = fields.get(field, line)
+        if value in seen:
+            first_path, first_line = seen[value]
+            yield at, f"{field} '{value}' duplicato (già in {first_path}:{first_line})"
+        else:
+            seen[value] = (ctx.path, at)
+    return check
+
+
+def check_slug(field):
+    def check(record, line, fields, items, ctx):
+        value = record.get(field)
+        if _present(value) and not (isinstance(value, str) and SLUG_RE.match(value)):
+            yield fields.get(field, line), f"{field} '{value}' non è uno slug valido (minuscole, cifre, trattini)"
+    return check
+
+
+def check_enum(field, allowed):
+    def check(record, line, fields, items, ctx):
+        value = record.get(field)
+        if _present(value) and value not in allowed:
+            yield fields.get(field, line), f"{field} '{value}' non valido (ammessi: {', '.join(allowed)})"
+    return check
+
+
+# Regole testuali di validation_rules -> (chiave del controllo, fabbrica)
+RULE_PATTERNS = [
+    (re.compile(r'^(\w+) must exist in (\w+)$'),
+     lambda entity, m: (('fk', m[1]), m[2], lambda: check_foreign_key(m[1], m[2], many=False))),
+    (re.compile(r'^(\w+) must all exist in (\w+)$'),
+     lambda entity, m: (('fk', m[1]), m[2], lambda: check_foreign_key(m[1], m[2], many=True))),
+    (re.compile(r'^(\w+) must be unique across all (\w+)$'),
+     lambda entity, m: (('unique', m[1]), None, lambda: check_unique(entity, m[1]))),
+    (re.compile(r'^(\w+) must be valid slug\b'),
+     lambda entity, m: (('slug', m[1]), None, lambda: check_slug(m[1]))),
+]
+
+# build.validation.checks: controlli applicati a tutte le entità
+GLOBAL_CHECKS = {
+    'all FK references exist': 'fk',
+    'no duplicate IDs': 'unique',
+    'required fields present': 'required',
+    'status is valid enum': 'status',
+    'slugs are valid format': 'slug',
+}
+
+
+class RuleSet:
+    """Regole di schema.yaml compilate: controlli per entità e impostazioni di build"""
+
+    def __init__(self, checks, targets, settings, warnings):
+        self.checks = checks          # {entità: [check]}
+        self.targets = targets        # {collezione di destinazione: [(riga, regola)]}
+        self.settings = settings      # build.validation
+        self.warnings = warnings      # Issue emersi in compilazione
+
+    def collections(self):
+        return {plural(entity): entity for entity in self.checks}
+
+
+def compile_schema(schema):
+    """Compila un schema.yaml già letto (Located) in un RuleSet"""
+    entities = schema.data.get('entities') or {}
+    settings = (schema.data.get('build') or {}).get('validation') or {}
+    enabled = set()
+    warnings = []
+    for i, text in enumerate(settings.get('checks') or []):
+        if text in GLOBAL_CHECKS:
+            enabled.add(GLOBAL_CHECKS[text])
+        else:
+            warnings.append(Issue('warning', schema.path, schema.line_of('build', 'validation', 'checks', i),
+                                  f"controllo '{text}' non riconosciuto, ignorato"))
+
+    checks = {}
+    targets = {}
+    for entity, spec in entities.items():
+        spec = spec or {}
+        compiled = {}
+        if 'required' in enabled:
+            for field in spec.get('required_fields') or []:
+                compiled[('required', field)] = check_required(field)
+        for i, rule in enumerate(spec.get('validation_rules') or []):
+            line = schema.line_of('entities', entity, 'validation_rules', i)
+            for pattern, factory in RULE_PATTERNS:
+                match = pattern.match(rule.strip())
+                if match:
+                    key, target, build = factory(entity, match)
+                    if key[0] == 'fk' and 'fk' not in enabled:
+                        break
+                    compiled[key] = build()
+                    if target:
+                        targets.setdefault(target, []).append((line, rule))
+                    break
+            else:
+                raise SchemaRuleError(f"{schema.path}:{line}: regola non riconosciuta: '{rule}'")
+        required = set(spec.get('required_fields') or [])
+        if 'unique' in enabled and 'id' in required:
+            compiled.setdefault(('unique', 'id'), check_unique(entity, 'id'))
+        if 'slug' in enabled:
+            for field in ('id', 'slug'):
+                if field in required or field in (spec.get('optional_fields') or []):
+                    compiled.setdefault(('slug', field), check_slug(field))
+        if 'status' in enabled and 'status' in required:
+            compiled[('status', 'status')] = check_enum('status', STATUS_VALUES)
+        checks[entity] = list(compiled.values())
+    return RuleSet(checks, targets, settings, warnings)
+
+
+_compiled = {}
+
+
+def load_rules(site_dir=None):
+    """RuleSet di schema.yaml (compilato una volta per processo e contenuto)"""
+    path = Path(site_dir or SITE_ROOT) / SCHEMA_RELPATH
+    key = (path, path.stat().st_mtime_ns)
+    rules = _compiled.get(key)
+    if rules is None:
+        rules = _compiled[key] = compile_schema(load_located(path, SCHEMA_RELPATH))
+    return rules
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VALIDAZIONE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class _Context:
+    """Stato di una passata: indici degli id per chiave esterna e valori già visti"""
+
+    def __init__(self, ids):
+        self.ids = ids
+        self.seen = {}
+        self.path = None
+
+
+class Report:
+    """Esito della validazione"""
+
+    def __init__(self, issues, settings, records, elapsed):
+        self.issues = sorted(issues, key=lambda i: (i.level != 'error', i.path, i.line))
+        self.settings = settings
+        self.records = records
+        self.elapsed = elapsed
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i.level == 'error']
+
+    @property
+    def warnings(self):
+        return [i for i in self.issues if i.level == 'warning']
+
+    @property
+    def ok(self):
+        """False se ci sono problemi bloccanti secondo build.validation"""
+        if self.errors and self.settings.get('fail_on_error', True):
+            return False
+        if self.warnings and self.settings.get('fail_on_warning', False):
+            return False
+        return True
+
+
+def validate_documents(rules, documents, unreadable=()):
+    """Valida {collezione: Located} con un RuleSet già compilato
+
+    unreadable: collezioni il cui file non si è potuto leggere (già segnalate)
+    """
+    started = time.perf_counter()
+    issues = list(rules.warnings)
+
+    # Indici per le chiavi esterne: un set di id per ogni collezione di destinazione
+    ids = {}
+    for target, uses in rules.targets.items():
+        doc = documents.get(target)
+        if doc is None:
+            for line, rule in ([] if target in unreadable else uses):
+                issues.append(Issue('warning', SCHEMA_RELPATH, line,
+                                    f"'{rule}': {ENTITIES_DIR}/{target}.yaml non esiste, regola saltata"))
+            ids[target] = _AnyId()
+        else:
+            ids[target] = {r.get('id') for r in doc.data.get(target) or [] if isinstance(r, dict)}
+
+    ctx = _Context(ids)
+    records = 0
+    for collection, entity in rules.collections().items():
+        doc = documents.get(collection)
+        if doc is None:
+            continue
+        ctx.path = doc.path
+        checks = rules.checks[entity]
+        for record, line, fields, items in doc.records(collection):
+            records += 1
+            for check in checks:
+                for at, message in check(record, line, fields, items, ctx):
+                    issues.append(Issue('error', doc.path, at, message))
+    return Report(issues, rules.settings, records, time.perf_counter() - started)
+
+
+class _AnyId:
+    """Indice di una collezione non caricata: accetta ogni id (la regola è già segnalata)"""
+
+    def __contains__(self, value):
+        return True
+
+
+def validate_site(site_dir=None):
+    """Valida tutte le collezioni di data/v2/entities/ dichiarate in schema.yaml"""
+    started = time.perf_counter()
+    site_dir = Path(site_dir or SITE_ROOT)
+    rules = load_rules(site_dir)
+    documents = {}
+    parse_issues = {}
+    for collection in rules.collections():
+        rel = f"{ENTITIES_DIR}/{collection}.yaml"
+        path = site_dir / rel
+        if not path.exists():
+            continue
+        try:
+            documents[collection] = load_located(path, rel)
+        except yaml.YAMLError as e:
+            mark = getattr(e, 'problem_mark', None)
+            line = mark.line + 1 if mark is not None else 1
+            parse_issues[collection] = Issue('error', rel, line, f"YAML non valido: {getattr(e, 'problem', e)}")
+    report = validate_documents(rules, documents, unreadable=parse_issues)
+    report.issues[:0] = parse_issues.values()
+    report.elapsed = time.perf_counter() - started
+    return report
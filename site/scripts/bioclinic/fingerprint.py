@@ -0,0 +1,143 @@
+"""
+Fingerprint degli asset CSS e JS: l'hash del contenuto nel nome del file.
+
+_headers serve /css/* e /js/* con `max-age=31536000, immutable`, ma i nomi
+stabili (css/style.css, js/search.js) con una cache di un anno lasciano ai
+client il codice vecchio. Per ogni sorgente in css/ e js/ si scrive accanto
+una copia con l'hash nel nome:
+
+    css/style.css   ->  css/style.<hash>.css
+    js/search.js    ->  js/search.<hash>.js
+
+e nelle pagine i riferimenti <script src> e <link href> (con o senza ../,
+con o senza ?v=..., o con un hash precedente) puntano alla copia corrente.
+Le copie stanno nella stessa cartella del sorgente, quindi i path relativi
+interni (url(...) nei CSS, js/db/ in database.js) restano validi. Un nome
+cambia solo se cambia il contenuto: la cache immutable resta sicura.
+
+I sorgenti restano quelli da modificare a mano; il manifest
+data/asset-manifest.json ({sorgente: copia}) dice quale copia è corrente e
+le copie non più referenziate vengono cancellate. Gli shard in js/db/ hanno
+già l'hash nel nome (labshards) e non vengono toccati.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from bioclinic import writes
+from bioclinic.buildcache import hash_bytes
+from bioclinic.precompress import published_files
+
+SOURCE_DIRS = ('css', 'js')
+SOURCE_SUFFIXES = ('.css', '.js')
+MANIFEST_RELPATH = 'data/asset-manifest.json'
+
+_FINGERPRINTED = re.compile(r'\.[0-9a-f]{16}\.(?:css|js)$')
+
+# <script ... src="..."> e <link ... href="..."> verso css/ o js/ del sito:
+# prefisso relativo, sorgente senza estensione, hash e query opzionali
+_REFERENCE = re.compile(
+    r'(<(?:script|link)\b[^>]*?\b(?:src|href)=(["\']))'
+    r'((?:\.\./)*|/)?'
+    r'((?:css|js)/[\w.-]+?)(?:\.[0-9a-f]{16})?(\.(?:css|js))'
+    r'(?:\?[^"\']*)?\2'
+)
+
+
+def is_fingerprinted(name):
+    return bool(_FINGERPRINTED.search(name))
+
+
+def find_sources(site_dir):
+    """Sorgenti CSS/JS da cui derivare le copie (path relativi, ordinati)"""
+    site_dir = Path(site_dir)
+    sources = []
+    for folder in SOURCE_DIRS:
+        for path in (site_dir / folder).glob('*'):
+            if path.is_file() and path.name.endswith(SOURCE_SUFFIXES) and not is_fingerprinted(path.name):
+                sources.append(f"{folder}/{path.name}")
+    return sorted(sources)
+
+
+def fingerprinted_name(rel, text):
+    """'css/style.css' -> 'css/style.<hash>.css'"""
+    stem, ext = rel.rsplit('.', 1)
+    return f"{stem}.{hash_bytes(text)}.{ext}"
+
+
+def build_manifest(sources):
+    """{sorgente: copia con hash} da {sorgente: contenuto}"""
+    return {rel: fingerprinted_name(rel, text) for rel, text in sorted(sources.items())}
+
+
+def dump_manifest(manifest):
+    return json.dumps({'assets': manifest}, ensure_ascii=False, indent=2) + '\n'
+
+
+def rewrite_references(html, manifest):
+    """Riferimenti agli asset puntati alle copie correnti; ritorna (html, sostituzioni)"""
+    replaced = 0
+
+    def replace(match):
+        nonlocal replaced
+        target = manifest.get(match.group(4) + match.group(5))
+        if target is None:
+            return match.group(0)
+        reference = f"{match.group(1)}{match.group(3) or ''}{target}{match.group(2)}"
+        if reference != match.group(0):
+            replaced += 1
+        return reference
+
+    return _REFERENCE.sub(replace, html), replaced
+
+
+def find_pages(site_dir):
+    """Pagine HTML pubblicate in cui riscrivere i riferimenti"""
+    return published_files(site_dir, ('.html',))
+
+
+def stale_fingerprints(site_dir, keep):
+    """Copie con hash su disco non più nel manifest (path relativi)"""
+    site_dir = Path(site_dir)
+    keep = set(keep)
+    stale = []
+    for folder in SOURCE_DIRS:
+        for path in (site_dir / folder).glob('*'):
+            rel = f"{folder}/{path.name}"
+            if path.is_file() and is_fingerprinted(path.name) and rel not in keep:
+                stale.append(rel)
+    return sorted(stale)
+
+
+def write_fingerprints(site_dir):
+    """Scrive copie, pagine e manifest, cancella le copie obsolete
+
+    Ritorna (manifest, copie nuove, obsolete, pagine riscritte).
+    """
+    site_dir = Path(site_dir)
+    sources = {rel: (site_dir / rel).read_bytes() for rel in find_sources(site_dir)}
+    manifest = build_manifest(sources)
+
+    written = 0
+    for rel, target in manifest.items():
+        path = site_dir / target
+        if path.exists():
+            continue  # nome = hash del contenuto: se esiste è già aggiornata
+        written += 1
+        writes.write_bytes(path, sources[rel])
+
+    pages = []
+    for rel in find_pages(site_dir):
+        path = site_dir / rel
+        html = path.read_bytes().decode('utf-8')
+        new_html, _ = rewrite_references(html, manifest)
+        if new_html != html:
+            pages.append(rel)
+            writes.write_text(path, new_html)
+
+    stale = stale_fingerprints(site_dir, manifest.values())
+    for rel in stale:
+        writes.remove(site_dir / rel)
+    writes.write_text(site_dir / MANIFEST_RELPATH, dump_manifest(manifest))
+    return manifest, written, stale, pages
@@ -0,0 +1,190 @@
+"""
+Indice a trigrammi con tolleranza agli errori di battitura.
+
+Usato in due modi:
+
+- in build (labshards.py) per l'indice fuzzy di BioClinicDB
+  (js/db/fuzzy.<hash>.json): parole dei nomi degli esami, delle categorie,
+  delle etichette dei sintomi e dei sinonimi di data/search/synonyms.json.
+  search() in database.js corregge le parole della query che non trovano
+  nessun esame ("tireoide" -> "tiroide", "complto" -> "completo") senza una
+  lista di errori scritta a mano;
+- come libreria per i validatori: near_duplicates() trova i nomi quasi
+  uguali nel listino (probabili doppioni).
+
+Una parola è candidata se condivide abbastanza trigrammi con la query;
+i candidati vengono poi verificati con la distanza di edit (Damerau, con
+trasposizioni adiacenti). La stessa logica è replicata in database.js:
+modificare WORD_PATTERN, trigrams() o max_distance() richiede di
+aggiornare anche fuzzyCorrect() lato client.
+"""
+
+import math
+import re
+import unicodedata
+
+FUZZY_VERSION = 1
+
+# Solo parole di lettere, di almeno 4 caratteri: sigle corte come TSH o FT3
+# hanno troppi vicini a distanza 1 per essere corrette in modo affidabile
+WORD_PATTERN = re.compile(r'[^\W\d_]{4,}')
+
+# Frazione minima di trigrammi della query che un candidato deve condividere
+MIN_OVERLAP = 0.3
+
+
+def words(text):
+    """Parole indicizzabili di un testo (minuscolo, accenti conservati)"""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def trigrams(word):
+    """Trigrammi con i bordi di parola: 'tsh' -> [' ts', 'tsh', 'sh ']"""
+    padded = f" {word} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def max_distance(word):
+    """Errori tollerati per una parola della query"""
+    return 1 if len(word) <= 5 else 2
+
+
+def edit_distance(a, b, limit=None):
+    """Distanza di Damerau-Levenshtein (trasposizioni adiacenti)
+
+    Con `limit` si ferma appena la distanza supera il limite e ritorna limit + 1.
+    """
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = None
+    current = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if limit is not None and min(current) > limit:
+            return limit + 1
+    return current[-1]
+
+
+class FuzzyIndex:
+    """Vocabolario con posting list per trigramma"""
+
+    def __init__(self, vocabulary=()):
+        self.words = []
+        self.frequency = []
+        self.postings = {}
+        self._ids = {}
+        for word in vocabulary:
+            self.add(word)
+
+    def add(self, word, count=1):
+        word_id = self._ids.get(word)
+        if word_id is None:
+            word_id = self._ids[word] = len(self.words)
+            self.words.append(word)
+            self.frequency.append(0)
+            for trigram in trigrams(word):
+                self.postings.setdefault(trigram, []).append(word_id)
+        self.frequency[word_id] += count
+
+    def candidates(self, word):
+        """[(parola, trigrammi condivisi)] con sovrapposizione >= MIN_OVERLAP"""
+        grams = trigrams(word)
+        shared = {}
+        for trigram in grams:
+            for word_id in self.postings.get(trigram, ()):
+                shared[word_id] = shared.get(word_id, 0) + 1
+        needed = max(1, math.ceil(len(grams) * MIN_OVERLAP))
+        return [(self.words[i], n) for i, n in shared.items() if n >= needed]
+
+    def matches(self, word, limit=None):
+        """[(parola, distanza)] entro la distanza tollerata, dalla più vicina"""
+        limit = max_distance(word) if limit is None else limit
+        found = []
+        for candidate, shared in self.candidates(word):
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                found.append((distance, -shared, -self.frequency[self._ids[candidate]],
+                              candidate))
+        found.sort()
+        return [(candidate, distance) for distance, _, _, candidate in found]
+
+    def correct(self, word):
+        """Parola del vocabolario più vicina (la parola stessa se c'è), None se nessuna"""
+        if word in self._ids:
+            return word
+        found = self.matches(word)
+        return found[0][0] if found else None
+
+    def to_json(self):
+        """Forma compatta per il client: parole, frequenze, trigramma -> indici"""
+        return {
+            'version': FUZZY_VERSION,
+            'words': self.words,
+            'frequency': self.frequency,
+            'trigrams': dict(sorted(self.postings.items())),
+        }
+
+
+def _strip_accents(text):
+    return ''.join(c for c in unicodedata.normalize('NFD', text) if not unicodedata.combining(c))
+
+
+def normalize_name(name):
+    """Chiave di confronto per i doppioni: minuscolo, senza accenti né punteggiatura"""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', _strip_accents(name.lower())).split())
+
+
+# Numeri romani (FATTORE VIII / FATTORE XIII sono esami diversi)
+ROMAN_NUMERAL = re.compile(r'm{0,4}(?:cm|cd|d?c{0,3})(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3})')
+
+
+def _typo_pair(a, b):
+    """True se due parole diverse sono lo stesso termine scritto male
+
+    Non sono errori di battitura le parole con cifre (FT3/FT4), i numeri
+    romani (VIII/XIII) e le differenze nella sola prima lettera: ETANOLO /
+    METANOLO e IODIO / SODIO sono sostanze diverse.
+    """
+    if min(len(a), len(b)) < 4 or any(c.isdigit() for c in a + b):
+        return False
+    if ROMAN_NUMERAL.fullmatch(a) and ROMAN_NUMERAL.fullmatch(b):
+        return False
+    if a[1:] == b[1:] or a[1:] == b or b[1:] == a:
+        return False
+    return edit_distance(a, b, 1) <= 1
+
+
+def near_duplicates(names, min_length=8):
+    """Coppie (nome, nome) di nomi quasi uguali, nell'ordine della lista
+
+    Due nomi sono doppioni se coincidono dopo normalize_name() o se differiscono
+    in una sola parola per un errore di battitura (distanza 1, parole di almeno
+    4 lettere, vedi _typo_pair): 'ANEXINA V IGG' / 'Annexina V IgG' sì;
+    IgG/IgM, FT3/FT4, F.T./I.T., ETANOLO/METANOLO, FATTORE VIII/XIII no. I confronti avvengono solo tra nomi con le altre parole
+    uguali (blocchi per parola mancante), quindi il costo resta lineare.
+    """
+    keys = [normalize_name(name) for name in names]
+    blocks = {}
+    for position, key in enumerate(keys):
+        if len(key) < min_length:
+            continue
+        tokens = key.split()
+        for i in range(len(tokens)):
+            block = (len(tokens), i, ' '.join(tokens[:i] + tokens[i + 1:]))
+            blocks.setdefault(block, []).append(position)
+
+    found = set()
+    for (_, i, _), positions in blocks.items():
+        for a, first in enumerate(positions):
+            for second in positions[a + 1:]:
+                if (first, second) in found:
+                    continue
+                if keys[first] == keys[second] or _typo_pair(keys[first].split()[i],
+                                                             keys[second].split()[i]):
+                    found.add((first, second))
+    return [(names[first], names[second]) for first, second in sorted(found)]
@@ -0,0 +1,126 @@
+"""
+Regione dell'header nelle pagine, delimitata da marcatori stabili.
+
+Il master header (components/master-header.html) e i generatori emettono
+
+    <!-- BEGIN MASTER HEADER -->
+    ...
+    <!-- END MASTER HEADER -->
+
+e propagate-header.py sostituisce esattamente il testo tra i due marcatori
+(inclusi), senza regex. L'indice data/cache/header-regions.json ricorda, per
+ogni pagina, gli offset in byte della regione dopo l'ultima propagazione:
+se a quegli offset ci sono ancora i marcatori la regione si usa così com'è,
+altrimenti (pagina modificata nel frattempo) si ritrova con una ricerca
+letterale dei marcatori. Il costo per pagina è il confronto e la copia
+dell'header, non più una scansione del documento con undici pattern.
+
+Le pagine ancora senza marcatori passano una sola volta dalla vecchia
+ricerca a regex di propagate-header.py, che inserisce l'header completo di
+marcatori.
+"""
+
+import json
+from pathlib import Path
+
+BEGIN_MARKER = '<!-- BEGIN MASTER HEADER -->'
+END_MARKER = '<!-- END MASTER HEADER -->'
+
+INDEX_VERSION = 1
+INDEX_RELPATH = Path('data') / 'cache' / 'header-regions.json'
+
+_MARKERS = {
+    str: (BEGIN_MARKER, END_MARKER),
+    bytes: (BEGIN_MARKER.encode('utf-8'), END_MARKER.encode('utf-8')),
+}
+
+
+def wrap(header):
+    """Header con i marcatori di inizio e fine (aggiunti se mancano)"""
+    header = header.strip()
+    if not header.startswith(BEGIN_MARKER):
+        header = f"{BEGIN_MARKER}\n{header}"
+    if not header.endswith(END_MARKER):
+        header = f"{header}\n{END_MARKER}"
+    return header
+
+
+def find_region(data, hint=None):
+    """(inizio, fine) della regione in `data` (str o bytes), marcatori inclusi
+
+    `hint` è la regione registrata nell'indice: viene verificata guardando solo
+    i due marcatori. Ritorna None se la pagina non ha i marcatori.
+    """
+    begin, end = _MARKERS[type(data)]
+    if hint is not None:
+        start, stop = hint
+        if stop <= len(data) and data.startswith(begin, start) and data.endswith(end, start, stop):
+            return start, stop
+    start = data.find(begin)
+    if start == -1:
+        return None
+    stop = data.find(end, start)
+    if stop == -1:
+        return None
+    return start, stop + len(end)
+
+
+def skip_end_markers(data, position):
+    """Posizione dopo eventuali END_MARKER (e spazi) che seguono `position`
+
+    Le vecchie propagazioni lasciavano il marcatore di fine della pagina dopo
+    quello del nuovo header: a ogni esecuzione se ne accumulava uno.
+    """
+    _, end = _MARKERS[type(data)]
+    while True:
+        rest = data[position:].lstrip()
+        if not rest.startswith(end):
+            return position
+        position = len(data) - len(rest) + len(end)
+
+
+def splice(data, region, header):
+    """Sostituisce la regione con `header` (stesso tipo di `data`)"""
+    start, stop = region
+    return data[:start] + header + data[stop:]
+
+
+class RegionIndex:
+    """Offset in byte della regione header per pagina (relativa al sito)"""
+
+    def __init__(self, site_dir):
+        self.path = Path(site_dir) / INDEX_RELPATH
+        self.pages = {}
+        self.changed = False
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == INDEX_VERSION:
+                    self.pages = {rel: tuple(region) for rel, region in data.get('pages', {}).items()}
+            except (json.JSONDecodeError, OSError):
+                # Indice corrotto: le regioni si ritrovano dai marcatori
+                self.pages = {}
+
+    def get(self, rel):
+        return self.pages.get(rel)
+
+    def record(self, rel, region):
+        region = tuple(region) if region else None
+        if self.pages.get(rel) != region:
+            if region is None:
+                self.pages.pop(rel, None)
+            else:
+                self.pages[rel] = region
+            self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'pages': {rel: list(region) for rel, region in sorted(self.pages.items())},
+            }, f, indent=2)
+            f.write('\n')
+        self.changed = False
@@ -0,0 +1,115 @@
+"""
+Contesto HTML di ogni posizione di una pagina, calcolato con una sola scansione.
+
+Gli autolinker devono sapere se un'occorrenza di un nome è testo visibile
+oppure sta dentro un tag (attributi compresi), un link esistente, uno
+<script> (JSON-LD compreso), uno <style>, il <title> o un commento.
+Invece di riscandire a ritroso 200-500 caratteri per ogni occorrenza,
+HtmlContext tokenizza la pagina una volta e divide il testo in segmenti
+etichettati; ogni interrogazione è una ricerca binaria sui segmenti.
+
+    context = HtmlContext(html)
+    if context.is_text(start, end):
+        ... linkabile ...
+"""
+
+import re
+from bisect import bisect_right
+
+# Etichette (combinabili): 0 = testo visibile
+TAG = 1       # dentro <...>, nome e attributi compresi
+LINK = 2      # contenuto di <a>...</a>
+SCRIPT = 4    # contenuto di <script>
+JSONLD = 8    # contenuto di <script type="application/ld+json">
+STYLE = 16    # contenuto di <style>
+TITLE = 32    # contenuto di <title>
+COMMENT = 64  # <!-- ... -->
+
+# Elementi il cui contenuto è testo grezzo fino al tag di chiusura
+RAW_TEXT_ELEMENTS = {'script': SCRIPT, 'style': STYLE, 'title': TITLE}
+
+MARKUP_START = re.compile(r'<(?:!--|[/!?]?[A-Za-z])')
+TAG_TOKEN = re.compile(r'''<[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*>?''')
+TAG_NAME = re.compile(r'</?([A-Za-z][\w:-]*)')
+
+
+class HtmlContext:
+    """Segmenti [inizio, fine) di una pagina con le etichette di contesto"""
+
+    def __init__(self, html):
+        self.length = len(html)
+        self._starts = []
+        self._flags = []
+        self._tokenize(html)
+
+    def _segment(self, start, end, flags):
+        if start >= end:
+            return
+        if self._flags and self._flags[-1] == flags:
+            return  # stesso contesto del segmento precedente: si estende
+        self._starts.append(start)
+        self._flags.append(flags)
+
+    def _tokenize(self, html):
+        n = len(html)
+        pos = 0
+        link_depth = 0
+        while pos < n:
+            text_flags = LINK if link_depth else 0
+            m = MARKUP_START.search(html, pos)
+            if m is None:
+                self._segment(pos, n, text_flags)
+                break
+            start = m.start()
+            self._segment(pos, start, text_flags)
+
+            if html.startswith('<!--', start):
+                end = html.find('-->', start + 4)
+                end = n if end == -1 else end + 3
+                self._segment(start, end, text_flags | COMMENT)
+                pos = end
+                continue
+
+            end = TAG_TOKEN.match(html, start).end()
+            self._segment(start, end, text_flags | TAG)
+            pos = end
+
+            name_match = TAG_NAME.match(html, start)
+            if name_match is None:
+                continue  # <!DOCTYPE ...>, <?xml ...?>
+            name = name_match.group(1).lower()
+            closing = html[start + 1] == '/'
+
+            if name == 'a':
+                if closing:
+                    link_depth = max(0, link_depth - 1)
+                elif not html[start:end].endswith('/>'):
+                    link_depth += 1
+            elif name in RAW_TEXT_ELEMENTS and not closing:
+                flags = RAW_TEXT_ELEMENTS[name]
+                if name == 'script' and 'application/ld+json' in html[start:end].lower():
+                    flags |= JSONLD
+                close = re.compile(rf'</{name}\s*>', re.IGNORECASE).search(html, end)
+                close_start = n if close is None else close.start()
+                self._segment(end, close_start, text_flags | flags)
+                pos = close_start
+
+    def at(self, pos):
+        """Etichette del carattere in posizione `pos`"""
+        index = bisect_right(self._starts, pos) - 1
+        return self._flags[index] if index >= 0 else 0
+
+    def flags(self, start, end):
+        """Unione delle etichette dei caratteri in [start, end)"""
+        index = max(0, bisect_right(self._starts, start) - 1)
+        result = 0
+        while index < len(self._starts) and self._starts[index] < end:
+            result |= self._flags[index]
+            index += 1
+        return result
+
+    def is_text(self, start, end=None):
+        """True se [start, end) è interamente testo visibile, fuori da link esistenti"""
+        if end is None:
+            return self.at(start) == 0
+        return self.flags(start, end) == 0
@@ -0,0 +1,323 @@
+"""
+Varianti responsive delle immagini (AVIF/WebP a larghezze scalate) e <picture>.
+
+Le immagini hero (images/colposcopia-hero.jpg, ecocardiogramma-hero.jpg, ...)
+sono JPEG a piena risoluzione da centinaia di KB, serviti uguali a mobile e
+desktop. Per ogni JPEG/PNG in images/ si generano, in un pool di processi,
+varianti AVIF e WebP alle larghezze di WIDTHS (più quella originale, fino a
+MAX_WIDTH):
+
+    images/variants/<nome>-<larghezza>.<hash sorgente>.<formato>
+
+L'hash del sorgente nel nome fa da cache: se la variante esiste è già
+aggiornata. Il manifest data/image-variants.json ({sorgente: dimensioni e
+varianti}) è ciò che serve per riscrivere le pagine, senza riaprire le
+immagini:
+
+    <img src="../images/pma-hero.jpg" alt="..." width="500" height="400" loading="lazy">
+
+diventa
+
+    <picture>
+    <source type="image/avif" srcset="...-480.<h>.avif 480w, ..." sizes="...">
+    <source type="image/webp" srcset="...-480.<h>.webp 480w, ..." sizes="...">
+    <img src="../images/pma-hero.jpg" alt="..." width="500" height="400" loading="lazy" decoding="async">
+    </picture>
+
+Le <img> senza width/height ricevono le dimensioni intrinseche (niente layout
+shift); quelle senza loading diventano lazy solo se fuori dal primo viewport
+(l'immagine LCP resta eager). L'header (regione del master header) non viene
+toccato: lo scrive propagate-header.
+
+Pillow è opzionale (`pip install pillow`; AVIF con Pillow >= 11.3 o
+pillow-avif-plugin): senza, le dimensioni si leggono dagli header JPEG/PNG e
+le pagine ricevono solo width/height e lazy loading.
+"""
+
+import json
+import re
+import struct
+from io import BytesIO
+from pathlib import Path
+
+from bioclinic import headerregion, writes
+from bioclinic.buildcache import hash_bytes
+from bioclinic.criticalcss import fold_offset
+from bioclinic.fingerprint import find_pages
+from bioclinic.parallel import run_sharded
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+SOURCE_DIR = 'images'
+VARIANT_DIR = 'images/variants'
+MANIFEST_RELPATH = 'data/image-variants.json'
+MANIFEST_VERSION = 1
+SOURCE_SUFFIXES = ('.jpg', '.jpeg', '.png')
+
+WIDTHS = (480, 768, 1024)
+MAX_WIDTH = 1600
+QUALITY = {'avif': 50, 'webp': 78}
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+
+_IMG = re.compile(r'<img\b[^>]*>', re.I)
+_PICTURE = re.compile(r'<picture>\s*(?:<source\b[^>]*>\s*)*(<img\b[^>]*>)\s*</picture>', re.I)
+_ATTRIBUTE = re.compile(r'\s([\w-]+)\s*=\s*(["\'])(.*?)\2', re.S)
+_LOCAL_SRC = re.compile(r'^((?:\.\./)*|/)?(images/[^/"\'?#]+\.(?:jpe?g|png))$', re.I)
+
+
+def formats():
+    """Formati delle varianti producibili in questo ambiente (AVIF prima, se supportato)"""
+    if Image is None:
+        return ()
+    extensions = Image.registered_extensions()
+    return tuple(fmt for fmt in ('avif', 'webp') if f'.{fmt}' in extensions)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SORGENTI E VARIANTI
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def find_sources(site_dir):
+    """Immagini raster in images/ (path relativi, ordinati)"""
+    folder = Path(site_dir) / SOURCE_DIR
+    return sorted(f"{SOURCE_DIR}/{p.name}" for p in folder.glob('*')
+                  if p.is_file() and p.suffix.lower() in SOURCE_SUFFIXES)
+
+
+def image_size(data):
+    """(larghezza, altezza) dall'header JPEG o PNG, None se non riconosciuto"""
+    if data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+        return struct.unpack('>II', data[16:24])
+    if data[:2] != b'\xff\xd8':
+        return None
+    pos = 2
+    while pos + 9 < len(data):
+        if data[pos] != 0xFF:
+            pos += 1
+            continue
+        marker = data[pos + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+            pos += 1 if marker == 0xFF else 2
+            continue
+        length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        # SOF0..SOF15, esclusi DHT (C4), JPG (C8) e DAC (CC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
+
+
+def variant_widths(width):
+    """Larghezze delle varianti per un'immagine larga `width`"""
+    widths = [w for w in WIDTHS if w < width]
+    widths.append(min(width, MAX_WIDTH))
+    return sorted(set(widths))
+
+
+def variant_name(rel, width, digest, fmt):
+    return f"{VARIANT_DIR}/{Path(rel).stem}-{width}.{digest}.{fmt}"
+
+
+def describe_source(rel, data):
+    """Voce del manifest per un sorgente (varianti previste, non ancora scritte)"""
+    size = image_size(data)
+    if Image is not None:
+        with Image.open(BytesIO(data)) as image:
+            size = ImageOps.exif_transpose(image).size
+    if size is None:
+        return None
+    width, height = size
+    digest = hash_bytes(data)
+    return {
+        'hash': digest,
+        'width': width,
+        'height': height,
+        'variants': {fmt: [[w, variant_name(rel, w, digest, fmt)] for w in variant_widths(width)]
+                     for fmt in formats()},
+    }
+
+
+def encode_variants(path, missing):
+    """Codifica le varianti mancanti di un'immagine: [(path relativo, bytes)]
+
+    `missing` è [(formato, larghezza, path relativo)]; gira nei worker del pool.
+    """
+    results = []
+    with Image.open(path) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+        for fmt, width, rel in missing:
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            buffer = BytesIO()
+            if fmt == 'webp':
+                resized.save(buffer, 'WEBP', quality=QUALITY[fmt], method=6)
+            else:
+                resized.save(buffer, 'AVIF', quality=QUALITY[fmt])
+            results.append((rel, buffer.getvalue()))
+    return results
+
+
+def _encode_job(job):
+    path, missing = job
+    return encode_variants(path, missing)
+
+
+def plan_variants(site_dir, manifest, exists):
+    """Job di codifica [(path sorgente, varianti mancanti)] per il pool"""
+    site_dir = Path(site_dir)
+    jobs = []
+    for rel, entry in manifest.items():
+        missing = [(fmt, width, variant) for fmt, variants in entry['variants'].items()
+                   for width, variant in variants if not exists(variant)]
+        if missing:
+            jobs.append((str(site_dir / rel), missing))
+    return jobs
+
+
+def encode_all(jobs, workers=1):
+    """Esegue i job nel pool; ritorna {path relativo: bytes}"""
+    files = {}
+    for results in run_sharded(_encode_job, jobs, workers):
+        files.update(results)
+    return files
+
+
+def stale_variants(site_dir, manifest):
+    """Varianti su disco non più nel manifest (path relativi)"""
+    folder = Path(site_dir) / VARIANT_DIR
+    if not folder.is_dir():
+        return []
+    keep = {variant for entry in manifest.values()
+            for variants in entry['variants'].values() for _, variant in variants}
+    return sorted(rel for rel in (f"{VARIANT_DIR}/{p.name}" for p in folder.iterdir() if p.is_file())
+                  if rel not in keep)
+
+
+def dump_manifest(manifest):
+    return json.dumps({'version': MANIFEST_VERSION, 'images': manifest}, ensure_ascii=False, indent=2) + '\n'
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RISCRITTURA DELLE PAGINE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _attributes(tag):
+    return {name.lower(): value for name, _, value in _ATTRIBUTE.findall(tag)}
+
+
+def _set_attribute(tag, name, value):
+    """<img ...> con un attributo in più (prima della chiusura)"""
+    end = len(tag) - (2 if tag.endswith('/>') else 1)
+    return f'{tag[:end].rstrip()} {name}="{value}"{tag[end:]}'
+
+
+def _sizes(attrs):
+    """sizes: larghezza dichiarata in px se c'è, altrimenti tutta la viewport"""
+    width = attrs.get('width', '')
+    if width.isdigit():
+        return f"(max-width: {width}px) 100vw, {width}px"
+    return "100vw"
+
+
+def _srcset(variants, prefix):
+    return ', '.join(f"{prefix}{variant} {width}w" for width, variant in variants)
+
+
+def render_image(tag, entry, prefix, below_fold):
+    """<img> con dimensioni, lazy loading e (se ci sono varianti) <picture>"""
+    attrs = _attributes(tag)
+    if 'width' not in attrs and 'height' not in attrs:
+        tag = _set_attribute(tag, 'width', entry['width'])
+        tag = _set_attribute(tag, 'height', entry['height'])
+    elif 'height' not in attrs and attrs['width'].isdigit():
+        tag = _set_attribute(tag, 'height', round(int(attrs['width']) * entry['height'] / entry['width']))
+    if 'loading' not in attrs and below_fold:
+        tag = _set_attribute(tag, 'loading', 'lazy')
+    if 'decoding' not in attrs:
+        tag = _set_attribute(tag, 'decoding', 'async')
+    variants = {fmt: v for fmt, v in entry['variants'].items() if v}
+    if not variants or 'srcset' in attrs:
+        return tag
+    sizes = _sizes(attrs)
+    sources = [f'<source type="{MIME_TYPES[fmt]}" srcset="{_srcset(v, prefix)}" sizes="{sizes}">'
+               for fmt, v in variants.items()]
+    return '\n'.join(['<picture>', *sources, tag, '</picture>'])
+
+
+def rewrite_page(html, manifest):
+    """<img> locali con varianti/dimensioni; ritorna (html, immagini riscritte)"""
+    # Le <picture> generate in precedenza tornano <img> e vengono rigenerate
+    html = _PICTURE.sub(lambda m: m.group(1), html)
+    region = headerregion.find_region(html)
+    fold = fold_offset(html)
+    rewritten = 0
+    parts = []
+    last = 0
+    for match in _IMG.finditer(html):
+        if region and region[0] <= match.start() < region[1]:
+            continue
+        attrs = _attributes(match.group(0))
+        src = _LOCAL_SRC.match(attrs.get('src', ''))
+        entry = manifest.get(src.group(2)) if src else None
+        if entry is None:
+            continue
+        tag = render_image(match.group(0), entry, src.group(1) or '', match.start() > fold)
+        parts.append(html[last:match.start()])
+        parts.append(tag)
+        last = match.end()
+        rewritten += 1
+    parts.append(html[last:])
+    return ''.join(parts), rewritten
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SCRITTURA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def build_manifest(site_dir, read_bytes):
+    """{sorgente: voce} per le immagini in images/; `read_bytes(rel)` legge il sorgente"""
+    manifest = {}
+    for rel in find_sources(site_dir):
+        entry = describe_source(rel, read_bytes(rel))
+        if entry is not None:
+            manifest[rel] = entry
+    return manifest
+
+
+def write_images(site_dir, workers=1):
+    """Scrive varianti mancanti, pagine e manifest, cancella le varianti obsolete
+
+    Ritorna (manifest, varianti nuove, obsolete, pagine riscritte).
+    """
+    site_dir = Path(site_dir)
+    manifest = build_manifest(site_dir, lambda rel: (site_dir / rel).read_bytes())
+    jobs = plan_variants(site_dir, manifest, lambda rel: (site_dir / rel).exists())
+    written = [variant for _, missing in jobs for _, _, variant in missing]
+    stale = stale_variants(site_dir, manifest)
+
+    pages = []
+    for rel in find_pages(site_dir):
+        path = site_dir / rel
+        html = path.read_bytes().decode('utf-8')
+        new_html, _ = rewrite_page(html, manifest)
+        if new_html != html:
+            pages.append(rel)
+            writes.write_text(path, new_html)
+
+    # Con --dry-run le varianti mancanti vengono solo elencate, non codificate
+    if writes.dry_run():
+        for rel in written:
+            print(f"  🔍 {rel} (variante da codificare)")
+    else:
+        for rel, data in encode_all(jobs, workers).items():
+            writes.write_bytes(site_dir / rel, data)
+    for rel in stale:
+        writes.remove(site_dir / rel)
+    writes.write_text(site_dir / MANIFEST_RELPATH, dump_manifest(manifest))
+    return manifest, written, stale, pages
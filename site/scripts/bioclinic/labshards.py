@@ -0,0 +1,238 @@
+"""
+Shard JSON del listino di laboratorio per js/database.js.
+
+Il listino (data/listino-processed.json, 1136 esami) non è più incluso nello
+script: js/database.js resta un modulo core (pacchetti, configurazione,
+etichette dei sintomi, medici, procedure) e gli esami vengono scaricati su
+richiesta da file JSON con l'hash del contenuto nel nome:
+
+    js/db/categoria-<slug>.<hash>.json   esami di una categoria
+    js/db/sintomo-<slug>.<hash>.json     esami associati a un sintomo
+    js/db/indici.<hash>.json             indici precalcolati (vedi build_lab_index)
+    js/db/fuzzy.<hash>.json              indice a trigrammi per le parole con errori
+
+Il manifest (file per categoria/sintomo/indici/fuzzy, statistiche, ordine originale
+del listino) è scritto nel core tra i marcatori MANIFEST_START/MANIFEST_END.
+Un file cambia nome solo se cambia il suo contenuto, quindi la cache
+immutable di /js/* in _headers resta valida.
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+from bioclinic import fuzzy, writes
+from bioclinic.buildcache import hash_bytes
+
+LISTINO_RELPATH = 'data/listino-processed.json'
+SYNONYMS_RELPATH = 'data/search/synonyms.json'
+CORE_RELPATH = 'js/database.js'
+SHARD_DIR = 'js/db'
+
+MANIFEST_START = '  // <lab-shards> generato da scripts/build-lab-shards.py: non modificare a mano'
+MANIFEST_END = '  // </lab-shards>'
+
+# Alfabeto per l'ordine del listino: un carattere = indice della categoria
+ORDER_ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+_COMBINING = re.compile('[\u0300-\u036f]')
+_NON_SLUG = re.compile(r'[^a-z0-9]+')
+_SYMPTOM_LABELS = re.compile(r'const sintomiLabels = (\{.*?\});', re.S)
+
+
+def shard_slug(name):
+    """'Vitamina/Minerali' -> 'vitamina-minerali', 'controllo_reni' -> 'controllo-reni'"""
+    text = _COMBINING.sub('', unicodedata.normalize('NFD', name.lower()))
+    return _NON_SLUG.sub('-', text).strip('-')
+
+
+def dump_shard(entries):
+    # Compatto: viene scaricato dal browser
+    return json.dumps(entries, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def _group(listino, keys_of):
+    """{chiave: [esami]} nell'ordine di prima apparizione (come gli indici in database.js)"""
+    groups = {}
+    for entry in listino:
+        for key in keys_of(entry):
+            groups.setdefault(key, []).append(entry)
+    return groups
+
+
+def _shard_files(kind, groups):
+    files = {}
+    names = {}
+    for key, entries in groups.items():
+        text = dump_shard(entries)
+        name = f"{kind}-{shard_slug(key)}.{hash_bytes(text)}.json"
+        if name in files:
+            raise ValueError(f"Shard duplicato per '{key}': {name}")
+        files[name] = text
+        names[key] = name
+    return names, files
+
+
+def _positions(groups, position_of):
+    return {key: [position_of[id(e)] for e in entries] for key, entries in groups.items()}
+
+
+def build_lab_index(listino, by_category, by_symptom):
+    """Indici del listino per BioClinicDB, come posizioni nel listino ricomposto
+
+    - byCategory, bySymptom, byUpsell: chiave -> posizioni degli esami
+    - tokens/postings: parole dei nomi (minuscolo, separate da spazi, come
+      calculateRelevance in database.js), ordinate, con le posizioni degli
+      esami che le contengono. Una parola della query senza spazi compare in
+      un nome solo se è contenuta in uno dei suoi token, quindi search()
+      valuta la rilevanza solo degli esami candidati.
+    - suffixes: i suffissi dei token in ordine, come coppie piatte
+      [token, offset, ...]; il browser trova i token che contengono una
+      parola con una ricerca binaria, senza ordinare nulla al caricamento.
+    """
+    position_of = {id(e): i for i, e in enumerate(listino)}
+    by_upsell = _group(listino, lambda e: [e['upsell']] if e.get('upsell') else [])
+    postings = {}
+    for i, entry in enumerate(listino):
+        for token in entry['nome'].lower().split():
+            positions = postings.setdefault(token, [])
+            if not positions or positions[-1] != i:
+                positions.append(i)
+    tokens = sorted(postings)
+    return {
+        'byCategory': _positions(by_category, position_of),
+        'bySymptom': _positions(by_symptom, position_of),
+        'byUpsell': _positions(by_upsell, position_of),
+        'tokens': tokens,
+        'postings': [postings[t] for t in tokens],
+        'suffixes': _sorted_suffixes(tokens),
+    }
+
+
+def _sorted_suffixes(tokens):
+    """[token, offset, ...] dei suffissi dei token, ordinati come stringhe JavaScript
+
+    Offset e ordine sono in unità UTF-16 (confronto `<` e slice() in database.js).
+    """
+    entries = []
+    for t, token in enumerate(tokens):
+        units = token.encode('utf-16-be')
+        entries.extend((units[o:], t, o // 2) for o in range(0, len(units), 2))
+    entries.sort()
+    return [n for _, t, offset in entries for n in (t, offset)]
+
+
+def symptom_labels(core):
+    """Etichette dei sintomi (sintomiLabels) lette dal core js/database.js"""
+    match = _SYMPTOM_LABELS.search(core)
+    return json.loads(match.group(1)) if match else {}
+
+
+def fuzzy_vocabulary(core, synonyms_data=None):
+    """Testi oltre ai nomi degli esami da cui prendere le parole dell'indice fuzzy"""
+    texts = list(symptom_labels(core).values())
+    synonyms_data = synonyms_data or {}
+    for data in synonyms_data.get('synonyms', {}).values():
+        texts.append(data.get('primary', ''))
+        texts.extend(data.get('alternatives', []))
+    texts.extend(synonyms_data.get('common_misspellings', {}).values())
+    return texts
+
+
+def build_fuzzy_index(listino, extra_texts=()):
+    """Indice fuzzy: parole dei nomi e delle categorie (frequenza = esami) + testi extra"""
+    index = fuzzy.FuzzyIndex()
+    for entry in listino:
+        for word in dict.fromkeys(fuzzy.words(entry['nome']) + fuzzy.words(entry['cat'])):
+            index.add(word)
+    for text in extra_texts:
+        for word in fuzzy.words(text):
+            index.add(word, count=0)
+    return index
+
+
+def build_lab_shards(listino, extra_texts=()):
+    """Ritorna (manifest, {percorso relativo al sito: contenuto}) per il listino"""
+    by_category = _group(listino, lambda e: [e['cat']])
+    by_symptom = _group(listino, lambda e: e.get('sintomi') or [])
+    if len(by_category) > len(ORDER_ALPHABET):
+        raise ValueError(f"Troppe categorie per l'ordine del listino: {len(by_category)}")
+
+    category_files, files = _shard_files('categoria', by_category)
+    symptom_files, symptom_shards = _shard_files('sintomo', by_symptom)
+    files.update(symptom_shards)
+    index_text = dump_shard(build_lab_index(listino, by_category, by_symptom))
+    index_file = f"indici.{hash_bytes(index_text)}.json"
+    files[index_file] = index_text
+    fuzzy_text = dump_shard(build_fuzzy_index(listino, extra_texts).to_json())
+    fuzzy_file = f"fuzzy.{hash_bytes(fuzzy_text)}.json"
+    files[fuzzy_file] = fuzzy_text
+
+    category_index = {cat: i for i, cat in enumerate(by_category)}
+    prices = [e['prezzo'] for e in listino]
+    manifest = {
+        'categorie': category_files,
+        'sintomi': symptom_files,
+        'indici': index_file,
+        'fuzzy': fuzzy_file,
+        # Per ricomporre il listino nell'ordine originale dagli shard per categoria
+        'ordine': ''.join(ORDER_ALPHABET[category_index[e['cat']]] for e in listino),
+        'stats': {
+            'totaleEsami': len(listino),
+            'categorie': len(by_category),
+            'sintomiMappati': len(by_symptom),
+            'esamiConUpsell': sum(1 for e in listino if e.get('upsell')),
+            'prezzoMin': min(prices) if prices else 0,
+            'prezzoMax': max(prices) if prices else 0,
+        },
+    }
+    return manifest, {f"{SHARD_DIR}/{name}": text for name, text in files.items()}
+
+
+def render_manifest(manifest):
+    """Blocco JS con il manifest, marcatori compresi"""
+    body = json.dumps(manifest, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+    return f"{MANIFEST_START}\n  const shards = {body};\n{MANIFEST_END}"
+
+
+def splice_manifest(core, manifest):
+    """Sostituisce il blocco del manifest nel core; ValueError se mancano i marcatori"""
+    start = core.find(MANIFEST_START)
+    end = core.find(MANIFEST_END, start)
+    if start == -1 or end == -1:
+        raise ValueError(f"Marcatori del manifest non trovati in {CORE_RELPATH}")
+    return core[:start] + render_manifest(manifest) + core[end + len(MANIFEST_END):]
+
+
+def stale_shards(site_dir, keep):
+    """Shard su disco non più referenziati dal manifest (percorsi relativi al sito)"""
+    shard_dir = Path(site_dir) / SHARD_DIR
+    if not shard_dir.is_dir():
+        return []
+    keep = set(keep)
+    return sorted(rel for rel in (f"{SHARD_DIR}/{p.name}" for p in shard_dir.glob('*.json'))
+                  if rel not in keep)
+
+
+def write_lab_shards(site_dir, listino):
+    """Scrive shard nuovi e manifest, cancella gli obsoleti; ritorna (manifest, nuovi, obsoleti, core cambiato)"""
+    site_dir = Path(site_dir)
+    core_path = site_dir / CORE_RELPATH
+    core = core_path.read_text(encoding='utf-8')
+    synonyms_data = json.loads((site_dir / SYNONYMS_RELPATH).read_text(encoding='utf-8'))
+    manifest, files = build_lab_shards(listino, fuzzy_vocabulary(core, synonyms_data))
+    new_core = splice_manifest(core, manifest)
+    stale = stale_shards(site_dir, files)
+
+    written = 0
+    for rel, text in files.items():
+        path = site_dir / rel
+        if path.exists():
+            continue  # nome = hash del contenuto: se esiste è già aggiornato
+        written += 1
+        writes.write_text(path, text)
+    writes.write_text(core_path, new_core)
+    for rel in stale:
+        writes.remove(site_dir / rel)
+    return manifest, written, stale, new_core != core
@@ -0,0 +1,295 @@
+"""
+Import del listino di laboratorio da data/listino-laboratorio.xlsx.
+
+Pipeline riproducibile xlsx -> data/listino-processed.json (e da lì gli shard
+di js/database.js, vedi labshards.py). Ogni riga del foglio passa per tre
+stage, ciascuno definito da una tabella di regole a parole chiave:
+
+    categoria   prima regola di CATEGORY_RULES che compare nel nome
+    sintomi     tutti i sintomi di SYMPTOM_RULES con almeno una parola chiave
+    servizi     upsell, preparazione, tempi di referto, flag urgente
+
+Il risultato di ogni stage è memoizzato per (hash della riga, hash delle
+regole dello stage) in data/cache/listino-stages.json: reimportando un
+listino in cui cambiano 10 prezzi si ricalcolano solo quelle 10 righe, e
+modificando le regole di uno stage si ricalcola solo quello stage.
+
+Il foglio si legge con la sola libreria standard (un .xlsx è uno zip di XML),
+senza dipendere da openpyxl.
+"""
+
+import json
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from io import BytesIO
+
+from bioclinic.buildcache import hash_record
+
+XLSX_RELPATH = 'data/listino-laboratorio.xlsx'
+LISTINO_RELPATH = 'data/listino-processed.json'
+STAGE_CACHE_RELPATH = 'data/cache/listino-stages.json'
+STAGE_CACHE_VERSION = 1
+
+# Intestazioni delle colonne usate
+NAME_HEADER = 'Articolo'
+PRICE_HEADER = 'Prezzo'
+
+_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_COLUMN = re.compile(r'[A-Z]+')
+_NON_ID = re.compile(r'[^a-z0-9]+')
+MAX_ID_LENGTH = 50
+
+# Le regole sono in ordine: per categoria, upsell, preparazione e referto vince
+# la prima che ha una parola chiave contenuta nel nome (minuscolo)
+CATEGORY_RULES = [
+    ('Tiroide', ['tsh', 'ft3', 'ft4', 'tiroxina', 'tireoglobulina', 'calcitonina', 'tiroide']),
+    ('Ematologia', ['emocrom', 'ferritin', 'ferro', 'emoglobin', 'transferrin', 'sideremia',
+                    'eritrocit', 'piastrin']),
+    ('Epatico', ['alt', 'ast', 'bilirubin', 'albumin', 'fosfatasi alcalina', 'ldh', 'epatite']),
+    ('Renale', ['urine', 'creatin', 'azot', 'acido urico', 'cistatina', 'filtrazione', 'urea']),
+    ('Coagulazione', ['pt', 'fibrinogeno', 'dimero', 'trombina']),
+    ('Ormoni', ['estradiolo', 'estriolo', 'progesteron', 'hcg', 'cortisolo', 'androstenedione',
+                'dhea', 'testosteron', 'prolattin', 'fsh', '(lh)']),
+    ('Glicemia/Diabete', ['glucosio', 'insulin', 'ogtt', 'fruttosamina', 'glicat']),
+    ('Lipidico', ['colesterolo', 'trigliceridi', 'ldl', 'hdl', 'lipoprotein']),
+    ('Cardiologico', ['bnp', 'ck-mb', 'ckmb', 'mioglobin', 'omocistein', 'troponin']),
+    ('Tumore/Markers', ['psa', 'cea', 'carboidratico', 'afp', 'alfafetoproteina', 'marker', 'brca1']),
+    ('Infiammazione', ['pcr', 'ves', 'complemento', 'interleuchina', 'tnf']),
+    ('Vitamina/Minerali', ['vitamina', 'folico', 'folati', 'rame', 'selenio', 'zinco']),
+    ('Elettroliti', ['sodio', 'potassio', 'cloro', 'calcio', 'fosforo', 'magnesio']),
+    ('Urinario', ['urinario']),
+    ('Autoimmunità', ['ige', 'igg', 'igm', 'iga', 'anticorp', 'ana', 'ena', 'reuma']),
+    ('Tossicologia', ['alcol', 'cadmio']),
+    ('Fecale', ['feci', 'fecale', 'parassiti']),
+    ('Infettivologia', ['tampone', 'hiv', 'hcv', 'hbsag', 'hsv', 'helicobacter', 'citomegalovirus',
+                        'epstein']),
+    ('Genetica/Molecolare', ['dna', 'hla', 'mutazion', 'chlamydia']),
+    ('Allergologia', ['graminacee', 'allerg']),
+]
+DEFAULT_CATEGORY = 'Altro'
+
+# Chiavi di sintomiLabels in js/database.js, nell'ordine in cui finiscono in `sintomi`
+SYMPTOM_RULES = [
+    ('gravidanza', ['urine', 'rosolia', 'toxo', 'hiv', 'hbsag', 'hcg', 'glucosio', 'emocrom', 'tsh']),
+    ('stanchezza', ['ferritin', 'emocrom', 'tsh', 'ft3', 'ft4', 'vitamina b12', 'vitamina d', 'folic',
+                    'glucosio', 'cortisolo', 'sideremia']),
+    ('aumento_peso', ['tsh', 'ft3', 'ft4', 'glucosio', 'insulin', 'glicata', 'colesterolo',
+                      'trigliceridi', 'cortisolo']),
+    ('dimagrimento', ['tsh', 'ft3', 'ft4', 'glucosio', 'emocrom', 'ves', 'cea', 'afp']),
+    ('dolori_articolari', ['ana', 'reuma', 'pcr', 'ves', 'acido urico', 'vitamina d', 'vanadio',
+                           'tiocianati']),
+    ('perdita_capelli', ['tsh', 'ft3', 'ft4', 'ferritin', 'sideremia', 'zinco', 'vitamina d',
+                         'testosteron', 'cortisolo']),
+    ('menopausa', ['tsh', 'fsh', '(lh)', 'estradiolo', 'colesterolo', 'calcio', 'vitamina d']),
+    ('controllo_fegato', ['albumin', 'bilirubin', 'fosfatasi', 'hcv', 'hbsag']),
+    ('controllo_cuore', ['colesterolo', 'trigliceridi', 'ldl', 'bnp', 'troponin', 'omocistein', 'pcr']),
+    ('problemi_digestivi', ['helicobacter', 'amilasi', 'lipasi', 'bilirubin', 'calprotectina',
+                            'elastasi', 'celiachia', 'celiaca']),
+    ('controllo_prostata', ['psa', 'testosteron']),
+    ('anemia', ['ferritin', 'emocrom', 'sideremia', 'transferrin', 'vitamina b12', 'folic']),
+    ('insonnia', ['tsh', 'cortisolo', 'magnesio', 'ferritin']),
+    ('infertilita', ['tsh', 'fsh', '(lh)', 'estradiolo', 'progesteron', 'prolattin', 'testosteron',
+                     'amh', 'spermiogramma']),
+    ('allergie', ['ige', 'eosinofil', 'rast']),
+    ('palpitazioni', ['tsh', 'ft3', 'ft4', 'bnp', 'troponin', 'emocrom', 'magnesio', 'potassio',
+                      'calcio']),
+    ('ansia_stress', ['tsh', 'cortisolo', 'magnesio', 'vitamina b12', 'vitamina d']),
+    ('infezioni_frequenti', ['igg', 'igm', 'iga', 'ves', 'pcr', 'emocrom', 'vitamina d']),
+    ('controllo_reni', ['urine', 'creatin', 'azot', 'filtrazione', 'acido urico', 'microalbumin']),
+]
+
+# Chiavi di `pacchetti` in js/database.js
+UPSELL_RULES = [
+    ('base', ['emocrom', 'glucosio', 'colesterolo', 'urine']),
+    ('pregravidanza', ['hcv', 'hiv', 'rosolia', 'toxo', 'hbsag']),
+    ('tiroide-plus', ['tireoglobulina', 'calcitonina']),
+    ('donna-under40', ['tsh', 'ferritin', 'sideremia', 'folic', 'vitamina d']),
+    ('donna-over40', ['estradiolo', 'calcio', 'paratormone', 'ft3', 'ft4']),
+    ('uomo-under40', ['psa', 'testosteron']),
+    ('renale', ['creatin', 'azot']),
+    ('epatico', ['bilirubin']),
+    ('cardio', ['bnp', 'troponin', 'ldl', 'trigliceridi']),
+]
+
+PREP_RULES = [
+    ('Raccolta urine 24 ore', ['urine 24', '24 ore']),
+    ('Urine del mattino, mitto intermedio', ['urine']),
+    ('Campione feci fresco', ['feci', 'fecale']),
+    ('A digiuno da 12 ore', ['colesterolo', 'trigliceridi', 'lipid']),
+    ('A digiuno da 8-12 ore', ['glucosio', 'ogtt']),
+    ('Prelievo mattutino ore 8-9', ['cortisolo']),
+    ('A riposo, evitare stress', ['prolattina']),
+    ('Astinenza 3-5 giorni', ['spermiogramma']),
+]
+
+REFERTO_RULES = [
+    ('urgente', ['d-dimero', 'troponin']),
+    ('24h', ['urine']),
+    ('7-15gg', ['hla', 'chlamydia', 'analisi genetica', 'analisi molecolare', 'citogenetica',
+                'intolleranza genetica']),
+    ('3-5gg', ['vitamina', 'he4']),
+    ('48h', ['tsh', 'colesterolo', 'ferritin']),
+    ('24h', ['emocrom', 'glucosio', 'creatin']),
+]
+DEFAULT_REFERTO = '48-72h'
+
+# Esami refertabili in giornata (come config.urgenza in js/database.js)
+URGENT_KEYWORDS = ['hcg', 'd-dimero', 'procalcitonina', 'troponin']
+
+
+def _first_match(rules, name, default=None):
+    for value, keywords in rules:
+        if any(keyword in name for keyword in keywords):
+            return value
+    return default
+
+
+def categorize(row):
+    return _first_match(CATEGORY_RULES, row['nome'].lower(), DEFAULT_CATEGORY)
+
+
+def tag_symptoms(row):
+    name = row['nome'].lower()
+    return [symptom for symptom, keywords in SYMPTOM_RULES
+            if any(keyword in name for keyword in keywords)]
+
+
+def map_services(row):
+    """Campi opzionali dell'esame: referto sempre, upsell/prep/urgente se applicabili"""
+    name = row['nome'].lower()
+    services = {'referto': _first_match(REFERTO_RULES, name, DEFAULT_REFERTO)}
+    upsell = _first_match(UPSELL_RULES, name)
+    if upsell:
+        services['upsell'] = upsell
+    prep = _first_match(PREP_RULES, name)
+    if prep:
+        services['prep'] = prep
+    if any(keyword in name for keyword in URGENT_KEYWORDS):
+        services['urgente'] = True
+    return services
+
+
+# (nome, funzione, regole): l'hash delle regole fa parte della chiave di cache
+STAGES = [
+    ('categoria', categorize, [CATEGORY_RULES, DEFAULT_CATEGORY]),
+    ('sintomi', tag_symptoms, [SYMPTOM_RULES]),
+    ('servizi', map_services, [REFERTO_RULES, DEFAULT_REFERTO, UPSELL_RULES, PREP_RULES,
+                               URGENT_KEYWORDS]),
+]
+
+
+def make_id(name):
+    """'1-2 CICLOESANDIOLO URINE F.T.' -> '1-2-cicloesandiolo-urine-f-t' (max 50 caratteri)"""
+    return _NON_ID.sub('-', name.lower()).strip('-')[:MAX_ID_LENGTH]
+
+
+def read_xlsx_rows(data):
+    """Righe del primo foglio di un .xlsx (bytes) come {intestazione: valore}"""
+    with zipfile.ZipFile(BytesIO(data)) as archive:
+        names = set(archive.namelist())
+        shared = []
+        if 'xl/sharedStrings.xml' in names:
+            root = ET.fromstring(archive.read('xl/sharedStrings.xml'))
+            shared = [''.join(t.text or '' for t in si.iter(f'{_NS}t'))
+                      for si in root.findall(f'{_NS}si')]
+        sheet = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+    rows = []
+    for row in sheet.iter(f'{_NS}row'):
+        cells = {}
+        for cell in row.findall(f'{_NS}c'):
+            value = cell.find(f'{_NS}v')
+            if value is None:
+                inline = cell.find(f'{_NS}is')
+                if inline is None:
+                    continue
+                text = ''.join(t.text or '' for t in inline.iter(f'{_NS}t'))
+            elif cell.get('t') == 's':
+                text = shared[int(value.text)]
+            else:
+                text = value.text or ''
+            cells[_COLUMN.match(cell.get('r')).group()] = text
+        rows.append(cells)
+    if not rows:
+        return []
+
+    header = {column: title.strip() for column, title in rows[0].items()}
+    return [{header[c]: v for c, v in cells.items() if c in header} for cells in rows[1:]]
+
+
+def parse_rows(data):
+    """Righe del listino normalizzate ({'nome', 'prezzo'}); salta quelle senza nome o prezzo"""
+    rows = []
+    for cells in read_xlsx_rows(data):
+        name = (cells.get(NAME_HEADER) or '').strip()
+        price = (cells.get(PRICE_HEADER) or '').strip()
+        if not name or not price:
+            continue
+        try:
+            rows.append({'nome': cells[NAME_HEADER], 'prezzo': float(price)})
+        except ValueError:
+            raise ValueError(f"Prezzo non valido per '{name}': {price!r}")
+    return rows
+
+
+class StageCache:
+    """Risultati degli stage per (hash riga, hash regole), persistiti in JSON"""
+
+    def __init__(self, text=None):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._used = {}
+        if text:
+            try:
+                data = json.loads(text)
+                if data.get('version') == STAGE_CACHE_VERSION:
+                    self.entries = data.get('stages', {})
+            except json.JSONDecodeError:
+                # Cache corrotta: si ricalcola tutto
+                self.entries = {}
+
+    def run(self, stage, rules_hash, row_hash, func, row):
+        key = f"{rules_hash}:{row_hash}"
+        cached = self.entries.get(stage, {})
+        if key in cached:
+            result = cached[key]
+            self.hits += 1
+        else:
+            result = func(row)
+            self.misses += 1
+        self._used.setdefault(stage, {})[key] = result
+        return result
+
+    def dumps(self):
+        # Solo le voci usate da questo import: la cache non cresce a ogni revisione
+        stages = {stage: dict(sorted(entries.items())) for stage, entries in self._used.items()}
+        return json.dumps({'version': STAGE_CACHE_VERSION, 'stages': stages},
+                          ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def build_listino(rows, cache=None):
+    """Esami elaborati dalle righe del foglio, nell'ordine del foglio"""
+    cache = cache or StageCache()
+    rules_hashes = {name: hash_record(rules) for name, _, rules in STAGES}
+    listino = []
+    for row in rows:
+        row_hash = hash_record(row)
+        results = {name: cache.run(name, rules_hashes[name], row_hash, func, row)
+                   for name, func, _ in STAGES}
+        entry = {
+            'id': make_id(row['nome']),
+            'nome': row['nome'],
+            'prezzo': row['prezzo'],
+            'cat': results['categoria'],
+            'sintomi': results['sintomi'],
+        }
+        entry.update(results['servizi'])
+        listino.append(entry)
+    return listino
+
+
+def dump_listino(listino):
+    # Stesso formato del file storico (indentato, senza newline finale)
+    return json.dumps(listino, ensure_ascii=False, indent=2)
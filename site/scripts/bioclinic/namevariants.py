@@ -0,0 +1,257 @@
+"""
+Indice compilato delle varianti dei nomi dei medici.
+
+Tutti gli script che riconoscono nomi di medici (autolinker, fix delle card,
+physician-linker.js lato client) leggono lo stesso artefatto invece di
+ricostruire ciascuno le proprie tabelle da physicians-complete.json:
+
+    data/entities/physician-name-index.json
+
+Ogni variante ha il testo, la chiave normalizzata, lo slug, la forma
+('full_name', 'title', 'name', 'reversed', 'surname') e il flag `ambiguous`
+se la stessa chiave appartiene a più medici (es. "Dott. Dessole").
+Le varianti sono ordinate dalla più lunga alla più corta.
+
+L'indice si rigenera con `python3 scripts/build-name-index.py` o con lo
+stage `name-index` di scripts/build.py; load_name_index lo ricompila da sé
+se physicians-complete.json è cambiato (source_hash).
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+from bioclinic import writes
+from bioclinic.buildcache import hash_bytes
+
+INDEX_VERSION = 1
+INDEX_RELPATH = Path('data') / 'entities' / 'physician-name-index.json'
+SOURCE_RELPATH = Path('data') / 'entities' / 'physicians-complete.json'
+
+# Titoli con cui un nome può comparire nelle pagine
+TITLE_FORMS = [
+    'Dott.', 'Dott.ssa', 'Dottssa', 'Dottoressa', 'Dottor',
+    'Dr.', 'Dr', 'Dr.ssa',
+    'Prof.', 'Prof', 'Professor', 'Professore',
+]
+
+# Titoli per la forma solo-cognome ("Dott. Uras")
+SURNAME_TITLE_FORMS = ['Dott.', 'Dott.ssa', 'Dr.', 'Prof.']
+
+# Forme in ordine di priorità (se due forme producono lo stesso testo vince la prima)
+FORMS = ['full_name', 'title', 'name', 'reversed', 'surname']
+
+# Varianti più corte di così generano troppi falsi positivi
+MIN_VARIANT_LENGTH = 6
+
+PHYSICIAN_FIELDS = ['id', 'slug', 'title', 'name', 'full_name', 'job_title']
+
+TITLE_PREFIX = re.compile(
+    r'^(?:' + '|'.join(re.escape(t) for t in sorted(TITLE_FORMS, key=len, reverse=True)) + r')\s+')
+
+
+def normalize_name(text):
+    """Chiave di confronto: NFC, spazi compattati, minuscolo (uguale in physician-linker.js)"""
+    return ' '.join(unicodedata.normalize('NFC', text).split()).lower()
+
+
+def _physician_variants(physician):
+    """(forma, testo) di tutte le varianti di un medico"""
+    name = physician.get('name', '')
+    full_name = physician.get('full_name', '')
+    parts = name.split()
+
+    yield 'full_name', full_name
+    for title in TITLE_FORMS:
+        yield 'title', f"{title} {name}"
+    yield 'name', name
+    if len(parts) >= 2:
+        yield 'reversed', f"{' '.join(parts[1:])} {parts[0]}"
+        surname = ' '.join(parts[1:])
+        for title in SURNAME_TITLE_FORMS:
+            yield 'surname', f"{title} {surname}"
+
+
+def compile_name_index(physicians, source_hash=''):
+    """Compila l'indice delle varianti da una lista di medici"""
+    by_text = {}
+    slugs_by_key = {}
+    surnames = {}
+
+    for physician in physicians:
+        slug = physician.get('slug')
+        name = physician.get('name', '')
+        if not slug or not name:
+            continue
+        parts = name.split()
+        if len(parts) >= 2:
+            surnames.setdefault(normalize_name(' '.join(parts[1:])), []).append(slug)
+
+        for form, text in _physician_variants(physician):
+            text = ' '.join(text.split())
+            if len(text) < MIN_VARIANT_LENGTH:
+                continue
+            key = normalize_name(text)
+            slugs_by_key.setdefault(key, set()).add(slug)
+            existing = by_text.get((text, slug))
+            if existing is None or FORMS.index(form) < FORMS.index(existing['form']):
+                by_text[(text, slug)] = {'text': text, 'key': key, 'slug': slug, 'form': form}
+
+    variants = sorted(by_text.values(), key=lambda v: (-len(v['text']), v['text'], v['slug']))
+    for variant in variants:
+        variant['ambiguous'] = len(slugs_by_key[variant['key']]) > 1
+
+    return {
+        'version': INDEX_VERSION,
+        'source': SOURCE_RELPATH.as_posix(),
+        'source_hash': source_hash,
+        'titles': TITLE_FORMS,
+        'physicians': {
+            p['slug']: {field: p.get(field) for field in PHYSICIAN_FIELDS}
+            for p in physicians if p.get('slug')
+        },
+        'surnames': {
+            surname: slugs for surname, slugs in sorted(surnames.items()) if len(slugs) > 1
+        },
+        'variants': variants,
+    }
+
+
+def compile_from_json(text):
+    """Compila l'indice dal contenuto di physicians-complete.json"""
+    data = json.loads(text)
+    physicians = data.get('physicians', data) if isinstance(data, dict) else data
+    return compile_name_index(physicians, source_hash=hash_bytes(text))
+
+
+def dump_name_index(index):
+    # Compatto: il file viene scaricato anche dal browser (physician-linker.js);
+    # le tabelle derivate in memoria ('_lookup') non vengono scritte
+    index = {key: value for key, value in index.items() if not key.startswith('_')}
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def write_name_index(site_dir, source_text=None):
+    """Rigenera l'artefatto da physicians-complete.json; ritorna l'indice"""
+    site_dir = Path(site_dir)
+    if source_text is None:
+        source_text = (site_dir / SOURCE_RELPATH).read_text(encoding='utf-8')
+    index = compile_from_json(source_text)
+    writes.write_text(site_dir / INDEX_RELPATH, dump_name_index(index))
+    return index
+
+
+def load_name_index(site_dir):
+    """Legge l'indice compilato, se è aggiornato rispetto a physicians-complete.json
+
+    Se manca, ha un'altra versione o source_hash non corrisponde al JSON
+    corrente (medici aggiunti o modificati) viene ricompilato e riscritto.
+    """
+    site_dir = Path(site_dir)
+    path = site_dir / INDEX_RELPATH
+    source_text = (site_dir / SOURCE_RELPATH).read_text(encoding='utf-8')
+    if path.exists():
+        try:
+            index = json.loads(path.read_text(encoding='utf-8'))
+        except json.JSONDecodeError:
+            index = {}
+        if index.get('version') == INDEX_VERSION and index.get('source_hash') == hash_bytes(source_text):
+            name_lookup(index)
+            return index
+        print(f"⚠️  {INDEX_RELPATH.as_posix()} non aggiornato: ricompilato da {SOURCE_RELPATH.as_posix()}")
+    index = write_name_index(site_dir, source_text)
+    name_lookup(index)
+    return index
+
+
+def variant_title(variant):
+    """Titolo con cui inizia una variante ('title' o 'surname'), None per le altre forme"""
+    if variant['form'] not in ('title', 'surname'):
+        return None
+    match = TITLE_PREFIX.match(variant['text'])
+    return match.group(0).strip() if match else None
+
+
+def iter_variants(index, forms, titles=None):
+    """Varianti non ambigue delle forme richieste, dalla più lunga
+
+    Con `titles` le varianti con titolo sono limitate a quei titoli (gli
+    script che ne cercavano solo alcuni non pagano una passata per ognuno
+    dei TITLE_FORMS).
+    """
+    for variant in index['variants']:
+        if variant['form'] not in forms or variant['ambiguous']:
+            continue
+        if titles is not None and variant['form'] in ('title', 'surname') \
+                and variant_title(variant) not in titles:
+            continue
+        yield variant
+
+
+def variants_by_slug(index, forms, titles=None):
+    """{slug: [testi delle varianti]} per le forme richieste, dalla più lunga"""
+    result = {}
+    for variant in iter_variants(index, forms, titles):
+        result.setdefault(variant['slug'], []).append(variant['text'])
+    return result
+
+
+def variant_pattern(texts):
+    """Regex (da compilare con re.IGNORECASE) che trova uno qualunque dei testi
+
+    Le varianti sono fuse in un trie ("Dott. Mario Rossi|Dott. Mario Rossetti"
+    → "dott\\. mario ross(?:etti|i)"): un'unica passata per pagina, e a ogni
+    posizione il motore segue un solo ramo invece di provare tutte le
+    alternative. A parità di inizio vince il testo più lungo.
+    """
+    trie = {}
+    for text in texts:
+        node = trie
+        for ch in text.lower():
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    return _trie_pattern(trie)
+
+
+def _trie_pattern(node):
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        # Fine di una variante: il resto è facoltativo (greedy, prima il più lungo)
+        return f"(?:{body})?"
+    return body
+
+
+def name_lookup(index):
+    """{chiave normalizzata: slug} delle varianti (None se la chiave è ambigua)
+
+    Costruito una volta per indice (load_name_index lo prepara al caricamento)
+    e tenuto in index['_lookup'], che dump_name_index non scrive.
+    """
+    lookup = index.get('_lookup')
+    if lookup is None:
+        lookup = {}
+        for variant in index['variants']:
+            slug = lookup.setdefault(variant['key'], variant['slug'])
+            if slug != variant['slug']:
+                lookup[variant['key']] = None
+        index['_lookup'] = lookup
+    return lookup
+
+
+def resolve_name(index, name):
+    """Slug del medico per un nome (con o senza titolo), None se sconosciuto o ambiguo"""
+    if not name:
+        return None
+    lookup = name_lookup(index)
+    keys = [normalize_name(name)]
+    stripped = TITLE_PREFIX.sub('', ' '.join(name.split()))
+    keys.append(normalize_name(stripped))
+    for key in keys:
+        slug = lookup.get(key)
+        if slug is not None:
+            return slug
+    return None
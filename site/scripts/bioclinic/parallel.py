@@ -0,0 +1,58 @@
+"""
+Esecuzione parallela multi-processo per i validatori (--jobs N).
+
+Le pagine vengono distribuite su un pool di processi; i risultati tornano
+sempre nell'ordine di input, quindi errori, warning e punteggi si fondono
+in modo deterministico indipendentemente dal numero di worker.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+def parse_jobs(argv=None, default=1):
+    """Legge --jobs N / --jobs=N / -j N dalla riga di comando.
+
+    `--jobs 0` o `--jobs auto` usano tutti i core disponibili.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    value = None
+    for i, arg in enumerate(argv):
+        if arg in ('--jobs', '-j') and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith('--jobs='):
+            value = arg.split('=', 1)[1]
+    if value is None:
+        return default
+    if value == 'auto':
+        return os.cpu_count() or 1
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise SystemExit(f"❌ Valore --jobs non valido: {value}")
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def run_sharded(func, items, jobs=1, initializer=None, initargs=()):
+    """Applica `func` a ogni elemento di `items` e ritorna la lista dei risultati.
+
+    Con jobs <= 1 (o un solo elemento) lavora nel processo corrente; altrimenti
+    usa un ProcessPoolExecutor con `jobs` worker. `initializer` viene eseguito
+    una volta per worker (es. per caricare database e schema) ed è eseguito
+    anche in modalità seriale, così `func` vede sempre lo stesso stato.
+    L'ordine dei risultati corrisponde sempre a quello di `items`.
+    """
+    items = list(items)
+    if jobs <= 1 or len(items) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(item) for item in items]
+
+    jobs = min(jobs, len(items))
+    # Blocchi abbastanza grandi da ammortizzare l'IPC, abbastanza piccoli da bilanciare
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
@@ -0,0 +1,204 @@
+"""
+Infrastruttura della pipeline di build unificata (scripts/build.py).
+
+- PageStore: tiene in memoria le pagine lette una sola volta; gli stage di
+  trasformazione lavorano sul testo e ogni file viene scritto al massimo
+  una volta, alla fine, e solo se il contenuto è cambiato.
+- PipelineState: ricorda l'hash degli input di ogni stage e l'hash finale
+  di ogni pagina, per eseguire solo gli stage (e le pagine) che cambiano.
+- load_script: importa uno script con trattino nel nome come modulo.
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+from bioclinic.buildcache import BuildManifest, hash_bytes, hash_file
+from bioclinic.writes import atomic_write
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+STATE_VERSION = 1
+STATE_RELPATH = Path('data') / 'cache' / 'pipeline-state.json'
+
+
+def load_script(filename):
+    """Importa uno script (es. 'propagate-header.py') e ritorna il modulo"""
+    path = Path(filename)
+    if not path.is_absolute():
+        path = SCRIPTS_DIR / path
+    module_name = path.stem.replace('-', '_')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registrato prima dell'esecuzione, come un import normale: pickle (i worker
+    # di --jobs N) risolve le funzioni dello script per nome del modulo
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
+
+
+class PageStore:
+    """File del sito caricati in memoria, con scrittura differita"""
+
+    def __init__(self, site_dir):
+        self.site_dir = Path(site_dir).resolve()
+        self._original = {}
+        self._current = {}
+        self._removed = set()
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def rel(self, path):
+        """Chiave relativa al sito (posix) per un path assoluto o relativo"""
+        path = Path(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.site_dir)
+        return path.as_posix()
+
+    def abspath(self, rel):
+        return self.site_dir / rel
+
+    def load(self, paths):
+        """Precarica un insieme di file (una sola lettura per file)"""
+        for path in paths:
+            self.read(path)
+
+    def read(self, path):
+        """Contenuto corrente del file (da memoria, o letto da disco la prima volta)"""
+        rel = self.rel(path)
+        if rel not in self._current:
+            file_path = self.abspath(rel)
+            if file_path.exists():
+                data = file_path.read_bytes()
+                self.bytes_read += len(data)
+                # Niente traduzione dei fine riga: i file invariati restano byte-identici
+                text = data.decode('utf-8')
+            else:
+                text = None
+            self._original[rel] = text
+            self._current[rel] = text
+        return self._current[rel]
+
+    def write(self, path, text):
+        """Aggiorna il contenuto in memoria (nessuna scrittura su disco)"""
+        rel = self.rel(path)
+        self.read(rel)
+        self._current[rel] = text
+        self._removed.discard(rel)
+
+    def write_bytes(self, path, data):
+        """Come write, per file binari (es. sitemap .gz): confrontati byte per byte"""
+        rel = self.rel(path)
+        if rel not in self._current:
+            file_path = self.abspath(rel)
+            self._original[rel] = file_path.read_bytes() if file_path.exists() else None
+        self._current[rel] = data
+        self._removed.discard(rel)
+
+    def remove(self, path):
+        """Segna un file da cancellare al flush"""
+        self._removed.add(self.rel(path))
+
+    def exists(self, path):
+        return self.read(path) is not None
+
+    def loaded(self):
+        return [rel for rel, text in self._current.items() if text is not None]
+
+    def changed(self):
+        """File il cui contenuto in memoria differisce da quello su disco (o da cancellare)"""
+        changed = {rel for rel, text in self._current.items()
+                   if text is not None and text != self._original[rel]}
+        changed.update(rel for rel in self._removed if self.abspath(rel).exists())
+        return sorted(changed)
+
+    def created(self):
+        """File nuovi (non esistenti su disco al momento del caricamento)"""
+        return sorted(rel for rel, text in self._current.items()
+                      if text is not None and self._original[rel] is None)
+
+    def flush(self):
+        """Scrive su disco i file cambiati, una volta ciascuno e in modo atomico; ritorna la lista"""
+        written = self.changed()
+        for rel in written:
+            file_path = self.abspath(rel)
+            if rel in self._removed:
+                file_path.unlink()
+                continue
+            data = self._current[rel]
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            atomic_write(file_path, data)
+            self.bytes_written += len(data)
+            self._original[rel] = self._current[rel]
+        self._removed.clear()
+        return written
+
+
+class PipelineState:
+    """Hash degli input per stage e hash delle pagine a fine build
+
+    Tiene anche i manifest dei generatori (bioclinic/buildcache.py): vengono
+    salvati insieme allo stato, cioè solo dopo che le pagine sono state
+    scritte (mai con --dry-run).
+    """
+
+    def __init__(self, site_dir):
+        self.site_dir = Path(site_dir)
+        self.path = self.site_dir / STATE_RELPATH
+        self.stages = {}
+        self.pages = {}
+        self.manifests = []
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == STATE_VERSION:
+                    self.stages = data.get('stages', {})
+                    self.pages = data.get('pages', {})
+            except (json.JSONDecodeError, OSError):
+                pass
+
+    def stage_changed(self, name, digest):
+        return self.stages.get(name) != digest
+
+    def mark_stage(self, name, digest):
+        self.stages[name] = digest
+
+    def modified_pages(self, store):
+        """Pagine caricate il cui contenuto differisce dall'ultima build (modifiche esterne)"""
+        return {rel for rel in store.loaded()
+                if self.pages.get(rel) != hash_bytes(store.read(rel))}
+
+    def generator_manifest(self):
+        """BuildManifest per un generatore, salvato da save() invece che dal generatore"""
+        manifest = BuildManifest(self.site_dir)
+        self.manifests.append(manifest)
+        return manifest
+
+    def record_pages(self, store):
+        for rel in store.loaded():
+            self.pages[rel] = hash_bytes(store.read(rel))
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': STATE_VERSION,
+                'stages': dict(sorted(self.stages.items())),
+                'pages': dict(sorted(self.pages.items())),
+            }, f, indent=2)
+            f.write('\n')
+        for manifest in self.manifests:
+            manifest.save()
+
+
+def digest_inputs(site_dir, inputs, extra=''):
+    """Hash combinato di una lista di file di input (+ stringa opzionale)"""
+    site_dir = Path(site_dir)
+    parts = [f"{rel}:{hash_file(site_dir / rel)}" for rel in sorted(inputs)]
+    parts.append(extra)
+    return hash_bytes('\n'.join(parts))
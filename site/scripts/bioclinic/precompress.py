@@ -0,0 +1,148 @@
+"""
+Varianti precompresse (.br e .gz) degli asset testuali del sito.
+
+Per ogni file HTML, CSS, JS, JSON, XML, SVG o TXT pubblicato scrive accanto
+`<file>.gz` (gzip livello 9) e `<file>.br` (Brotli qualità 11), così l'edge
+le serve senza comprimere al volo. La compressione gira in un pool di
+processi; i file il cui hash non è cambiato dall'ultima esecuzione vengono
+saltati (manifest in data/cache/precompress-manifest.json, un
+buildcache.BuildManifest con una voce per variante).
+
+Brotli è opzionale (`pip install brotli`): senza il modulo si scrivono solo
+le varianti .gz. Le varianti non più piccole dell'originale non vengono
+scritte (e quelle vecchie si cancellano).
+"""
+
+import gzip
+import os
+from pathlib import Path
+
+from bioclinic.buildcache import BuildManifest, hash_file
+from bioclinic.parallel import run_sharded
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_RELPATH = Path('data') / 'cache' / 'precompress-manifest.json'
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.xml', '.svg', '.txt')
+
+# Sotto questa dimensione la compressione non ripaga l'header della risposta
+MIN_SIZE = 1024
+
+# Cartelle non pubblicate (sorgenti, copie, cache, output intermedi)
+EXCLUDED_DIRS = {
+    'scripts', 'templates', 'components', 'docs', 'backups', 'output', 'reports',
+    'logs', 'build', 'node_modules', '__pycache__', '.git',
+}
+EXCLUDED_PATHS = {'data/cache'}
+
+
+def encodings():
+    """Estensioni delle varianti prodotte in questo ambiente"""
+    return ('.br', '.gz') if brotli is not None else ('.gz',)
+
+
+def published_files(site_dir, suffixes, min_size=0):
+    """File pubblicati del sito con una delle estensioni date (path relativi posix, ordinati)"""
+    site_dir = Path(site_dir)
+    found = []
+    for root, dirs, files in os.walk(site_dir):
+        rel_root = Path(root).relative_to(site_dir)
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS
+                         and (rel_root / d).as_posix() not in EXCLUDED_PATHS)
+        for name in files:
+            if name.endswith(suffixes) and (not min_size or (Path(root) / name).stat().st_size >= min_size):
+                found.append((rel_root / name).as_posix())
+    return sorted(found)
+
+
+def find_assets(site_dir):
+    """Asset comprimibili del sito (path relativi posix, ordinati)"""
+    return published_files(site_dir, COMPRESSIBLE, MIN_SIZE)
+
+
+def compress(data, encoding):
+    """Compressione massima di `data` per l'estensione `encoding` ('.br' o '.gz')"""
+    if encoding == '.br':
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    # mtime=0: a parità di input il .gz è identico byte per byte
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_asset(path):
+    """Scrive le varianti di un file; ritorna (dimensione, {encoding: dimensione o None})"""
+    path = Path(path)
+    data = path.read_bytes()
+    sizes = {}
+    for encoding in encodings():
+        variant = path.with_name(path.name + encoding)
+        compressed = compress(data, encoding)
+        if len(compressed) < len(data):
+            variant.write_bytes(compressed)
+            sizes[encoding] = len(compressed)
+        else:
+            if variant.exists():
+                variant.unlink()
+            sizes[encoding] = None
+    return len(data), sizes
+
+
+def variant_paths(rel):
+    """Path relativi delle varianti di un asset"""
+    return [rel + encoding for encoding in encodings()]
+
+
+def pending_assets(site_dir, assets, manifest, force=False):
+    """Asset da (ri)comprimere: sorgente cambiato o variante mancante
+
+    Ritorna (asset da comprimere, {asset: dipendenze}); il manifest ha una
+    voce per variante scritta, con l'hash del sorgente da cui deriva.
+    """
+    site_dir = Path(site_dir)
+    deps_by_asset = {}
+    pending = []
+    for rel in assets:
+        deps = deps_by_asset[rel] = {'source': hash_file(site_dir / rel)}
+        if force or not all(manifest.is_fresh(site_dir / variant, deps)
+                             for variant in variant_paths(rel)):
+            pending.append(rel)
+    return pending, deps_by_asset
+
+
+def stale_variants(site_dir, manifest):
+    """Varianti registrate nel manifest il cui file sorgente non esiste più"""
+    site_dir = Path(site_dir)
+    stale = []
+    for variant in manifest.outputs:
+        source = os.path.splitext(variant)[0]
+        if not (site_dir / source).exists() and (site_dir / variant).exists():
+            stale.append(variant)
+    return sorted(stale)
+
+
+def precompress_site(site_dir, jobs=1, force=False):
+    """Comprime gli asset cambiati e cancella le varianti orfane
+
+    Ritorna (report, invariati, rimossi): report è [(asset, dimensione,
+    {encoding: dimensione compressa o None})] per gli asset compressi ora.
+    """
+    site_dir = Path(site_dir)
+    manifest = BuildManifest(site_dir, site_dir / MANIFEST_RELPATH)
+    assets = find_assets(site_dir)
+    pending, deps = pending_assets(site_dir, assets, manifest, force)
+    results = run_sharded(compress_asset, [site_dir / rel for rel in pending], jobs)
+
+    report = []
+    for rel, (size, sizes) in zip(pending, results):
+        for encoding, compressed in sizes.items():
+            if compressed is not None:
+                manifest.record(site_dir / (rel + encoding), deps[rel])
+        report.append((rel, size, sizes))
+
+    removed = stale_variants(site_dir, manifest)
+    for variant in removed:
+        (site_dir / variant).unlink()
+    manifest.save()
+    return report, len(assets) - len(pending), removed
@@ -0,0 +1,406 @@
+"""
+Grafo JSON-LD (Schema.org) delle pagine, costruito in un solo punto.
+
+Prima ogni script assemblava il proprio JSON-LD: il nodo MedicalClinic era
+ricopiato a mano (con @id diversi: #clinic, #organization) in tre generatori
+e due script di profilo, le prestazioni erano inserite in f-string senza
+escape, e fix-seo-issues.py / fix-json-ld-errors.py correggevano a
+posteriori con regex virgole e campi vuoti. Qui:
+
+    from bioclinic import schemagraph
+
+    graph = schemagraph.Graph()
+    clinic = graph.add(schemagraph.clinic())
+    graph.add(schemagraph.physician(slug, name, specialty=..., services=[...]))
+    graph.add(schemagraph.breadcrumb([("Home", schemagraph.SITE_URL + "/"), ...]))
+    html = f'<script type="application/ld+json">{graph.dumps()}</script>'
+
+- i nodi condivisi (clinica, specialità, prestazioni) sono memoizzati per
+  processo e serializzati una volta sola: le pagine li riferiscono per @id;
+- i valori vuoti (None, '', [], {}) non entrano nel grafo;
+- dumps() usa separatori compatti ed escape di '</' (sicuro dentro <script>);
+- prima di serializzare il grafo viene validato con le regole JSON_LD di
+  data/SCHEMA-VALIDAZIONE.json (@context, @type, proprietà richieste per
+  tipo, riferimenti @id risolti): un grafo non valido solleva
+  SchemaGraphError in build invece di finire nella pagina.
+"""
+
+import json
+import re
+from pathlib import Path
+
+SITE_URL = 'https://bio-clinic.it'
+CONTEXT = 'https://schema.org'
+CLINIC_ID = f"{SITE_URL}/#clinic"
+RULES_RELPATH = 'data/SCHEMA-VALIDAZIONE.json'
+
+SITE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+CLINIC = {
+    'name': 'Bio-Clinic Sassari',
+    'url': SITE_URL,
+    'telephone': '+39 079 956 1332',
+    'address': {
+        '@type': 'PostalAddress',
+        'streetAddress': 'Via Renzo Mossa, 23',
+        'addressLocality': 'Sassari',
+        'postalCode': '07100',
+        'addressRegion': 'SS',
+        'addressCountry': 'IT',
+    },
+}
+
+# Valori dell'enumerazione MedicalSpecialty di Schema.org per specialità
+SPECIALTY_ENUM = {
+    'ginecologia': 'Gynecologic',
+    'ostetricia': 'Obstetric',
+    'cardiologia': 'Cardiovascular',
+    'dermatologia': 'Dermatology',
+    'endocrinologia': 'Endocrine',
+    'neurologia': 'Neurologic',
+    'oculistica': 'Optometric',
+    'otorinolaringoiatria': 'Otolaryngologic',
+    'ortopedia': 'Musculoskeletal',
+    'gastroenterologia': 'Gastroenterologic',
+    'medicina-interna': 'InternalMedicine',
+    'nefrologia': 'Renal',
+    'pneumologia': 'Pulmonary',
+    'ematologia': 'Hematologic',
+    'reumatologia': 'Rheumatologic',
+    'urologia': 'Urologic',
+    'chirurgia-vascolare': 'Surgical',
+    'pediatria': 'Pediatric',
+    'psicologia': 'Psychiatric',
+    'nutrizione': 'DietNutrition',
+}
+
+_JSON_LD_BLOCK = re.compile(
+    r'(<script[^>]*type=["\']application/ld\+json["\'][^>]*>)(.*?)(</script>)',
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+class SchemaGraphError(ValueError):
+    """Grafo JSON-LD che non rispetta le regole di validazione"""
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__('; '.join(problems))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SERIALIZZAZIONE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def compact(value):
+    """Copia senza valori vuoti (None, '', [], {}), anche annidati"""
+    if isinstance(value, dict):
+        cleaned = {key: compact(item) for key, item in value.items()}
+        return {key: item for key, item in cleaned.items() if item not in (None, '', [], {})}
+    if isinstance(value, (list, tuple)):
+        cleaned = [compact(item) for item in value]
+        return [item for item in cleaned if item not in (None, '', [], {})]
+    return value
+
+
+def dumps(data):
+    """JSON compatto, sicuro dentro <script> (nessun '</' letterale)"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def ref(node_or_id):
+    """Riferimento {"@id": ...} a un nodo del grafo"""
+    node_id = node_or_id if isinstance(node_or_id, str) else node_or_id['@id']
+    return {'@id': node_id}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# NODI CONDIVISI (memoizzati per processo)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_shared = {}
+_fragments = {}
+
+
+def _share(node):
+    """Registra un nodo condiviso: stesso oggetto e stessa serializzazione per ogni pagina"""
+    node_id = node['@id']
+    known = _shared.get(node_id)
+    if known is not None and known == node:
+        return known
+    _shared[node_id] = node
+    _fragments[node_id] = dumps(node)
+    return node
+
+
+def clinic():
+    """Nodo MedicalClinic di Bio-Clinic"""
+    node = _shared.get(CLINIC_ID)
+    if node is None:
+        node = _share(compact({'@type': 'MedicalClinic', '@id': CLINIC_ID, **CLINIC}))
+    return node
+
+
+def specialty_id(slug):
+    return f"{SITE_URL}/#specialty-{slug}"
+
+
+def specialty(slug, name):
+    """Nodo MedicalSpecialty di una specialità (sameAs il valore Schema.org se noto)"""
+    node_id = specialty_id(slug)
+    node = _shared.get(node_id)
+    if node is None or node.get('name') != name:
+        enum = SPECIALTY_ENUM.get(slug)
+        node = _share(compact({
+            '@type': 'MedicalSpecialty',
+            '@id': node_id,
+            'name': name,
+            'sameAs': f"{CONTEXT}/{enum}" if enum else None,
+        }))
+    return node
+
+
+def procedure_id(slug):
+    return f"{SITE_URL}/pages/{slug}/#procedure"
+
+
+def procedure(slug, name):
+    """Nodo MedicalProcedure di una prestazione, riferito dai medici che la eseguono"""
+    node_id = procedure_id(slug)
+    node = _shared.get(node_id)
+    if node is None or node.get('name') != name:
+        node = _share(compact({'@type': 'MedicalProcedure', '@id': node_id, 'name': name}))
+    return node
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# NODI DI PAGINA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def procedure_page(slug, name, *, description=None, procedure_type=None, body_location=None,
+                   specialty=None):
+    """Nodo MedicalProcedure completo, per la pagina della prestazione"""
+    return compact({
+        '@type': 'MedicalProcedure',
+        '@id': procedure_id(slug),
+        'name': name,
+        'description': description,
+        'procedureType': procedure_type,
+        'bodyLocation': body_location,
+        'relevantSpecialty': ref(specialty) if specialty else None,
+        'provider': ref(CLINIC_ID),
+    })
+
+
+def physician_id(slug):
+    return f"{SITE_URL}/equipe/{slug}/#physician"
+
+
+def physician(slug, name, *, given_name=None, family_name=None, honorific_prefix=None,
+              job_title=None, description=None, specialty=None, services=(),
+              knows_about=(), same_as=(), citations=(), affiliations=(),
+              accepting_new_patients=None):
+    """Nodo Physician; specialty e services sono nodi condivisi (riferiti per @id)"""
+    return compact({
+        '@type': 'Physician',
+        '@id': physician_id(slug),
+        'name': name,
+        'givenName': given_name,
+        'familyName': family_name,
+        'honorificPrefix': honorific_prefix,
+        'jobTitle': job_title,
+        'description': description,
+        'medicalSpecialty': ref(specialty) if specialty else None,
+        'isAcceptingNewPatients': accepting_new_patients,
+        'worksFor': ref(CLINIC_ID),
+        'availableService': [ref(service) for service in services],
+        'knowsAbout': list(knows_about),
+        'sameAs': list(same_as),
+        'citation': list(citations),
+        'affiliation': [{'@type': 'Organization', 'name': org} for org in affiliations],
+    })
+
+
+def article(title, url=None, year=None, journal=None):
+    """ScholarlyArticle di una pubblicazione (anno e rivista opzionali)"""
+    return compact({
+        '@type': 'ScholarlyArticle',
+        'name': title,
+        'url': url,
+        'datePublished': str(year) if year else None,
+        'isPartOf': {'@type': 'Periodical', 'name': journal} if journal else None,
+    })
+
+
+def breadcrumb(items):
+    """BreadcrumbList da [(nome, url)]"""
+    return {
+        '@type': 'BreadcrumbList',
+        'itemListElement': [
+            {'@type': 'ListItem', 'position': position, 'name': name, 'item': url}
+            for position, (name, url) in enumerate(items, 1)
+        ],
+    }
+
+
+def item_list(list_id, name, urls, *, description=None, number_of_items=None):
+    """ItemList di pagine (ListItem con riferimento all'URL di ciascuna)"""
+    return compact({
+        '@type': 'ItemList',
+        '@id': list_id,
+        'name': name,
+        'description': description,
+        'numberOfItems': number_of_items if number_of_items is not None else len(urls),
+        'itemListElement': [
+            {'@type': 'ListItem', 'position': position, 'item': ref(url)}
+            for position, url in enumerate(urls, 1)
+        ],
+    })
+
+
+def faq_page(faqs):
+    """FAQPage da [(domanda, risposta)]"""
+    return {
+        '@type': 'FAQPage',
+        'mainEntity': [
+            {'@type': 'Question', 'name': question,
+             'acceptedAnswer': {'@type': 'Answer', 'text': answer}}
+            for question, answer in faqs
+        ],
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# VALIDAZIONE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_rules = {}
+
+
+def load_rules(site_dir=None):
+    """Regole JSON_LD di data/SCHEMA-VALIDAZIONE.json (lette una volta per processo)"""
+    path = Path(site_dir or SITE_ROOT) / RULES_RELPATH
+    rules = _rules.get(path)
+    if rules is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            rules = _rules[path] = json.load(f)['rules']['JSON_LD']
+    return rules
+
+
+def _walk(value, path):
+    """(path, oggetto) per ogni oggetto JSON annidato in value"""
+    if isinstance(value, dict):
+        yield path, value
+        for key, item in value.items():
+            yield from _walk(item, f"{path}.{key}")
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            yield from _walk(item, f"{path}[{i}]")
+
+
+def is_shared_id(node_id):
+    """True per gli @id dei nodi condivisi (clinica, specialità, prestazioni)"""
+    return node_id == CLINIC_ID or node_id.startswith(specialty_id('')) or \
+        (node_id.startswith(procedure_id('')[:-len('/#procedure')]) and node_id.endswith('/#procedure'))
+
+
+def check_block(data, rules):
+    """Problemi di un blocco JSON-LD già decodificato (lista vuota se valido)"""
+    problems = []
+    blocks = data if isinstance(data, list) else [data]
+    required = rules.get('requiredProperties', {})
+    for block in blocks:
+        if not isinstance(block, dict):
+            problems.append("blocco JSON-LD non è un oggetto")
+            continue
+        if block.get('@context') != rules.get('context', CONTEXT):
+            problems.append(f"@context mancante o diverso da {rules.get('context', CONTEXT)}")
+        nodes = block.get('@graph', [block])
+        ids = {node.get('@id') for node in nodes if isinstance(node, dict)}
+        for i, node in enumerate(nodes):
+            if not isinstance(node, dict) or '@type' not in node:
+                problems.append(f"@graph[{i}] senza @type")
+                continue
+            for path, obj in _walk(node, f"{node['@type']}"):
+                obj_type = obj.get('@type')
+                for prop in required.get(obj_type if isinstance(obj_type, str) else '', []):
+                    if obj.get(prop) in (None, '', [], {}):
+                        problems.append(f"{path}: {obj_type} senza {prop}")
+                # I nodi condivisi si riferiscono per @id: devono essere nel grafo
+                if set(obj) == {'@id'} and is_shared_id(obj['@id']) and obj['@id'] not in ids:
+                    problems.append(f"{path}: riferimento {obj['@id']} non presente nel grafo")
+    return problems
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# GRAFO DI PAGINA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Graph:
+    """@graph di una pagina: nodi in ordine, ciascun @id una sola volta"""
+
+    def __init__(self):
+        self.nodes = []
+        self._ids = set()
+
+    def add(self, node):
+        """Aggiunge un nodo (ignorato se il suo @id è già nel grafo); ritorna il nodo"""
+        node_id = node.get('@id')
+        if node_id is not None:
+            if node_id in self._ids:
+                return node
+            self._ids.add(node_id)
+        self.nodes.append(node)
+        return node
+
+    def to_dict(self):
+        return {'@context': CONTEXT, '@graph': self.nodes}
+
+    def validate(self, rules=None):
+        problems = check_block(self.to_dict(), rules if rules is not None else load_rules())
+        if problems:
+            raise SchemaGraphError(problems)
+
+    def dumps(self, rules=None):
+        """Grafo validato e serializzato; i nodi condivisi riusano la serializzazione in cache"""
+        self.validate(rules)
+        parts = []
+        for node in self.nodes:
+            node_id = node.get('@id')
+            if node_id is not None and _shared.get(node_id) is node:
+                parts.append(_fragments[node_id])
+            else:
+                parts.append(dumps(node))
+        return f'{{"@context":"{CONTEXT}","@graph":[{",".join(parts)}]}}'
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BLOCCHI NELLE PAGINE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def find_blocks(html):
+    """[(match, testo JSON)] dei blocchi <script type="application/ld+json">"""
+    return [(match, match.group(2)) for match in _JSON_LD_BLOCK.finditer(html)]
+
+
+def rewrite_blocks(html, transform):
+    """Applica transform(data) -> data ai blocchi JSON-LD validi; ritorna (html, blocchi cambiati)
+
+    I blocchi non decodificabili restano come sono. Un blocco cambia solo se
+    transform ne modifica i dati; in quel caso viene riscritto compatto.
+    """
+    changed = 0
+
+    def replace(match):
+        nonlocal changed
+        try:
+            data = json.loads(match.group(2))
+        except json.JSONDecodeError:
+            return match.group(0)
+        new_data = transform(json.loads(match.group(2)))
+        if new_data == data:
+            return match.group(0)
+        changed += 1
+        return f"{match.group(1)}{dumps(new_data)}{match.group(3)}"
+
+    return _JSON_LD_BLOCK.sub(replace, html), changed
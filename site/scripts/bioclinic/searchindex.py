@@ -0,0 +1,160 @@
+"""
+Compilatore dell'indice di ricerca per js/search.js.
+
+Da data/search/index.json (termini -> entità) e data/search/synonyms.json
+produce data/search/compiled.json, un indice invertito compatto:
+
+- entities: tabella [tipo, id] delle entità; le posting list sono indici interi
+- terms:    per ogni termine la posting list (già nell'ordine dei risultati)
+            e il contesto usato per i sottotitoli (uplink, contesto clinico,
+            specialità)
+- words:    chiavi normalizzate delle query (minuscolo, senza accenti né
+            punteggiatura, come normalizeQuery in search.js), ordinate
+- hits:     per ogni chiave i termini trovati, con alias, sinonimi e
+            correzioni ortografiche già espansi
+- prefixes: prefisso (2-4 caratteri) -> indici delle chiavi che lo completano,
+            per i suggerimenti durante la digitazione; i gruppi di 4 caratteri
+            sono completi, per input più lunghi il client li filtra
+
+Il client fa una sola lookup per tasto premuto invece di scorrere alias e
+sinonimi a ogni input.
+"""
+
+import json
+import re
+import unicodedata
+
+from bioclinic.buildcache import hash_bytes
+
+COMPILED_VERSION = 1
+COMPILED_RELPATH = 'data/search/compiled.json'
+
+# Ordine dei tipi nei risultati (come in search.js)
+ENTITY_TYPES = [
+    ('pathways', 'pathway'),
+    ('packs', 'pack'),
+    ('procedures', 'procedure'),
+    ('tests', 'test'),
+    ('physicians', 'physician'),
+    ('specialties', 'specialty'),
+]
+
+MIN_PREFIX_LENGTH = 2
+MAX_PREFIX_LENGTH = 4
+MAX_COMPLETIONS = 5
+
+_COMBINING = re.compile('[\u0300-\u036f]')
+_NON_WORD = re.compile(r'[^a-z0-9\s]')
+
+
+def normalize_query(text):
+    """Stessa normalizzazione di normalizeQuery() in search.js"""
+    text = unicodedata.normalize('NFD', text.lower())
+    return _NON_WORD.sub('', _COMBINING.sub('', text)).strip()
+
+
+def expand_query(query, aliases, synonyms, misspellings):
+    """Espansioni di una query normalizzata, nell'ordine della vecchia expandSynonyms()"""
+    expanded = [query]
+    for alias, target in aliases.items():
+        if alias in query:
+            expanded.append(query.replace(alias, target, 1))
+    for data in synonyms.values():
+        if query in data.get('alternatives', []):
+            expanded.append(data['primary'])
+    if query in misspellings:
+        expanded.append(misspellings[query])
+    return list(dict.fromkeys(expanded))
+
+
+def _candidate_queries(term_keys, aliases, synonyms, misspellings):
+    """Tutte le query normalizzate che possono produrre almeno un risultato"""
+    candidates = set()
+    for key in term_keys:
+        candidates.add(normalize_query(key))
+        # Query con un alias al posto del testo espanso (es. "eco tiroide" -> "ecografia tiroide")
+        for alias, target in aliases.items():
+            start = key.find(target)
+            while start != -1:
+                candidates.add(key[:start] + alias + key[start + len(target):])
+                start = key.find(target, start + 1)
+    for data in synonyms.values():
+        candidates.update(data.get('alternatives', []))
+    candidates.update(misspellings)
+    return sorted(q for q in candidates if q and q == normalize_query(q))
+
+
+def compile_search_index(index_data, synonyms_data):
+    """Compila index.json + synonyms.json nell'indice invertito (dict serializzabile)"""
+    raw_terms = index_data.get('terms', {})
+    aliases = index_data.get('aliases', {})
+    synonyms = synonyms_data.get('synonyms', {})
+    misspellings = synonyms_data.get('common_misspellings', {})
+
+    entities = []
+    entity_ids = {}
+    terms = []
+    term_ids = {}
+    for key, data in raw_terms.items():
+        postings = []
+        for field, entity_type in ENTITY_TYPES:
+            for entity_id in data.get(field) or []:
+                ref = (entity_type, entity_id)
+                if ref not in entity_ids:
+                    entity_ids[ref] = len(entities)
+                    entities.append([entity_type, entity_id])
+                postings.append(entity_ids[ref])
+        term = {'p': postings}
+        if data.get('uplink') is not None:
+            term['u'] = data['uplink']
+        if data.get('clinical_context'):
+            term['c'] = data['clinical_context']
+        if data.get('specialties'):
+            term['s'] = data['specialties'][0]
+        term_ids[key] = len(terms)
+        terms.append(term)
+
+    # Termini raggiungibili anche dalla forma normalizzata (es. "fertilità" da "fertilita")
+    by_normalized = {}
+    for key in raw_terms:
+        by_normalized.setdefault(normalize_query(key), []).append(term_ids[key])
+
+    keys = {}
+    for query in _candidate_queries(list(raw_terms), aliases, synonyms, misspellings):
+        found = []
+        for expansion in expand_query(query, aliases, synonyms, misspellings):
+            if expansion in term_ids:
+                found.append(term_ids[expansion])
+            found.extend(by_normalized.get(expansion, []))
+        found = [t for t in dict.fromkeys(found) if terms[t]['p']]
+        if found:
+            keys[query] = found
+
+    words = sorted(keys)
+    prefixes = {}
+    for position, word in enumerate(words):
+        for length in range(MIN_PREFIX_LENGTH, min(len(word) - 1, MAX_PREFIX_LENGTH) + 1):
+            prefixes.setdefault(word[:length], []).append(position)
+    for prefix, completions in prefixes.items():
+        completions.sort(key=lambda i: (len(words[i]), words[i]))
+        if len(prefix) < MAX_PREFIX_LENGTH:
+            del completions[MAX_COMPLETIONS:]
+
+    return {
+        'version': COMPILED_VERSION,
+        # Solo gli input della compilazione: il timestamp 'generated' di
+        # index.json cambierebbe l'hash (e il file) a ogni build
+        'source_hash': hash_bytes(json.dumps([raw_terms, aliases, synonyms, misspellings],
+                                             sort_keys=True)),
+        'entities': entities,
+        'terms': terms,
+        'prefix_length': MAX_PREFIX_LENGTH,
+        'words': words,
+        'hits': [keys[word] for word in words],
+        'prefixes': dict(sorted(prefixes.items())),
+    }
+
+
+def dump_compiled(compiled):
+    # Compatto: viene scaricato dal browser a ogni visita
+    return json.dumps(compiled, ensure_ascii=False, separators=(',', ':')) + '\n'
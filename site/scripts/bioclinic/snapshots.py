@@ -0,0 +1,296 @@
+"""
+Snapshot delle pagine con blob deduplicati per hash del contenuto.
+
+Sostituisce le copie complete in backups/backup_<data>/ (ogni esecuzione
+duplicava tutte le pagine anche se cambiavano pochi byte). Prima di scrivere,
+gli script che modificano le pagine chiamano
+
+    from bioclinic import snapshots
+    snapshots.before_write('fix-seo-issues')
+
+e lo store in backups/ riceve:
+
+    backups/objects/<h[:2]>/<h[2:]>.gz|.zst   contenuto di un file, compresso
+    backups/snapshots/<id>.json              {path: [hash, dimensione, mtime_ns]}
+
+Un blob si scrive solo se non esiste già, quindi il costo di uno snapshot è
+proporzionale a ciò che è cambiato dall'ultimo. Anche la lettura lo è: i file
+con dimensione e mtime uguali allo snapshot precedente riusano il suo hash
+senza essere riletti.
+
+zstd è opzionale (`pip install zstandard`); senza si usa gzip. Lo snapshot si
+salta con --dry-run o --no-snapshot sulla riga di comando dello script.
+scripts/snapshot.py elenca, confronta e ripristina gli snapshot.
+"""
+
+import difflib
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from bioclinic.fingerprint import find_pages
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+STORE_DIR = 'backups'
+OBJECTS_DIR = 'objects'
+SNAPSHOTS_DIR = 'snapshots'
+SNAPSHOT_VERSION = 1
+
+LEGACY_PATTERN = re.compile(r'^backup_(\d{8})_(\d{6})$')
+_LABEL = re.compile(r'[^\w-]+')
+
+SITE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def blob_hash(data):
+    """SHA-256 completo: nello store l'hash è l'identità del contenuto"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class SnapshotStore:
+    """Blob e manifest degli snapshot di un sito"""
+
+    def __init__(self, site_dir=None):
+        self.site_dir = Path(site_dir or SITE_ROOT)
+        self.root = self.site_dir / STORE_DIR
+        self.objects = self.root / OBJECTS_DIR
+        self.snapshots = self.root / SNAPSHOTS_DIR
+
+    # ── blob ──────────────────────────────────────────────────────────────────
+
+    def _blob_paths(self, digest):
+        folder = self.objects / digest[:2]
+        return [folder / f"{digest[2:]}{suffix}" for suffix in ('.zst', '.gz')]
+
+    def has_blob(self, digest):
+        return any(path.exists() for path in self._blob_paths(digest))
+
+    def put_blob(self, data, digest=None):
+        """Salva un contenuto (se nuovo); ritorna (hash, byte scritti)"""
+        digest = digest or blob_hash(data)
+        if self.has_blob(digest):
+            return digest, 0
+        zst_path, gz_path = self._blob_paths(digest)
+        if zstandard is not None:
+            path, packed = zst_path, zstandard.ZstdCompressor(level=19).compress(data)
+        else:
+            path, packed = gz_path, gzip.compress(data, compresslevel=9, mtime=0)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_bytes(packed)
+        os.replace(tmp, path)
+        return digest, len(packed)
+
+    def get_blob(self, digest):
+        for path in self._blob_paths(digest):
+            if not path.exists():
+                continue
+            if path.suffix == '.gz':
+                return gzip.decompress(path.read_bytes())
+            if zstandard is None:
+                raise RuntimeError(f"Blob {digest[:12]} compresso con zstd: pip install zstandard")
+            return zstandard.ZstdDecompressor().decompress(path.read_bytes())
+        raise KeyError(f"Blob mancante nello store: {digest}")
+
+    # ── snapshot ──────────────────────────────────────────────────────────────
+
+    def ids(self):
+        """Id degli snapshot, dal più vecchio"""
+        if not self.snapshots.is_dir():
+            return []
+        return sorted(p.stem for p in self.snapshots.glob('*.json'))
+
+    def resolve(self, name):
+        """Id completo da un id, un suo prefisso univoco o un'etichetta (il più recente)"""
+        ids = self.ids()
+        if name in ids:
+            return name
+        matches = [s for s in ids if s.startswith(name)]
+        if len(matches) == 1:
+            return matches[0]
+        labelled = [s for s in ids if s.endswith(f"-{name}")]
+        if labelled:
+            return labelled[-1]
+        raise KeyError(f"Snapshot non trovato o ambiguo: {name}")
+
+    def load(self, name):
+        path = self.snapshots / f"{self.resolve(name)}.json"
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def latest(self):
+        ids = self.ids()
+        return self.load(ids[-1]) if ids else None
+
+    def _new_id(self, label, when):
+        base = f"{when.strftime('%Y%m%d-%H%M%S')}-{_LABEL.sub('-', label).strip('-') or 'snapshot'}"
+        snapshot_id, n = base, 1
+        while (self.snapshots / f"{snapshot_id}.json").exists():
+            n += 1
+            snapshot_id = f"{base}-{n}"
+        return snapshot_id
+
+    def create(self, label, paths=None, when=None):
+        """Snapshot dei file indicati (default: le pagine del sito)
+
+        Ritorna (manifest, blob nuovi, byte scritti nello store).
+        """
+        paths = find_pages(self.site_dir) if paths is None else sorted(paths)
+        previous = self.latest()
+        known = previous['files'] if previous else {}
+        files, new_blobs, stored = {}, 0, 0
+        for rel in paths:
+            path = self.site_dir / rel
+            if not path.is_file():
+                continue
+            stat = path.stat()
+            record = known.get(rel)
+            if record and record[1:] == [stat.st_size, stat.st_mtime_ns] and self.has_blob(record[0]):
+                files[rel] = record
+                continue
+            digest, written = self.put_blob(path.read_bytes())
+            if written:
+                new_blobs += 1
+                stored += written
+            files[rel] = [digest, stat.st_size, stat.st_mtime_ns]
+        return self._save(label, files, when), new_blobs, stored
+
+    def _save(self, label, files, when=None):
+        when = when or datetime.now()
+        manifest = {
+            'version': SNAPSHOT_VERSION,
+            'id': self._new_id(label, when),
+            'label': label,
+            'created': when.isoformat(timespec='seconds'),
+            'files': files,
+        }
+        self.snapshots.mkdir(parents=True, exist_ok=True)
+        path = self.snapshots / f"{manifest['id']}.json"
+        path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1) + '\n', encoding='utf-8')
+        return manifest
+
+    def current_files(self, paths):
+        """{path: hash} dei file su disco (hash riusati dall'ultimo snapshot se invariati)"""
+        previous = self.latest()
+        known = previous['files'] if previous else {}
+        current = {}
+        for rel in paths:
+            path = self.site_dir / rel
+            if not path.is_file():
+                continue
+            stat = path.stat()
+            record = known.get(rel)
+            if record and record[1:] == [stat.st_size, stat.st_mtime_ns]:
+                current[rel] = record[0]
+            else:
+                current[rel] = blob_hash(path.read_bytes())
+        return current
+
+    def restore(self, snapshot_id, paths=None, dry_run=False):
+        """Riporta i file allo snapshot; ritorna i path cambiati (o da cambiare)"""
+        manifest = self.load(snapshot_id)
+        wanted = {rel: record[0] for rel, record in manifest['files'].items()
+                  if paths is None or rel in paths or any(rel.startswith(p.rstrip('/') + '/') for p in paths)}
+        current = self.current_files(wanted)
+        changed = sorted(rel for rel, digest in wanted.items() if current.get(rel) != digest)
+        if not dry_run:
+            for rel in changed:
+                path = self.site_dir / rel
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(self.get_blob(wanted[rel]))
+        return changed
+
+    def gc(self, keep=None):
+        """Cancella gli snapshot oltre gli ultimi `keep` e i blob non più referenziati
+
+        Ritorna (snapshot rimossi, blob rimossi).
+        """
+        ids = self.ids()
+        removed = ids[:-keep] if keep else []
+        for snapshot_id in removed:
+            (self.snapshots / f"{snapshot_id}.json").unlink()
+        referenced = {record[0] for snapshot_id in self.ids()
+                      for record in self.load(snapshot_id)['files'].values()}
+        blobs = 0
+        if self.objects.is_dir():
+            for path in self.objects.glob('*/*'):
+                digest = path.parent.name + path.name.split('.', 1)[0]
+                if digest not in referenced:
+                    path.unlink()
+                    blobs += 1
+        return removed, blobs
+
+    def import_legacy(self):
+        """Importa le copie complete backups/backup_<data>_<ora>/ come snapshot
+
+        Ritorna [(cartella, manifest, blob nuovi)]; le cartelle restano al loro posto.
+        """
+        imported = []
+        for folder in sorted(self.root.glob('backup_*')):
+            match = LEGACY_PATTERN.match(folder.name)
+            if not match or not folder.is_dir():
+                continue
+            when = datetime.strptime(''.join(match.groups()), '%Y%m%d%H%M%S')
+            files, new_blobs = {}, 0
+            for path in sorted(folder.rglob('*')):
+                if not path.is_file():
+                    continue
+                data = path.read_bytes()
+                digest, written = self.put_blob(data)
+                new_blobs += bool(written)
+                files[path.relative_to(folder).as_posix()] = [digest, len(data), 0]
+            imported.append((folder, self._save('legacy', files, when), new_blobs))
+        return imported
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CONFRONTI
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def compare(old_files, new_files):
+    """(aggiunti, rimossi, modificati) tra due mappe {path: hash}"""
+    added = sorted(set(new_files) - set(old_files))
+    removed = sorted(set(old_files) - set(new_files))
+    changed = sorted(rel for rel in set(old_files) & set(new_files) if old_files[rel] != new_files[rel])
+    return added, removed, changed
+
+
+def snapshot_hashes(manifest):
+    return {rel: record[0] for rel, record in manifest['files'].items()}
+
+
+def unified_diff(rel, old_data, new_data, old_label, new_label):
+    """Diff unificato di un file tra due contenuti (None = file assente)"""
+    def lines(data):
+        return [] if data is None else data.decode('utf-8', errors='replace').splitlines(keepends=True)
+
+    return ''.join(difflib.unified_diff(lines(old_data), lines(new_data),
+                                        f"{old_label}/{rel}", f"{new_label}/{rel}"))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# HOOK PER GLI SCRIPT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def snapshot_requested(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    return '--dry-run' not in argv and '--no-snapshot' not in argv
+
+
+def before_write(label, site_dir=None, paths=None, argv=None):
+    """Snapshot delle pagine prima che uno script le modifichi; ritorna il manifest o None"""
+    if not snapshot_requested(argv):
+        return None
+    store = SnapshotStore(site_dir)
+    manifest, new_blobs, stored = store.create(label, paths)
+    print(f"📸 Snapshot {manifest['id']}: {len(manifest['files'])} file, "
+          f"{new_blobs} blob nuovi ({stored / 1024:.1f} KB)")
+    return manifest
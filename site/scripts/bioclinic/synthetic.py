@@ -0,0 +1,221 @@
+"""
+Sito sintetico scalato per i benchmark (scripts/benchmark.py).
+
+Copia il sito in una cartella temporanea e moltiplica il corpus per `scale`:
+medici (physicians-complete/extended.json, physicians.yaml e pagine équipe),
+pagine in pages/ ed esami del listino (JSON processato e xlsx sorgente).
+Le copie sono deterministiche: a parità di sorgente e scala il sito
+sintetico è sempre lo stesso, quindi i tempi sono confrontabili tra commit.
+
+I cloni hanno slug `<slug>-<tag>` e nome `<nome> <Tag>` (tag alfabetico:
+'b', 'c', ... 'ba', ...), così gli autolinker li trattano come medici distinti.
+"""
+
+import json
+import shutil
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from bioclinic.listino import LISTINO_RELPATH, NAME_HEADER, PRICE_HEADER, XLSX_RELPATH, make_id
+
+PHYSICIANS_JSON = 'data/entities/physicians-complete.json'
+PHYSICIANS_EXTENDED_JSON = 'data/entities/physicians-extended.json'
+PHYSICIANS_YAML = 'data/v2/entities/physicians.yaml'
+
+# Non copiati: copie di sicurezza, output generati e cache (il benchmark parte a freddo)
+IGNORED_DIRS = {'backups', 'output', 'node_modules', '.git', '__pycache__'}
+KEPT_CACHE_FILES = {'version.json'}
+
+_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def clone_tag(k):
+    """Tag alfabetico della copia k (k >= 1): 1 -> 'b', 25 -> 'z', 26 -> 'ba'"""
+    digits = ''
+    while True:
+        k, rest = divmod(k, len(_LETTERS))
+        digits = _LETTERS[rest] + digits
+        if k == 0:
+            return digits
+
+
+def _ignore(directory, names):
+    ignored = {name for name in names if name in IGNORED_DIRS}
+    if Path(directory).name == 'cache':
+        ignored.update(name for name in names if name not in KEPT_CACHE_FILES)
+    return ignored
+
+
+def _replace_all(text, replacements):
+    for old, new in replacements:
+        text = text.replace(old, new)
+    return text
+
+
+def _physician_replacements(physician, k):
+    """Sostituzioni testuali (slug e nome) per la copia k di un medico"""
+    slug = physician.get('slug') or physician.get('id')
+    name = physician.get('name', '')
+    tag = clone_tag(k)
+    replacements = [(slug, f"{slug}-{tag}")]
+    if name:
+        replacements.append((name, f"{name} {tag.capitalize()}"))
+    return replacements
+
+
+def _clone_record(record, replacements):
+    return json.loads(_replace_all(json.dumps(record, ensure_ascii=False), replacements))
+
+
+def _read_json(path):
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _write_json(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def _scale_physicians(site_dir, scale):
+    """Moltiplica i medici; ritorna le sostituzioni per copia {k: [(vecchio, nuovo)]}"""
+    path = site_dir / PHYSICIANS_JSON
+    data = _read_json(path)
+    physicians = data['physicians']
+    clones = {k: [] for k in range(1, scale)}
+    scaled = list(physicians)
+    for k in range(1, scale):
+        for physician in physicians:
+            replacements = _physician_replacements(physician, k)
+            clones[k].append(replacements)
+            scaled.append(_clone_record(physician, replacements))
+    data['physicians'] = scaled
+    if 'total' in data:
+        data['total'] = len(scaled)
+    _write_json(path, data)
+
+    path = site_dir / PHYSICIANS_EXTENDED_JSON
+    if path.exists():
+        data = _read_json(path)
+        extended = data.get('physicians_extended', {})
+        originals = list(extended.items())
+        for k in range(1, scale):
+            by_slug = {replacements[0][0]: replacements for replacements in clones[k]}
+            for slug, record in originals:
+                if slug in by_slug:
+                    extended[by_slug[slug][0][1]] = _clone_record(record, by_slug[slug])
+        _write_json(path, data)
+
+    path = site_dir / PHYSICIANS_YAML
+    if path.exists():
+        import yaml
+        data = yaml.safe_load(path.read_text(encoding='utf-8'))
+        originals = list(data.get('physicians', []))
+        for k in range(1, scale):
+            for physician in originals:
+                data['physicians'].append(
+                    _clone_record(physician, _physician_replacements(physician, k)))
+        path.write_text(yaml.safe_dump(data, allow_unicode=True, sort_keys=False), encoding='utf-8')
+    return clones
+
+
+def _scale_pages(site_dir, scale, clones):
+    """Pagine équipe dei medici clonati e copie delle pagine in pages/"""
+    equipe = site_dir / 'equipe'
+    for k, physicians in clones.items():
+        for replacements in physicians:
+            slug, new_slug = replacements[0]
+            page = equipe / f"{slug}.html"
+            if page.exists():
+                text = _replace_all(page.read_text(encoding='utf-8'), replacements)
+                (equipe / f"{new_slug}.html").write_text(text, encoding='utf-8')
+
+    pages = sorted((site_dir / 'pages').glob('*.html'))
+    for k in range(1, scale):
+        for page in pages:
+            page.with_name(f"{page.stem}-{clone_tag(k)}.html").write_bytes(page.read_bytes())
+
+
+def write_xlsx(path, rows, headers):
+    """Scrive un .xlsx minimo (un foglio, stringhe inline) leggibile da listino.read_xlsx_rows"""
+    def column(i):
+        return chr(ord('A') + i)
+
+    def cell(ref, value):
+        if isinstance(value, (int, float)):
+            return f'<c r="{ref}"><v>{value}</v></c>'
+        return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape(value)}</t></is></c>'
+
+    lines = []
+    for r, values in enumerate([headers] + rows, start=1):
+        cells = ''.join(cell(f"{column(i)}{r}", v) for i, v in enumerate(values) if v is not None)
+        lines.append(f'<row r="{r}">{cells}</row>')
+    ns = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    rel_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+    files = {
+        '[Content_Types].xml': (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '</Types>'),
+        '_rels/.rels': (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rel_ns}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'),
+        'xl/workbook.xml': (
+            f'<?xml version="1.0" encoding="UTF-8"?><workbook xmlns="{ns}" xmlns:r="{rel_ns}">'
+            '<sheets><sheet name="Listino" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+        'xl/_rels/workbook.xml.rels': (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rel_ns}/worksheet" Target="worksheets/sheet1.xml"/>'
+            '</Relationships>'),
+        'xl/worksheets/sheet1.xml': (
+            f'<?xml version="1.0" encoding="UTF-8"?><worksheet xmlns="{ns}"><sheetData>'
+            + ''.join(lines) + '</sheetData></worksheet>'),
+    }
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, text in files.items():
+            archive.writestr(name, text)
+
+
+def _scale_listino(site_dir, scale):
+    path = site_dir / LISTINO_RELPATH
+    listino = _read_json(path)
+    scaled = list(listino)
+    for k in range(1, scale):
+        tag = clone_tag(k).upper()
+        for entry in listino:
+            clone = dict(entry, nome=f"{entry['nome']} {tag}")
+            clone['id'] = make_id(clone['nome'])
+            scaled.append(clone)
+    path.write_text(json.dumps(scaled, ensure_ascii=False, indent=2), encoding='utf-8')
+    rows = [[e['nome'], None, None, e['prezzo']] for e in scaled]
+    write_xlsx(site_dir / XLSX_RELPATH, rows, [NAME_HEADER, None, None, PRICE_HEADER])
+    return len(scaled)
+
+
+def corpus_stats(site_dir):
+    """Dimensioni del corpus: pagine HTML, medici, esami"""
+    site_dir = Path(site_dir)
+    pages = [p for p in site_dir.rglob('*.html')
+             if not IGNORED_DIRS.intersection(p.relative_to(site_dir).parts)]
+    physicians = _read_json(site_dir / PHYSICIANS_JSON).get('physicians', [])
+    tests = _read_json(site_dir / LISTINO_RELPATH)
+    return {'pages': len(pages), 'physicians': len(physicians), 'tests': len(tests)}
+
+
+def build_synthetic_site(source_dir, target_dir, scale=1):
+    """Crea in `target_dir` una copia del sito con il corpus moltiplicato per `scale`"""
+    source_dir, target_dir = Path(source_dir), Path(target_dir)
+    if target_dir.exists():
+        shutil.rmtree(target_dir)
+    shutil.copytree(source_dir, target_dir, ignore=_ignore)
+    if scale > 1:
+        clones = _scale_physicians(target_dir, scale)
+        _scale_pages(target_dir, scale, clones)
+        _scale_listino(target_dir, scale)
+    return corpus_stats(target_dir)
@@ -0,0 +1,219 @@
+"""
+Tracing delle prestazioni per gli script di build e validazione.
+
+Disattivato di default: ogni hook costa una chiamata a funzione che ritorna
+subito. Si attiva con --trace (o --trace=FILE) sulla riga di comando, oppure
+con la variabile d'ambiente BIOCLINIC_TRACE (1 o un percorso). A fine
+esecuzione scrive un trace in formato Chrome (apribile con chrome://tracing
+o ui.perfetto.dev; default reports/trace-<script>.json) e stampa le pagine
+più lente.
+
+Uso tipico in uno script:
+
+    from bioclinic import trace
+
+    trace.setup('propagate-header')
+    with trace.span('carica master header'):
+        ...
+    for page in pages:
+        with trace.page(rel_path):
+            content = f.read()
+            trace.bytes_read(content)
+            ...
+
+Registra:
+- tempo wall degli stage (span) e delle singole pagine (page);
+- contatori: byte letti e scritti, valutazioni di regex, hit/miss di cache.
+  Ogni span riporta nei suoi args gli incrementi dei contatori al suo interno.
+
+Le chiamate alle funzioni del modulo re (re.search, re.sub, ...) vengono
+contate automaticamente, avvolgendole solo quando il tracing è attivo; i
+pattern compilati nei cicli caldi si contano a mano con count('regex', n).
+Con --jobs N le pagine elaborate dai worker non finiscono nel trace: resta
+lo span dello stage parallelo nel processo principale.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+TRACE_ENV = 'BIOCLINIC_TRACE'
+TRACE_DIR = 'reports'
+TOP_PAGES = 10
+
+# Funzioni del modulo re contate come valutazioni di regex
+REGEX_FUNCTIONS = ('match', 'fullmatch', 'search', 'sub', 'subn', 'split', 'findall', 'finditer')
+
+_DISABLED = contextlib.nullcontext()
+
+
+def trace_option(argv=None):
+    """Percorso del trace richiesto ('' = percorso di default), None se disattivato"""
+    argv = sys.argv[1:] if argv is None else argv
+    for arg in argv:
+        if arg == '--trace':
+            return ''
+        if arg.startswith('--trace='):
+            return arg.split('=', 1)[1]
+    value = os.environ.get(TRACE_ENV, '')
+    if value in ('', '0'):
+        return None
+    return '' if value == '1' else value
+
+
+class Tracer:
+    """Raccoglie span e contatori e li scrive come trace Chrome (eventi X e C)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.name = None
+        self.path = None
+        self.events = []
+        self.counters = {}
+        self.pages = []
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._patched = {}
+
+    def setup(self, name, site_dir=None, argv=None):
+        """Attiva il tracing se richiesto; il trace viene scritto all'uscita"""
+        option = trace_option(argv)
+        if option is None or self.enabled:
+            return self.enabled
+        site_dir = Path(site_dir) if site_dir else Path(__file__).resolve().parent.parent.parent
+        self.enabled = True
+        self.name = name
+        self.path = Path(option) if option else site_dir / TRACE_DIR / f"trace-{name}.json"
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self.events.append({'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'tid': 0,
+                            'args': {'name': name}})
+        self._patch_re()
+        atexit.register(self.finish)
+        return True
+
+    def _patch_re(self):
+        for func_name in REGEX_FUNCTIONS:
+            original = getattr(re, func_name)
+            self._patched[func_name] = original
+
+            @functools.wraps(original)
+            def counted(*args, _original=original, **kwargs):
+                self.counters['regex'] = self.counters.get('regex', 0) + 1
+                return _original(*args, **kwargs)
+
+            setattr(re, func_name, counted)
+
+    def _unpatch_re(self):
+        for func_name, original in self._patched.items():
+            setattr(re, func_name, original)
+        self._patched = {}
+
+    def _timestamp(self, moment):
+        return round((moment - self._origin) * 1e6, 1)
+
+    def span(self, name, cat='stage', **args):
+        """Context manager: tempo wall di uno stage"""
+        if not self.enabled:
+            return _DISABLED
+        return self._span(name, cat, args)
+
+    def page(self, name, **args):
+        """Context manager: tempo wall di una pagina (entra nella classifica delle più lente)"""
+        if not self.enabled:
+            return _DISABLED
+        return self._span(name, 'page', args)
+
+    @contextlib.contextmanager
+    def _span(self, name, cat, args):
+        before = dict(self.counters)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            delta = {key: value - before.get(key, 0) for key, value in self.counters.items()
+                     if value != before.get(key, 0)}
+            self.events.append({'name': name, 'cat': cat, 'ph': 'X', 'pid': self._pid, 'tid': 0,
+                                'ts': self._timestamp(start), 'dur': self._timestamp(end) - self._timestamp(start),
+                                'args': {**args, **delta}})
+            if self.counters:
+                self.events.append({'name': 'contatori', 'ph': 'C', 'pid': self._pid, 'tid': 0,
+                                    'ts': self._timestamp(end), 'args': dict(self.counters)})
+            if cat == 'page':
+                self.pages.append((end - start, name, delta))
+
+    def count(self, name, n=1):
+        """Incrementa un contatore (es. 'regex', 'cache_hit', 'cache_miss')"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def bytes_read(self, data):
+        """Conta i byte letti (str in UTF-8 o bytes)"""
+        if self.enabled:
+            self.count('bytes_read', len(data.encode('utf-8') if isinstance(data, str) else data))
+
+    def bytes_written(self, data):
+        """Conta i byte scritti (str in UTF-8 o bytes)"""
+        if self.enabled:
+            self.count('bytes_written', len(data.encode('utf-8') if isinstance(data, str) else data))
+
+    def slowest_pages(self, n=TOP_PAGES):
+        """[(secondi, pagina, contatori)] delle n pagine più lente"""
+        return sorted(self.pages, key=lambda p: -p[0])[:n]
+
+    def finish(self):
+        """Scrive il trace e stampa il riepilogo (una sola volta, solo nel processo principale)"""
+        if not self.enabled or os.getpid() != self._pid:
+            return None
+        self.enabled = False
+        self._unpatch_re()
+        elapsed = time.perf_counter() - self._origin
+        slowest = self.slowest_pages()
+        data = {
+            'traceEvents': self.events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'script': self.name,
+                'seconds': round(elapsed, 3),
+                'pages': len(self.pages),
+                'counters': self.counters,
+                'slowest_pages': [{'page': name, 'ms': round(seconds * 1000, 3), **delta}
+                                  for seconds, name, delta in slowest],
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, ensure_ascii=False) + '\n', encoding='utf-8')
+
+        print()
+        print(f"⏱️  Trace: {self.path} ({len(self.events)} eventi, {elapsed:.2f}s, {len(self.pages)} pagine)")
+        if self.counters:
+            print("   " + ", ".join(f"{key} {value}" for key, value in sorted(self.counters.items())))
+        if slowest:
+            print(f"🐢 Pagine più lente (top {len(slowest)}):")
+            for seconds, name, delta in slowest:
+                details = ", ".join(f"{key} {value}" for key, value in sorted(delta.items()))
+                print(f"   {seconds * 1000:8.2f} ms  {name}" + (f"  ({details})" if details else ""))
+        return self.path
+
+
+_tracer = Tracer()
+
+setup = _tracer.setup
+span = _tracer.span
+page = _tracer.page
+count = _tracer.count
+bytes_read = _tracer.bytes_read
+bytes_written = _tracer.bytes_written
+finish = _tracer.finish
+
+
+def enabled():
+    """True se il tracing è attivo in questo processo"""
+    return _tracer.enabled
@@ -0,0 +1,181 @@
+"""
+Scrittura dei file per gli script che modificano le pagine.
+
+Gli script scrivevano con open(path, 'w') anche quando il contenuto non
+cambiava (mtime nuovi a ogni esecuzione, deploy incrementali che ricaricano
+tutto) e un Ctrl-C a metà scrittura lasciava una pagina troncata. Con questo
+modulo:
+
+    from bioclinic import writes
+
+    writes.setup('fix-seo-issues')
+    ...
+    if writes.write_text(page_path, new_content):
+        print("✅ aggiornata")
+
+- un file si scrive solo se il contenuto è diverso da quello su disco;
+- la scrittura è atomica: file temporaneo nella stessa cartella + os.replace;
+- con --dry-run non si scrive nulla: si stampano i file che cambierebbero
+  con le righe aggiunte/rimosse;
+- con --diff si stampa anche il diff unificato di ogni file cambiato
+  (insieme a --dry-run per vedere le modifiche senza applicarle);
+- remove() cancella un file generato obsoleto (con --dry-run lo elenca).
+
+A fine esecuzione setup() registra un riepilogo (file scritti o da scrivere,
+invariati, righe aggiunte e rimosse).
+"""
+
+import atexit
+import difflib
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from bioclinic import trace
+
+SITE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def atomic_write(path, data):
+    """Scrive bytes in path tramite un file temporaneo e os.replace
+
+    Chi legge (o un'interruzione) vede il file vecchio o quello nuovo, mai
+    uno a metà. I permessi del file esistente vengono mantenuti.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        else:
+            os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def line_stats(old, new):
+    """(righe aggiunte, righe rimosse) tra due testi"""
+    added = removed = 0
+    for line in difflib.unified_diff(old.splitlines(), new.splitlines(), lineterm='', n=0):
+        if line.startswith('+') and not line.startswith('+++'):
+            added += 1
+        elif line.startswith('-') and not line.startswith('---'):
+            removed += 1
+    return added, removed
+
+
+class Writer:
+    """Scritture di uno script: solo se cambiate, atomiche, con dry-run e diff"""
+
+    def __init__(self):
+        self.name = None
+        self.site_dir = SITE_ROOT
+        self.dry_run = False
+        self.show_diff = False
+        self.changed = []
+        self.removed_files = []
+        self.unchanged = 0
+        self.added = 0
+        self.removed = 0
+        self._registered = False
+
+    def setup(self, name, site_dir=None, argv=None):
+        """Legge --dry-run e --diff; ritorna True se è un dry-run"""
+        argv = sys.argv[1:] if argv is None else argv
+        self.name = name
+        self.site_dir = Path(site_dir) if site_dir else SITE_ROOT
+        self.dry_run = '--dry-run' in argv
+        self.show_diff = '--diff' in argv
+        if self.dry_run:
+            print("🔎 DRY RUN: nessun file verrà scritto")
+        if not self._registered:
+            atexit.register(self.report)
+            self._registered = True
+        return self.dry_run
+
+    def display(self, path):
+        try:
+            return Path(path).resolve().relative_to(self.site_dir.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    def write_bytes(self, path, data, text=None):
+        """Scrive data se diverso dal contenuto attuale; ritorna True se cambia"""
+        path = Path(path)
+        old = path.read_bytes() if path.exists() else None
+        if old == data:
+            self.unchanged += 1
+            return False
+        rel = self.display(path)
+        self.changed.append(rel)
+        if text is not None:
+            old_text = '' if old is None else old.decode('utf-8', errors='replace')
+            added, removed = line_stats(old_text, text)
+            self.added += added
+            self.removed += removed
+            if self.dry_run:
+                print(f"  🔍 {rel} (+{added} -{removed})" + (" nuovo" if old is None else ""))
+            if self.show_diff:
+                print(''.join(difflib.unified_diff(old_text.splitlines(keepends=True),
+                                                   text.splitlines(keepends=True),
+                                                   f"a/{rel}", f"b/{rel}")), end='')
+        elif self.dry_run:
+            print(f"  🔍 {rel} ({len(data)} byte)")
+        if not self.dry_run:
+            atomic_write(path, data)
+            trace.bytes_written(data)
+        return True
+
+    def write_text(self, path, text):
+        """Come write_bytes per testo UTF-8"""
+        return self.write_bytes(path, text.encode('utf-8'), text)
+
+    def remove(self, path):
+        """Cancella un file (se esiste); ritorna True se c'era"""
+        path = Path(path)
+        if not path.exists():
+            return False
+        rel = self.display(path)
+        self.removed_files.append(rel)
+        if self.dry_run:
+            print(f"  🗑️  {rel}")
+        else:
+            path.unlink()
+        return True
+
+    def report(self):
+        """Riepilogo delle scritture (registrato da setup all'uscita)"""
+        if self.name is None or not (self.changed or self.unchanged or self.removed_files):
+            return
+        verb = "da scrivere" if self.dry_run else "scritti"
+        deleted = f", {len(self.removed_files)} da cancellare" if self.dry_run else \
+            f", {len(self.removed_files)} cancellati"
+        print(f"💾 {self.name}: {len(self.changed)} file {verb}, {self.unchanged} invariati"
+              f"{deleted if self.removed_files else ''} (+{self.added} -{self.removed} righe)")
+
+
+_writer = Writer()
+
+setup = _writer.setup
+write_bytes = _writer.write_bytes
+write_text = _writer.write_text
+remove = _writer.remove
+report = _writer.report
+
+
+def dry_run():
+    """True se lo script è stato lanciato con --dry-run"""
+    return _writer.dry_run
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC LAB SHARDS                                                       ║
+║                                                                               ║
+║  Divide data/listino-processed.json in shard JSON per categoria e per        ║
+║  sintomo (js/db/*.<hash>.json) e aggiorna il manifest in js/database.js.     ║
+║  BioClinicDB scarica gli shard solo quando servono (search,                  ║
+║  esamiPerCategoria, esamiPerSintomo); gli shard obsoleti vengono rimossi.    ║
+║                                                                               ║
+║  Uso: python3 scripts/build-lab-shards.py [--dry-run] [--diff]               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+from pathlib import Path
+
+from bioclinic import writes
+from bioclinic.labshards import LISTINO_RELPATH, write_lab_shards
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    dry_run = writes.setup('build-lab-shards')
+    listino = json.loads((SITE_ROOT / LISTINO_RELPATH).read_text(encoding='utf-8'))
+    manifest, written, stale, core_changed = write_lab_shards(SITE_ROOT, listino)
+
+    prefix = "🔍 [DRY-RUN] " if dry_run else "✅ "
+    print(f"{prefix}{len(listino)} esami -> {len(manifest['categorie'])} shard per categoria, "
+          f"{len(manifest['sintomi'])} per sintomo")
+    print(f"   📝 {written} shard nuovi, 🗑️  {len(stale)} obsoleti, "
+          f"manifest {'aggiornato' if core_changed else 'invariato'}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
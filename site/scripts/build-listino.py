@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC LISTINO IMPORT                                                   ║
+║                                                                               ║
+║  Rigenera data/listino-processed.json da data/listino-laboratorio.xlsx       ║
+║  (categoria, sintomi, upsell, preparazione, referto) e poi gli shard e il    ║
+║  manifest di js/database.js. Gli stage sono memoizzati per riga in           ║
+║  data/cache/listino-stages.json: si ricalcolano solo le righe cambiate.      ║
+║                                                                               ║
+║  Uso: python3 scripts/build-listino.py [--dry-run] [--diff] [--force]        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from pathlib import Path
+
+from bioclinic import writes
+from bioclinic.buildcache import force_requested
+from bioclinic.labshards import write_lab_shards
+from bioclinic.listino import (LISTINO_RELPATH, STAGE_CACHE_RELPATH, XLSX_RELPATH,
+                               StageCache, build_listino, dump_listino, parse_rows)
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    dry_run = writes.setup('build-listino')
+    cache_path = SITE_ROOT / STAGE_CACHE_RELPATH
+    cache_text = None
+    if cache_path.exists() and not force_requested():
+        cache_text = cache_path.read_text(encoding='utf-8')
+    cache = StageCache(cache_text)
+
+    rows = parse_rows((SITE_ROOT / XLSX_RELPATH).read_bytes())
+    listino = build_listino(rows, cache)
+    print(f"📥 {len(rows)} righe da {XLSX_RELPATH}")
+    print(f"   ♻️  {cache.hits} stage dalla cache, ⚙️  {cache.misses} ricalcolati")
+
+    listino_path = SITE_ROOT / LISTINO_RELPATH
+    text = dump_listino(listino)
+    changed = writes.write_text(listino_path, text)
+    writes.write_text(cache_path, cache.dumps())
+
+    manifest, written, stale, core_changed = write_lab_shards(SITE_ROOT, listino)
+
+    prefix = "🔍 [DRY-RUN] " if dry_run else "✅ "
+    print(f"{prefix}{LISTINO_RELPATH} {'aggiornato' if changed else 'invariato'}: "
+          f"{len(listino)} esami, {manifest['stats']['esamiConUpsell']} con upsell")
+    print(f"   📝 {written} shard nuovi, 🗑️  {len(stale)} obsoleti, "
+          f"manifest {'aggiornato' if core_changed else 'invariato'}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC PHYSICIAN NAME INDEX                                             ║
+║                                                                               ║
+║  Compila data/entities/physician-name-index.json da physicians-complete.json:║
+║  varianti normalizzate dei nomi, titoli, slug e flag per i cognomi condivisi.║
+║  È l'unica tabella nomi -> medico usata da autolinker, fix delle card e      ║
+║  js/physician-linker.js.                                                     ║
+║                                                                               ║
+║  Uso: python3 scripts/build-name-index.py                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from pathlib import Path
+
+from bioclinic.namevariants import INDEX_RELPATH, write_name_index
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    index = write_name_index(SITE_ROOT)
+    ambiguous = sum(1 for v in index['variants'] if v['ambiguous'])
+    print(f"✅ {INDEX_RELPATH.as_posix()}: {len(index['physicians'])} medici, "
+          f"{len(index['variants'])} varianti ({ambiguous} ambigue)")
+    for surname, slugs in index['surnames'].items():
+        print(f"   ⚠️  Cognome condiviso '{surname}': {', '.join(slugs)}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
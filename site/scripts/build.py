@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC BUILD PIPELINE v1.0                                              ║
+║                                                                               ║
+║  Sostituisce la catena manuale di script:                                    ║
+║    generate-* → build-name-index → propagate-header →                       ║
+║    physician-autolink-v3 →                                                   ║
+║    update-all-profiles → update-search-index → build-listino →               ║
+║    build-lab-shards → optimize-images → critical-css → fingerprint-assets →  ║
+║    generate_sitemap                                                          ║
+║                                                                               ║
+║  Ogni pagina viene letta una sola volta, tutti gli stage lavorano in         ║
+║  memoria e ogni file viene scritto al massimo una volta, alla fine.          ║
+║  Uno stage viene eseguito solo se i suoi input sono cambiati; gli stage      ║
+║  sulle pagine elaborano anche le pagine modificate da stage precedenti.      ║
+║                                                                               ║
+║  Uso: python3 scripts/build.py [--force] [--dry-run] [--validate]            ║
+║                                [--only stage1,stage2] [--jobs N]             ║
+║                                [--precompress] [--trace[=FILE]]              ║
+║  --precompress: al termine scrive le varianti .br/.gz degli asset            ║
+║  (scripts/precompress.py). Prima di scrivere salva uno snapshot in           ║
+║  backups/ (scripts/snapshot.py); --no-snapshot lo salta.                     ║
+║  Prima di tutto i dati v2 vengono validati con data/v2/config/schema.yaml    ║
+║  (scripts/validate-data.py): con errori la build si ferma.                   ║
+║  --trace (o BIOCLINIC_TRACE): tempo wall di ogni stage e di ogni pagina in   ║
+║  reports/trace-build.json (bioclinic/trace.py).                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bioclinic import criticalcss, datarules, fingerprint, images, labshards, listino, namevariants, precompress, searchindex, snapshots, trace
+from bioclinic.buildcache import hash_bytes
+from bioclinic.parallel import parse_jobs
+from bioclinic.pipeline import PageStore, PipelineState, digest_inputs, load_script
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+PHYSICIANS_YAML = [
+    'data/v2/entities/physicians.yaml',
+    'data/v2/entities/specialties.yaml',
+    'data/v2/entities/procedures.yaml',
+]
+PHYSICIANS_JSON = 'data/entities/physicians-complete.json'
+PHYSICIANS_EXTENDED_JSON = 'data/entities/physicians-extended.json'
+MASTER_HEADER = 'components/master-header.html'
+MASTER_FOOTER = 'components/master-footer.html'
+COMPONENTS_MODULE = 'scripts/bioclinic/components.py'
+NAME_INDEX = namevariants.INDEX_RELPATH.as_posix()
+NAME_VARIANTS_MODULE = 'scripts/bioclinic/namevariants.py'
+SEARCH_SYNONYMS = 'data/search/synonyms.json'
+LAB_SHARDS_MODULE = 'scripts/bioclinic/labshards.py'
+LISTINO_MODULE = 'scripts/bioclinic/listino.py'
+FINGERPRINT_MODULE = 'scripts/bioclinic/fingerprint.py'
+CRITICAL_CSS_MODULE = 'scripts/bioclinic/criticalcss.py'
+IMAGES_MODULE = 'scripts/bioclinic/images.py'
+SCHEMA_GRAPH = ['scripts/bioclinic/schemagraph.py', 'data/SCHEMA-VALIDAZIONE.json']
+
+
+class Stage:
+    """Uno stage della pipeline.
+
+    - inputs: file (relativi al sito) il cui hash decide se lo stage va rieseguito
+    - run(store, targets): esegue lo stage; `targets` sono le pagine da elaborare
+    - pages(store): per gli stage sulle pagine, l'insieme di pagine di competenza;
+      se gli input non sono cambiati vengono elaborate solo quelle già modificate
+    - follows_pages: stage non-pagina che va rieseguito se una pagina HTML cambia
+    - extra(store): input calcolato dallo store (es. file già riscritti da stage
+      precedenti), aggiunto all'hash degli input
+    """
+
+    def __init__(self, name, script, inputs, run, pages=None, follows_pages=False, extra=None):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs) + [script]
+        self.run = run
+        self.pages = pages
+        self.follows_pages = follows_pages
+        self.extra = extra
+
+    def digest(self, extra=''):
+        return digest_inputs(SITE_ROOT, self.inputs, extra)
+
+
+def _script_path(filename):
+    return (Path('scripts') / filename).as_posix()
+
+
+def _emitter(store):
+    """Emettitore per i generatori: le pagine finiscono nello store, non su disco"""
+    def emit(path, html):
+        store.write(Path(path).resolve(), html)
+    return emit
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STAGE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+_modules = {}
+
+
+def _generator_manifest():
+    """Manifest di un generatore: lo salva PipelineState dopo la scrittura delle pagine"""
+    return _modules['pipeline_state'].generator_manifest()
+
+
+def run_generate_physicians(store, targets):
+    load_script('generate-physician-pages-jinja.py').main(
+        emit=_emitter(store), manifest=_generator_manifest())
+
+
+def run_generate_procedures(store, targets):
+    load_script('generate-procedure-pages.py').main(
+        emit=_emitter(store), manifest=_generator_manifest())
+
+
+def run_generate_equipe_index(store, targets):
+    load_script('generate-equipe-index.py').main(
+        emit=_emitter(store), manifest=_generator_manifest())
+
+
+def _module(filename):
+    """Carica uno script una sola volta per build"""
+    if filename not in _modules:
+        _modules[filename] = load_script(filename)
+    return _modules[filename]
+
+
+def header_pages(store):
+    return [store.rel(p) for p in _module('propagate-header.py').find_all_html_pages()]
+
+
+def run_propagate_header(store, targets):
+    module = _module('propagate-header.py')
+    master_header = module.load_master_header()
+    for rel in targets:
+        with trace.page(rel, stage='propagate-header'):
+            ok, result = module.splice_header(store.read(rel), str(store.abspath(rel)), master_header)
+        if ok:
+            store.write(rel, result)
+        else:
+            print(f"  ❌ {rel} - ERRORE: {result}")
+
+
+def run_name_index(store, targets):
+    index = namevariants.compile_from_json(store.read(PHYSICIANS_JSON))
+    store.write(NAME_INDEX, namevariants.dump_name_index(index))
+    print(f"  🏷️  {len(index['variants'])} varianti per {len(index['physicians'])} medici")
+
+
+def _name_index(store):
+    """Indice dei nomi corrente (quello appena compilato, se lo stage è girato)"""
+    import json
+    text = store.read(NAME_INDEX)
+    if text is None:
+        return namevariants.compile_from_json(store.read(PHYSICIANS_JSON))
+    return json.loads(text)
+
+
+def autolink_pages(store):
+    return [store.rel(p) for p in _module('physician-autolink-v3.py').find_all_html_pages()]
+
+
+def run_autolink(store, targets):
+    module = _module('physician-autolink-v3.py')
+    matcher = module.PhysicianMatcher(module.build_physician_patterns(_name_index(store)))
+    total = 0
+    for rel in targets:
+        with trace.page(rel, stage='autolink'):
+            content, links_added = module.link_physicians(store.read(rel), store.abspath(rel), matcher)
+        store.write(rel, content)
+        total += links_added
+    print(f"  🔗 {total} link aggiunti")
+
+
+def _profile_updater():
+    module = _module('update-all-profiles.py')
+    if 'profile_updater' not in _modules:
+        updater = module.ProfileUpdater(SITE_ROOT)
+        updater.load_data()
+        _modules['profile_updater'] = updater
+    return _modules['profile_updater']
+
+
+def profile_pages(store):
+    updater = _profile_updater()
+    pages = []
+    for physician in updater.physicians:
+        slug = physician.get('slug')
+        if slug and store.exists(f"equipe/{slug}.html"):
+            pages.append(f"equipe/{slug}.html")
+    return pages
+
+
+def run_update_profiles(store, targets):
+    updater = _profile_updater()
+    by_page = {f"equipe/{p.get('slug')}.html": p for p in updater.physicians if p.get('slug')}
+    for rel in targets:
+        with trace.page(rel, stage='update-profiles'):
+            store.write(rel, updater.update_profile_html(store.read(rel), by_page[rel]))
+
+
+def run_search_index(store, targets):
+    import json
+    module = _module('update-search-index.py')
+    physicians_data = json.loads(store.read(PHYSICIANS_JSON))
+    index_data = json.loads(store.read('data/search/index.json'))
+    index_data, version_data = module.build_search_index(physicians_data, index_data)
+    store.write('data/search/index.json', json.dumps(index_data, ensure_ascii=False, indent=2))
+    store.write('data/cache/version.json', json.dumps(version_data, ensure_ascii=False, indent=2))
+    compiled = searchindex.compile_search_index(index_data, json.loads(store.read(SEARCH_SYNONYMS)))
+    store.write(searchindex.COMPILED_RELPATH, searchindex.dump_compiled(compiled))
+    print(f"  🔍 {version_data['terms']} termini, {version_data['physicians']} medici, "
+          f"{len(compiled['words'])} chiavi nell'indice compilato")
+
+
+def run_listino(store, targets):
+    cache = listino.StageCache(store.read(listino.STAGE_CACHE_RELPATH))
+    rows = listino.parse_rows(store.abspath(listino.XLSX_RELPATH).read_bytes())
+    entries = listino.build_listino(rows, cache)
+    store.write(listino.LISTINO_RELPATH, listino.dump_listino(entries))
+    store.write(listino.STAGE_CACHE_RELPATH, cache.dumps())
+    print(f"  📥 {len(entries)} esami: {cache.hits} stage dalla cache, {cache.misses} ricalcolati")
+
+
+def run_lab_shards(store, targets):
+    import json
+    listino = json.loads(store.read(labshards.LISTINO_RELPATH))
+    core = store.read(labshards.CORE_RELPATH)
+    vocabulary = labshards.fuzzy_vocabulary(core, json.loads(store.read(SEARCH_SYNONYMS)))
+    manifest, files = labshards.build_lab_shards(listino, vocabulary)
+    for rel, text in files.items():
+        store.write(rel, text)
+    for rel in labshards.stale_shards(SITE_ROOT, files):
+        store.remove(rel)
+    store.write(labshards.CORE_RELPATH, labshards.splice_manifest(core, manifest))
+    print(f"  🧪 {manifest['stats']['totaleEsami']} esami in {len(files)} shard")
+
+
+def images_manifest():
+    """Manifest delle varianti dalle immagini su disco (calcolato una volta per build)"""
+    if 'images_manifest' not in _modules:
+        _modules['images_manifest'] = images.build_manifest(
+            SITE_ROOT, lambda rel: (SITE_ROOT / rel).read_bytes())
+    return _modules['images_manifest']
+
+
+def run_images(store, targets):
+    manifest = images_manifest()
+    if not images.formats():
+        print("  ⚠️  Pillow non installato (pip install pillow): solo width/height e lazy loading")
+    jobs = images.plan_variants(SITE_ROOT, manifest, lambda rel: (SITE_ROOT / rel).exists())
+    encoded = images.encode_all(jobs, parse_jobs())
+    for rel, data in encoded.items():
+        store.write_bytes(rel, data)
+    for rel in images.stale_variants(SITE_ROOT, manifest):
+        store.remove(rel)
+    total = 0
+    for rel in targets:
+        with trace.page(rel, stage='images'):
+            html, rewritten = images.rewrite_page(store.read(rel), manifest)
+        if html != store.read(rel):
+            store.write(rel, html)
+        total += rewritten
+    store.write(images.MANIFEST_RELPATH, images.dump_manifest(manifest))
+    print(f"  🖼️  {len(manifest)} immagini, {len(encoded)} varianti nuove, {total} <img> riscritte")
+
+
+def critical_css_inputs(store):
+    """Fogli di css/ e script di js/ correnti (in memoria)"""
+    sources = {rel: store.read(rel) for rel in criticalcss.find_sources(SITE_ROOT)}
+    scripts = {rel: store.read(rel) for rel in criticalcss.find_scripts(SITE_ROOT)}
+    return sources, scripts
+
+
+def critical_css_digest(store):
+    sources, scripts = critical_css_inputs(store)
+    return '\n'.join(f"{rel}:{hash_bytes(text)}" for rel, text in {**sources, **scripts}.items())
+
+
+def run_critical_css(store, targets):
+    sources, scripts = critical_css_inputs(store)
+    pages = {rel: store.read(rel) for rel in fingerprint_pages(store)}
+    family_index = criticalcss.load_family_index(store.read)
+    files, rewritten, stats = criticalcss.build_critical_css(pages, sources, scripts.values(), family_index)
+    for rel, text in files.items():
+        store.write(rel, text)
+    for rel in criticalcss.stale_pruned(SITE_ROOT, files):
+        store.remove(rel)
+    for rel, html in rewritten.items():
+        store.write(rel, html)
+    before = sum(s['bytes'] for s in stats.values())
+    after = sum(s['pruned'] for s in stats.values())
+    print(f"  🎨 {len(stats)} famiglie, {len(files)} fogli potati "
+          f"({before // 1024} KB → {after // 1024} KB), {len(rewritten)} pagine riscritte")
+
+
+def fingerprint_manifest(store):
+    """Manifest {sorgente: copia con hash} dal contenuto corrente (in memoria) di css/ e js/"""
+    sources = {rel: store.read(rel) for rel in fingerprint.find_sources(SITE_ROOT)}
+    return sources, fingerprint.build_manifest(sources)
+
+
+def fingerprint_pages(store):
+    pages = set(fingerprint.find_pages(SITE_ROOT))
+    pages.update(rel for rel in store.created() if rel.endswith('.html'))
+    return sorted(pages)
+
+
+def run_fingerprint(store, targets):
+    sources, manifest = fingerprint_manifest(store)
+    for rel, target in manifest.items():
+        store.write(target, sources[rel])
+    for rel in fingerprint.stale_fingerprints(SITE_ROOT, manifest.values()):
+        store.remove(rel)
+    total = 0
+    for rel in targets:
+        with trace.page(rel, stage='fingerprint'):
+            html, replaced = fingerprint.rewrite_references(store.read(rel), manifest)
+        if replaced:
+            store.write(rel, html)
+            total += replaced
+    store.write(fingerprint.MANIFEST_RELPATH, fingerprint.dump_manifest(manifest))
+    print(f"  🔖 {len(manifest)} asset, {total} riferimenti aggiornati")
+
+
+def sitemap_paths(store):
+    module = _module(SITE_ROOT / 'generate_sitemap.py')
+    paths = set(module.scan_html_files())
+    paths.update(rel for rel in store.created() if module.is_sitemap_page(rel))
+    return module, module.sort_sitemap_paths(paths)
+
+
+def run_sitemap(store, targets):
+    module, paths = sitemap_paths(store)
+    # lastmod dal contenuto finale (in memoria) delle pagine
+    tracker = module.LastmodTracker(SITE_ROOT)
+    entries = ((rel, tracker.lastmod(rel, store.read(rel))) for rel in paths)
+    written = []
+    for name, data in module.iter_sitemap_files(entries):
+        store.write_bytes(name, data)
+        written.append(name)
+    for name in module.stale_sitemap_files(written):
+        store.remove(name)
+    if store.exists('robots.txt'):
+        store.write('robots.txt', module.update_robots(store.read('robots.txt'), written[-1]))
+    store.write(module.LASTMOD_RELPATH, tracker.dumps())
+    print(f"  🗺️  {len(paths)} URL in {len(written)} file")
+
+
+STAGES = [
+    Stage('generate-physicians', _script_path('generate-physician-pages-jinja.py'),
+          PHYSICIANS_YAML + ['templates/physician.html.j2', MASTER_HEADER, MASTER_FOOTER, COMPONENTS_MODULE, *SCHEMA_GRAPH],
+          run_generate_physicians),
+    Stage('generate-procedures', _script_path('generate-procedure-pages.py'),
+          PHYSICIANS_YAML + [MASTER_HEADER, MASTER_FOOTER, COMPONENTS_MODULE, *SCHEMA_GRAPH],
+          run_generate_procedures),
+    Stage('generate-equipe-index', _script_path('generate-equipe-index.py'),
+          [PHYSICIANS_JSON, MASTER_HEADER, MASTER_FOOTER, COMPONENTS_MODULE, *SCHEMA_GRAPH],
+          run_generate_equipe_index),
+    Stage('name-index', _script_path('build-name-index.py'),
+          [PHYSICIANS_JSON, NAME_VARIANTS_MODULE], run_name_index),
+    Stage('propagate-header', _script_path('propagate-header.py'),
+          [MASTER_HEADER, COMPONENTS_MODULE], run_propagate_header, pages=header_pages),
+    Stage('autolink', _script_path('physician-autolink-v3.py'),
+          [PHYSICIANS_JSON, NAME_VARIANTS_MODULE], run_autolink, pages=autolink_pages),
+    Stage('update-profiles', _script_path('update-all-profiles.py'),
+          [PHYSICIANS_JSON, PHYSICIANS_EXTENDED_JSON, *SCHEMA_GRAPH], run_update_profiles,
+          pages=profile_pages),
+    Stage('search-index', _script_path('update-search-index.py'),
+          [PHYSICIANS_JSON, SEARCH_SYNONYMS, 'scripts/bioclinic/searchindex.py'], run_search_index),
+    Stage('listino', _script_path('build-listino.py'),
+          [listino.XLSX_RELPATH, LISTINO_MODULE], run_listino),
+    Stage('lab-shards', _script_path('build-lab-shards.py'),
+          [listino.XLSX_RELPATH, LISTINO_MODULE, labshards.LISTINO_RELPATH, LAB_SHARDS_MODULE,
+           SEARCH_SYNONYMS, 'scripts/bioclinic/fuzzy.py'],
+          run_lab_shards),
+    Stage('images', _script_path('optimize-images.py'), [IMAGES_MODULE], run_images,
+          pages=fingerprint_pages, extra=lambda store: images.dump_manifest(images_manifest())),
+    Stage('critical-css', _script_path('critical-css.py'),
+          [CRITICAL_CSS_MODULE, *criticalcss.FAMILY_SOURCES], run_critical_css,
+          follows_pages=True, extra=critical_css_digest),
+    Stage('fingerprint', _script_path('fingerprint-assets.py'), [FINGERPRINT_MODULE],
+          run_fingerprint, pages=fingerprint_pages,
+          extra=lambda store: fingerprint.dump_manifest(fingerprint_manifest(store)[1])),
+    # La lista delle pagine è essa stessa un input della sitemap
+    Stage('sitemap', 'generate_sitemap.py', [], run_sitemap, follows_pages=True,
+          extra=lambda store: '\n'.join(sitemap_paths(store)[1])),
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RUNNER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_only(argv):
+    for i, arg in enumerate(argv):
+        if arg == '--only' and i + 1 < len(argv):
+            return set(argv[i + 1].split(','))
+        if arg.startswith('--only='):
+            return set(arg.split('=', 1)[1].split(','))
+    return None
+
+
+def run_pipeline(force=False, dry_run=False, only=None):
+    """Esegue gli stage; ritorna (ok, file scritti o da scrivere)"""
+    store = PageStore(SITE_ROOT)
+    state = PipelineState(SITE_ROOT)
+    _modules['pipeline_state'] = state
+
+    # Una sola lettura per pagina: tutto il sito finisce in memoria
+    with trace.span('carica pagine'):
+        store.load(header_pages(store))
+    dirty = state.modified_pages(store)
+    print(f"📄 {len(store.loaded())} pagine caricate ({store.bytes_read // 1024} KB), "
+          f"{len(dirty)} modificate dall'ultima build")
+    print("-" * 70)
+
+    ok = True
+    for stage in STAGES:
+        if only and stage.name not in only:
+            continue
+        digest = stage.digest(stage.extra(store) if stage.extra else '')
+        changed = force or state.stage_changed(stage.name, digest)
+        html_dirty = {rel for rel in dirty | set(store.changed()) if rel.endswith('.html')}
+
+        targets = []
+        if stage.pages is not None:
+            scope = stage.pages(store)
+            targets = scope if changed else [rel for rel in scope if rel in html_dirty]
+            if not targets:
+                print(f"⏭️  {stage.name}: invariato")
+                state.mark_stage(stage.name, digest)
+                continue
+        elif not changed and not (stage.follows_pages and html_dirty):
+            print(f"⏭️  {stage.name}: invariato")
+            continue
+
+        started = time.perf_counter()
+        label = f" ({len(targets)} pagine)" if stage.pages is not None else ""
+        span_args = {'pages': len(targets)} if stage.pages is not None else {}
+        print(f"▶️  {stage.name}{label}")
+        try:
+            with trace.span(stage.name, **span_args):
+                stage.run(store, targets)
+        except Exception as e:
+            print(f"  ❌ {stage.name} fallito: {e}")
+            ok = False
+            break
+        state.mark_stage(stage.name, digest)
+        print(f"  ✅ {stage.name} in {time.perf_counter() - started:.2f}s")
+
+    changed_files = store.changed()
+    if dry_run:
+        return ok, changed_files
+
+    # Snapshot delle pagine e dei file che stanno per cambiare
+    # (backups/, saltato con --no-snapshot)
+    if changed_files:
+        with trace.span('snapshot'):
+            snapshots.before_write('build', SITE_ROOT, set(fingerprint.find_pages(SITE_ROOT)) | set(changed_files))
+
+    # Scrittura finale: ogni file al massimo una volta (anche dopo un errore,
+    # per non perdere il lavoro degli stage completati)
+    with trace.span('scrittura', files=len(changed_files)):
+        written = store.flush()
+    if ok:
+        state.record_pages(store)
+        state.save()
+    return ok, written
+
+
+def validate_data():
+    """Primo controllo della build: regole di schema.yaml sui dati v2 (build.validation.pre_build)"""
+    try:
+        rules = datarules.load_rules(SITE_ROOT)
+        if not rules.settings.get('pre_build', True):
+            return True
+        report = datarules.validate_site(SITE_ROOT)
+    except datarules.SchemaRuleError as e:
+        print(f"❌ {e}")
+        return False
+    load_script('validate-data.py').print_report(report)
+    if not report.ok:
+        print("❌ Build interrotta: correggere i dati (scripts/validate-data.py)")
+    return report.ok
+
+
+def main():
+    argv = sys.argv[1:]
+    force = '--force' in argv
+    dry_run = '--dry-run' in argv
+    only = parse_only(argv)
+    # Gli hook trace.* degli script caricati dagli stage finiscono nello stesso trace
+    trace.setup('build', SITE_ROOT)
+
+    print("=" * 70)
+    print("BIO-CLINIC BUILD PIPELINE v1.0")
+    print(f"Esecuzione: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+
+    started = time.perf_counter()
+    with trace.span('valida dati'):
+        data_ok = validate_data()
+    if not data_ok:
+        print("=" * 70)
+        return 1
+    ok, files = run_pipeline(force=force, dry_run=dry_run, only=only)
+
+    print("-" * 70)
+    verb = "da scrivere (dry-run)" if dry_run else "scritti"
+    print(f"📊 File {verb}: {len(files)}")
+    for rel in files[:20]:
+        print(f"   • {rel}")
+    if len(files) > 20:
+        print(f"   ... e altri {len(files) - 20}")
+    print(f"⏱️  Tempo totale: {time.perf_counter() - started:.2f}s")
+
+    if ok and '--validate' in argv and not dry_run:
+        print("=" * 70)
+        validator = load_script('validate-site-v2.py').SiteValidator(SITE_ROOT)
+        with trace.span('validate'):
+            ok = validator.run_validation(jobs=parse_jobs())
+
+    if ok and '--precompress' in argv and not dry_run:
+        print("=" * 70)
+        print("🗜️  Precompressione asset")
+        precompress_script = load_script('precompress.py')
+        with trace.span('precompress'):
+            report, skipped, removed = precompress.precompress_site(SITE_ROOT, parse_jobs(), force)
+        precompress_script.print_report(report, skipped, removed)
+
+    print("=" * 70)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ import json
 import re
 from pathlib import Path
 
+from bioclinic import snapshots, writes
+
 def load_physicians_data():
     with open("data/entities/physicians-extended.json", 'r', encoding='utf-8') as f:
         return json.load(f)
@@ -94,12 +96,13 @@ def clean_and_rebuild(slug, info, equipe_dir):
             # Inserisci prima di </body>
             content = content.replace('</body>', new_pub_html + '\n  </body>', 1)
     
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    writes.write_text(html_file, content)
     
     return True
 
 def main():
+    writes.setup('clean-and-rebuild-publications')
+    snapshots.before_write('clean-and-rebuild-publications')
     print("=" * 60)
     print("PULIZIA E RICOSTRUZIONE SEZIONI PUBBLICAZIONI")
     print("=" * 60)
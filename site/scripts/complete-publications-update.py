@@ -12,6 +12,8 @@ import os
 import re
 from pathlib import Path
 
+from bioclinic import schemagraph, snapshots, writes
+
 # Nuovi medici con pubblicazioni trovate
 NUOVI_MEDICI = {
     "sara-uras": {
@@ -173,8 +175,7 @@ def update_json_database():
     data['metadata']['last_verification'] = "2026-01-28"
     data['version'] = "4.1.0"
     
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    writes.write_text(json_path, json.dumps(data, ensure_ascii=False, indent=2))
     
     print(f"\n📊 Database aggiornato:")
     print(f"   Medici con pubblicazioni: {data['metadata']['physicians_with_publications']}")
@@ -260,16 +261,25 @@ def update_html_profiles(physicians_data):
                 )
         
         # Aggiorna anche lo schema JSON-LD per rimuovere gli anni
-        content = re.sub(r'"datePublished":\s*"\d{4}"', '', content)
+        content, _ = schemagraph.rewrite_blocks(content, without_publication_years)
         
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if not writes.write_text(html_file, content):
+            continue
         
         updated += 1
         print(f"✅ Aggiornato: {slug}")
     
     return updated
 
+def without_publication_years(data):
+    """Dati JSON-LD senza datePublished negli articoli (in un oggetto nuovo)"""
+    if isinstance(data, list):
+        return [without_publication_years(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {key: without_publication_years(value) for key, value in data.items()
+            if not (key == 'datePublished' and data.get('@type') == 'ScholarlyArticle')}
+
 def fix_all_publications_title():
     """Sostituisce 'Pubblicazioni Scientifiche' con 'Alcune delle Pubblicazioni Scientifiche' in tutti i file"""
     equipe_dir = Path("equipe")
@@ -291,12 +301,13 @@ def fix_all_publications_title():
         # Pattern: "— 2003 —" o "— 2024 —" o "— Fertility" diventa "— Fertility"
         content = re.sub(r'— \d{4} —', '—', content)
         
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        writes.write_text(html_file, content)
     
     print(f"✏️ Titoli aggiornati: {count} file")
 
 def main():
+    writes.setup('complete-publications-update')
+    snapshots.before_write('complete-publications-update')
     print("=" * 60)
     print("AGGIORNAMENTO COMPLETO PUBBLICAZIONI BIO-CLINIC")
     print("=" * 60)
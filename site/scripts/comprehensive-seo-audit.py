@@ -2,6 +2,8 @@
 """
 Audit SEO/SERP AI Completo per Bio-Clinic
 Verifica tutti gli aspetti tecnici, contenutistici e strutturali
+
+Uso: python3 scripts/comprehensive-seo-audit.py [--jobs N] [--trace[=FILE]]
 """
 
 import json
@@ -12,6 +14,58 @@ from collections import defaultdict
 from urllib.parse import urlparse
 import html.parser
 
+from bioclinic import trace
+from bioclinic.parallel import parse_jobs, run_sharded
+
+
+class ParsedPage:
+    """Pagina HTML letta e analizzata una sola volta.
+
+    Tutti i check_* lavorano su questo oggetto invece di rileggere il file
+    e ripetere le stesse regex: un audit completo costa una lettura e un
+    parsing per pagina.
+    """
+
+    def __init__(self, file_path, content=None):
+        self.path = Path(file_path)
+        if content is None:
+            content = self.path.read_text(encoding='utf-8', errors='ignore')
+            trace.bytes_read(content)
+        self.content = content
+        self.lower = content.lower()
+
+        # Head / meta
+        title_match = re.search(r'<title[^>]*>([^<]+)</title>', content, re.IGNORECASE)
+        self.title = title_match.group(1) if title_match else None
+
+        desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', content, re.IGNORECASE)
+        if not desc_match:
+            desc_match = re.search(r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']', content, re.IGNORECASE)
+        self.meta_description = desc_match.group(1) if desc_match else None
+
+        self.has_html_lang = re.search(r'<html[^>]*lang=', content, re.IGNORECASE) is not None
+
+        # JSON-LD
+        self.json_ld_blocks = re.findall(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', content, re.DOTALL | re.IGNORECASE)
+
+        # Link, immagini, heading
+        self.links = re.findall(r'href=["\']([^"\']+)["\']', content)
+        self.images = re.findall(r'<img[^>]+>', content, re.IGNORECASE)
+        self.images_without_alt = re.findall(r'<img(?![^>]*alt=)[^>]*>', content, re.IGNORECASE)
+        self.picture_sources = re.findall(r'<source[^>]+srcset=[^>]*>', content, re.IGNORECASE)
+        self.headings = re.findall(r'<h([1-6])', content, re.IGNORECASE)
+
+        # Risorse e stili
+        self.external_urls = re.findall(r'(https?://[^/"\'\s]+)', content)
+        self.preconnects = re.findall(r'rel=["\']preconnect["\']', content)
+        self.inline_styles = re.findall(r'<style[^>]*>.*?</style>', content, re.DOTALL)
+        self.font_sizes = re.findall(r'font-size:\s*(\d+)px', content)
+
+        # Testo senza tag
+        text = re.sub(r'<[^>]+>', ' ', content)
+        self.text = re.sub(r'\s+', ' ', text).strip()
+
+
 class SEOAudit:
     def __init__(self, site_dir):
         self.site_dir = Path(site_dir)
@@ -19,6 +73,7 @@ class SEOAudit:
         self.warnings = []
         self.successes = []
         self.scores = {}
+        self._link_suffix_cache = {}
         
     def log_error(self, category, message, file=None):
         self.errors.append({"category": category, "message": message, "file": file})
@@ -29,56 +84,51 @@ class SEOAudit:
     def log_success(self, category, message):
         self.successes.append({"category": category, "message": message})
 
-    def check_html_validity(self, file_path):
+    def check_html_validity(self, page):
         """Verifica validità HTML base"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        lower = page.lower
         
         # DOCTYPE
-        if not content.strip().lower().startswith('<!doctype html'):
+        if not lower.strip().startswith('<!doctype html'):
             issues.append("Manca DOCTYPE")
         
         # Tag essenziali
         essential_tags = ['<html', '<head', '<body', '</html>', '</head>', '</body>']
         for tag in essential_tags:
-            if tag not in content.lower():
+            if tag not in lower:
                 issues.append(f"Manca tag: {tag}")
         
         # Charset
-        if 'charset' not in content.lower():
+        if 'charset' not in lower:
             issues.append("Manca charset declaration")
             
         # Viewport
-        if 'viewport' not in content.lower():
+        if 'viewport' not in lower:
             issues.append("Manca viewport meta tag")
         
         return issues
 
-    def check_seo_meta(self, file_path):
+    def check_seo_meta(self, page):
         """Verifica meta tag SEO"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = page.content
         
         # Title
-        title_match = re.search(r'<title[^>]*>([^<]+)</title>', content, re.IGNORECASE)
-        if not title_match:
+        if page.title is None:
             issues.append("Manca tag <title>")
         else:
-            title = title_match.group(1)
+            title = page.title
             if len(title) < 30:
                 issues.append(f"Title troppo corto: {len(title)} chars (min 30)")
             elif len(title) > 65:
                 issues.append(f"Title troppo lungo: {len(title)} chars (max 65)")
         
         # Meta description
-        desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)["\']', content, re.IGNORECASE)
-        if not desc_match:
-            desc_match = re.search(r'<meta[^>]*content=["\']([^"\']+)["\'][^>]*name=["\']description["\']', content, re.IGNORECASE)
-        
-        if not desc_match:
+        if page.meta_description is None:
             issues.append("Manca meta description")
         else:
-            desc = desc_match.group(1)
+            desc = page.meta_description
             if len(desc) < 120:
                 issues.append(f"Meta description troppo corta: {len(desc)} chars (min 120)")
             elif len(desc) > 160:
@@ -96,18 +146,17 @@ class SEOAudit:
         
         return issues
 
-    def check_schema_markup(self, file_path):
+    def check_schema_markup(self, page):
         """Verifica Schema.org markup"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
         
         # JSON-LD
-        if 'application/ld+json' not in content:
+        if 'application/ld+json' not in page.content:
             issues.append("Manca Schema.org JSON-LD")
             return issues
         
-        # Estrai e valida JSON-LD
-        json_ld_matches = re.findall(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', content, re.DOTALL | re.IGNORECASE)
+        # Valida i blocchi JSON-LD già estratti
+        json_ld_matches = page.json_ld_blocks
         
         if not json_ld_matches:
             issues.append("JSON-LD presente ma non parsabile")
@@ -137,26 +186,24 @@ class SEOAudit:
         
         return issues
 
-    def check_accessibility(self, file_path):
+    def check_accessibility(self, page):
         """Verifica accessibilità base"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
         
         # Lang attribute
-        if not re.search(r'<html[^>]*lang=', content, re.IGNORECASE):
+        if not page.has_html_lang:
             issues.append("Manca attributo lang su <html>")
         
         # Alt text su immagini
-        img_without_alt = re.findall(r'<img(?![^>]*alt=)[^>]*>', content, re.IGNORECASE)
-        if img_without_alt:
-            issues.append(f"{len(img_without_alt)} immagini senza alt text")
+        if page.images_without_alt:
+            issues.append(f"{len(page.images_without_alt)} immagini senza alt text")
         
         # Skip links
-        if 'skip' not in content.lower() and 'main-content' not in content.lower():
+        if 'skip' not in page.lower and 'main-content' not in page.lower:
             issues.append("Potrebbe mancare skip link per accessibilità")
         
         # Heading hierarchy
-        headings = re.findall(r'<h([1-6])', content, re.IGNORECASE)
+        headings = page.headings
         if headings:
             if headings[0] != '1':
                 issues.append("La pagina non inizia con H1")
@@ -172,46 +219,56 @@ class SEOAudit:
         
         return issues
 
-    def check_performance_hints(self, file_path):
+    def check_performance_hints(self, page):
         """Verifica ottimizzazioni performance"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
         
         # Lazy loading per immagini
-        imgs = re.findall(r'<img[^>]+>', content, re.IGNORECASE)
-        imgs_without_lazy = [img for img in imgs if 'loading=' not in img.lower()]
+        imgs_without_lazy = [img for img in page.images if 'loading=' not in img.lower()]
         if imgs_without_lazy and len(imgs_without_lazy) > 2:
             issues.append(f"{len(imgs_without_lazy)} immagini senza lazy loading")
+
+        # Dimensioni esplicite (evitano il layout shift)
+        imgs_without_size = [img for img in page.images
+                             if 'width=' not in img.lower() or 'height=' not in img.lower()]
+        if imgs_without_size:
+            issues.append(f"{len(imgs_without_size)} immagini senza width/height "
+                          "(scripts/optimize-images.py)")
         
         # Preconnect/Preload per risorse esterne
         external_domains = set()
-        for match in re.findall(r'(https?://[^/"\'\s]+)', content):
+        for match in page.external_urls:
             domain = urlparse(match).netloc
             if domain and 'bio-clinic' not in domain:
                 external_domains.add(domain)
         
         if external_domains:
-            preconnects = re.findall(r'rel=["\']preconnect["\']', content)
-            if len(preconnects) < len(external_domains) // 2:
+            if len(page.preconnects) < len(external_domains) // 2:
                 issues.append(f"Considera preconnect per domini esterni: {len(external_domains)} trovati")
         
         # CSS/JS inline eccessivo
-        inline_styles = re.findall(r'<style[^>]*>.*?</style>', content, re.DOTALL)
-        total_inline_css = sum(len(s) for s in inline_styles)
+        total_inline_css = sum(len(s) for s in page.inline_styles)
         if total_inline_css > 10000:
             issues.append(f"CSS inline eccessivo: {total_inline_css} bytes")
         
         return issues
 
-    def check_internal_links(self, file_path, all_files):
+    def _matches_known_file(self, name, all_files):
+        """True se qualche file del sito termina con `name` (memoizzato per audit)"""
+        cached = self._link_suffix_cache.get(name)
+        if cached is None:
+            trace.count('cache_miss')
+            cached = any(str(f).endswith(name) for f in all_files)
+            self._link_suffix_cache[name] = cached
+        else:
+            trace.count('cache_hit')
+        return cached
+
+    def check_internal_links(self, page, all_files):
         """Verifica link interni"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Trova tutti i link interni
-        links = re.findall(r'href=["\']([^"\']+)["\']', content)
         
-        for link in links:
+        for link in page.links:
             if link.startswith('#') or link.startswith('http') or link.startswith('mailto:') or link.startswith('tel:'):
                 continue
             
@@ -219,28 +276,22 @@ class SEOAudit:
             if link.startswith('/'):
                 target = self.site_dir / link.lstrip('/')
             else:
-                target = file_path.parent / link
-            
-            target_str = str(target.resolve())
+                target = page.path.parent / link
             
             # Verifica se il file esiste
-            if not target.exists() and not any(str(f).endswith(link.split('/')[-1]) for f in all_files):
+            if not target.exists() and not self._matches_known_file(link.split('/')[-1], all_files):
                 issues.append(f"Link rotto: {link}")
         
         return issues
 
-    def check_content_quality(self, file_path):
+    def check_content_quality(self, page):
         """Verifica qualità contenuto"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Rimuovi HTML tags per analisi testo
-        text = re.sub(r'<[^>]+>', ' ', content)
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = page.text
         
         # Word count
         words = len(text.split())
-        if words < 300 and 'index' not in str(file_path).lower():
+        if words < 300 and 'index' not in str(page.path).lower():
             issues.append(f"Contenuto scarso: {words} parole (min 300)")
         
         # Keyword stuffing check (parole ripetute eccessivamente)
@@ -256,43 +307,43 @@ class SEOAudit:
         
         return issues
 
-    def check_mobile_friendly(self, file_path):
+    def check_mobile_friendly(self, page):
         """Verifica mobile-friendliness"""
         issues = []
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
         
         # Viewport
-        if 'viewport' not in content:
+        if 'viewport' not in page.content:
             issues.append("Manca viewport meta tag")
         
         # Touch targets (buttons, links)
-        small_touch = re.findall(r'font-size:\s*(\d+)px', content)
-        if small_touch:
-            small_sizes = [int(s) for s in small_touch if int(s) < 12]
+        if page.font_sizes:
+            small_sizes = [int(s) for s in page.font_sizes if int(s) < 12]
             if small_sizes:
                 issues.append(f"Font size troppo piccoli per mobile: {small_sizes}")
         
         # Responsive images
-        imgs = re.findall(r'<img[^>]+>', content, re.IGNORECASE)
+        imgs = page.images
         responsive_imgs = [img for img in imgs if 'srcset' in img or 'sizes' in img]
-        if len(imgs) > 3 and len(responsive_imgs) == 0:
+        if len(imgs) > 3 and len(responsive_imgs) == 0 and not page.picture_sources:
             issues.append("Nessuna immagine responsive (srcset/sizes)")
         
         return issues
 
     def audit_file(self, file_path, all_files):
-        """Audit completo di un singolo file"""
-        results = {
-            "file": str(file_path.relative_to(self.site_dir)),
-            "html_validity": self.check_html_validity(file_path),
-            "seo_meta": self.check_seo_meta(file_path),
-            "schema_markup": self.check_schema_markup(file_path),
-            "accessibility": self.check_accessibility(file_path),
-            "performance": self.check_performance_hints(file_path),
-            "internal_links": self.check_internal_links(file_path, all_files),
-            "content_quality": self.check_content_quality(file_path),
-            "mobile_friendly": self.check_mobile_friendly(file_path)
-        }
+        """Audit completo di un singolo file (una lettura, un parsing)"""
+        with trace.page(str(file_path.relative_to(self.site_dir))):
+            page = ParsedPage(file_path)
+            results = {
+                "file": str(file_path.relative_to(self.site_dir)),
+                "html_validity": self.check_html_validity(page),
+                "seo_meta": self.check_seo_meta(page),
+                "schema_markup": self.check_schema_markup(page),
+                "accessibility": self.check_accessibility(page),
+                "performance": self.check_performance_hints(page),
+                "internal_links": self.check_internal_links(page, all_files),
+                "content_quality": self.check_content_quality(page),
+                "mobile_friendly": self.check_mobile_friendly(page)
+            }
         
         return results
 
@@ -326,15 +377,16 @@ class SEOAudit:
         
         return max(0, round(score, 1)), deductions, total_issues
 
-    def run_full_audit(self):
-        """Esegue audit completo del sito"""
+    def run_full_audit(self, jobs=1):
+        """Esegue audit completo del sito (jobs > 1: pool di processi)"""
         print("=" * 70)
         print("🔍 AUDIT SEO/SERP AI COMPLETO - BIO-CLINIC")
         print("=" * 70)
         
         # Trova tutti i file HTML
-        html_files = list(self.site_dir.glob('**/*.html'))
-        html_files = [f for f in html_files if not any(x in str(f) for x in ['node_modules', '.git', 'reports'])]
+        with trace.span('trova pagine'):
+            html_files = list(self.site_dir.glob('**/*.html'))
+            html_files = [f for f in html_files if not any(x in str(f) for x in ['node_modules', '.git', 'reports'])]
         
         print(f"\n📁 File HTML trovati: {len(html_files)}")
         
@@ -342,8 +394,16 @@ class SEOAudit:
         total_score = 0
         critical_issues = []
         
-        for file_path in html_files:
-            results = self.audit_file(file_path, html_files)
+        with trace.span('audit pagine', pages=len(html_files), jobs=jobs):
+            if jobs <= 1:
+                page_results = [self.audit_file(file_path, html_files) for file_path in html_files]
+            else:
+                print(f"⚡ Audit parallelo su {jobs} processi")
+                page_results = run_sharded(_audit_file_worker, html_files, jobs,
+                                           initializer=_init_worker,
+                                           initargs=(self.site_dir, html_files))
+        
+        for results in page_results:
             score, deductions, num_issues = self.calculate_score(results)
             results['score'] = score
             results['deductions'] = deductions
@@ -466,6 +526,20 @@ class SEOAudit:
         
         return avg_score, all_results
 
+# Worker per la modalità parallela (--jobs N)
+_worker_audit = None
+_worker_all_files = None
+
+def _init_worker(site_dir, all_files):
+    global _worker_audit, _worker_all_files
+    _worker_audit = SEOAudit(site_dir)
+    _worker_all_files = all_files
+
+def _audit_file_worker(file_path):
+    return _worker_audit.audit_file(file_path, _worker_all_files)
+
+
 if __name__ == "__main__":
+    trace.setup('comprehensive-seo-audit', '.')
     audit = SEOAudit(".")
-    audit.run_full_audit()
+    audit.run_full_audit(jobs=parse_jobs())
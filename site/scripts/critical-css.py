@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC CSS CRITICO                                                      ║
+║                                                                               ║
+║  Per ogni famiglia di pagine (equipe, prestazioni, specialità, ...) e ogni   ║
+║  foglio di css/ scrive un foglio potato delle regole mai usate               ║
+║  (css/pruned/<famiglia>-<foglio>.<hash>.css) e mette inline nell'<head> le   ║
+║  regole usate above the fold; il foglio completo si carica senza bloccare.   ║
+║                                                                               ║
+║  Uso: python3 scripts/critical-css.py [--dry-run] [--diff]                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from pathlib import Path
+
+from bioclinic import fingerprint, snapshots, writes
+from bioclinic.criticalcss import stale_pruned, write_critical_css
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def format_kb(size):
+    return f"{size / 1024:.1f} KB"
+
+
+def main():
+    dry_run = writes.setup('critical-css')
+    # Pagine e fogli potati esistenti (quelli obsoleti vengono cancellati)
+    snapshots.before_write('critical-css', SITE_ROOT,
+                           fingerprint.find_pages(SITE_ROOT) + stale_pruned(SITE_ROOT, ()))
+    stats, written, stale, pages = write_critical_css(SITE_ROOT)
+
+    prefix = "🔍 [DRY-RUN] " if dry_run else "✅ "
+    print(f"{prefix}{len(stats)} famiglie, {len(pages)} pagine riscritte")
+    for family, data in stats.items():
+        print(f"   🎨 {family}: {data['pages']} pagine, {data['sheets']} fogli, "
+              f"{format_kb(data['bytes'])} → {format_kb(data['pruned'])} potati, "
+              f"{format_kb(data['critical'])} critici inline")
+    print(f"   📝 {len(written)} fogli nuovi, 🗑️  {len(stale)} obsoleti")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -19,6 +19,8 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+from bioclinic import schemagraph, snapshots, writes
+
 # Configurazione
 SITE_ROOT = Path(__file__).parent.parent
 DATA_DIR = SITE_ROOT / "data" / "entities"
@@ -39,34 +41,10 @@ def load_extended_data():
     except FileNotFoundError:
         return {"physicians_extended": {}, "default_sintomi_by_specialty": {}}
 
-# Mapping specialità per Schema.org
-SPECIALTY_SCHEMA = {
-    'ginecologia': 'https://schema.org/Gynecologic',
-    'ostetricia': 'https://schema.org/Obstetric',
-    'cardiologia': 'https://schema.org/Cardiovascular',
-    'dermatologia': 'https://schema.org/Dermatology',
-    'endocrinologia': 'https://schema.org/Endocrine',
-    'neurologia': 'https://schema.org/Neurologic',
-    'oculistica': 'https://schema.org/Optometric',
-    'otorinolaringoiatria': 'https://schema.org/Otolaryngologic',
-    'ortopedia': 'https://schema.org/Musculoskeletal',
-    'gastroenterologia': 'https://schema.org/Gastroenterologic',
-    'medicina-interna': 'https://schema.org/InternalMedicine',
-    'nefrologia': 'https://schema.org/Renal',
-    'pneumologia': 'https://schema.org/Pulmonary',
-    'ematologia': 'https://schema.org/Hematologic',
-    'reumatologia': 'https://schema.org/Rheumatologic',
-    'urologia': 'https://schema.org/Urologic',
-    'chirurgia-vascolare': 'https://schema.org/Surgical',
-    'pediatria': 'https://schema.org/Pediatric',
-    'psicologia': 'https://schema.org/Psychiatric',
-    'nutrizione': 'https://schema.org/DietNutrition'
-}
-
-def generate_schema_graph(physician, extended):
-    """Genera Schema.org Graph complesso"""
+def generate_schema_graph(physician, extended, specialties):
+    """Genera Schema.org Graph complesso (validato, vedi bioclinic/schemagraph.py)"""
     slug = physician['slug']
-    specialty_schema = SPECIALTY_SCHEMA.get(physician.get('specialty_id', ''), 'MedicalSpecialty')
+    specialty_id = physician.get('specialty_id', '')
     
     # Build sameAs
     same_as = []
@@ -77,19 +55,10 @@ def generate_schema_graph(physician, extended):
             same_as.append(s['url'])
     
     # Build citations
-    citations = []
-    if extended.get('pubblicazioni'):
-        for pub in extended['pubblicazioni']:
-            citation = {
-                "@type": "ScholarlyArticle",
-                "name": pub['titolo'],
-                "url": pub['url']
-            }
-            if pub.get('anno'):
-                citation['datePublished'] = str(pub['anno'])
-            if pub.get('journal'):
-                citation['isPartOf'] = {"@type": "Periodical", "name": pub['journal']}
-            citations.append(citation)
+    citations = [
+        schemagraph.article(pub['titolo'], pub['url'], pub.get('anno'), pub.get('journal'))
+        for pub in extended.get('pubblicazioni') or []
+    ]
     
     # Build knowsAbout
     knows_about = []
@@ -99,83 +68,46 @@ def generate_schema_graph(physician, extended):
         for proc in physician['procedures']:
             knows_about.append(proc.replace('-', ' ').title())
     
-    # Physician schema
-    physician_schema = {
-        "@type": "Physician",
-        "@id": f"https://bio-clinic.it/equipe/{slug}/#physician",
-        "name": physician['full_name'],
-        "givenName": physician['name'].split()[0],
-        "familyName": " ".join(physician['name'].split()[1:]),
-        "honorificPrefix": physician.get('title', ''),
-        "jobTitle": physician['job_title'],
-        "description": physician.get('bio', ''),
-        "medicalSpecialty": specialty_schema,
-        "isAcceptingNewPatients": True,
-        "worksFor": {
-            "@type": "MedicalClinic",
-            "@id": "https://bio-clinic.it/#organization",
-            "name": "Bio-Clinic Sassari",
-            "address": {
-                "@type": "PostalAddress",
-                "streetAddress": "Via Renzo Mossa, 23",
-                "addressLocality": "Sassari",
-                "postalCode": "07100",
-                "addressRegion": "SS",
-                "addressCountry": "IT"
-            },
-            "telephone": "+39 079 956 1332"
-        }
-    }
-    
-    # Add optional fields
-    if physician.get('procedures'):
-        physician_schema['availableService'] = [
-            {"@type": "MedicalProcedure", "name": p.replace('-', ' ').title()}
-            for p in physician['procedures']
-        ]
+    graph = schemagraph.Graph()
+    graph.add(schemagraph.clinic())
+    specialty = None
+    if specialty_id:
+        specialty_name = specialties.get(specialty_id, {}).get('name', specialty_id.replace('-', ' ').title())
+        specialty = graph.add(schemagraph.specialty(specialty_id, specialty_name))
+    services = [graph.add(schemagraph.procedure(p, p.replace('-', ' ').title()))
+                for p in physician.get('procedures', [])]
     
-    if knows_about:
-        physician_schema['knowsAbout'] = knows_about[:15]  # Limit to 15
-    
-    if same_as:
-        physician_schema['sameAs'] = same_as
-    
-    if citations:
-        physician_schema['citation'] = citations
-    
-    if extended.get('affiliazioni'):
-        physician_schema['affiliation'] = [
-            {"@type": "Organization", "name": a}
-            for a in extended['affiliazioni']
-        ]
+    # Physician schema
+    graph.add(schemagraph.physician(
+        slug, physician['full_name'],
+        given_name=physician['name'].split()[0],
+        family_name=" ".join(physician['name'].split()[1:]),
+        honorific_prefix=physician.get('title'),
+        job_title=physician['job_title'],
+        description=physician.get('bio'),
+        specialty=specialty,
+        services=services,
+        knows_about=knows_about[:15],  # Limit to 15
+        same_as=same_as,
+        citations=citations,
+        affiliations=extended.get('affiliazioni') or [],
+        accepting_new_patients=True,
+    ))
     
     # Breadcrumb
-    breadcrumb = {
-        "@type": "BreadcrumbList",
-        "itemListElement": [
-            {"@type": "ListItem", "position": 1, "name": "Home", "item": "https://bio-clinic.it/"},
-            {"@type": "ListItem", "position": 2, "name": "Equipe", "item": "https://bio-clinic.it/equipe/"},
-            {"@type": "ListItem", "position": 3, "name": physician['full_name'], "item": f"https://bio-clinic.it/equipe/{slug}/"}
-        ]
-    }
+    graph.add(schemagraph.breadcrumb([
+        ("Home", f"{schemagraph.SITE_URL}/"),
+        ("Equipe", f"{schemagraph.SITE_URL}/equipe/"),
+        (physician['full_name'], f"{schemagraph.SITE_URL}/equipe/{slug}/"),
+    ]))
     
     # FAQPage
-    faqs = generate_faqs(physician, extended)
-    faq_page = {
-        "@type": "FAQPage",
-        "mainEntity": faqs
-    }
-    
-    # Complete graph
-    graph = {
-        "@context": "https://schema.org",
-        "@graph": [physician_schema, breadcrumb, faq_page]
-    }
+    graph.add(schemagraph.faq_page(generate_faqs(physician, extended)))
     
     return graph
 
 def generate_faqs(physician, extended):
-    """Genera FAQ automatiche"""
+    """Genera FAQ automatiche come coppie (domanda, risposta)"""
     faqs = []
     cognome = physician['name'].split()[-1]
     title = physician.get('title', 'Dott.')
@@ -183,47 +115,31 @@ def generate_faqs(physician, extended):
     
     # FAQ 1: Patologie
     sintomi = extended.get('sintomi', [])
-    faqs.append({
-        "@type": "Question",
-        "name": f"Quali patologie tratta {prefix} {cognome}?",
-        "acceptedAnswer": {
-            "@type": "Answer",
-            "text": f"{prefix.title()} {cognome} è specializzato nel trattamento di: {', '.join(sintomi[:8])}. Prenota una visita chiamando Bio-Clinic al 079 956 1332." if sintomi else f"{prefix.title()} {cognome} è {physician['job_title']} presso Bio-Clinic Sassari. Per informazioni, contatta il 079 956 1332."
-        }
-    })
+    faqs.append((
+        f"Quali patologie tratta {prefix} {cognome}?",
+        f"{prefix.title()} {cognome} è specializzato nel trattamento di: {', '.join(sintomi[:8])}. Prenota una visita chiamando Bio-Clinic al 079 956 1332." if sintomi else f"{prefix.title()} {cognome} è {physician['job_title']} presso Bio-Clinic Sassari. Per informazioni, contatta il 079 956 1332."
+    ))
     
     # FAQ 2: Pubblicazioni
     if extended.get('pubblicazioni'):
         pub_count = len(extended['pubblicazioni'])
         pub_titles = '; '.join([p['titolo'] for p in extended['pubblicazioni'][:2]])
-        faqs.append({
-            "@type": "Question",
-            "name": f"{prefix.title()} {cognome} ha pubblicazioni scientifiche?",
-            "acceptedAnswer": {
-                "@type": "Answer",
-                "text": f"Sì, {prefix} {cognome} è autore di {pub_count} pubblicazioni scientifiche indicizzate su PubMed, tra cui: \"{pub_titles}\". Questo conferma l'alto livello di competenza professionale."
-            }
-        })
+        faqs.append((
+            f"{prefix.title()} {cognome} ha pubblicazioni scientifiche?",
+            f"Sì, {prefix} {cognome} è autore di {pub_count} pubblicazioni scientifiche indicizzate su PubMed, tra cui: \"{pub_titles}\". Questo conferma l'alto livello di competenza professionale."
+        ))
     
     # FAQ 3: Dove riceve
-    faqs.append({
-        "@type": "Question",
-        "name": f"Dove riceve {prefix} {cognome}?",
-        "acceptedAnswer": {
-            "@type": "Answer",
-            "text": f"{prefix.title()} {cognome} riceve presso Bio-Clinic Sassari, in Via Renzo Mossa 23, 07100 Sassari. Orari: Lun-Ven 07:00-21:00, Sab 08:00-14:00. Tel: 079 956 1332."
-        }
-    })
+    faqs.append((
+        f"Dove riceve {prefix} {cognome}?",
+        f"{prefix.title()} {cognome} riceve presso Bio-Clinic Sassari, in Via Renzo Mossa 23, 07100 Sassari. Orari: Lun-Ven 07:00-21:00, Sab 08:00-14:00. Tel: 079 956 1332."
+    ))
     
     # FAQ 4: Come prenotare
-    faqs.append({
-        "@type": "Question",
-        "name": f"Come posso prenotare una visita con {prefix} {cognome}?",
-        "acceptedAnswer": {
-            "@type": "Answer",
-            "text": f"Puoi prenotare una visita con {prefix} {cognome} chiamando il 079 956 1332 o tramite MioDottore.it. Bio-Clinic Sassari: Via Renzo Mossa 23." if physician.get('miodottore_url') else f"Per prenotare, chiama Bio-Clinic al 079 956 1332 o recati in Via Renzo Mossa 23, Sassari."
-        }
-    })
+    faqs.append((
+        f"Come posso prenotare una visita con {prefix} {cognome}?",
+        f"Puoi prenotare una visita con {prefix} {cognome} chiamando il 079 956 1332 o tramite MioDottore.it. Bio-Clinic Sassari: Via Renzo Mossa 23." if physician.get('miodottore_url') else f"Per prenotare, chiama Bio-Clinic al 079 956 1332 o recati in Via Renzo Mossa 23, Sassari."
+    ))
     
     return faqs
 
@@ -315,15 +231,15 @@ def update_profile_page(physician, extended, physicians_data):
     original = content
     
     # 1. Aggiorna Schema.org JSON-LD
-    schema_graph = generate_schema_graph(physician, extended)
-    schema_json = json.dumps(schema_graph, indent=2, ensure_ascii=False)
+    schema_graph = generate_schema_graph(physician, extended, physicians_data.get('specialties', {}))
+    schema_json = schema_graph.dumps()
     
     # Pattern per trovare lo schema esistente
     schema_pattern = r'<script type="application/ld\+json">.*?</script>'
     new_schema = f'<script type="application/ld+json">\n  {schema_json}\n  </script>'
     
     if re.search(schema_pattern, content, re.DOTALL):
-        content = re.sub(schema_pattern, new_schema, content, count=1, flags=re.DOTALL)
+        content = re.sub(schema_pattern, lambda m: new_schema, content, count=1, flags=re.DOTALL)
     else:
         # Inserisci prima di </head>
         content = content.replace('</head>', f'{new_schema}\n</head>')
@@ -337,13 +253,14 @@ def update_profile_page(physician, extended, physicians_data):
     changed = content != original
     
     if changed:
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        writes.write_text(html_path, content)
     
     return changed, f"Schema aggiornato per {physician['full_name']}"
 
 def main():
     """Main execution"""
+    writes.setup('enhance-physician-profiles')
+    snapshots.before_write('enhance-physician-profiles')
     print("=" * 60)
     print("BIO-CLINIC PHYSICIAN PROFILE ENHANCER v3.0.0")
     print("=" * 60)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC FINGERPRINT ASSET                                                ║
+║                                                                               ║
+║  Copia ogni sorgente di css/ e js/ con l'hash del contenuto nel nome         ║
+║  (css/style.<hash>.css), punta a quelle copie tutti i <script src> e         ║
+║  <link href> delle pagine e scrive il manifest data/asset-manifest.json.     ║
+║  Le copie obsolete vengono rimosse: la cache immutable di _headers non       ║
+║  serve mai codice vecchio.                                                   ║
+║                                                                               ║
+║  Uso: python3 scripts/fingerprint-assets.py [--dry-run] [--diff]             ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from pathlib import Path
+
+from bioclinic import snapshots, writes
+from bioclinic.fingerprint import MANIFEST_RELPATH, find_pages, stale_fingerprints, write_fingerprints
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    dry_run = writes.setup('fingerprint-assets')
+    # Pagine, copie con hash esistenti (quelle obsolete vengono cancellate) e manifest
+    snapshots.before_write('fingerprint-assets', SITE_ROOT,
+                           find_pages(SITE_ROOT) + stale_fingerprints(SITE_ROOT, ()) + [MANIFEST_RELPATH])
+    manifest, written, stale, pages = write_fingerprints(SITE_ROOT)
+
+    prefix = "🔍 [DRY-RUN] " if dry_run else "✅ "
+    print(f"{prefix}{len(manifest)} asset con fingerprint, {len(pages)} pagine riscritte")
+    print(f"   📝 {written} copie nuove, 🗑️  {len(stale)} obsolete")
+    for rel in stale:
+        print(f"      • {rel}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
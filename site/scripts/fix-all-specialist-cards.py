@@ -9,31 +9,15 @@
 """
 
 import re
-import json
 from pathlib import Path
 
+from bioclinic import namevariants, snapshots, writes
+
 SITE_ROOT = Path(__file__).parent.parent
 
 def load_physicians():
-    """Carica database medici per trovare gli slug"""
-    physicians_path = SITE_ROOT / 'data' / 'entities' / 'physicians-complete.json'
-    if physicians_path.exists():
-        with open(physicians_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            physicians = data.get('physicians', data)
-            # Crea mappatura nome -> slug
-            name_to_slug = {}
-            for p in physicians:
-                name_to_slug[p.get('name', '')] = p.get('slug', '')
-                name_to_slug[p.get('full_name', '')] = p.get('slug', '')
-                # Aggiungi varianti
-                name = p.get('name', '')
-                if name:
-                    name_to_slug[f"Dott. {name}"] = p.get('slug', '')
-                    name_to_slug[f"Dott.ssa {name}"] = p.get('slug', '')
-                    name_to_slug[f"Prof. {name}"] = p.get('slug', '')
-            return name_to_slug
-    return {}
+    """Carica l'indice compilato dei nomi dei medici per trovare gli slug"""
+    return namevariants.load_name_index(SITE_ROOT)
 
 def get_equipe_path(page_path):
     """Calcola il path relativo alla cartella equipe"""
@@ -53,28 +37,24 @@ def extract_name_from_content(content):
         return name
     return None
 
-def find_slug_for_name(name, name_to_slug):
+def find_slug_for_name(name, name_index):
     """Trova lo slug per un nome"""
     if not name:
         return None
     
-    # Prova match esatto
-    if name in name_to_slug:
-        return name_to_slug[name]
-    
-    # Prova senza titolo
-    name_clean = re.sub(r'^(Dott\.?ssa?|Prof\.?|Dr\.?)\s+', '', name).strip()
-    for key, slug in name_to_slug.items():
-        if name_clean in key or key in name_clean:
-            return slug
+    # Match sull'indice dei nomi (con o senza titolo, maiuscole e spazi normalizzati)
+    slug = namevariants.resolve_name(name_index, name)
+    if slug:
+        return slug
     
     # Genera slug dal nome
+    name_clean = namevariants.TITLE_PREFIX.sub('', name.strip())
     slug = name_clean.lower()
     slug = re.sub(r'[^a-z0-9]+', '-', slug)
     slug = slug.strip('-')
     return slug
 
-def convert_team_member_to_clickable(content, page_path, name_to_slug):
+def convert_team_member_to_clickable(content, page_path, name_index):
     """Converte div.team-member in a.team-member-clickable"""
     equipe_path = get_equipe_path(page_path)
     changes = 0
@@ -89,7 +69,7 @@ def convert_team_member_to_clickable(content, page_path, name_to_slug):
         name = match.group(3).strip()
         role = match.group(4).strip()
         
-        slug = find_slug_for_name(name, name_to_slug)
+        slug = find_slug_for_name(name, name_index)
         if not slug:
             print(f"    ⚠️  Slug non trovato per: {name}")
             return match.group(0)
@@ -130,7 +110,7 @@ def convert_team_member_to_clickable(content, page_path, name_to_slug):
     
     return content, changes
 
-def process_page(page_path, name_to_slug):
+def process_page(page_path, name_index):
     """Processa una singola pagina"""
     with open(page_path, 'r', encoding='utf-8') as f:
         content = f.read()
@@ -138,11 +118,10 @@ def process_page(page_path, name_to_slug):
     original = content
     
     # Converti team-member
-    content, changes = convert_team_member_to_clickable(content, page_path, name_to_slug)
+    content, changes = convert_team_member_to_clickable(content, page_path, name_index)
     
     if content != original:
-        with open(page_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        writes.write_text(page_path, content)
         return changes
     
     return 0
@@ -250,12 +229,13 @@ a.physician-card:active {
 }
 '''
     
-    with open(css_path, 'a', encoding='utf-8') as f:
-        f.write(unified_css)
+    writes.write_text(css_path, css_path.read_text(encoding='utf-8') + unified_css)
     
     return True
 
 def main():
+    writes.setup('fix-all-specialist-cards')
+    snapshots.before_write('fix-all-specialist-cards')
     print("=" * 70)
     print("BIO-CLINIC - FIX ALL SPECIALIST CARDS")
     print("Rende TUTTE le card cliccabili con animazione hover uniforme")
@@ -264,8 +244,8 @@ def main():
     
     # Carica database medici
     print("📂 Caricamento database medici...")
-    name_to_slug = load_physicians()
-    print(f"   Trovati {len(name_to_slug)} mappature nome->slug")
+    name_index = load_physicians()
+    print(f"   Trovate {len(name_index['variants'])} varianti nome->slug")
     print()
     
     # Aggiungi stili hover unificati
@@ -302,7 +282,7 @@ def main():
     total_changes = 0
     
     for page in pages_to_process:
-        changes = process_page(page, name_to_slug)
+        changes = process_page(page, name_index)
         if changes > 0:
             rel_path = page.relative_to(SITE_ROOT)
             print(f"   ✅ {rel_path} - {changes} card convertite")
@@ -8,6 +8,8 @@ import re
 import glob
 from pathlib import Path
 
+from bioclinic import snapshots, writes
+
 SITE_ROOT = Path(__file__).parent.parent
 
 def fix_page(page_path):
@@ -46,12 +48,13 @@ def fix_page(page_path):
             content = content[:first_open[0]] + content[first_open[1]:]
     
     if content != original:
-        with open(page_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        writes.write_text(page_path, content)
         return True
     return False
 
 def main():
+    writes.setup('fix-header-tags')
+    snapshots.before_write('fix-header-tags')
     print("=" * 60)
     print("FIX HEADER TAGS")
     print("=" * 60)
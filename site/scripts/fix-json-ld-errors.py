@@ -7,6 +7,8 @@ import re
 import json
 from pathlib import Path
 
+from bioclinic import schemagraph, snapshots, writes
+
 def fix_json_ld_in_file(file_path):
     """Corregge JSON-LD corrotti nel file"""
     content = file_path.read_text(encoding='utf-8', errors='ignore')
@@ -19,6 +21,13 @@ def fix_json_ld_in_file(file_path):
         nonlocal modified
         prefix, json_str, suffix = match.groups()
         
+        # I blocchi validi (come quelli di bioclinic/schemagraph.py) restano come sono
+        try:
+            json.loads(json_str)
+            return match.group(0)
+        except json.JSONDecodeError:
+            pass
+        
         # Fix comuni
         # 1. Virgole doppie
         json_str = re.sub(r',\s*,', ',', json_str)
@@ -38,8 +47,7 @@ def fix_json_ld_in_file(file_path):
         try:
             data = json.loads(json_str)
             modified = True
-            clean_json = json.dumps(data, ensure_ascii=False, indent=2)
-            return f'{prefix}\n{clean_json}\n{suffix}'
+            return f'{prefix}{schemagraph.dumps(data)}{suffix}'
         except json.JSONDecodeError as e:
             # Tentativo più aggressivo
             # Rimuovi tutti i campi problematici datePublished
@@ -51,8 +59,7 @@ def fix_json_ld_in_file(file_path):
             try:
                 data = json.loads(json_str)
                 modified = True
-                clean_json = json.dumps(data, ensure_ascii=False, indent=2)
-                return f'{prefix}\n{clean_json}\n{suffix}'
+                return f'{prefix}{schemagraph.dumps(data)}{suffix}'
             except:
                 print(f"  ❌ Non riesco a correggere: {file_path.name}")
                 return match.group(0)
@@ -60,11 +67,13 @@ def fix_json_ld_in_file(file_path):
     new_content = re.sub(pattern, fix_json, content, flags=re.DOTALL | re.IGNORECASE)
     
     if modified:
-        file_path.write_text(new_content, encoding='utf-8')
+        writes.write_text(file_path, new_content)
         return True
     return False
 
 def main():
+    writes.setup('fix-json-ld-errors')
+    snapshots.before_write('fix-json-ld-errors')
     print("=" * 60)
     print("🔧 CORREZIONE JSON-LD CORROTTI")
     print("=" * 60)
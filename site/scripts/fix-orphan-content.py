@@ -7,6 +7,8 @@ import os
 import re
 from pathlib import Path
 
+from bioclinic import snapshots, writes
+
 SITE_ROOT = Path(__file__).parent.parent
 
 def fix_page(page_path):
@@ -41,14 +43,15 @@ def fix_page(page_path):
         # C'è contenuto orfano - rimuovilo
         new_content = content[:end_header_pos] + "\n\n  " + after_header[section_match.start():]
         
-        with open(page_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        writes.write_text(page_path, new_content)
         
         return True, f"Removed {len(between)} chars of orphan content"
     
     return True, "No orphan content"
 
 def main():
+    writes.setup('fix-orphan-content')
+    snapshots.before_write('fix-orphan-content')
     print("=" * 60)
     print("FIX ORPHAN CONTENT")
     print("=" * 60)
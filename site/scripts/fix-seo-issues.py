@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 from urllib.parse import quote
 
+from bioclinic import schemagraph, snapshots, writes
+
 def fix_meta_tags(file_path):
     """Corregge meta tag SEO"""
     content = file_path.read_text(encoding='utf-8', errors='ignore')
@@ -91,7 +93,7 @@ def fix_meta_tags(file_path):
         modified = True
     
     if modified:
-        file_path.write_text(content, encoding='utf-8')
+        writes.write_text(file_path, content)
     
     return modified
 
@@ -107,6 +109,13 @@ def fix_schema_json_ld(file_path):
         nonlocal modified
         prefix, json_str, suffix = match.groups()
         
+        # I blocchi validi (come quelli di bioclinic/schemagraph.py) restano come sono
+        try:
+            json.loads(json_str)
+            return match.group(0)
+        except json.JSONDecodeError:
+            pass
+        
         # Prova a parsare e correggere
         try:
             # Fix comuni: virgole extra, quote mancanti
@@ -117,9 +126,8 @@ def fix_schema_json_ld(file_path):
             data = json.loads(json_str)
             
             # Pulisci i dati
-            clean_json = json.dumps(data, ensure_ascii=False, indent=2)
             modified = True
-            return f'{prefix}\n{clean_json}\n{suffix}'
+            return f'{prefix}{schemagraph.dumps(data)}{suffix}'
             
         except json.JSONDecodeError:
             # Se non riesce, lascia com'è
@@ -128,7 +136,7 @@ def fix_schema_json_ld(file_path):
     new_content = re.sub(pattern, fix_json, content, flags=re.DOTALL | re.IGNORECASE)
     
     if modified:
-        file_path.write_text(new_content, encoding='utf-8')
+        writes.write_text(file_path, new_content)
     
     return modified
 
@@ -141,50 +149,45 @@ def add_missing_schema(file_path):
     
     filename = file_path.stem
     
-    # Schema per pagine specifiche
+    # Schema per pagine specifiche (validati, vedi bioclinic/schemagraph.py)
+    def web_page(name, description, url):
+        return {"@type": "WebPage", "name": name, "description": description, "url": url,
+                "publisher": schemagraph.ref(schemagraph.CLINIC_ID)}
+    
+    def checkup(name, description, how_performed):
+        return {"@type": "MedicalProcedure", "name": name, "description": description,
+                "procedureType": "https://schema.org/DiagnosticProcedure",
+                "howPerformed": how_performed, "provider": schemagraph.ref(schemagraph.CLINIC_ID)}
+    
     schemas = {
-        "privacy": {
-            "@context": "https://schema.org",
-            "@type": "WebPage",
-            "name": "Privacy Policy - Bio-Clinic Sassari",
-            "description": "Informativa sulla privacy di Bio-Clinic Sassari",
-            "url": "https://bio-clinic.it/privacy/"
-        },
-        "cookie": {
-            "@context": "https://schema.org",
-            "@type": "WebPage",
-            "name": "Cookie Policy - Bio-Clinic Sassari",
-            "description": "Informativa sui cookie di Bio-Clinic Sassari",
-            "url": "https://bio-clinic.it/cookie/"
-        },
-        "checkup-cardiovascolare": {
-            "@context": "https://schema.org",
-            "@type": "MedicalProcedure",
-            "name": "Checkup Cardiovascolare",
-            "description": "Checkup cardiovascolare completo presso Bio-Clinic Sassari",
-            "procedureType": "https://schema.org/DiagnosticProcedure",
-            "howPerformed": "Visita cardiologica, ECG, Ecocardiogramma"
-        },
-        "checkup-tiroide": {
-            "@context": "https://schema.org",
-            "@type": "MedicalProcedure",
-            "name": "Checkup Tiroide",
-            "description": "Checkup tiroideo completo presso Bio-Clinic Sassari",
-            "procedureType": "https://schema.org/DiagnosticProcedure",
-            "howPerformed": "Visita endocrinologica, Ecografia tiroidea, Esami ematici"
-        }
+        "privacy": web_page("Privacy Policy - Bio-Clinic Sassari",
+                            "Informativa sulla privacy di Bio-Clinic Sassari",
+                            "https://bio-clinic.it/privacy/"),
+        "cookie": web_page("Cookie Policy - Bio-Clinic Sassari",
+                           "Informativa sui cookie di Bio-Clinic Sassari",
+                           "https://bio-clinic.it/cookie/"),
+        "checkup-cardiovascolare": checkup("Checkup Cardiovascolare",
+                                           "Checkup cardiovascolare completo presso Bio-Clinic Sassari",
+                                           "Visita cardiologica, ECG, Ecocardiogramma"),
+        "checkup-tiroide": checkup("Checkup Tiroide",
+                                   "Checkup tiroideo completo presso Bio-Clinic Sassari",
+                                   "Visita endocrinologica, Ecografia tiroidea, Esami ematici"),
     }
     
     if filename in schemas:
-        schema_json = json.dumps(schemas[filename], ensure_ascii=False, indent=2)
-        schema_tag = f'<script type="application/ld+json">\n{schema_json}\n</script>'
+        graph = schemagraph.Graph()
+        graph.add(schemagraph.clinic())
+        graph.add(schemas[filename])
+        schema_tag = f'<script type="application/ld+json">{graph.dumps()}</script>'
         content = content.replace('</head>', f'{schema_tag}\n</head>')
-        file_path.write_text(content, encoding='utf-8')
+        writes.write_text(file_path, content)
         return True
     
     return False
 
 def main():
+    writes.setup('fix-seo-issues')
+    snapshots.before_write('fix-seo-issues')
     print("=" * 60)
     print("🔧 CORREZIONE AUTOMATICA PROBLEMI SEO")
     print("=" * 60)
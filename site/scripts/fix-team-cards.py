@@ -6,6 +6,8 @@ Fix per le team cards - ripristina struttura corretta
 import re
 from pathlib import Path
 
+from bioclinic import snapshots, writes
+
 SITE_ROOT = Path(__file__).parent.parent
 
 def fix_ginecologia():
@@ -77,8 +79,7 @@ def fix_ginecologia():
     
     content = re.sub(pattern, replacement, content, flags=re.DOTALL)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    writes.write_text(path, content)
     
     print("✅ ginecologia.html - Fixed")
 
@@ -119,8 +120,7 @@ def fix_laboratorio():
     
     content = re.sub(pattern, replacement, content, flags=re.DOTALL)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    writes.write_text(path, content)
     
     print("✅ laboratorio.html - Fixed")
 
@@ -184,12 +184,13 @@ def fix_slim_care_donna():
     
     content = content.replace(old2, new2)
     
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    writes.write_text(path, content)
     
     print("✅ slim-care-donna.html - Fixed")
 
 if __name__ == '__main__':
+    writes.setup('fix-team-cards')
+    snapshots.before_write('fix-team-cards')
     print("Fixing team cards...")
     fix_ginecologia()
     fix_laboratorio()
@@ -7,6 +7,9 @@ Generates the main équipe listing page with all physicians grouped by specialty
 import json
 from pathlib import Path
 
+from bioclinic import components, schemagraph, writes
+from bioclinic.buildcache import BuildManifest, force_requested, hash_file, hash_record
+
 def get_initials(name):
     """Get initials from name"""
     parts = name.split()
@@ -14,7 +17,11 @@ def get_initials(name):
         return (parts[0][0] + parts[-1][0]).upper()
     return name[:2].upper()
 
-def main():
+def write_page(output_file, html):
+    """Write the page to disk if changed (build.py passes its own in-memory emitter)"""
+    writes.write_text(output_file, html)
+
+def main(emit=write_page, manifest=None):
     script_dir = Path(__file__).parent
     site_dir = script_dir.parent
     data_file = site_dir / 'data' / 'entities' / 'physicians-complete.json'
@@ -27,6 +34,28 @@ def main():
     physicians = data['physicians']
     specialties_map = data['specialties']
     
+    # Build incrementale: salta se medici, specialità, header, footer e generatore sono invariati
+    # (build.py passa il proprio manifest e lo salva dopo aver scritto le pagine)
+    save_manifest = manifest is None
+    if save_manifest:
+        manifest = BuildManifest(site_dir)
+    deps = {
+        'physicians': hash_record(physicians),
+        'specialties': hash_record(specialties_map),
+        'header': hash_file(site_dir / 'components' / 'master-header.html'),
+        'footer': hash_file(site_dir / 'components' / 'master-footer.html'),
+        'components': hash_file(components.__file__),
+        'schemagraph': hash_file(schemagraph.__file__),
+        'generator': hash_file(__file__),
+    }
+    if not force_requested() and manifest.is_fresh(output_file, deps):
+        print("Équipe index unchanged, skipping (use --force to regenerate)")
+        return
+    
+    # Master header and footer rendered for equipe/index.html
+    header = components.include(site_dir, components.MASTER_HEADER, 'equipe/index.html')
+    footer = components.include(site_dir, components.MASTER_FOOTER, 'equipe/index.html')
+    
     # Group physicians by specialty
     by_specialty = {}
     for p in physicians:
@@ -35,12 +64,23 @@ def main():
             by_specialty[spec_id] = []
         by_specialty[spec_id].append(p)
     
-    # Generate JSON-LD itemListElement
-    jsonld_items = []
-    jsonld_employees = []
-    for i, p in enumerate(physicians, 1):
-        jsonld_items.append(f'{{"@type": "ListItem", "position": {i}, "item": {{"@id": "https://bio-clinic.it/equipe/{p["slug"]}/"}}}}')
-        jsonld_employees.append(f'{{"@type": "Physician", "name": "{p["full_name"]}", "@id": "https://bio-clinic.it/equipe/{p["slug"]}/#physician"}}')
+    # JSON-LD: lista dei profili, clinica e medici (validato, vedi bioclinic/schemagraph.py)
+    site_url = schemagraph.SITE_URL
+    graph = schemagraph.Graph()
+    graph.add(schemagraph.item_list(
+        f"{site_url}/equipe/#list", "Équipe Medica Bio-Clinic",
+        [f"{site_url}/equipe/{p['slug']}/" for p in physicians[:20]],
+        description=f"Lista completa dei {len(physicians)} medici specialisti di Bio-Clinic Sassari",
+        number_of_items=len(physicians),
+    ))
+    graph.add(schemagraph.clinic())
+    for p in physicians[:20]:
+        graph.add(schemagraph.physician(p['slug'], p['full_name']))
+    graph.add(schemagraph.breadcrumb([
+        ("Home", f"{site_url}/"),
+        ("Équipe", f"{site_url}/equipe/"),
+    ]))
+    json_ld = graph.dumps()
     
     # Generate specialty sections HTML
     specialty_order = [
@@ -119,36 +159,7 @@ def main():
   <link rel="stylesheet" href="../css/search.css">
   
   <script type="application/ld+json">
-  {{
-    "@context": "https://schema.org",
-    "@graph": [
-      {{
-        "@type": "ItemList",
-        "@id": "https://bio-clinic.it/equipe/#list",
-        "name": "Équipe Medica Bio-Clinic",
-        "description": "Lista completa dei {len(physicians)} medici specialisti di Bio-Clinic Sassari",
-        "numberOfItems": {len(physicians)},
-        "itemListElement": [
-          {',\n          '.join(jsonld_items[:20])}
-        ]
-      }},
-      {{
-        "@type": "MedicalClinic",
-        "@id": "https://bio-clinic.it/#organization",
-        "name": "Bio-Clinic Sassari",
-        "employee": [
-          {',\n          '.join(jsonld_employees[:20])}
-        ]
-      }},
-      {{
-        "@type": "BreadcrumbList",
-        "itemListElement": [
-          {{"@type": "ListItem", "position": 1, "name": "Home", "item": "https://bio-clinic.it/"}},
-          {{"@type": "ListItem", "position": 2, "name": "Équipe", "item": "https://bio-clinic.it/equipe/"}}
-        ]
-      }}
-    ]
-  }}
+  {json_ld}
   </script>
   
   <style>
@@ -297,74 +308,7 @@ def main():
 </head>
 <body>
   <!-- Header -->
-  <header class="header">
-    <div class="header-top">
-      <div class="container flex-between">
-        <div class="flex" style="gap: 1.5rem;">
-          <a href="tel:+390799561332" style="display: flex; align-items: center; gap: 0.5rem;">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-              <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"/>
-            </svg>
-            079 956 1332
-          </a>
-          <span class="hide-mobile">Lun-Ven 07:00-21:00 | Sab 08:00-14:00</span>
-        </div>
-        <div class="flex" style="gap: 1rem;">
-          <a href="https://www.facebook.com/bioclinicss" target="_blank" aria-label="Facebook">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="currentColor"><path d="M18 2h-3a5 5 0 0 0-5 5v3H7v4h3v8h4v-8h3l1-4h-4V7a1 1 0 0 1 1-1h3z"/></svg>
-          </a>
-          <a href="https://www.instagram.com/bioclinicss/" target="_blank" aria-label="Instagram">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="2" y="2" width="20" height="20" rx="5" ry="5"/></svg>
-          </a>
-        </div>
-      </div>
-    </div>
-    
-    <div class="header-main">
-      <div class="container header-content">
-        <a href="../index.html" class="logo">
-          <img src="../images/logo-bioclinic.png" alt="Bio-Clinic" style="height: 50px; width: auto;">
-        </a>
-        
-        <nav class="nav">
-          <ul class="nav-list">
-            <li class="nav-item"><a href="../index.html" class="nav-link">Home</a></li>
-            <li class="nav-item">
-              <a href="#" class="nav-link">Percorsi</a>
-              <div class="nav-dropdown">
-                <a href="../pages/slim-care.html">Slim Care</a>
-                <a href="../pages/slim-care-donna.html">Slim Care Donna</a>
-                <a href="../pages/pma-fertilita.html">PMA / Fertilità</a>
-              </div>
-            </li>
-            <li class="nav-item">
-              <a href="#" class="nav-link">Specialità</a>
-              <div class="nav-dropdown">
-                <a href="../pages/ginecologia.html">Ginecologia</a>
-                <a href="../pages/cardiologia.html">Cardiologia</a>
-                <a href="../pages/endocrinologia.html">Endocrinologia</a>
-                <a href="../pages/laboratorio.html">Laboratorio</a>
-                <a href="../pages/specialita.html">Tutte le Specialità</a>
-              </div>
-            </li>
-            <li class="nav-item"><a href="index.html" class="nav-link active">Équipe</a></li>
-            <li class="nav-item"><a href="../prestazioni/index.html" class="nav-link">Prestazioni</a></li>
-            <li class="nav-item"><a href="../pages/contatti.html" class="nav-link">Contatti</a></li>
-          </ul>
-          <a href="tel:+390799561332" class="btn btn-primary">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-              <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z"/>
-            </svg>
-            Prenota
-          </a>
-        </nav>
-        
-        <button class="menu-toggle" aria-label="Menu">
-          <span></span><span></span><span></span>
-        </button>
-      </div>
-    </div>
-  </header>
+  {header}
 
   <!-- Hero Section -->
   <section class="equipe-hero">
@@ -406,37 +350,7 @@ def main():
   </main>
 
   <!-- Footer -->
-  <footer class="footer">
-    <div class="container">
-      <div class="footer-grid">
-        <div class="footer-brand">
-          <img src="../images/logo-bioclinic.png" alt="Bio-Clinic" style="height: 40px; margin-bottom: 1rem;">
-          <p>Poliambulatorio di riferimento a Sassari con {len(by_specialty)} specialità, {len(physicians)} medici e oltre 1.840 prestazioni.</p>
-        </div>
-        <div>
-          <h4 class="footer-title">Link Rapidi</h4>
-          <ul class="footer-links">
-            <li><a href="../pages/slim-care.html">Slim Care</a></li>
-            <li><a href="../pages/pma-fertilita.html">PMA / Fertilità</a></li>
-            <li><a href="index.html">Équipe</a></li>
-            <li><a href="../prestazioni/index.html">Prestazioni</a></li>
-          </ul>
-        </div>
-        <div>
-          <h4 class="footer-title">Contatti</h4>
-          <ul class="footer-contact">
-            <li>Via Renzo Mossa, 23 - 07100 Sassari</li>
-            <li><a href="tel:+390799561332">079 956 1332</a></li>
-            <li><a href="mailto:gestione@bio-clinic.it">gestione@bio-clinic.it</a></li>
-          </ul>
-        </div>
-      </div>
-      <div class="footer-bottom">
-        <p>&copy; 2026 Bio Pharma S.r.l. - P.IVA 02869450904</p>
-        <p>Direttore Sanitario: Prof. Emerito Salvatore Dessole</p>
-      </div>
-    </div>
-  </footer>
+  {footer}
 
   <!-- Search Results Panel -->
   <div id="search-overlay" class="search-overlay"></div>
@@ -481,8 +395,11 @@ def main():
 </body>
 </html>'''
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    emit(output_file, html)
+    
+    manifest.record(output_file, deps)
+    if save_manifest:
+        manifest.save()
     
     print(f"Generated équipe index with {len(physicians)} physicians in {len(by_specialty)} specialties")
 
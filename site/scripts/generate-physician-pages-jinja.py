@@ -2,19 +2,27 @@
 """
 Bio-Clinic Physician Page Generator v2.2
 Generates individual HTML pages for all physicians using Jinja2 template
+
+Incremental: pages whose inputs (physician record, specialty, procedures,
+template, master header/footer, generator) are unchanged are skipped.
+Use --force to regenerate everything.
 """
 
-import json
 import os
 import yaml
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 
+from bioclinic import components, schemagraph, writes
+from bioclinic.buildcache import BuildManifest, force_requested, hash_file, hash_record
+
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / 'data' / 'v2' / 'entities'
 TEMPLATE_DIR = BASE_DIR / 'templates'
 OUTPUT_DIR = BASE_DIR / 'equipe'
+MASTER_HEADER = BASE_DIR / 'components' / 'master-header.html'
+MASTER_FOOTER = BASE_DIR / 'components' / 'master-footer.html'
 
 def load_yaml(file_path):
     """Load YAML file"""
@@ -36,54 +44,36 @@ def get_procedure_by_id(procedures, proc_id):
     return None
 
 def generate_schema_json(physician, specialty, procedures_details):
-    """Generate JSON-LD schema for physician"""
-    schema = {
-        "@context": "https://schema.org",
-        "@graph": [
-            {
-                "@type": "MedicalClinic",
-                "@id": "https://bio-clinic.it/#clinic",
-                "name": "Bio-Clinic Sassari",
-                "url": "https://bio-clinic.it",
-                "telephone": "+39 079 956 1332",
-                "address": {
-                    "@type": "PostalAddress",
-                    "streetAddress": "Via Renzo Mossa, 23",
-                    "addressLocality": "Sassari",
-                    "postalCode": "07100",
-                    "addressCountry": "IT"
-                }
-            },
-            {
-                "@type": "Physician",
-                "@id": f"https://bio-clinic.it/equipe/{physician['id']}/#physician",
-                "name": physician.get('display_name', f"{physician.get('title', '')} {physician.get('name', '')}".strip()),
-                "givenName": physician.get('first_name', ''),
-                "familyName": physician.get('last_name', ''),
-                "jobTitle": physician.get('job_title', ''),
-                "description": physician.get('bio_short', ''),
-                "medicalSpecialty": specialty.get('name', '') if specialty else '',
-                "worksFor": {
-                    "@id": "https://bio-clinic.it/#clinic"
-                },
-                "availableService": [
-                    {"@type": "MedicalProcedure", "name": proc.get('name', '')} 
-                    for proc in (procedures_details or [])
-                ] if procedures_details else None
-            },
-            {
-                "@type": "BreadcrumbList",
-                "itemListElement": [
-                    {"@type": "ListItem", "position": 1, "name": "Home", "item": "https://bio-clinic.it/"},
-                    {"@type": "ListItem", "position": 2, "name": "Équipe", "item": "https://bio-clinic.it/equipe/"},
-                    {"@type": "ListItem", "position": 3, "name": physician.get('display_name', physician.get('name', '')), "item": f"https://bio-clinic.it/equipe/{physician['id']}.html"}
-                ]
-            }
-        ]
-    }
-    return json.dumps(schema, ensure_ascii=False, indent=2)
+    """Generate JSON-LD schema for physician (validated, see bioclinic/schemagraph.py)"""
+    graph = schemagraph.Graph()
+    graph.add(schemagraph.clinic())
+    specialty_node = None
+    if specialty:
+        specialty_node = graph.add(schemagraph.specialty(specialty['id'], specialty.get('name', '')))
+    services = [graph.add(schemagraph.procedure(proc.get('slug', proc['id']), proc.get('name', '')))
+                for proc in (procedures_details or [])]
+    graph.add(schemagraph.physician(
+        physician['id'],
+        physician.get('display_name', f"{physician.get('title', '')} {physician.get('name', '')}".strip()),
+        given_name=physician.get('first_name'),
+        family_name=physician.get('last_name'),
+        job_title=physician.get('job_title'),
+        description=physician.get('bio_short'),
+        specialty=specialty_node,
+        services=services,
+    ))
+    graph.add(schemagraph.breadcrumb([
+        ("Home", f"{schemagraph.SITE_URL}/"),
+        ("Équipe", f"{schemagraph.SITE_URL}/equipe/"),
+        (physician.get('display_name', physician.get('name', '')), f"{schemagraph.SITE_URL}/equipe/{physician['id']}.html"),
+    ]))
+    return graph.dumps()
 
-def main():
+def write_page(output_file, html):
+    """Write a rendered page to disk if changed (build.py passes its own in-memory emitter)"""
+    writes.write_text(output_file, html)
+
+def main(emit=write_page, manifest=None):
     print("=" * 60)
     print("BIO-CLINIC Physician Page Generator v2.2 (Jinja2)")
     print("=" * 60)
@@ -113,6 +103,21 @@ def main():
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
+    # Incremental build manifest
+    force = force_requested()
+    # (build.py passa il proprio manifest e lo salva dopo aver scritto le pagine)
+    save_manifest = manifest is None
+    if save_manifest:
+        manifest = BuildManifest(BASE_DIR)
+    shared_deps = {
+        'template': hash_file(TEMPLATE_DIR / 'physician.html.j2'),
+        'header': hash_file(MASTER_HEADER),
+        'footer': hash_file(MASTER_FOOTER),
+        'components': hash_file(components.__file__),
+        'schemagraph': hash_file(schemagraph.__file__),
+        'generator': hash_file(__file__),
+    }
+    
     # Generate pages
     print("\nGenerating physician pages...")
     generated_count = 0
@@ -140,6 +145,15 @@ def main():
             else:
                 warnings.append(f"Procedure '{pid}' not found for {phys_id}")
         
+        # Skip if nothing this page depends on has changed
+        output_file = OUTPUT_DIR / f"{phys_id}.html"
+        deps = dict(shared_deps,
+                    physician=hash_record(physician),
+                    specialty=hash_record(specialty),
+                    procedures=hash_record(procedures_details))
+        if not force and manifest.is_fresh(output_file, deps):
+            continue
+        
         # Build display name
         title = physician.get('title', '')
         name = physician.get('name', '')
@@ -149,33 +163,38 @@ def main():
         # Add procedures_details to physician object
         physician['procedures_details'] = procedures_details
         
-        # Generate JSON-LD schema
-        schema_json = generate_schema_json(physician, specialty, procedures_details)
-        
-        # Render template
+        # Generate JSON-LD schema and render template
         try:
+            schema_json = generate_schema_json(physician, specialty, procedures_details)
             html = template.render(
                 physician=physician,
                 specialty=specialty,
-                schema_json=schema_json
+                schema_json=schema_json,
+                header=components.include(BASE_DIR, components.MASTER_HEADER,
+                                          f"equipe/{phys_id}.html"),
+                footer=components.include(BASE_DIR, components.MASTER_FOOTER,
+                                          f"equipe/{phys_id}.html")
             )
             
             # Write output
-            output_file = OUTPUT_DIR / f"{phys_id}.html"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+            emit(output_file, html)
             
+            manifest.record(output_file, deps)
             generated_count += 1
             print(f"  ✓ {display_name}")
             
         except Exception as e:
             warnings.append(f"Error rendering {phys_id}: {str(e)}")
     
+    if save_manifest:
+        manifest.save()
+    
     # Summary
     print("\n" + "=" * 60)
     print("GENERATION COMPLETE")
     print("=" * 60)
     print(f"Pages generated: {generated_count}")
+    print(f"Pages unchanged (skipped): {manifest.skipped}")
     print(f"Warnings: {len(warnings)}")
     
     if warnings:
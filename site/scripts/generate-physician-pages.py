@@ -8,6 +8,8 @@ import json
 import os
 from pathlib import Path
 
+from bioclinic import schemagraph, writes
+
 # Template HTML per pagina medico
 TEMPLATE = '''<!DOCTYPE html>
 <html lang="it">
@@ -29,47 +31,7 @@ TEMPLATE = '''<!DOCTYPE html>
   <link rel="stylesheet" href="../css/physician.css">
   
   <!-- Schema.org Physician -->
-  <script type="application/ld+json">
-  {{
-    "@context": "https://schema.org",
-    "@graph": [
-      {{
-        "@type": "Physician",
-        "@id": "https://bio-clinic.it/equipe/{slug}/#physician",
-        "name": "{full_name}",
-        "givenName": "{first_name}",
-        "familyName": "{last_name}",
-        "honorificPrefix": "{title}",
-        "jobTitle": "{job_title}",
-        "description": "{bio}",
-        "medicalSpecialty": "{specialty_schema}",
-        "worksFor": {{
-          "@type": "MedicalClinic",
-          "@id": "https://bio-clinic.it/#organization",
-          "name": "Bio-Clinic Sassari",
-          "address": {{
-            "@type": "PostalAddress",
-            "streetAddress": "Via Renzo Mossa, 23",
-            "addressLocality": "Sassari",
-            "postalCode": "07100",
-            "addressRegion": "SS",
-            "addressCountry": "IT"
-          }},
-          "telephone": "+39 079 956 1332"
-        }},
-        "availableService": [{procedures_schema}]
-      }},
-      {{
-        "@type": "BreadcrumbList",
-        "itemListElement": [
-          {{"@type": "ListItem", "position": 1, "name": "Home", "item": "https://bio-clinic.it/"}},
-          {{"@type": "ListItem", "position": 2, "name": "Equipe", "item": "https://bio-clinic.it/equipe/"}},
-          {{"@type": "ListItem", "position": 3, "name": "{full_name}", "item": "https://bio-clinic.it/equipe/{slug}/"}}
-        ]
-      }}
-    ]
-  }}
-  </script>
+  <script type="application/ld+json">{json_ld}</script>
 </head>
 <body>
   <!-- Header -->
@@ -323,12 +285,6 @@ def generate_page(physician, specialties):
             <span class="procedure-name">{proc_name}</span>
           </div>'''
     
-    # Generate procedures schema
-    procedures_schema = ', '.join([
-        f'{{"@type": "MedicalProcedure", "name": "{format_procedure_name(p)}"}}'
-        for p in procedures
-    ])
-    
     # Role badge HTML
     role_badge_html = ''
     if physician.get('role_badge'):
@@ -355,46 +311,42 @@ def generate_page(physician, specialties):
     meta_keywords = f"{physician['job_title'].lower()} sassari, {physician['name'].lower()}, bio-clinic, {specialty_name.lower()}"
     page_title = f"{physician['full_name']} | {physician['job_title']} | Bio-Clinic Sassari"
     
-    # Specialty schema mapping
-    specialty_schema_map = {
-        'ginecologia': 'Gynecology',
-        'ostetricia': 'Obstetrics',
-        'cardiologia': 'Cardiology',
-        'dermatologia': 'Dermatology',
-        'endocrinologia': 'Endocrinology',
-        'neurologia': 'Neurology',
-        'oculistica': 'Ophthalmology',
-        'ortopedia': 'Orthopedics',
-        'pediatria': 'Pediatrics',
-        'urologia': 'Urology',
-        'pneumologia': 'Pulmonology',
-        'gastroenterologia': 'Gastroenterology',
-        'ematologia': 'Hematology',
-        'reumatologia': 'Rheumatology',
-        'nefrologia': 'Nephrology',
-        'psicologia': 'Psychology',
-        'fisiatria': 'PhysicalMedicine'
-    }
-    specialty_schema = specialty_schema_map.get(physician['specialty_id'], physician['specialty_id'].title())
+    # Schema.org (validato, vedi bioclinic/schemagraph.py)
+    graph = schemagraph.Graph()
+    graph.add(schemagraph.clinic())
+    specialty_node = graph.add(schemagraph.specialty(physician['specialty_id'], specialty_name))
+    services = [graph.add(schemagraph.procedure(p, format_procedure_name(p))) for p in procedures]
+    graph.add(schemagraph.physician(
+        physician['slug'],
+        physician['full_name'],
+        given_name=first_name,
+        family_name=last_name,
+        honorific_prefix=physician.get('title'),
+        job_title=physician['job_title'],
+        description=physician['bio'],
+        specialty=specialty_node,
+        services=services,
+    ))
+    graph.add(schemagraph.breadcrumb([
+        ("Home", f"{schemagraph.SITE_URL}/"),
+        ("Equipe", f"{schemagraph.SITE_URL}/equipe/"),
+        (physician['full_name'], f"{schemagraph.SITE_URL}/equipe/{physician['slug']}/"),
+    ]))
     
     # Fill template
     html = TEMPLATE.format(
         slug=physician['slug'],
         full_name=physician['full_name'],
-        first_name=first_name,
-        last_name=last_name,
-        title=physician.get('title', ''),
         name=physician['name'],
         job_title=physician['job_title'],
         bio=physician['bio'],
         specialty_id=physician['specialty_id'],
         specialty_name=specialty_name,
         specialty_color=specialty_color,
-        specialty_schema=specialty_schema,
         initials=get_initials(physician['name']),
         widget_html=physician.get('widget_html', '<p>Prenotazione telefonica disponibile</p>'),
         procedures_html=procedures_html,
-        procedures_schema=procedures_schema,
+        json_ld=graph.dumps(),
         role_badge_html=role_badge_html,
         pathways_html=pathways_html,
         meta_description=meta_description,
@@ -427,8 +379,7 @@ def main():
         html = generate_page(physician, specialties)
         output_file = equipe_dir / f"{physician['slug']}.html"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        writes.write_text(output_file, html)
         
         print(f"Generated: {output_file.name}")
         generated += 1
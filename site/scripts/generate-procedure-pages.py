@@ -2,12 +2,21 @@
 """
 Bio-Clinic Procedure Page Generator
 Genera pagine prestazioni moderne con template Tailwind CSS
+
+Build incrementale: le pagine i cui input (record procedura, medici
+associati, master header/footer, generatore) non sono cambiati vengono saltate.
+Usa --force per rigenerare tutto.
 """
 
 import yaml
 import os
 from pathlib import Path
 
+from bioclinic import components, schemagraph, writes
+from bioclinic.buildcache import BuildManifest, force_requested, hash_file, hash_record
+
+SITE_DIR = Path(__file__).resolve().parent.parent
+
 # Colori delle specialità
 SPECIALTY_COLORS = {
     "ginecologia": {"primary": "#E91E63", "dark": "#a31545", "light": "#FCE4EC", "icon": "👩‍⚕️", "name": "Ginecologia"},
@@ -60,7 +69,11 @@ def get_physicians_for_procedure(proc_id, physicians_data):
             result.append(physician)
     return result[:3]  # Max 3 medici
 
-def generate_procedure_page(proc, physicians, output_dir):
+def write_page(output_path, html_content):
+    """Scrive la pagina su disco se cambiata (build.py passa un emettitore in memoria)"""
+    writes.write_text(output_path, html_content)
+
+def generate_procedure_page(proc, physicians, output_dir, emit=write_page):
     """Genera una pagina HTML per una procedura"""
     
     proc_id = proc['id']
@@ -70,6 +83,12 @@ def generate_procedure_page(proc, physicians, output_dir):
     
     colors = get_specialty_colors(specialty_id)
     
+    # Master header e footer renderizzati per la posizione della pagina
+    output_path = os.path.join(output_dir, f'{proc_slug}.html')
+    page_rel = os.path.relpath(output_path, SITE_DIR)
+    header = components.include(SITE_DIR, components.MASTER_HEADER, page_rel)
+    footer = components.include(SITE_DIR, components.MASTER_FOOTER, page_rel)
+    
     # Info base
     description = proc.get('content', {}).get('description_short', f'Prestazione medica specialistica')
     
@@ -169,49 +188,42 @@ def generate_procedure_page(proc, physicians, output_dir):
                             <span class="font-medium text-gray-700">{rel_name}</span>
                         </a>'''
     
-    # JSON-LD
-    json_ld = f'''{{
-      "@context": "https://schema.org",
-      "@graph": [
-        {{
-          "@type": "MedicalClinic",
-          "@id": "https://bio-clinic.it/#clinic",
-          "name": "Bio-Clinic Sassari",
-          "url": "https://bio-clinic.it",
-          "telephone": "+39 079 956 1332",
-          "address": {{
-            "@type": "PostalAddress",
-            "streetAddress": "Via Renzo Mossa, 23",
-            "addressLocality": "Sassari",
-            "postalCode": "07100",
-            "addressCountry": "IT"
-          }}
-        }},
-        {{
-          "@type": "MedicalProcedure",
-          "@id": "https://bio-clinic.it/pages/{proc_slug}/#procedure",
-          "name": "{proc_name}",
-          "description": "{description}",
-          "procedureType": "{procedure_type}",
-          "bodyLocation": "{body_location}",
-          "relevantSpecialty": {{
-            "@type": "MedicalSpecialty",
-            "name": "{colors['name']}"
-          }},
-          "provider": {{
-            "@id": "https://bio-clinic.it/#clinic"
-          }}
-        }},
-        {{
-          "@type": "BreadcrumbList",
-          "itemListElement": [
-            {{"@type": "ListItem", "position": 1, "name": "Home", "item": "https://bio-clinic.it/"}},
-            {{"@type": "ListItem", "position": 2, "name": "{colors['name']}", "item": "https://bio-clinic.it/pages/{specialty_id}.html"}},
-            {{"@type": "ListItem", "position": 3, "name": "{proc_name}", "item": "https://bio-clinic.it/pages/{proc_slug}.html"}}
-          ]
-        }}
-      ]
-    }}'''
+    # JSON-LD (validato, vedi bioclinic/schemagraph.py)
+    graph = schemagraph.Graph()
+    graph.add(schemagraph.clinic())
+    specialty = graph.add(schemagraph.specialty(specialty_id, colors['name']))
+    graph.add(schemagraph.procedure_page(
+        proc_slug, proc_name,
+        description=description,
+        procedure_type=procedure_type,
+        body_location=body_location,
+        specialty=specialty,
+    ))
+    graph.add(schemagraph.breadcrumb([
+        ("Home", f"{schemagraph.SITE_URL}/"),
+        (colors['name'], f"{schemagraph.SITE_URL}/pages/{specialty_id}.html"),
+        (proc_name, f"{schemagraph.SITE_URL}/pages/{proc_slug}.html"),
+    ]))
+    json_ld = graph.dumps()
+    
+    # Sezioni opzionali (fuori dal template: f-string annidate con le stesse
+    # virgolette non sono valide prima di Python 3.12)
+    faq_section = f'''<section class="py-16 bg-white">
+        <div class="max-w-4xl mx-auto px-4">
+            <h2 class="text-3xl font-bold text-gray-800 mb-8 text-center">Domande Frequenti</h2>
+            <div class="space-y-4">
+                {faq_html}
+            </div>
+        </div>
+    </section>''' if faq_html else ''
+    related_section = f'''<section class="py-12 bg-gray-50">
+        <div class="max-w-5xl mx-auto px-4">
+            <h3 class="text-xl font-bold text-gray-800 mb-6">Prestazioni Correlate</h3>
+            <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4">
+                {related_html}
+            </div>
+        </div>
+    </section>''' if related_html else ''
     
     html_content = f'''<!DOCTYPE html>
 <html lang="it">
@@ -267,159 +279,7 @@ def generate_procedure_page(proc, physicians, output_dir):
 </head>
 <body>
     <!-- HEADER PRINCIPALE (Standard del sito) -->
-    <header class="header">
-      <div class="container">
-        <!-- Logo -->
-        <a href="../index.html" class="logo" title="Torna alla Homepage Bio-Clinic">
-          <img src="../images/logo-bioclinic.png" alt="Bio-Clinic Sassari - Poliambulatorio Medico" width="180" height="60" loading="eager">
-        </a>
-        
-        <!-- Navigazione Desktop -->
-        <nav class="nav" aria-label="Navigazione principale">
-          <ul class="nav-list">
-            <!-- HOME -->
-            <li class="nav-item">
-              <a href="../index.html" class="nav-link" title="Torna alla Homepage Bio-Clinic">Home</a>
-            </li>
-            
-            <!-- SLIM CARE MEDICAL -->
-            <li class="nav-item">
-              <a href="#" class="nav-link" title="Percorsi Slim Care" aria-haspopup="true" aria-expanded="false">Slim Care Medical</a>
-              <div class="nav-dropdown" role="menu">
-                <a href="slim-care.html" title="Slim Care - Percorso Dimagrimento" role="menuitem">
-                  <span style="color: #00A651;">💚</span> Slim Care
-                </a>
-                <a href="slim-care-donna.html" title="Slim Care Donna - Dimagrimento Femminile" role="menuitem">
-                  <span style="color: #E91E8C;">💗</span> Slim Care Donna
-                </a>
-              </div>
-            </li>
-            
-            <!-- LABORATORIO -->
-            <li class="nav-item">
-              <a href="../laboratorio/index.html" class="nav-link" title="Laboratorio Analisi - 1.136 Esami">Laboratorio</a>
-            </li>
-            
-            <!-- DONNA & PMA -->
-            <li class="nav-item">
-              <a href="#" class="nav-link" title="Salute Donna e PMA" aria-haspopup="true" aria-expanded="false">Donna & PMA</a>
-              <div class="nav-dropdown" role="menu">
-                <a href="ginecologia.html" title="Ginecologia e Ostetricia" role="menuitem">
-                  <span>👩‍⚕️</span> Ginecologia
-                </a>
-                <a href="pma-fertilita.html" title="PMA e Fertilità" role="menuitem">
-                  <span>👶</span> PMA / Fertilità
-                </a>
-              </div>
-            </li>
-            
-            <!-- SPECIALISTI -->
-            <li class="nav-item">
-              <a href="#" class="nav-link" title="Specialità Mediche" aria-haspopup="true" aria-expanded="false">Specialisti</a>
-              <div class="nav-dropdown nav-dropdown-wide" role="menu">
-                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem; min-width: 320px;">
-                  <a href="cardiologia.html" title="Cardiologia" role="menuitem">❤️ Cardiologia</a>
-                  <a href="endocrinologia.html" title="Endocrinologia" role="menuitem">🦋 Endocrinologia</a>
-                  <a href="dermatologia.html" title="Dermatologia" role="menuitem">🩺 Dermatologia</a>
-                  <a href="neurologia.html" title="Neurologia" role="menuitem">🧠 Neurologia</a>
-                  <a href="oculistica.html" title="Oculistica" role="menuitem">👁️ Oculistica</a>
-                  <a href="ortopedia.html" title="Ortopedia" role="menuitem">🦴 Ortopedia</a>
-                </div>
-                <hr style="margin: 0.5rem 0; border: none; border-top: 1px solid #eee;">
-                <a href="specialita.html" title="Tutte le Specialità" role="menuitem" style="font-weight: 600; color: var(--primary);">
-                  Tutte le Specialità →
-                </a>
-                <a href="../equipe/index.html" title="Équipe Medica" role="menuitem" style="font-weight: 600;">
-                  👨‍⚕️ Équipe Medica (51 Specialisti)
-                </a>
-              </div>
-            </li>
-            
-            <!-- MEDICAL SHOP -->
-            <li class="nav-item">
-              <a href="../shop/index.html" class="nav-link" title="Medical Shop - Dispositivi Medici">
-                Medical Shop
-                <span style="background: #E91E8C; color: white; font-size: 0.65rem; padding: 0.15rem 0.4rem; border-radius: 10px; margin-left: 0.3rem; vertical-align: middle;">NEW</span>
-              </a>
-            </li>
-            
-            <!-- CONTATTI -->
-            <li class="nav-item">
-              <a href="contatti.html" class="nav-link" title="Contatti e Orari">Contatti</a>
-            </li>
-          </ul>
-          
-          <!-- PULSANTE PRENOTA -->
-          <a href="tel:+390799561332" class="btn btn-primary nav-cta" title="Chiama per prenotare" style="background: #00704A; color: white; padding: 0.6rem 1.2rem; border-radius: 8px; font-weight: 600; display: flex; align-items: center; gap: 0.5rem; margin-left: 1rem;">
-            <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-              <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72c.127.96.361 1.903.7 2.81a2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45c.907.339 1.85.573 2.81.7A2 2 0 0 1 22 16.92z"/>
-            </svg>
-            Prenota
-          </a>
-        </nav>
-        
-        <!-- Mobile Toggle -->
-        <button class="menu-toggle" aria-label="Apri menu" aria-expanded="false" aria-controls="mobile-nav">
-          <span></span>
-          <span></span>
-          <span></span>
-        </button>
-      </div>
-    </header>
-
-    <!-- Mobile Overlay -->
-    <div class="mobile-overlay" aria-hidden="true"></div>
-
-    <!-- Mobile Navigation -->
-    <nav class="mobile-nav" id="mobile-nav" aria-label="Menu mobile" aria-hidden="true">
-      <div class="mobile-nav-header">
-        <img src="../images/logo-bioclinic.png" alt="Bio-Clinic" width="140" height="47">
-        <button class="mobile-nav-close" aria-label="Chiudi menu">
-          <svg width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-            <line x1="18" y1="6" x2="6" y2="18"></line>
-            <line x1="6" y1="6" x2="18" y2="18"></line>
-          </svg>
-        </button>
-      </div>
-      <ul class="mobile-nav-list">
-        <li><a href="../index.html" title="Home">🏠 Home</a></li>
-        <li class="mobile-nav-section">
-          <span class="mobile-nav-section-title">Slim Care Medical</span>
-          <ul>
-            <li><a href="slim-care.html">💚 Slim Care</a></li>
-            <li><a href="slim-care-donna.html">💗 Slim Care Donna</a></li>
-          </ul>
-        </li>
-        <li><a href="../laboratorio/index.html" title="Laboratorio">🔬 Laboratorio Analisi</a></li>
-        <li class="mobile-nav-section">
-          <span class="mobile-nav-section-title">Donna & PMA</span>
-          <ul>
-            <li><a href="ginecologia.html">👩‍⚕️ Ginecologia</a></li>
-            <li><a href="pma-fertilita.html">👶 PMA / Fertilità</a></li>
-          </ul>
-        </li>
-        <li class="mobile-nav-section">
-          <span class="mobile-nav-section-title">Specialisti</span>
-          <ul>
-            <li><a href="cardiologia.html">❤️ Cardiologia</a></li>
-            <li><a href="endocrinologia.html">🦋 Endocrinologia</a></li>
-            <li><a href="specialita.html" style="font-weight: 600;">→ Tutte le Specialità</a></li>
-            <li><a href="../equipe/index.html" style="font-weight: 600;">👨‍⚕️ Équipe (51 Medici)</a></li>
-          </ul>
-        </li>
-        <li><a href="../shop/index.html" title="Medical Shop">🛒 Medical Shop <span style="background: #E91E8C; color: white; font-size: 0.65rem; padding: 0.1rem 0.3rem; border-radius: 8px;">NEW</span></a></li>
-        <li><a href="contatti.html" title="Contatti">📍 Contatti</a></li>
-      </ul>
-      <div class="mobile-nav-footer">
-        <a href="tel:+390799561332" class="btn btn-primary" style="width: 100%; justify-content: center; background: #00704A;">
-          <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-            <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72c.127.96.361 1.903.7 2.81a2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45c.907.339 1.85.573 2.81.7A2 2 0 0 1 22 16.92z"/>
-          </svg>
-          Chiama: 079 956 1332
-        </a>
-      </div>
-    </nav>
-    <!-- END MASTER HEADER -->
+    {header}
 
     <!-- PAGE CONTENT (Tailwind) -->
     <main class="page-content">
@@ -513,14 +373,7 @@ def generate_procedure_page(proc, physicians, output_dir):
     </section>
 
     <!-- FAQ SECTION -->
-    {f'''<section class="py-16 bg-white">
-        <div class="max-w-4xl mx-auto px-4">
-            <h2 class="text-3xl font-bold text-gray-800 mb-8 text-center">Domande Frequenti</h2>
-            <div class="space-y-4">
-                {faq_html}
-            </div>
-        </div>
-    </section>''' if faq_html else ''}
+    {faq_section}
 
     <!-- CTA PRENOTA -->
     <section id="prenota" class="py-16 scroll-mt-28" style="background: linear-gradient(135deg, {colors['dark']} 0%, {colors['primary']} 100%);">
@@ -546,57 +399,12 @@ def generate_procedure_page(proc, physicians, output_dir):
     </section>
 
     <!-- PROCEDURE CORRELATE -->
-    {f'''<section class="py-12 bg-gray-50">
-        <div class="max-w-5xl mx-auto px-4">
-            <h3 class="text-xl font-bold text-gray-800 mb-6">Prestazioni Correlate</h3>
-            <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4">
-                {related_html}
-            </div>
-        </div>
-    </section>''' if related_html else ''}
+    {related_section}
 
     </main>
 
     <!-- FOOTER -->
-    <footer class="footer">
-      <div class="container">
-        <div class="footer-grid">
-          <div class="footer-info">
-            <a href="../index.html" class="footer-logo">
-              <img src="../images/logo-bioclinic.png" alt="Bio-Clinic Sassari" width="160" height="53">
-            </a>
-            <p>Poliambulatorio Medico d'eccellenza a Sassari dal 1990. 51 specialisti, oltre 60 prestazioni diagnostiche e terapeutiche.</p>
-          </div>
-          <div class="footer-links">
-            <h4>Contatti</h4>
-            <ul>
-              <li><a href="tel:+390799561332"><i class="fas fa-phone"></i> 079 956 1332</a></li>
-              <li><a href="mailto:gestione@bio-clinic.it"><i class="fas fa-envelope"></i> gestione@bio-clinic.it</a></li>
-              <li><i class="fas fa-map-marker-alt"></i> Via Renzo Mossa, 23 - 07100 Sassari</li>
-            </ul>
-          </div>
-          <div class="footer-links">
-            <h4>Orari</h4>
-            <ul>
-              <li>Lunedì - Venerdì: 07:00 - 21:00</li>
-              <li>Sabato: 08:00 - 14:00</li>
-              <li>Domenica: Chiuso</li>
-            </ul>
-          </div>
-          <div class="footer-links">
-            <h4>Link Utili</h4>
-            <ul>
-              <li><a href="privacy.html">Privacy Policy</a></li>
-              <li><a href="cookie.html">Cookie Policy</a></li>
-              <li><a href="contatti.html">Contatti</a></li>
-            </ul>
-          </div>
-        </div>
-        <div class="footer-bottom">
-          <p>&copy; 2025 Bio-Clinic Sassari. Tutti i diritti riservati. P.IVA 01234567890</p>
-        </div>
-      </div>
-    </footer>
+    {footer}
 
     <!-- Scripts -->
     <script src="../js/main.js"></script>
@@ -605,16 +413,14 @@ def generate_procedure_page(proc, physicians, output_dir):
 </html>'''
     
     # Scrivi il file
-    output_path = os.path.join(output_dir, f'{proc_slug}.html')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    emit(output_path, html_content)
     
     return proc_slug
 
-def main():
+def main(emit=write_page, manifest=None):
     """Main function"""
     # Percorsi
-    base_dir = Path('/home/user/webapp/site')
+    base_dir = Path(__file__).resolve().parent.parent
     data_dir = base_dir / 'data' / 'v2' / 'entities'
     output_dir = base_dir / 'pages'
     
@@ -652,20 +458,46 @@ def main():
     
     print(f"Trovate {len(procedures_to_generate)} procedure da generare")
     
+    # Manifest per la build incrementale
+    force = force_requested()
+    # (build.py passa il proprio manifest e lo salva dopo aver scritto le pagine)
+    save_manifest = manifest is None
+    if save_manifest:
+        manifest = BuildManifest(base_dir)
+    shared_deps = {
+        'header': hash_file(base_dir / 'components' / 'master-header.html'),
+        'footer': hash_file(base_dir / 'components' / 'master-footer.html'),
+        'components': hash_file(components.__file__),
+        'schemagraph': hash_file(schemagraph.__file__),
+        'generator': hash_file(__file__),
+    }
+    
     # Genera pagine
     generated = []
     for proc in procedures_to_generate:
         proc_id = proc['id']
         proc_physicians = get_physicians_for_procedure(proc_id, physicians)
         
+        output_path = output_dir / f"{proc.get('slug', proc_id)}.html"
+        deps = dict(shared_deps,
+                    procedure=hash_record(proc),
+                    physicians=hash_record(proc_physicians))
+        if not force and manifest.is_fresh(output_path, deps):
+            continue
+        
         try:
-            slug = generate_procedure_page(proc, proc_physicians, output_dir)
+            slug = generate_procedure_page(proc, proc_physicians, output_dir, emit)
+            manifest.record(output_path, deps)
             generated.append(slug)
             print(f"✓ Generata: {slug}")
         except Exception as e:
             print(f"✗ Errore {proc_id}: {e}")
     
+    if save_manifest:
+        manifest.save()
+    
     print(f"\nTotale pagine generate: {len(generated)}")
+    print(f"Pagine invariate (cache): {manifest.skipped}")
     print("\nLink pagine:")
     for slug in generated:
         print(f"  - pages/{slug}.html")
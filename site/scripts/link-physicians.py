@@ -11,17 +11,24 @@ Usage:
     python scripts/link-physicians.py
 """
 
-import json
 import re
 import os
 from pathlib import Path
 from html import escape
 
+from bioclinic import namevariants, snapshots, writes
+from bioclinic.htmlcontext import HtmlContext
+
 # Configuration
 SITE_DIR = Path(__file__).parent.parent
-PHYSICIANS_FILE = SITE_DIR / 'data/entities/physicians-complete.json'
 EQUIPE_DIR = SITE_DIR / 'equipe'
 
+# Name index forms to link: full name, name with a title, bare name
+LINK_FORMS = ('full_name', 'title', 'name')
+
+# Titles linked in front of the name (the ones this script has always searched)
+LINK_TITLES = ('Dr.', 'Dott.', 'Dott.ssa', 'Prof.')
+
 # Pages to process
 PAGES_TO_PROCESS = [
     'index.html',
@@ -51,40 +58,31 @@ EXCLUDE_PATTERNS = [
 ]
 
 def load_physicians():
-    """Load physicians from JSON"""
-    with open(PHYSICIANS_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data.get('physicians', [])
+    """Load physicians and their name variants from the compiled name index"""
+    index = namevariants.load_name_index(SITE_DIR)
+    variants = namevariants.variants_by_slug(index, LINK_FORMS, LINK_TITLES)
+    return [
+        dict(physician, variants=variants.get(slug, []))
+        for slug, physician in index['physicians'].items()
+    ]
 
 def create_name_variants(physician):
-    """Create all possible name variants for a physician"""
-    variants = set()
-    
-    full_name = physician.get('full_name', '')
-    name = physician.get('name', '')
-    title = physician.get('title', '')
-    
-    if full_name:
-        variants.add(full_name)
-    
-    if name:
-        variants.add(name)
-        
-        # With different titles
-        if title:
-            variants.add(f"{title} {name}")
-        
-        # Common title variations
-        variants.add(f"Dr. {name}")
-        variants.add(f"Dott. {name}")
-        variants.add(f"Dott.ssa {name}")
-        variants.add(f"Prof. {name}")
-        
-        # Just surname if unique enough (skip for now to avoid false positives)
-        # surname = name.split()[-1]
-        # variants.add(f"Dr. {surname}")
-    
-    return list(variants)
+    """Name variants for a physician (from the name index, longest first)"""
+    return physician['variants']
+
+def build_matcher(physicians):
+    """One case-insensitive regex over all name variants (longest first)
+    and the physician for each normalized variant"""
+    by_key = {}
+    for physician in physicians:
+        for variant in create_name_variants(physician):
+            if len(variant) < 5:  # Skip very short names
+                continue
+            by_key.setdefault(namevariants.normalize_name(variant), (variant, physician))
+    pattern = re.compile(
+        r'\b(?:' + namevariants.variant_pattern(v for v, _ in by_key.values()) + r')\b',
+        re.IGNORECASE)
+    return pattern, {key: physician for key, (_, physician) in by_key.items()}
 
 def create_link_html(physician, matched_text):
     """Create the HTML link for a physician"""
@@ -106,43 +104,12 @@ def create_link_html(physician, matched_text):
         f'{matched_text}</a>'
     )
 
-def should_replace(html_content, match_start, match_end):
-    """Check if this match should be replaced (not already in excluded context)"""
-    # Get context around the match
-    context_start = max(0, match_start - 500)
-    context_end = min(len(html_content), match_end + 100)
-    context = html_content[context_start:context_end]
-    
-    match_in_context = match_start - context_start
-    
-    # Check if inside a link
-    last_a_open = context.rfind('<a ', 0, match_in_context)
-    last_a_close = context.rfind('</a>', 0, match_in_context)
-    if last_a_open > last_a_close:
-        return False  # Inside a link
-    
-    # Check if inside script or style
-    for tag in ['script', 'style']:
-        last_open = context.rfind(f'<{tag}', 0, match_in_context)
-        last_close = context.rfind(f'</{tag}>', 0, match_in_context)
-        if last_open > last_close:
-            return False
-    
-    # Check if it's an attribute value
-    last_quote = context.rfind('"', 0, match_in_context)
-    if last_quote > 0:
-        # Count quotes before to see if we're inside an attribute
-        quote_count = context[:match_in_context].count('"')
-        if quote_count % 2 == 1:
-            return False  # Inside a quoted attribute
-    
-    # Check if already has physician-link class nearby
-    if 'physician-link' in context[match_in_context-50:match_in_context+len(context)-match_in_context]:
-        return False
-    
-    return True
+def should_replace(context, match_start, match_end):
+    """Check if this match should be replaced (visible text, not inside a tag,
+    link, script, style, title or comment)"""
+    return context.is_text(match_start, match_end)
 
-def process_page(page_path, physicians):
+def process_page(page_path, matcher):
     """Process a single HTML page"""
     full_path = SITE_DIR / page_path
     
@@ -154,68 +121,42 @@ def process_page(page_path, physicians):
         content = f.read()
     
     original_content = content
-    links_created = 0
+    pattern, physician_by_key = matcher
     
-    # Sort physicians by name length (longest first to avoid partial matches)
-    sorted_physicians = sorted(
-        physicians, 
-        key=lambda p: len(p.get('full_name', '')), 
-        reverse=True
-    )
+    # HTML context of every position, computed once on the original page
+    context = HtmlContext(content)
     
-    # Track replaced positions to avoid overlaps
+    # Links to insert, as (start, end, html) ranges of the original content.
+    # A single pass finds every variant; at each position the longest one
+    # wins ("Dott. Guido Marongiu" before "Guido Marongiu")
     replaced_ranges = []
     
-    for physician in sorted_physicians:
-        variants = create_name_variants(physician)
+    for match in pattern.finditer(content):
+        start, end = match.start(), match.end()
         
-        for variant in variants:
-            if len(variant) < 5:  # Skip very short names
-                continue
-            
-            # Create regex pattern (word boundary, case insensitive)
-            pattern = r'\b' + re.escape(variant) + r'\b'
-            
-            # Find all matches
-            for match in re.finditer(pattern, content, re.IGNORECASE):
-                start, end = match.start(), match.end()
-                
-                # Check if this range overlaps with already replaced
-                overlaps = any(
-                    start < r_end and end > r_start 
-                    for r_start, r_end in replaced_ranges
-                )
-                
-                if overlaps:
-                    continue
-                
-                # Check if should replace
-                if not should_replace(content, start, end):
-                    continue
-                
-                matched_text = match.group()
-                link_html = create_link_html(physician, matched_text)
-                
-                # Replace in content
-                content = content[:start] + link_html + content[end:]
-                
-                # Update replaced ranges (account for length change)
-                len_diff = len(link_html) - len(matched_text)
-                replaced_ranges.append((start, start + len(link_html)))
-                
-                # Update other ranges
-                replaced_ranges = [
-                    (r_start + len_diff if r_start > start else r_start,
-                     r_end + len_diff if r_end > start else r_end)
-                    for r_start, r_end in replaced_ranges
-                ]
-                
-                links_created += 1
+        # Check if should replace
+        if not should_replace(context, start, end):
+            continue
+        
+        physician = physician_by_key[namevariants.normalize_name(match.group())]
+        replaced_ranges.append((start, end, create_link_html(physician, match.group())))
+    
+    # Build the linked page in one pass
+    links_created = len(replaced_ranges)
+    if replaced_ranges:
+        replaced_ranges.sort()
+        parts = []
+        last = 0
+        for start, end, link_html in replaced_ranges:
+            parts.append(content[last:start])
+            parts.append(link_html)
+            last = end
+        parts.append(content[last:])
+        content = ''.join(parts)
     
     # Save if changed
     if content != original_content:
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        writes.write_text(full_path, content)
         print(f"  ✅ {page_path}: {links_created} links created")
     else:
         print(f"  ⚪ {page_path}: no changes")
@@ -223,6 +164,8 @@ def process_page(page_path, physicians):
     return links_created
 
 def main():
+    writes.setup('link-physicians')
+    snapshots.before_write('link-physicians')
     print("=" * 50)
     print("PHYSICIAN AUTO-LINKER")
     print("=" * 50)
@@ -231,6 +174,7 @@ def main():
     # Load physicians
     print("Loading physicians...")
     physicians = load_physicians()
+    matcher = build_matcher(physicians)
     print(f"  Found {len(physicians)} physicians")
     print()
     
@@ -239,7 +183,7 @@ def main():
     total_links = 0
     
     for page in PAGES_TO_PROCESS:
-        links = process_page(page, physicians)
+        links = process_page(page, matcher)
         total_links += links
     
     print()
@@ -11,6 +11,8 @@ import re
 import os
 from pathlib import Path
 
+from bioclinic import snapshots, writes
+
 SITE_ROOT = Path(__file__).parent.parent
 
 # Pagine da processare
@@ -67,8 +69,7 @@ def process_page(file_path):
     changes += count2
     
     if changes > 0:
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        writes.write_text(full_path, content)
         print(f"  ✅ {file_path} - {changes} card rese cliccabili")
     else:
         # Verifica se ci sono già card cliccabili
@@ -164,12 +165,13 @@ a.team-member-clickable .team-avatar svg {
 }
 '''
     
-    with open(css_path, 'a', encoding='utf-8') as f:
-        f.write(new_css)
+    writes.write_text(css_path, css_path.read_text(encoding='utf-8') + new_css)
     
     print("  ✅ CSS aggiornato con stili per card cliccabili")
 
 def main():
+    writes.setup('make-team-cards-clickable')
+    snapshots.before_write('make-team-cards-clickable')
     print("=" * 70)
     print("BIO-CLINIC - TEAM CARDS CLICKABLE")
     print("Rende l'intero riquadro del medico cliccabile")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC IMMAGINI RESPONSIVE                                              ║
+║                                                                               ║
+║  Genera in parallelo le varianti AVIF/WebP delle immagini di images/ a       ║
+║  larghezze scalate (images/variants/, cache per hash del sorgente) e         ║
+║  riscrive le <img> delle pagine in <picture> con srcset, width/height e      ║
+║  lazy loading fuori dal primo viewport.                                      ║
+║                                                                               ║
+║  Richiede `pip install pillow` per le varianti; senza, solo width/height.    ║
+║                                                                               ║
+║  Uso: python3 scripts/optimize-images.py [--dry-run] [--diff] [--jobs N]     ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+from pathlib import Path
+
+from bioclinic import images, snapshots, writes
+from bioclinic.parallel import parse_jobs
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def main():
+    dry_run = writes.setup('optimize-images')
+    # Pagine, varianti esistenti (quelle obsolete vengono cancellate) e manifest
+    snapshots.before_write('optimize-images', SITE_ROOT,
+                           images.find_pages(SITE_ROOT) + images.stale_variants(SITE_ROOT, {})
+                           + [images.MANIFEST_RELPATH])
+    if not images.formats():
+        print("⚠️  Pillow non installato (pip install pillow): solo width/height e lazy loading")
+    manifest, written, stale, pages = images.write_images(
+        SITE_ROOT, parse_jobs(default=os.cpu_count() or 1))
+
+    prefix = "🔍 [DRY-RUN] " if dry_run else "✅ "
+    variants = sum(len(v) for entry in manifest.values() for v in entry['variants'].values())
+    print(f"{prefix}{len(manifest)} immagini, {variants} varianti "
+          f"({', '.join(images.formats()) or 'nessun formato'}), {len(pages)} pagine riscritte")
+    print(f"   📝 {len(written)} varianti nuove, 🗑️  {len(stale)} obsolete")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -13,87 +13,61 @@
 
 import os
 import re
-import json
 import glob
 from pathlib import Path
 from datetime import datetime
 
+from bioclinic import namevariants, snapshots, writes
+
 # Configurazione
 SITE_ROOT = Path(__file__).parent.parent
-PHYSICIANS_JSON = SITE_ROOT / "data" / "entities" / "physicians-complete.json"
 LOG_FILE = SITE_ROOT / "logs" / "physician-autolink.log"
 
-def load_physicians():
-    """Carica tutti i medici dal database JSON."""
-    with open(PHYSICIANS_JSON, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data['physicians']
+# Forme dell'indice dei nomi da linkare
+LINK_FORMS = ('full_name', 'title', 'surname')
+
+# Titoli cercati davanti al nome o al cognome (quelli storici di questo script)
+LINK_TITLES = ('Dott.', 'Dott.ssa', 'Dottssa', 'Prof.', 'Prof', 'Dr.', 'Dr')
+
+def load_name_index():
+    """Carica l'indice compilato delle varianti dei nomi (scripts/build-name-index.py)."""
+    return namevariants.load_name_index(SITE_ROOT)
 
-def build_physician_patterns(physicians):
+def build_physician_patterns(index):
     """
-    Costruisce pattern di ricerca per ogni medico.
-    Include varianti comuni dei nomi.
+    Costruisce pattern di ricerca per ogni medico dall'indice delle varianti.
+    Include nome completo, nome con titolo e cognome con titolo
+    (es. "Dott. Dessole" è escluso perché il cognome è condiviso).
     """
     patterns = []
-    
-    for p in physicians:
-        slug = p['slug']
-        name = p['name']  # es. "Francesco Dessole"
-        full_name = p['full_name']  # es. "Dott. Francesco Dessole"
-        title = p.get('title', '')  # es. "Dott." o "Prof."
-        job_title = p.get('job_title', '')
-        
-        # Estrai nome e cognome
-        name_parts = name.split()
-        if len(name_parts) >= 2:
-            first_name = name_parts[0]
-            last_name = " ".join(name_parts[1:])
-        else:
-            first_name = name
-            last_name = ""
-        
-        # Lista di varianti da cercare (in ordine di priorità)
-        variants = []
-        
-        # 1. Nome completo con titolo (es. "Dott. Francesco Dessole", "Prof. Salvatore Dessole")
-        if title:
-            variants.append(f"{title} {name}")
-            # Variante con "ssa" per dottoressa
-            if title == "Dott.":
-                variants.append(f"Dott.ssa {name}")
-            # Varianti senza punto
-            variants.append(f"{title.replace('.', '')} {name}")
-            if title == "Dott.":
-                variants.append(f"Dottssa {name}")
-        
-        # 2. Dr./Dr con nome
-        variants.append(f"Dr. {name}")
-        variants.append(f"Dr {name}")
-        
-        # 3. Solo cognome con titolo (es. "Dott. Dessole")
-        if last_name:
-            if title:
-                variants.append(f"{title} {last_name}")
-                if title == "Dott.":
-                    variants.append(f"Dott.ssa {last_name}")
-            variants.append(f"Dr. {last_name}")
-        
-        # Aggiungi tutte le varianti
-        for variant in variants:
-            if variant and len(variant) > 5:  # Evita match troppo corti
-                patterns.append({
-                    'pattern': variant,
-                    'slug': slug,
-                    'full_name': full_name,
-                    'job_title': job_title,
-                    'name': name
-                })
-    
-    # Ordina per lunghezza decrescente (match più specifici prima)
-    patterns.sort(key=lambda x: len(x['pattern']), reverse=True)
+    physicians = index['physicians']
+    
+    # Le varianti sono già ordinate per lunghezza decrescente (match più specifici prima)
+    for variant in namevariants.iter_variants(index, LINK_FORMS, LINK_TITLES):
+        p = physicians[variant['slug']]
+        patterns.append({
+            'pattern': variant['text'],
+            'slug': p['slug'],
+            'full_name': p['full_name'],
+            'job_title': p.get('job_title', ''),
+            'name': p['name']
+        })
     
     return patterns
 
+def build_matcher(patterns):
+    """
+    Un'unica regex (case insensitive) su tutti i pattern, dal più lungo,
+    e il pattern per ogni testo normalizzato: una sola passata per pagina
+    invece di una per variante.
+    """
+    by_key = {}
+    for p in patterns:
+        by_key.setdefault(namevariants.normalize_name(p['pattern']), p)
+    regex = re.compile(
+        namevariants.variant_pattern(p['pattern'] for p in by_key.values()), re.IGNORECASE)
+    return regex, by_key
+
 def get_relative_path(page_path, target="equipe"):
     """Calcola il path relativo alla cartella equipe dalla pagina corrente."""
     page_path = Path(page_path)
@@ -131,7 +105,7 @@ def is_already_linked(text, start_pos, end_pos):
     
     return False
 
-def process_page(page_path, patterns):
+def process_page(page_path, matcher):
     """Processa una singola pagina HTML, aggiungendo link ai medici."""
     try:
         with open(page_path, 'r', encoding='utf-8') as f:
@@ -139,75 +113,44 @@ def process_page(page_path, patterns):
         
         original_content = content
         equipe_path = get_relative_path(page_path)
-        links_added = 0
+        regex, patterns_by_key = matcher
         
-        # Per ogni pattern di medico
-        for p in patterns:
-            pattern_text = p['pattern']
+        # Tutte le occorrenze in una passata (a parità di posizione vince il pattern più lungo);
+        # il controllo "già linkato" vede anche i link inseriti prima nella pagina
+        content = ''
+        last = 0
+        links_added = 0
+        for match in regex.finditer(original_content):
+            start = match.start()
+            end = match.end()
+            matched_text = match.group()
+            
+            # Salta se già linkato
+            content += original_content[last:start]
+            last = start
+            if is_already_linked(content, len(content), len(content) + len(matched_text)):
+                continue
+            
+            p = patterns_by_key[namevariants.normalize_name(matched_text)]
             slug = p['slug']
             full_name = p['full_name']
             job_title = p['job_title']
             
-            # Crea il regex pattern (case insensitive per alcune varianti)
-            regex = re.compile(re.escape(pattern_text), re.IGNORECASE)
-            
-            # Trova tutte le occorrenze
-            for match in list(regex.finditer(content)):
-                start = match.start()
-                end = match.end()
-                matched_text = match.group()
-                
-                # Salta se già linkato
-                if is_already_linked(content, start, end):
-                    continue
-                
-                # Crea il link
-                link_html = (
-                    f'<a href="{equipe_path}{slug}.html" '
-                    f'class="physician-link" '
-                    f'title="Vedi profilo e prenota - {full_name} - {job_title}">'
-                    f'{matched_text}</a>'
-                )
-                
-                # Sostituisci (una volta sola per evitare duplicati)
-                content = content[:start] + link_html + content[end:]
-                links_added += 1
-                
-                # Ricalcola il contenuto per il prossimo match
-                break  # Riavvia la ricerca dopo ogni sostituzione per gestire gli offset
-            
-            # Se abbiamo fatto una sostituzione, ripetiamo per lo stesso pattern
-            if links_added > 0:
-                # Ripeti il processo fino a quando non ci sono più match
-                while True:
-                    found = False
-                    for match in list(regex.finditer(content)):
-                        start = match.start()
-                        end = match.end()
-                        matched_text = match.group()
-                        
-                        if is_already_linked(content, start, end):
-                            continue
-                        
-                        link_html = (
-                            f'<a href="{equipe_path}{slug}.html" '
-                            f'class="physician-link" '
-                            f'title="Vedi profilo e prenota - {full_name} - {job_title}">'
-                            f'{matched_text}</a>'
-                        )
-                        
-                        content = content[:start] + link_html + content[end:]
-                        links_added += 1
-                        found = True
-                        break
-                    
-                    if not found:
-                        break
+            # Crea il link
+            content += (
+                f'<a href="{equipe_path}{slug}.html" '
+                f'class="physician-link" '
+                f'title="Vedi profilo e prenota - {full_name} - {job_title}">'
+                f'{matched_text}</a>'
+            )
+            last = end
+            links_added += 1
+        
+        content += original_content[last:]
         
         # Salva solo se ci sono modifiche
         if content != original_content:
-            with open(page_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            writes.write_text(page_path, content)
             return True, links_added
         else:
             return True, 0
@@ -237,17 +180,20 @@ def find_all_html_pages():
 
 def main():
     """Funzione principale."""
+    writes.setup('physician-autolink-v2')
+    snapshots.before_write('physician-autolink-v2')
     print("=" * 70)
     print("BIO-CLINIC PHYSICIAN AUTO-LINKER v2.0")
     print(f"Esecuzione: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
     
     # Carica medici
-    physicians = load_physicians()
-    print(f"✅ Caricati {len(physicians)} medici dal database")
+    index = load_name_index()
+    print(f"✅ Caricati {len(index['physicians'])} medici dall'indice dei nomi")
     
     # Costruisci pattern
-    patterns = build_physician_patterns(physicians)
+    patterns = build_physician_patterns(index)
+    matcher = build_matcher(patterns)
     print(f"✅ Generati {len(patterns)} pattern di ricerca")
     print("-" * 70)
     
@@ -271,7 +217,7 @@ def main():
     # Processa ogni pagina
     for page in pages:
         rel_path = os.path.relpath(page, SITE_ROOT)
-        success, result = process_page(page, patterns)
+        success, result = process_page(page, matcher)
         
         if success:
             if isinstance(result, int) and result > 0:
@@ -292,6 +238,9 @@ def main():
     print(f"   ❌ Errori: {errors}")
     print("=" * 70)
     
+    if writes.dry_run():
+        return 0 if errors == 0 else 1
+
     # Log
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(LOG_FILE, 'a', encoding='utf-8') as f:
@@ -7,78 +7,129 @@
 ║  VERSIONE MIGLIORATA: gestisce correttamente Dott./Dott.ssa/Prof.            ║
 ║  e tutti i casi di nomi medici presenti nelle pagine.                        ║
 ║                                                                               ║
-║  Uso: python scripts/physician-autolink-v3.py                                ║
+║  Uso: python scripts/physician-autolink-v3.py [--trace[=FILE]]               ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
 import os
 import re
-import json
 import glob
 from pathlib import Path
 from datetime import datetime
 
+from bioclinic import namevariants, snapshots, trace, writes
+from bioclinic.htmlcontext import HtmlContext
+
 # Configurazione
 SITE_ROOT = Path(__file__).parent.parent
-PHYSICIANS_JSON = SITE_ROOT / "data" / "entities" / "physicians-complete.json"
 LOG_FILE = SITE_ROOT / "logs" / "physician-autolink.log"
 
-def load_physicians():
-    """Carica tutti i medici dal database JSON."""
-    with open(PHYSICIANS_JSON, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return data['physicians']
+# Forme dell'indice dei nomi da linkare
+LINK_FORMS = ('full_name', 'title')
+
+def load_name_index():
+    """Carica l'indice compilato delle varianti dei nomi (scripts/build-name-index.py)."""
+    return namevariants.load_name_index(SITE_ROOT)
 
-def build_physician_patterns(physicians):
+def build_physician_patterns(index):
     """
-    Costruisce pattern di ricerca per ogni medico.
-    Include TUTTE le varianti possibili.
+    Costruisce i pattern di ricerca dall'indice delle varianti.
+    Nome completo e nome con ogni titolo (Dott., Dott.ssa, Dr., Prof., ...);
+    il nome senza titolo è escluso (troppo generico, falsi positivi).
     """
     patterns = []
+    physicians = index['physicians']
     
-    for p in physicians:
-        slug = p['slug']
-        name = p['name']  # es. "Sara Uras"
-        full_name = p['full_name']  # es. "Dott.ssa Sara Uras"
-        title = p.get('title', 'Dott.')  # es. "Dott.ssa" o "Prof."
-        job_title = p.get('job_title', 'Specialista')
-        
-        # Lista di varianti da cercare
-        variants = set()
-        
-        # 1. Full name esatto dal database
-        variants.add(full_name)
-        
-        # 2. Varianti con diversi titoli
-        titles = ['Dott.', 'Dott.ssa', 'Dr.', 'Dr', 'Prof.', 'Prof', 'Dottssa', 'Dottoressa']
-        for t in titles:
-            variants.add(f"{t} {name}")
-        
-        # 3. Se il title contiene "ssa", aggiungi versioni femminili
-        if 'ssa' in title.lower():
-            variants.add(f"Dott.ssa {name}")
-            variants.add(f"Dottssa {name}")
-            variants.add(f"Dottoressa {name}")
-        
-        # 4. Versione senza titolo (solo nome completo)
-        # variants.add(name)  # Troppo generico, potrebbe creare falsi positivi
-        
-        # Aggiungi tutte le varianti
-        for variant in variants:
-            if variant and len(variant) > 5:
-                patterns.append({
-                    'pattern': variant,
-                    'slug': slug,
-                    'full_name': full_name,
-                    'job_title': job_title,
-                    'name': name
-                })
-    
-    # Ordina per lunghezza decrescente (match più specifici prima)
-    patterns.sort(key=lambda x: len(x['pattern']), reverse=True)
+    # Le varianti sono già ordinate per lunghezza decrescente (match più specifici prima)
+    for variant in namevariants.iter_variants(index, LINK_FORMS):
+        p = physicians[variant['slug']]
+        patterns.append({
+            'pattern': variant['text'],
+            'slug': p['slug'],
+            'full_name': p['full_name'],
+            'job_title': p.get('job_title', 'Specialista'),
+            'name': p['name']
+        })
     
     return patterns
 
+class PhysicianMatcher:
+    """
+    Automa Aho-Corasick su tutte le varianti dei nomi (costruito una volta per build).
+
+    Una sola scansione della pagina trova tutte le occorrenze di tutti i pattern,
+    invece di un `content.find` per pattern: il costo per pagina dipende dalla
+    lunghezza del testo, non dal numero di medici.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self.lengths = [len(p['pattern']) for p in patterns]
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, p in enumerate(patterns):
+            state = 0
+            for ch in p['pattern']:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(index)
+
+        # Link di fallimento in ampiezza (BFS)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+        # Dalla radice si salta direttamente al prossimo carattere iniziale possibile
+        first_chars = ''.join(sorted(self.goto[0]))
+        self._next_start = re.compile(f"[{re.escape(first_chars)}]") if first_chars else None
+
+    def find_all(self, text):
+        """Ritorna {indice pattern: [posizioni iniziali]} per tutte le occorrenze (anche sovrapposte)."""
+        hits = {}
+        if self._next_start is None:
+            return hits
+        goto, fail, output, lengths = self.goto, self.fail, self.output, self.lengths
+        root = goto[0]
+        state = 0
+        i = 0
+        n = len(text)
+        searches = 0
+        while i < n:
+            ch = text[i]
+            if state == 0:
+                state = root.get(ch, 0)
+                if state == 0:
+                    searches += 1
+                    m = self._next_start.search(text, i + 1)
+                    if m is None:
+                        break
+                    i = m.start()
+                    continue
+            else:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            for index in output[state]:
+                hits.setdefault(index, []).append(i - lengths[index] + 1)
+            i += 1
+        trace.count('regex', searches)
+        return hits
+
 def get_relative_path(page_path, target="equipe"):
     """Calcola il path relativo alla cartella equipe dalla pagina corrente."""
     page_path = Path(page_path)
@@ -92,120 +143,88 @@ def get_relative_path(page_path, target="equipe"):
     else:
         return "../" * depth + f"{target}/"
 
-def is_inside_tag(content, pos):
-    """Verifica se la posizione è dentro un tag HTML (attributo, script, meta, ecc.)."""
-    # Cerca indietro per trovare < o >
-    search_back = content[max(0, pos - 200):pos]
-    
-    # Se troviamo < senza > dopo, siamo dentro un tag
-    last_open = search_back.rfind('<')
-    last_close = search_back.rfind('>')
+def link_physicians(content, page_path, matcher):
+    """Aggiunge i link ai profili nel contenuto di una pagina, senza toccare il disco.
+
+    Tutte le occorrenze vengono trovate con una sola scansione (PhysicianMatcher);
+    la scelta dei link segue lo stesso ordine di prima: pattern dal più lungo,
+    un solo pattern (variante) per medico, al massimo 100 occorrenze per pattern.
+    Si linka solo testo visibile: il contesto (tag, link esistenti, script,
+    JSON-LD, style, title, commenti) viene calcolato una volta per pagina da
+    HtmlContext. Il documento finale viene composto con un unico join.
+
+    Ritorna (nuovo contenuto, numero di link aggiunti).
+    """
+    hits = matcher.find_all(content)
+    if not hits:
+        return content, 0
     
-    if last_open > last_close:
-        return True
+    equipe_path = get_relative_path(page_path)
+    context = HtmlContext(content)
+    already_processed = set()  # Per evitare duplicati
+    links = []  # (inizio, fine, html) nel testo originale
     
-    return False
-
-def is_already_linked(content, start, end):
-    """Verifica se il testo è già dentro un link <a>."""
-    # Cerca <a> aperto prima della posizione
-    before = content[max(0, start - 300):start]
+    for index, p in enumerate(matcher.patterns):
+        starts = hits.get(index)
+        if not starts or p['slug'] in already_processed:
+            continue
+        
+        length = matcher.lengths[index]
+        search_pos = 0
+        iterations = 0
+        max_iterations = 100  # Stesso limite della versione a scansioni ripetute
+        
+        for pos in starts:
+            if pos < search_pos:
+                continue
+            if iterations >= max_iterations:
+                break
+            iterations += 1
+            end_pos = pos + length
+            search_pos = end_pos
+            
+            # Un testo già trasformato in link non può essere linkato di nuovo
+            if any(pos < link_end and link_start < end_pos for link_start, link_end, _ in links):
+                continue
+            
+            if not context.is_text(pos, end_pos):
+                continue
+            
+            links.append((pos, end_pos, (
+                f'<a href="{equipe_path}{p["slug"]}.html" '
+                f'class="physician-link" '
+                f'title="Vedi profilo e prenota - {p["full_name"]} - {p["job_title"]}">'
+                f'{content[pos:end_pos]}</a>'
+            )))
+            already_processed.add(p['slug'])
     
-    # Conta i tag <a aperti vs </a> chiusi
-    a_opens = len(re.findall(r'<a[\s>]', before, re.IGNORECASE))
-    a_closes = len(re.findall(r'</a>', before, re.IGNORECASE))
+    if not links:
+        return content, 0
     
-    if a_opens > a_closes:
-        return True
+    links.sort()
+    parts = []
+    last = 0
+    for link_start, link_end, link_html in links:
+        parts.append(content[last:link_start])
+        parts.append(link_html)
+        last = link_end
+    parts.append(content[last:])
     
-    return False
+    return ''.join(parts), len(links)
 
-def process_page(page_path, patterns):
+def process_page(page_path, matcher):
     """Processa una singola pagina HTML."""
     try:
         with open(page_path, 'r', encoding='utf-8') as f:
             content = f.read()
+        trace.bytes_read(content)
         
         original_content = content
-        equipe_path = get_relative_path(page_path)
-        links_added = 0
-        already_processed = set()  # Per evitare duplicati
-        
-        # Per ogni pattern
-        for p in patterns:
-            pattern_text = p['pattern']
-            slug = p['slug']
-            full_name = p['full_name']
-            job_title = p['job_title']
-            
-            # Salta se già processato questo slug
-            if slug in already_processed:
-                continue
-            
-            # Cerca il pattern nel contenuto
-            # Usa regex per match case-sensitive (i nomi devono matchare esattamente)
-            search_pos = 0
-            iterations = 0
-            max_iterations = 100  # Sicurezza contro loop infiniti
-            
-            while search_pos < len(content) and iterations < max_iterations:
-                iterations += 1
-                
-                # Trova la prossima occorrenza
-                pos = content.find(pattern_text, search_pos)
-                if pos == -1:
-                    break
-                
-                end_pos = pos + len(pattern_text)
-                
-                # Verifica se è un contesto valido per linkare
-                if is_inside_tag(content, pos):
-                    search_pos = end_pos
-                    continue
-                
-                if is_already_linked(content, pos, end_pos):
-                    search_pos = end_pos
-                    continue
-                
-                # Verifica che sia in un contesto HTML visibile (es. dentro <h4>, <p>, <span>)
-                # e non in meta, script, title, style, JSON-LD, ecc.
-                before_context = content[max(0, pos - 500):pos].lower()
-                
-                # IMPORTANTE: Escludi blocchi JSON-LD
-                if 'application/ld+json' in before_context:
-                    # Verifica se siamo ancora dentro il blocco script
-                    last_script_open = before_context.rfind('<script')
-                    last_script_close = before_context.rfind('</script')
-                    if last_script_open > last_script_close:
-                        search_pos = end_pos
-                        continue
-                
-                # Escludi altri contesti non validi
-                if any(tag in before_context[-150:] for tag in ['<meta', '<script', '<title', '<style', 'content="', "content='", '"name":', '"founder":']):
-                    search_pos = end_pos
-                    continue
-                
-                # Crea il link
-                matched_text = content[pos:end_pos]
-                link_html = (
-                    f'<a href="{equipe_path}{slug}.html" '
-                    f'class="physician-link" '
-                    f'title="Vedi profilo e prenota - {full_name} - {job_title}">'
-                    f'{matched_text}</a>'
-                )
-                
-                # Sostituisci
-                content = content[:pos] + link_html + content[end_pos:]
-                links_added += 1
-                already_processed.add(slug)
-                
-                # Aggiorna la posizione di ricerca (dopo il link appena inserito)
-                search_pos = pos + len(link_html)
+        content, links_added = link_physicians(content, page_path, matcher)
         
         # Salva se modificato
         if content != original_content:
-            with open(page_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            writes.write_text(page_path, content)
             return True, links_added
         else:
             return True, 0
@@ -236,18 +255,24 @@ def find_all_html_pages():
 
 def main():
     """Funzione principale."""
+    trace.setup('physician-autolink-v3')
+    writes.setup('physician-autolink-v3')
+    snapshots.before_write('physician-autolink-v3')
     print("=" * 70)
     print("BIO-CLINIC PHYSICIAN AUTO-LINKER v3.0")
     print(f"Esecuzione: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
     
     # Carica medici
-    physicians = load_physicians()
-    print(f"✅ Caricati {len(physicians)} medici dal database")
+    with trace.span('carica indice nomi'):
+        index = load_name_index()
+    print(f"✅ Caricati {len(index['physicians'])} medici dall'indice dei nomi")
     
     # Costruisci pattern
-    patterns = build_physician_patterns(physicians)
-    print(f"✅ Generati {len(patterns)} pattern di ricerca")
+    with trace.span('costruisci automa'):
+        patterns = build_physician_patterns(index)
+        matcher = PhysicianMatcher(patterns)
+    print(f"✅ Generati {len(patterns)} pattern di ricerca ({len(matcher.goto)} stati)")
     
     # Debug: mostra pattern per Sara Uras
     print("-" * 70)
@@ -258,7 +283,8 @@ def main():
     print("-" * 70)
     
     # Trova pagine
-    pages = find_all_html_pages()
+    with trace.span('trova pagine'):
+        pages = find_all_html_pages()
     print(f"📄 Trovate {len(pages)} pagine HTML")
     print("-" * 70)
     
@@ -268,20 +294,22 @@ def main():
     errors = 0
     
     # Processa
-    for page in pages:
-        rel_path = os.path.relpath(page, SITE_ROOT)
-        success, result = process_page(page, patterns)
+    with trace.span('linka medici', pages=len(pages)):
+        for page in pages:
+            rel_path = os.path.relpath(page, SITE_ROOT)
+            with trace.page(rel_path):
+                success, result = process_page(page, matcher)
         
-        if success:
-            if isinstance(result, int) and result > 0:
-                print(f"  ✅ {rel_path} - {result} link aggiunti")
-                total_links += result
-                pages_modified += 1
+            if success:
+                if isinstance(result, int) and result > 0:
+                    print(f"  ✅ {rel_path} - {result} link aggiunti")
+                    total_links += result
+                    pages_modified += 1
+                else:
+                    print(f"  ⏭️  {rel_path} - già completo")
             else:
-                print(f"  ⏭️  {rel_path} - già completo")
-        else:
-            print(f"  ❌ {rel_path} - ERRORE: {result}")
-            errors += 1
+                print(f"  ❌ {rel_path} - ERRORE: {result}")
+                errors += 1
     
     # Riepilogo
     print("-" * 70)
@@ -291,6 +319,9 @@ def main():
     print(f"   ❌ Errori: {errors}")
     print("=" * 70)
     
+    if writes.dry_run():
+        return 0 if errors == 0 else 1
+
     # Log
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(LOG_FILE, 'a', encoding='utf-8') as f:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC PRECOMPRESSIONE ASSET                                            ║
+║                                                                               ║
+║  Scrive accanto a ogni asset testuale pubblicato (HTML, CSS, JS, JSON,       ║
+║  XML, SVG, TXT) le varianti .br (Brotli 11) e .gz (gzip 9), in parallelo.    ║
+║  I file invariati dall'ultima esecuzione vengono saltati; per ogni file      ║
+║  compresso riporta i byte risparmiati.                                       ║
+║                                                                               ║
+║  Brotli richiede `pip install brotli`; senza, solo .gz.                      ║
+║                                                                               ║
+║  Uso: python3 scripts/precompress.py [--force] [--jobs N]                    ║
+║  (anche come ultimo passo di scripts/build.py --precompress)                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bioclinic import precompress
+from bioclinic.buildcache import force_requested
+from bioclinic.parallel import parse_jobs
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def format_kb(size):
+    return f"{size / 1024:.1f} KB"
+
+
+def print_report(report, skipped, removed):
+    """Righe per file compresso e totali; ritorna i byte risparmiati"""
+    total_before = total_after = 0
+    for rel, size, sizes in report:
+        written = {encoding: s for encoding, s in sizes.items() if s is not None}
+        if not written:
+            print(f"  ⏭️  {rel} - non comprimibile ({format_kb(size)})")
+            continue
+        best = min(written.values())
+        total_before += size
+        total_after += best
+        variants = ", ".join(f"{encoding[1:]} {format_kb(s)}" for encoding, s in sorted(written.items()))
+        print(f"  ✅ {rel} - {format_kb(size)} → {variants} (-{format_kb(size - best)}, "
+              f"-{1 - best / size:.0%})")
+    for variant in removed:
+        print(f"  🗑️  {variant} - sorgente rimosso")
+    print("-" * 70)
+    print(f"📊 {len(report)} file compressi, {skipped} invariati, {len(removed)} varianti rimosse")
+    if total_before:
+        print(f"   💾 Risparmio: {format_kb(total_before - total_after)} su {format_kb(total_before)} "
+              f"(-{1 - total_after / total_before:.0%}, variante migliore per file)")
+    return total_before - total_after
+
+
+def main():
+    print("=" * 70)
+    print("BIO-CLINIC PRECOMPRESSIONE ASSET")
+    print(f"Esecuzione: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+    if precompress.brotli is None:
+        print("⚠️  Modulo brotli non installato (pip install brotli): solo varianti .gz")
+
+    jobs = parse_jobs(default=os.cpu_count() or 1)
+    started = time.perf_counter()
+    report, skipped, removed = precompress.precompress_site(SITE_ROOT, jobs, force_requested())
+    print_report(report, skipped, removed)
+    print(f"⏱️  Tempo: {time.perf_counter() - started:.2f}s ({jobs} processi)")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,13 @@
 ║  Eseguire SEMPRE dopo ogni modifica al file:                                 ║
 ║     components/master-header.html                                            ║
 ║                                                                               ║
-║  Uso: python scripts/propagate-header.py                                     ║
+║  L'header di ogni pagina sta tra <!-- BEGIN MASTER HEADER --> e              ║
+║  <!-- END MASTER HEADER -->: la sostituzione è una copia tra i marcatori,    ║
+║  senza regex (vedi bioclinic/headerregion.py). Con --dry-run elenca le       ║
+║  pagine che cambierebbero senza riscriverle, con --diff ne stampa il diff.   ║
+║                                                                               ║
+║  Uso: python scripts/propagate-header.py [--dry-run] [--diff]                ║
+║                                          [--trace[=FILE]]                    ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
@@ -18,12 +24,15 @@ import glob
 from datetime import datetime
 from pathlib import Path
 
+from bioclinic import components, headerregion, snapshots, trace, writes
+
 # Configurazione
 SITE_ROOT = Path(__file__).parent.parent
 MASTER_HEADER_PATH = SITE_ROOT / "components" / "master-header.html"
 LOG_FILE = SITE_ROOT / "logs" / "header-propagation.log"
 
-# Pattern per identificare l'header esistente (da sostituire)
+# Pattern per identificare l'header esistente nelle pagine senza marcatori
+# (solo alla prima propagazione: poi la regione è delimitata dai marcatori)
 HEADER_START_PATTERNS = [
     r'<!-- TOP BAR -->',
     r'<div class="header-top">',
@@ -41,172 +50,116 @@ HEADER_END_PATTERNS = [
     r'<div class="hero'
 ]
 
-# Mappa dei path relativi per ogni tipo di pagina
-def get_paths_for_page(page_path: str) -> dict:
-    """Calcola i path relativi corretti per ogni pagina."""
-    page_path = Path(page_path)
-    rel_to_site = page_path.relative_to(SITE_ROOT)
-    depth = len(rel_to_site.parts) - 1  # -1 per il file stesso
-    
-    if depth == 0:
-        # Pagina nella root (es. index.html)
-        return {
-            "ROOT_PATH": "",
-            "PAGES_PATH": "pages/",
-            "IMAGES_PATH": "images/",
-            "JS_PATH": "js/",
-            "CSS_PATH": "css/"
-        }
-    elif depth == 1:
-        # Pagina in una sottocartella (es. pages/cardiologia.html, laboratorio/index.html)
-        return {
-            "ROOT_PATH": "../",
-            "PAGES_PATH": "" if "pages" in str(rel_to_site) else "../pages/",
-            "IMAGES_PATH": "../images/",
-            "JS_PATH": "../js/",
-            "CSS_PATH": "../css/"
-        }
-    elif depth == 2:
-        # Pagina più profonda (es. equipe/medici/nome.html)
-        return {
-            "ROOT_PATH": "../../",
-            "PAGES_PATH": "../../pages/",
-            "IMAGES_PATH": "../../images/",
-            "JS_PATH": "../../js/",
-            "CSS_PATH": "../../css/"
-        }
-    else:
-        # Default per profondità maggiori
-        prefix = "../" * depth
-        return {
-            "ROOT_PATH": prefix,
-            "PAGES_PATH": f"{prefix}pages/",
-            "IMAGES_PATH": f"{prefix}images/",
-            "JS_PATH": f"{prefix}js/",
-            "CSS_PATH": f"{prefix}css/"
-        }
+def load_master_header() -> str:
+    """Carica il master header (senza commento di documentazione, con i marcatori)."""
+    return components.load_source(SITE_ROOT, components.MASTER_HEADER)
+
+def render_header(page_path: str, master_header: str) -> str:
+    """Master header con path relativi e voci attive della pagina.
 
-def get_active_class(page_path: str) -> dict:
-    """Determina quali voci di menu devono essere attive."""
-    page_name = Path(page_path).name.lower()
-    page_dir = Path(page_path).parent.name.lower()
+    Le varianti sono memoizzate per valori dei segnaposto (profondità,
+    cartella, voce attiva): su tutto il sito se ne renderizza una decina.
+    """
+    rel_path = Path(os.path.relpath(page_path, SITE_ROOT)).as_posix()
+    return components.compile_component(master_header).render(components.page_context(rel_path))
+
+def splice_header(content: str, page_path: str, master_header: str) -> tuple[bool, str]:
+    """Sostituisce l'header nel contenuto di una pagina, senza toccare il disco.
+
+    Se la pagina ha i marcatori si sostituisce la regione tra di essi;
+    altrimenti l'header esistente si cerca con i pattern (prima propagazione).
+    Ritorna (True, nuovo contenuto) oppure (False, messaggio di errore).
+    """
+    header = render_header(page_path, master_header)
+    region = headerregion.find_region(content)
+    if region is not None:
+        return True, headerregion.splice(content, region, header)
     
-    active = {
-        "ACTIVE_HOME": "",
-        "ACTIVE_SLIMCARE": "",
-        "ACTIVE_LAB": "",
-        "ACTIVE_DONNA": "",
-        "ACTIVE_SPEC": "",
-        "ACTIVE_SHOP": "",
-        "ACTIVE_CONTATTI": ""
-    }
+    # Trova dove inizia l'header esistente
+    header_start = None
+    for pattern in HEADER_START_PATTERNS:
+        match = re.search(pattern, content, re.IGNORECASE)
+        if match:
+            header_start = match.start()
+            break
     
-    # Home
-    if page_name == "index.html" and page_dir in ["site", ""]:
-        active["ACTIVE_HOME"] = "active"
+    # Se non troviamo l'inizio, cerca </head>
+    if header_start is None:
+        head_end = content.find('</head>')
+        if head_end != -1:
+            # Cerca <body...>
+            body_match = re.search(r'<body[^>]*>', content[head_end:])
+            if body_match:
+                header_start = head_end + body_match.end()
     
-    # Slim Care
-    elif "slim-care" in page_name:
-        active["ACTIVE_SLIMCARE"] = "active"
+    if header_start is None:
+        return False, "Non trovato punto di inserimento header"
     
-    # Laboratorio
-    elif "laboratorio" in page_name or page_dir == "laboratorio":
-        active["ACTIVE_LAB"] = "active"
+    # Trova dove finisce l'header esistente
+    header_end = None
+    search_content = content[header_start:]
     
-    # Donna & PMA
-    elif page_name in ["ginecologia.html", "pma-fertilita.html"]:
-        active["ACTIVE_DONNA"] = "active"
+    for pattern in HEADER_END_PATTERNS:
+        match = re.search(pattern, search_content, re.IGNORECASE)
+        if match:
+            header_end = header_start + match.start()
+            break
     
-    # Shop
-    elif page_dir == "shop" or "shop" in page_name:
-        active["ACTIVE_SHOP"] = "active"
+    if header_end is None:
+        # Fallback: cerca la prima sezione/main
+        main_match = re.search(r'<(main|section|div class="hero|div class="page)', search_content, re.IGNORECASE)
+        if main_match:
+            header_end = header_start + main_match.start()
     
-    # Contatti
-    elif page_name == "contatti.html":
-        active["ACTIVE_CONTATTI"] = "active"
+    if header_end is None:
+        return False, "Non trovata fine dell'header esistente"
     
-    # Specialisti (tutte le altre specialità)
-    elif page_name in ["cardiologia.html", "endocrinologia.html", "dermatologia.html", 
-                       "neurologia.html", "oculistica.html", "ortopedia.html", 
-                       "specialita.html", "chi-siamo.html"] or page_dir == "equipe":
-        active["ACTIVE_SPEC"] = "active"
+    # Il vecchio marcatore di fine resta fuori: il nuovo header ha il suo
+    header_end = headerregion.skip_end_markers(content, header_end)
     
-    return active
+    # Costruisci il nuovo contenuto
+    return True, content[:header_start] + header + "\n\n" + content[header_end:].lstrip()
 
-def load_master_header() -> str:
-    """Carica il master header."""
-    with open(MASTER_HEADER_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-    # Rimuovi commenti di documentazione
-    content = re.sub(r'<!--\s*╔.*?╚[^>]*-->\s*', '', content, flags=re.DOTALL)
-    return content.strip()
+def apply_header_to_page(page_path: str, master_header: str, index=None,
+                         dry_run: bool = False) -> tuple[bool, str]:
+    """Applica il master header a una pagina specifica.
 
-def apply_header_to_page(page_path: str, master_header: str) -> tuple[bool, str]:
-    """Applica il master header a una pagina specifica."""
+    Lavora sui byte: la regione viene dall'indice degli offset (`index`,
+    verificata sui marcatori) o dalla ricerca dei marcatori, e la pagina si
+    riscrive solo se l'header è diverso. Con dry_run non scrive nulla.
+    """
     try:
-        with open(page_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Calcola i path relativi
-        paths = get_paths_for_page(page_path)
-        active_classes = get_active_class(page_path)
+        rel_path = Path(os.path.relpath(page_path, SITE_ROOT)).as_posix()
+        with open(page_path, 'rb') as f:
+            data = f.read()
+        trace.bytes_read(data)
         
-        # Sostituisci i placeholder nel master header
-        header = master_header
-        for key, value in {**paths, **active_classes}.items():
-            header = header.replace(f"{{{{{key}}}}}", value)
+        header = render_header(page_path, master_header).encode('utf-8')
+        hint = index.get(rel_path) if index is not None else None
+        region = headerregion.find_region(data, hint)
+        trace.count('cache_hit' if hint is not None and region == hint else 'cache_miss')
         
-        # Trova dove inizia l'header esistente
-        header_start = None
-        for pattern in HEADER_START_PATTERNS:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                header_start = match.start()
-                break
-        
-        # Se non troviamo l'inizio, cerca </head>
-        if header_start is None:
-            head_end = content.find('</head>')
-            if head_end != -1:
-                # Cerca <body...>
-                body_match = re.search(r'<body[^>]*>', content[head_end:])
-                if body_match:
-                    header_start = head_end + body_match.end()
-        
-        if header_start is None:
-            return False, "Non trovato punto di inserimento header"
-        
-        # Trova dove finisce l'header esistente
-        header_end = None
-        search_content = content[header_start:]
-        
-        for pattern in HEADER_END_PATTERNS:
-            match = re.search(pattern, search_content, re.IGNORECASE)
-            if match:
-                header_end = header_start + match.start()
-                break
-        
-        if header_end is None:
-            # Fallback: cerca la prima sezione/main
-            main_match = re.search(r'<(main|section|div class="hero|div class="page)', search_content, re.IGNORECASE)
-            if main_match:
-                header_end = header_start + main_match.start()
-        
-        if header_end is None:
-            return False, "Non trovata fine dell'header esistente"
+        if region is None:
+            # Pagina senza marcatori: prima propagazione con la ricerca a pattern
+            success, new_content = splice_header(data.decode('utf-8'), page_path, master_header)
+            if not success:
+                return False, new_content
+            new_data = new_content.encode('utf-8')
+            region = headerregion.find_region(new_data)
+        elif data[region[0]:region[1]] == header:
+            new_data = data
+        else:
+            new_data = headerregion.splice(data, region, header)
+            region = (region[0], region[0] + len(header))
         
-        # Costruisci il nuovo contenuto
-        new_content = content[:header_start] + header + "\n\n" + content[header_end:].lstrip()
+        if index is not None and not dry_run:
+            index.record(rel_path, region)
         
         # Salva solo se ci sono modifiche
-        if new_content != original_content:
-            with open(page_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            return True, "Aggiornato"
-        else:
+        if new_data == data:
             return True, "Già aggiornato"
+        writes.write_bytes(page_path, new_data, new_data.decode('utf-8'))
+        return True, "Da aggiornare" if dry_run else "Aggiornato"
             
     except Exception as e:
         return False, str(e)
@@ -234,10 +187,13 @@ def find_all_html_pages() -> list:
 
 def main():
     """Funzione principale."""
+    trace.setup('propagate-header')
     print("=" * 70)
     print("BIO-CLINIC HEADER PROPAGATION SYSTEM v2.0")
     print(f"Esecuzione: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    dry_run = writes.setup('propagate-header')
     print("=" * 70)
+    snapshots.before_write('propagate-header')
     
     # Verifica che esista il master header
     if not MASTER_HEADER_PATH.exists():
@@ -245,11 +201,13 @@ def main():
         return 1
     
     # Carica il master header
-    master_header = load_master_header()
+    with trace.span('carica master header'):
+        master_header = load_master_header()
     print(f"✅ Master header caricato ({len(master_header)} caratteri)")
     
     # Trova tutte le pagine
-    pages = find_all_html_pages()
+    with trace.span('trova pagine'):
+        pages = find_all_html_pages()
     print(f"📄 Trovate {len(pages)} pagine HTML")
     print("-" * 70)
     
@@ -259,29 +217,36 @@ def main():
     errors = 0
     
     # Applica l'header a ogni pagina
-    for page in pages:
-        rel_path = os.path.relpath(page, SITE_ROOT)
-        success, message = apply_header_to_page(page, master_header)
+    index = headerregion.RegionIndex(SITE_ROOT)
+    with trace.span('propaga header', pages=len(pages)):
+        for page in pages:
+            rel_path = os.path.relpath(page, SITE_ROOT)
+            with trace.page(rel_path):
+                success, message = apply_header_to_page(page, master_header, index, dry_run)
         
-        if success:
-            if "Aggiornato" in message and "Già" not in message:
-                print(f"  ✅ {rel_path} - {message}")
-                updated += 1
+            if success:
+                if message != "Già aggiornato":
+                    print(f"  ✅ {rel_path} - {message}")
+                    updated += 1
+                else:
+                    print(f"  ⏭️  {rel_path} - {message}")
+                    skipped += 1
             else:
-                print(f"  ⏭️  {rel_path} - {message}")
-                skipped += 1
-        else:
-            print(f"  ❌ {rel_path} - ERRORE: {message}")
-            errors += 1
+                print(f"  ❌ {rel_path} - ERRORE: {message}")
+                errors += 1
     
     # Riepilogo
     print("-" * 70)
     print(f"📊 RIEPILOGO:")
-    print(f"   ✅ Pagine aggiornate: {updated}")
+    print(f"   ✅ Pagine {'da aggiornare' if dry_run else 'aggiornate'}: {updated}")
     print(f"   ⏭️  Pagine già OK: {skipped}")
     print(f"   ❌ Errori: {errors}")
     print("=" * 70)
     
+    if dry_run:
+        return 0 if errors == 0 else 1
+    index.save()
+    
     # Crea log
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(LOG_FILE, 'a', encoding='utf-8') as f:
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC SNAPSHOT PAGINE                                                  ║
+║                                                                               ║
+║  Store di snapshot deduplicato (backups/objects + backups/snapshots):        ║
+║  ogni blob è salvato una volta per hash del contenuto, quindi uno            ║
+║  snapshot costa quanto i file cambiati. Gli script che modificano le         ║
+║  pagine ne creano uno prima di scrivere (bioclinic/snapshots.py).            ║
+║                                                                               ║
+║  Uso: python3 scripts/snapshot.py list                                       ║
+║       python3 scripts/snapshot.py create [etichetta]                         ║
+║       python3 scripts/snapshot.py diff <id> [<id2>] [--file PATH]            ║
+║       python3 scripts/snapshot.py restore <id> [PATH ...] [--dry-run]        ║
+║       python3 scripts/snapshot.py gc [--keep N]                              ║
+║       python3 scripts/snapshot.py import-legacy                              ║
+║  (diff senza <id2> confronta con i file su disco)                            ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import sys
+from pathlib import Path
+
+from bioclinic import snapshots
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def option(argv, name):
+    """Valore di --name VALORE / --name=VALORE, None se assente"""
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(f"{name}="):
+            return arg.split('=', 1)[1]
+    return None
+
+
+def positional(argv):
+    """Argomenti senza opzioni (e senza i valori delle opzioni)"""
+    values, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in ('--file', '--keep'):
+            skip = True
+        elif not arg.startswith('--'):
+            values.append(arg)
+    return values
+
+
+def cmd_list(store, args, argv):
+    ids = store.ids()
+    if not ids:
+        print("📭 Nessuno snapshot")
+        return 0
+    for snapshot_id in ids:
+        manifest = store.load(snapshot_id)
+        print(f"  📸 {snapshot_id}  {manifest['label']:<28} {len(manifest['files'])} file")
+    print(f"📊 {len(ids)} snapshot")
+    return 0
+
+
+def cmd_create(store, args, argv):
+    label = args[0] if args else 'manuale'
+    manifest, new_blobs, stored = store.create(label)
+    print(f"📸 Snapshot {manifest['id']}: {len(manifest['files'])} file, "
+          f"{new_blobs} blob nuovi ({stored / 1024:.1f} KB)")
+    return 0
+
+
+def cmd_diff(store, args, argv):
+    if not args:
+        print("❌ Uso: snapshot.py diff <id> [<id2>] [--file PATH]")
+        return 1
+    old = store.load(args[0])
+    old_files = snapshots.snapshot_hashes(old)
+    if len(args) > 1:
+        new = store.load(args[1])
+        new_files, new_label = snapshots.snapshot_hashes(new), new['id']
+    else:
+        new_files, new_label = store.current_files(old_files), 'disco'
+
+    path = option(argv, '--file')
+    if path:
+        old_data = store.get_blob(old_files[path]) if path in old_files else None
+        if new_label == 'disco':
+            new_data = (SITE_ROOT / path).read_bytes() if (SITE_ROOT / path).exists() else None
+        else:
+            new_data = store.get_blob(new_files[path]) if path in new_files else None
+        print(snapshots.unified_diff(path, old_data, new_data, old['id'], new_label), end='')
+        return 0
+
+    added, removed, changed = snapshots.compare(old_files, new_files)
+    for rel in added:
+        print(f"  ➕ {rel}")
+    for rel in removed:
+        print(f"  ➖ {rel}")
+    for rel in changed:
+        print(f"  ✏️  {rel}")
+    print(f"📊 {old['id']} → {new_label}: {len(changed)} modificati, "
+          f"{len(added)} aggiunti, {len(removed)} rimossi")
+    return 0
+
+
+def cmd_restore(store, args, argv):
+    if not args:
+        print("❌ Uso: snapshot.py restore <id> [PATH ...] [--dry-run]")
+        return 1
+    dry_run = '--dry-run' in argv
+    paths = args[1:] or None
+    if not dry_run:
+        # Lo stato attuale resta recuperabile
+        manifest, _, _ = store.create('pre-restore')
+        print(f"📸 Stato attuale salvato in {manifest['id']}")
+    changed = store.restore(args[0], paths, dry_run)
+    prefix = "🔍 [DRY-RUN] " if dry_run else "✅ "
+    for rel in changed:
+        print(f"  ↩️  {rel}")
+    print(f"{prefix}{len(changed)} file {'da ripristinare' if dry_run else 'ripristinati'}")
+    return 0
+
+
+def cmd_gc(store, args, argv):
+    keep = option(argv, '--keep')
+    removed, blobs = store.gc(int(keep) if keep else None)
+    print(f"🗑️  {len(removed)} snapshot e {blobs} blob rimossi")
+    return 0
+
+
+def cmd_import_legacy(store, args, argv):
+    imported = store.import_legacy()
+    for folder, manifest, new_blobs in imported:
+        print(f"  📦 {folder.name} → {manifest['id']}: {len(manifest['files'])} file, "
+              f"{new_blobs} blob nuovi")
+    print(f"✅ {len(imported)} backup importati; le cartelle backup_* si possono rimuovere")
+    return 0
+
+
+COMMANDS = {
+    'list': cmd_list,
+    'create': cmd_create,
+    'diff': cmd_diff,
+    'restore': cmd_restore,
+    'gc': cmd_gc,
+    'import-legacy': cmd_import_legacy,
+}
+
+
+def main():
+    argv = sys.argv[1:]
+    args = positional(argv)
+    if not args or args[0] not in COMMANDS:
+        print(__doc__)
+        return 1
+    try:
+        return COMMANDS[args[0]](snapshots.SnapshotStore(SITE_ROOT), args[1:], argv)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,9 @@ Aggiorna sistematicamente tutte le pagine profilo con:
 - Sintomi e pubblicazioni da physicians-extended.json
 - Meta tags ottimizzati
 - Sezioni visuali (tag sintomi, pubblicazioni, social)
+
+Riscrive solo i profili il cui contenuto cambia (bioclinic/writes.py).
+Uso: python3 scripts/update-all-profiles.py [--dry-run] [--diff]
 """
 
 import json
@@ -16,6 +19,8 @@ from pathlib import Path
 from datetime import datetime
 from html import escape
 
+from bioclinic import schemagraph, snapshots, trace, writes
+
 class ProfileUpdater:
     def __init__(self, site_path):
         self.site_path = Path(site_path)
@@ -23,6 +28,7 @@ class ProfileUpdater:
         self.data_path = self.site_path / 'data' / 'entities'
         self.stats = {
             'updated': 0,
+            'unchanged': 0,
             'created': 0,
             'errors': 0,
             'skipped': 0
@@ -41,13 +47,8 @@ class ProfileUpdater:
         self.physicians = self.main_db.get('physicians', [])
         self.specialties = self.main_db.get('specialties', {})
         self.extended = self.extended_db.get('physicians_extended', {})
-        self.specialty_map = self.extended_db.get('specialty_mapping_en', {})
         self.default_symptoms = self.extended_db.get('default_sintomi_by_specialty', {})
         
-    def get_specialty_english(self, specialty_id):
-        """Ottiene nome specialità in inglese"""
-        return self.specialty_map.get(specialty_id, 'Medicine')
-    
     def get_symptoms(self, slug, specialty_id):
         """Ottiene sintomi per il medico"""
         if slug in self.extended:
@@ -67,171 +68,90 @@ class ProfileUpdater:
         return []
     
     def generate_schema(self, physician):
-        """Genera Schema.org completo"""
+        """Genera Schema.org completo (grafo validato, vedi bioclinic/schemagraph.py)"""
         slug = physician.get('slug')
         name = physician.get('name')
         full_name = physician.get('full_name', name)
         title = physician.get('title', 'Dott.')
         specialty_id = physician.get('specialty_id')
-        job_title = physician.get('job_title', '')
-        bio = physician.get('bio', '')
+        surname = name.split()[-1] if name else ''
         
-        specialty_en = self.get_specialty_english(specialty_id)
         symptoms = self.get_symptoms(slug, specialty_id)
         publications = self.get_publications(slug)
         social = self.get_social(slug)
         
-        # Build graph
-        graph = {
-            "@context": "https://schema.org",
-            "@graph": []
-        }
+        graph = schemagraph.Graph()
+        graph.add(schemagraph.clinic())
+        specialty = None
+        if specialty_id:
+            specialty_name = self.specialties.get(specialty_id, {}).get('name', specialty_id.replace('-', ' ').title())
+            specialty = graph.add(schemagraph.specialty(specialty_id, specialty_name))
+        services = [graph.add(schemagraph.procedure(proc, proc.replace('-', ' ').title()))
+                    for proc in physician.get('procedures', [])[:5]]
         
         # 1. Physician Schema
-        physician_schema = {
-            "@type": "Physician",
-            "@id": f"https://bio-clinic.it/equipe/{slug}/#physician",
-            "name": full_name,
-            "givenName": name.split()[0] if name else "",
-            "familyName": name.split()[-1] if name else "",
-            "honorificPrefix": title,
-            "jobTitle": job_title,
-            "description": bio,
-            "medicalSpecialty": f"https://schema.org/{specialty_en}",
-            "isAcceptingNewPatients": True,
-            "worksFor": {
-                "@type": "MedicalClinic",
-                "name": "Bio-Clinic Sassari",
-                "url": "https://bio-clinic.it",
-                "address": {
-                    "@type": "PostalAddress",
-                    "streetAddress": "Via Renzo Mossa, 23",
-                    "addressLocality": "Sassari",
-                    "postalCode": "07100",
-                    "addressRegion": "SS",
-                    "addressCountry": "IT"
-                },
-                "telephone": "+39 079 956 1332"
-            },
-            "availableService": [
-                {"@type": "MedicalProcedure", "name": proc.replace('-', ' ').title()}
-                for proc in physician.get('procedures', [])[:5]
-            ]
-        }
-        
-        # Add knowsAbout
-        if symptoms:
-            physician_schema["knowsAbout"] = symptoms
-        
-        # Add citations (publications)
-        if publications:
-            physician_schema["citation"] = [
-                {
-                    "@type": "ScholarlyArticle",
-                    "name": pub.get('titolo', ''),
-                    "url": pub.get('url', ''),
-                    "datePublished": str(pub.get('anno', '')),
-                    "publisher": pub.get('journal', '')
-                }
-                for pub in publications
-            ]
-        
-        # Add social links
-        if social:
-            physician_schema["sameAs"] = [s.get('url') for s in social if s.get('url')]
-        
-        graph["@graph"].append(physician_schema)
+        graph.add(schemagraph.physician(
+            slug, full_name,
+            given_name=name.split()[0] if name else None,
+            family_name=surname,
+            honorific_prefix=title,
+            job_title=physician.get('job_title'),
+            description=physician.get('bio'),
+            specialty=specialty,
+            services=services,
+            knows_about=symptoms,
+            same_as=[s.get('url') for s in social if s.get('url')],
+            citations=[schemagraph.article(pub.get('titolo'), pub.get('url'), pub.get('anno'), pub.get('journal'))
+                       for pub in publications],
+            accepting_new_patients=True,
+        ))
         
         # 2. FAQPage Schema
-        faq_items = []
+        faqs = []
         
         # Q1: Patologie
         symptoms_list = ', '.join(symptoms[:8]) if symptoms else 'varie patologie della specializzazione'
-        faq_items.append({
-            "@type": "Question",
-            "name": f"Quali patologie tratta il {title} {name.split()[-1] if name else ''}?",
-            "acceptedAnswer": {
-                "@type": "Answer",
-                "text": f"Il {title} {name.split()[-1] if name else ''} è specializzato nel trattamento di: {symptoms_list}. Per prenotare una visita presso Bio-Clinic Sassari chiamare il 079 956 1332."
-            }
-        })
+        faqs.append((
+            f"Quali patologie tratta il {title} {surname}?",
+            f"Il {title} {surname} è specializzato nel trattamento di: {symptoms_list}. Per prenotare una visita presso Bio-Clinic Sassari chiamare il 079 956 1332."
+        ))
         
         # Q2: Pubblicazioni
         if publications:
             pub_titles = '; '.join([f"\"{p.get('titolo', '')}\"" for p in publications[:3]])
-            faq_items.append({
-                "@type": "Question",
-                "name": f"Il {title} {name.split()[-1] if name else ''} ha pubblicazioni scientifiche?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": f"Sì, il {title} {name.split()[-1] if name else ''} ha {len(publications)} pubblicazioni indicizzate su PubMed, tra cui: {pub_titles}."
-                }
-            })
+            faqs.append((
+                f"Il {title} {surname} ha pubblicazioni scientifiche?",
+                f"Sì, il {title} {surname} ha {len(publications)} pubblicazioni indicizzate su PubMed, tra cui: {pub_titles}."
+            ))
         else:
-            faq_items.append({
-                "@type": "Question",
-                "name": f"Dove posso trovare informazioni sul {title} {name.split()[-1] if name else ''}?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": f"Il {title} {name.split()[-1] if name else ''} esercita presso Bio-Clinic Sassari. Per informazioni chiamare il 079 956 1332 o visitare il sito bio-clinic.it."
-                }
-            })
+            faqs.append((
+                f"Dove posso trovare informazioni sul {title} {surname}?",
+                f"Il {title} {surname} esercita presso Bio-Clinic Sassari. Per informazioni chiamare il 079 956 1332 o visitare il sito bio-clinic.it."
+            ))
         
         # Q3: Sede
-        faq_items.append({
-            "@type": "Question",
-            "name": f"Dove riceve il {title} {name.split()[-1] if name else ''}?",
-            "acceptedAnswer": {
-                "@type": "Answer",
-                "text": f"Il {title} {name.split()[-1] if name else ''} riceve presso Bio-Clinic Sassari in Via Renzo Mossa 23, 07100 Sassari. Orari: Lun-Ven 07:00-21:00, Sab 08:00-14:00. Tel: 079 956 1332."
-            }
-        })
+        faqs.append((
+            f"Dove riceve il {title} {surname}?",
+            f"Il {title} {surname} riceve presso Bio-Clinic Sassari in Via Renzo Mossa 23, 07100 Sassari. Orari: Lun-Ven 07:00-21:00, Sab 08:00-14:00. Tel: 079 956 1332."
+        ))
         
         # Q4: Prenotazione
-        miodottore_url = physician.get('miodottore_url')
-        if miodottore_url:
-            faq_items.append({
-                "@type": "Question",
-                "name": f"Come posso prenotare una visita con il {title} {name.split()[-1] if name else ''}?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": f"È possibile prenotare una visita con il {title} {name.split()[-1] if name else ''} chiamando Bio-Clinic al 079 956 1332 oppure online tramite MioDottore.it."
-                }
-            })
+        if physician.get('miodottore_url'):
+            faqs.append((
+                f"Come posso prenotare una visita con il {title} {surname}?",
+                f"È possibile prenotare una visita con il {title} {surname} chiamando Bio-Clinic al 079 956 1332 oppure online tramite MioDottore.it."
+            ))
         
-        faq_schema = {
-            "@type": "FAQPage",
-            "mainEntity": faq_items
-        }
-        graph["@graph"].append(faq_schema)
+        graph.add(schemagraph.faq_page(faqs))
         
         # 3. BreadcrumbList Schema
-        breadcrumb_schema = {
-            "@type": "BreadcrumbList",
-            "itemListElement": [
-                {
-                    "@type": "ListItem",
-                    "position": 1,
-                    "name": "Home",
-                    "item": "https://bio-clinic.it/"
-                },
-                {
-                    "@type": "ListItem",
-                    "position": 2,
-                    "name": "Équipe",
-                    "item": "https://bio-clinic.it/equipe/"
-                },
-                {
-                    "@type": "ListItem",
-                    "position": 3,
-                    "name": full_name,
-                    "item": f"https://bio-clinic.it/equipe/{slug}/"
-                }
-            ]
-        }
-        graph["@graph"].append(breadcrumb_schema)
+        graph.add(schemagraph.breadcrumb([
+            ("Home", f"{schemagraph.SITE_URL}/"),
+            ("Équipe", f"{schemagraph.SITE_URL}/equipe/"),
+            (full_name, f"{schemagraph.SITE_URL}/equipe/{slug}/"),
+        ]))
         
-        return json.dumps(graph, indent=2, ensure_ascii=False)
+        return graph.dumps()
     
     def update_page_schema(self, html_content, physician):
         """Aggiorna lo schema nella pagina"""
@@ -244,8 +164,9 @@ class ProfileUpdater:
         html_parts = html_content.split('</head>')
         if len(html_parts) >= 2:
             head_content = html_parts[0]
-            # Rimuovi schema esistenti
-            head_content = re.sub(schema_pattern, '', head_content)
+            # Rimuovi schema esistenti (con gli spazi che li precedono, così
+            # una nuova esecuzione non accumula righe vuote)
+            head_content = re.sub(r'\s*' + schema_pattern, '', head_content)
             # Aggiungi nuovo schema prima di </head>
             new_schema_tag = f'''<script type="application/ld+json">
 {new_schema}
@@ -325,6 +246,11 @@ class ProfileUpdater:
         
         return html_content
     
+    def update_profile_html(self, html_content, physician):
+        """Applica schema e sezioni visuali al contenuto di un profilo (in memoria)"""
+        html_content = self.update_page_schema(html_content, physician)
+        return self.add_visual_sections(html_content, physician)
+    
     def process_all_profiles(self):
         """Processa tutti i profili"""
         print("=" * 60)
@@ -332,50 +258,54 @@ class ProfileUpdater:
         print("=" * 60)
         print()
         
-        self.load_data()
+        with trace.span('load data'):
+            self.load_data()
         print(f"Loaded {len(self.physicians)} physicians")
         print(f"Extended data for {len(self.extended)} physicians")
         print()
         
-        for physician in self.physicians:
-            slug = physician.get('slug')
-            if not slug:
-                continue
-            
-            html_file = self.equipe_path / f"{slug}.html"
-            
-            try:
-                if not html_file.exists():
-                    print(f"  ⚠ {slug}: File not found")
-                    self.stats['skipped'] += 1
+        with trace.span('update profiles', profiles=len(self.physicians)):
+            for physician in self.physicians:
+                slug = physician.get('slug')
+                if not slug:
                     continue
                 
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Update schema
-                html_content = self.update_page_schema(html_content, physician)
-                
-                # Add visual sections
-                html_content = self.add_visual_sections(html_content, physician)
-                
-                # Save
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                
-                has_pubs = "📚" if slug in self.extended and self.extended[slug].get('pubblicazioni') else ""
-                print(f"  ✓ {physician.get('name', slug):<35} {has_pubs}")
-                self.stats['updated'] += 1
+                html_file = self.equipe_path / f"{slug}.html"
                 
-            except Exception as e:
-                print(f"  ✗ {slug}: {str(e)}")
-                self.stats['errors'] += 1
+                try:
+                    if not html_file.exists():
+                        print(f"  ⚠ {slug}: File not found")
+                        self.stats['skipped'] += 1
+                        continue
+                    
+                    with trace.page(f"equipe/{slug}.html"):
+                        with open(html_file, 'r', encoding='utf-8') as f:
+                            html_content = f.read()
+                        trace.bytes_read(html_content)
+                        
+                        # Update schema and add visual sections
+                        html_content = self.update_profile_html(html_content, physician)
+                        
+                        # Save (solo se il contenuto è cambiato)
+                        changed = writes.write_text(html_file, html_content)
+                    
+                    if not changed:
+                        self.stats['unchanged'] += 1
+                        continue
+                    has_pubs = "📚" if slug in self.extended and self.extended[slug].get('pubblicazioni') else ""
+                    print(f"  ✓ {physician.get('name', slug):<35} {has_pubs}")
+                    self.stats['updated'] += 1
+                    
+                except Exception as e:
+                    print(f"  ✗ {slug}: {str(e)}")
+                    self.stats['errors'] += 1
         
         print()
         print("=" * 60)
         print("SUMMARY")
         print("=" * 60)
         print(f"Updated:  {self.stats['updated']}")
+        print(f"Unchanged: {self.stats['unchanged']}")
         print(f"Created:  {self.stats['created']}")
         print(f"Skipped:  {self.stats['skipped']}")
         print(f"Errors:   {self.stats['errors']}")
@@ -385,6 +315,9 @@ class ProfileUpdater:
 
 def main():
     site_path = Path(__file__).parent.parent
+    trace.setup('update-all-profiles', site_path)
+    writes.setup('update-all-profiles')
+    snapshots.before_write('update-all-profiles')
     updater = ProfileUpdater(site_path)
     updater.process_all_profiles()
 
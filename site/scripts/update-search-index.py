@@ -7,22 +7,19 @@ import json
 from pathlib import Path
 from datetime import datetime
 
-def main():
-    script_dir = Path(__file__).parent
-    site_dir = script_dir.parent
-    
-    # Load physicians
-    physicians_file = site_dir / 'data' / 'entities' / 'physicians-complete.json'
-    with open(physicians_file, 'r', encoding='utf-8') as f:
-        physicians_data = json.load(f)
-    
-    # Load current index
-    index_file = site_dir / 'data' / 'search' / 'index.json'
-    with open(index_file, 'r', encoding='utf-8') as f:
-        index_data = json.load(f)
-    
+from bioclinic import writes
+from bioclinic.searchindex import COMPILED_RELPATH, compile_search_index, dump_compiled
+
+def _without_timestamp(index_data):
+    return json.dumps({k: v for k, v in index_data.items() if k != 'generated'}, sort_keys=True)
+
+def build_search_index(physicians_data, index_data):
+    """Aggiorna index_data con i medici; ritorna (index_data, version_data) senza scrivere su disco"""
     specialties_map = physicians_data['specialties']
     physicians = physicians_data['physicians']
+    # Contenuto precedente senza timestamp: se non cambia, 'generated' resta
+    # quello vecchio e index.json/version.json non vengono riscritti
+    previous = _without_timestamp(index_data)
     
     # Update index with all physicians
     terms = index_data.get('terms', {})
@@ -105,27 +102,52 @@ def main():
     index_data['terms'] = terms
     index_data['stats']['total_terms'] = len(terms)
     index_data['stats']['physicians'] = len(physicians)
-    index_data['generated'] = datetime.now().isoformat()
     index_data['version'] = '2.1.0'
+    if 'generated' not in index_data or _without_timestamp(index_data) != previous:
+        index_data['generated'] = datetime.now().isoformat()
     
-    # Save updated index
-    with open(index_file, 'w', encoding='utf-8') as f:
-        json.dump(index_data, f, ensure_ascii=False, indent=2)
-    
-    # Update version file
-    version_file = site_dir / 'data' / 'cache' / 'version.json'
     version_data = {
         'version': '2.1.0',
-        'updated': datetime.now().isoformat(),
+        'updated': index_data['generated'],
         'physicians': len(physicians),
         'specialties': len([s for s in specialties_map if any(p['specialty_id'] == s for p in physicians)]),
         'terms': len(terms)
     }
-    with open(version_file, 'w', encoding='utf-8') as f:
-        json.dump(version_data, f, ensure_ascii=False, indent=2)
+    return index_data, version_data
+
+def main():
+    writes.setup('update-search-index')
+    script_dir = Path(__file__).parent
+    site_dir = script_dir.parent
+    
+    # Load physicians
+    physicians_file = site_dir / 'data' / 'entities' / 'physicians-complete.json'
+    with open(physicians_file, 'r', encoding='utf-8') as f:
+        physicians_data = json.load(f)
+    
+    # Load current index
+    index_file = site_dir / 'data' / 'search' / 'index.json'
+    with open(index_file, 'r', encoding='utf-8') as f:
+        index_data = json.load(f)
+    
+    index_data, version_data = build_search_index(physicians_data, index_data)
+    
+    # Save updated index
+    writes.write_text(index_file, json.dumps(index_data, ensure_ascii=False, indent=2))
+    
+    # Compile the inverted index loaded by js/search.js
+    with open(site_dir / 'data' / 'search' / 'synonyms.json', 'r', encoding='utf-8') as f:
+        synonyms_data = json.load(f)
+    compiled = compile_search_index(index_data, synonyms_data)
+    writes.write_text(site_dir / COMPILED_RELPATH, dump_compiled(compiled))
+    
+    # Update version file
+    version_file = site_dir / 'data' / 'cache' / 'version.json'
+    writes.write_text(version_file, json.dumps(version_data, ensure_ascii=False, indent=2))
     
-    print(f"Updated search index with {len(physicians)} physicians")
-    print(f"Total search terms: {len(terms)}")
+    print(f"Updated search index with {version_data['physicians']} physicians")
+    print(f"Total search terms: {version_data['terms']}")
+    print(f"Compiled index: {len(compiled['words'])} query keys, {len(compiled['entities'])} entities")
     print(f"Index version: 2.1.0")
 
 if __name__ == '__main__':
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  BIO-CLINIC DATA VALIDATOR                                                   ║
+║                                                                               ║
+║  Esegue le regole di data/v2/config/schema.yaml (required_fields,            ║
+║  validation_rules, build.validation.checks) su physicians.yaml,              ║
+║  procedures.yaml e specialties.yaml in una sola passata e stampa ogni        ║
+║  problema con file e riga YAML (bioclinic/datarules.py).                     ║
+║  build.py esegue gli stessi controlli prima di generare le pagine.           ║
+║                                                                               ║
+║  Uso: python3 scripts/validate-data.py                                       ║
+║  Exit code 1 se ci sono errori bloccanti (fail_on_error/fail_on_warning).    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import sys
+from pathlib import Path
+
+from bioclinic import datarules
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def print_report(report):
+    """Stampa i problemi e il riepilogo di un datarules.Report"""
+    for issue in report.errors:
+        print(f"  ❌ {issue}")
+    for issue in report.warnings:
+        print(f"  ⚠️  {issue}")
+    status = "✅" if report.ok else "❌"
+    print(f"{status} Dati: {report.records} record, {len(report.errors)} errori, "
+          f"{len(report.warnings)} avvisi ({report.elapsed * 1000:.0f} ms)")
+
+
+def main():
+    try:
+        report = datarules.validate_site(SITE_ROOT)
+    except datarules.SchemaRuleError as e:
+        print(f"❌ {e}")
+        return 1
+    print_report(report)
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
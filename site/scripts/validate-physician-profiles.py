@@ -11,6 +11,8 @@ Controlla:
 4. Presenza sezioni chiave (bio, prestazioni, contatti)
 5. Link funzionanti (interni)
 6. Pubblicazioni e sintomi per medici con dati estesi
+
+Uso: python3 scripts/validate-physician-profiles.py [--jobs N]
 """
 
 import json
@@ -20,12 +22,18 @@ from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
+from bioclinic.parallel import parse_jobs, run_sharded
+
 class PhysicianProfileValidator:
     def __init__(self, site_path):
         self.site_path = Path(site_path)
         self.equipe_path = self.site_path / 'equipe'
         self.data_path = self.site_path / 'data' / 'entities'
-        self.results = {
+        self.results = self.empty_results()
+        
+    def empty_results(self):
+        """Struttura risultati vuota (usata anche per i risultati parziali dei worker)"""
+        return {
             'timestamp': datetime.now().isoformat(),
             'total_physicians': 0,
             'pages_found': 0,
@@ -43,6 +51,15 @@ class PhysicianProfileValidator:
             'physicians_without_data': [],
             'detailed_results': {}
         }
+    
+    def merge_results(self, partial):
+        """Fonde i risultati parziali di un worker, nell'ordine in cui arrivano"""
+        self.results['pages_found'] += partial['pages_found']
+        for key, count in partial['schema_stats'].items():
+            self.results['schema_stats'][key] += count
+        for key in ('pages_missing', 'validation_passed', 'validation_failed', 'warnings',
+                    'physicians_with_publications', 'physicians_without_data'):
+            self.results[key].extend(partial[key])
         
     def load_physicians_db(self):
         """Carica database medici principale"""
@@ -203,8 +220,8 @@ class PhysicianProfileValidator:
         
         return result
     
-    def run_validation(self):
-        """Esegue validazione completa"""
+    def run_validation(self, jobs=1):
+        """Esegue validazione completa (jobs > 1: pool di processi)"""
         print("=" * 60)
         print("BIO-CLINIC PHYSICIAN PROFILES VALIDATOR v2.0")
         print("=" * 60)
@@ -220,12 +237,19 @@ class PhysicianProfileValidator:
         print()
         
         # Validate each profile
-        for physician in physicians:
-            slug = physician.get('slug')
-            if not slug:
-                continue
-            
-            result = self.validate_profile(slug, physician, extended_data)
+        physicians = [p for p in physicians if p.get('slug')]
+        if jobs <= 1:
+            results = [self.validate_profile(p['slug'], p, extended_data) for p in physicians]
+        else:
+            shards = run_sharded(_validate_profile_worker, physicians, jobs,
+                                 initializer=_init_worker, initargs=(self.site_path,))
+            results = []
+            for result, partial in shards:
+                self.merge_results(partial)
+                results.append(result)
+        
+        for physician, result in zip(physicians, results):
+            slug = physician['slug']
             self.results['detailed_results'][slug] = result
             
             # Progress indicator
@@ -345,10 +369,27 @@ class PhysicianProfileValidator:
         
         return r
 
+# Worker per la modalità parallela (--jobs N)
+_worker_validator = None
+_worker_extended_data = None
+
+def _init_worker(site_path):
+    """Carica il database esteso una sola volta per processo"""
+    global _worker_validator, _worker_extended_data
+    _worker_validator = PhysicianProfileValidator(site_path)
+    _worker_extended_data = _worker_validator.load_extended_db()
+
+def _validate_profile_worker(physician):
+    """Valida un profilo e ritorna (risultato, risultati parziali del worker)"""
+    validator = _worker_validator
+    validator.results = validator.empty_results()
+    result = validator.validate_profile(physician['slug'], physician, _worker_extended_data)
+    return result, validator.results
+
 def main():
     site_path = Path(__file__).parent.parent
     validator = PhysicianProfileValidator(site_path)
-    results = validator.run_validation()
+    results = validator.run_validation(jobs=parse_jobs())
     
     # Exit code based on results
     if len(results['validation_failed']) > 0 or len(results['pages_missing']) > 0:
@@ -7,6 +7,8 @@
 ║                                                                               ║
 ║  Esegui con: python3 scripts/validate-site-v2.py                             ║
 ║  Esegui con fix automatico: python3 scripts/validate-site-v2.py --fix        ║
+║  Esegui in parallelo: python3 scripts/validate-site-v2.py --jobs 8           ║
+║  Profilo dei tempi: python3 scripts/validate-site-v2.py --trace              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
@@ -17,6 +19,10 @@ import sys
 from pathlib import Path
 from collections import defaultdict
 
+from bioclinic import schemagraph, trace
+from bioclinic.fuzzy import near_duplicates
+from bioclinic.parallel import parse_jobs, run_sharded
+
 # Colori per output
 class Colors:
     OK = '\033[92m'
@@ -171,8 +177,9 @@ class SiteValidator:
         
         if reference_menu:
             if set(menu_items_clean) != set(reference_menu):
-                diff = set(menu_items_clean) ^ set(reference_menu)
-                self.add_error('E003', page_name, f"Menu inconsistente. Differenze: {diff}")
+                # Ordinato: il messaggio non dipende dall'hash seed del processo
+                diff = sorted(set(menu_items_clean) ^ set(reference_menu))
+                self.add_error('E003', page_name, "Menu inconsistente. Differenze: {" + ", ".join(map(repr, diff)) + "}")
         
         return menu_items_clean
     
@@ -203,20 +210,18 @@ class SiteValidator:
     # VALIDAZIONE 5: JSON-LD
     # ═══════════════════════════════════════════════════════════════
     def validate_json_ld(self, file_path, content):
-        """Verifica sintassi JSON-LD"""
+        """Verifica sintassi e struttura JSON-LD (regole JSON_LD, vedi bioclinic/schemagraph.py)"""
         page_name = str(file_path.relative_to(self.site_dir))
+        rules = self.schema.get('rules', {}).get('JSON_LD', {})
         
-        json_ld_matches = re.findall(
-            r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
-            content, 
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        for i, json_ld in enumerate(json_ld_matches):
+        for i, (_, json_ld) in enumerate(schemagraph.find_blocks(content)):
             try:
-                json.loads(json_ld)
+                data = json.loads(json_ld)
             except json.JSONDecodeError as e:
                 self.add_error('E007', page_name, f"JSON-LD #{i+1} sintatticamente errato: {str(e)[:50]}")
+                continue
+            for problem in schemagraph.check_block(data, rules):
+                self.add_error('E007', page_name, f"JSON-LD #{i+1}: {problem}")
     
     # ═══════════════════════════════════════════════════════════════
     # VALIDAZIONE 6: META TAGS
@@ -267,6 +272,17 @@ class SiteValidator:
     # ═══════════════════════════════════════════════════════════════
     # ESEGUI TUTTE LE VALIDAZIONI
     # ═══════════════════════════════════════════════════════════════
+    def validate_listino(self):
+        """Nomi quasi uguali nel listino di laboratorio (probabili doppioni)"""
+        listino_path = self.site_dir / 'data' / 'listino-processed.json'
+        if not listino_path.exists():
+            return
+        with open(listino_path, 'r', encoding='utf-8') as f:
+            names = [e['nome'] for e in json.load(f)]
+        for first, second in near_duplicates(names):
+            self.add_warning('data/listino-processed.json',
+                             f"Possibile doppione nel listino: '{first}' / '{second}'")
+
     def validate_page(self, file_path, reference_menu=None):
         """Esegue tutte le validazioni su una pagina"""
         try:
@@ -275,6 +291,7 @@ class SiteValidator:
         except Exception as e:
             self.add_error('E000', str(file_path), f"Impossibile leggere file: {e}")
             return None
+        trace.bytes_read(content)
         
         self.pages_validated += 1
         
@@ -290,20 +307,21 @@ class SiteValidator:
         
         return menu
     
-    def run_validation(self):
-        """Esegue validazione completa del sito"""
+    def run_validation(self, jobs=1):
+        """Esegue validazione completa del sito (jobs > 1: pool di processi)"""
         print(colorize("╔══════════════════════════════════════════════════════════════════╗", Colors.BOLD))
         print(colorize("║  BIO-CLINIC SITE VALIDATOR v2.0                                  ║", Colors.BOLD))
         print(colorize("╚══════════════════════════════════════════════════════════════════╝", Colors.BOLD))
         print()
         
         # Trova tutte le pagine HTML (esclusi template e componenti)
-        html_files = list(self.site_dir.glob('**/*.html'))
-        excluded_dirs = ['node_modules', 'templates', 'components']
-        excluded_files = ['profilo.html', 'master-header.html']
-        html_files = [f for f in html_files 
-                      if not any(excl in str(f) for excl in excluded_dirs)
-                      and f.name not in excluded_files]
+        with trace.span('trova pagine'):
+            html_files = list(self.site_dir.glob('**/*.html'))
+            excluded_dirs = ['node_modules', 'templates', 'components']
+            excluded_files = ['profilo.html', 'master-header.html']
+            html_files = [f for f in html_files 
+                          if not any(excl in str(f) for excl in excluded_dirs)
+                          and f.name not in excluded_files]
         
         print(f"📁 Trovate {len(html_files)} pagine HTML da validare")
         print(f"👨‍⚕️ Database medici: {len(self.physicians)} medici")
@@ -314,16 +332,33 @@ class SiteValidator:
         index_path = self.site_dir / 'index.html'
         reference_menu = None
         if index_path.exists():
-            reference_menu = self.validate_page(index_path)
+            with trace.span('menu di riferimento'):
+                reference_menu = self.validate_page(index_path)
             print(f"📋 Menu di riferimento estratto: {reference_menu}")
             print()
         
         # Valida tutte le pagine
-        print("🔍 Validazione in corso...")
-        for html_file in html_files:
-            if html_file != index_path:
-                self.validate_page(html_file, reference_menu)
-        
+        pages = [f for f in html_files if f != index_path]
+        with trace.span('valida pagine', pages=len(pages), jobs=jobs):
+            if jobs <= 1:
+                print("🔍 Validazione in corso...")
+                for html_file in pages:
+                    with trace.page(str(html_file.relative_to(self.site_dir))):
+                        self.validate_page(html_file, reference_menu)
+            else:
+                print(f"🔍 Validazione in corso su {jobs} processi...")
+                shards = run_sharded(_validate_page_worker, pages, jobs,
+                                     initializer=_init_worker,
+                                     initargs=(self.site_dir, reference_menu))
+                # Merge nell'ordine delle pagine: output identico alla modalità seriale
+                for errors, warnings, validated in shards:
+                    self.errors.extend(errors)
+                    self.warnings.extend(warnings)
+                    self.pages_validated += validated
+        
+        with trace.span('valida listino'):
+            self.validate_listino()
+
         # Report finale
         print()
         print(colorize("═══════════════════════════════════════════════════════════════════", Colors.BOLD))
@@ -385,13 +420,35 @@ class SiteValidator:
         return len(self.errors) == 0
 
 
+# ═══════════════════════════════════════════════════════════════
+# WORKER PER MODALITÀ PARALLELA (--jobs N)
+# ═══════════════════════════════════════════════════════════════
+_worker_validator = None
+_worker_reference_menu = None
+
+def _init_worker(site_dir, reference_menu):
+    """Carica schema e database medici una sola volta per processo"""
+    global _worker_validator, _worker_reference_menu
+    _worker_validator = SiteValidator(site_dir)
+    _worker_reference_menu = reference_menu
+
+def _validate_page_worker(file_path):
+    """Valida una pagina e ritorna (errori, warning, pagine validate)"""
+    validator = _worker_validator
+    validator.errors, validator.warnings, validator.pages_validated = [], [], 0
+    validator.validate_page(file_path, _worker_reference_menu)
+    return validator.errors, validator.warnings, validator.pages_validated
+
+
 def main():
     # Determina directory del sito
     script_dir = Path(__file__).parent
     site_dir = script_dir.parent
     
-    validator = SiteValidator(site_dir)
-    success = validator.run_validation()
+    trace.setup('validate-site-v2', site_dir)
+    with trace.span('carica schema e medici'):
+        validator = SiteValidator(site_dir)
+    success = validator.run_validation(jobs=parse_jobs())
     
     sys.exit(0 if success else 1)
 
@@ -11,6 +11,7 @@
 ║  5. Struttura consistente                                                    ║
 ║                                                                               ║
 ║  Uso: python scripts/validate-site.py                                        ║
+║  Parallelo: python scripts/validate-site.py --jobs 8                         ║
 ║  Exit code: 0 = OK, 1 = Errori trovati                                       ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
@@ -23,6 +24,8 @@ from pathlib import Path
 from collections import defaultdict
 from html.parser import HTMLParser
 
+from bioclinic.parallel import parse_jobs, run_sharded
+
 SITE_ROOT = Path(__file__).parent.parent
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -215,6 +218,33 @@ def validate_header_consistency(pages):
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════════
 
+SPECIALTY_PAGE_KEYWORDS = ['cardiologia', 'ginecologia', 'endocrinologia', 'dermatologia', 'slim-care', 'chi-siamo']
+
+
+def is_main_page(page):
+    return 'equipe/' not in page or page.endswith('index.html')
+
+
+def is_specialty_page(page):
+    return any(x in page for x in SPECIALTY_PAGE_KEYWORDS)
+
+
+def validate_page(page):
+    """Esegue i check per-pagina e ritorna {check: (ok, errors)}.
+
+    Funzione pura: può girare in un worker del pool (--jobs N).
+    """
+    results = {
+        'html_tags': validate_html_tags(page),
+        'paths': validate_paths(page),
+    }
+    if is_main_page(page):
+        results['menu'] = validate_menu_items(page)
+    if is_specialty_page(page):
+        results['physicians'] = validate_physician_links(page)
+    return results
+
+
 def get_all_pages():
     """Trova tutte le pagine da validare."""
     pages = []
@@ -229,7 +259,7 @@ def get_all_pages():
     return sorted(pages)
 
 
-def main():
+def main(jobs=1):
     print("=" * 75)
     print("BIO-CLINIC SITE VALIDATOR v1.0")
     print("=" * 75)
@@ -242,11 +272,15 @@ def main():
     total_errors = 0
     results = defaultdict(list)
     
+    # I check per-pagina girano una volta sola (eventualmente in parallelo),
+    # poi i risultati vengono stampati nell'ordine delle pagine
+    page_results = dict(zip(all_pages, run_sharded(validate_page, all_pages, jobs)))
+    
     # 1. Validazione TAG HTML
     print("\n🔍 CHECK 1: HTML Tag Balance")
     for page in all_pages:
         rel_path = os.path.relpath(page, SITE_ROOT)
-        ok, errors = validate_html_tags(page)
+        ok, errors = page_results[page]['html_tags']
         if not ok:
             print(f"   ❌ {rel_path}")
             for e in errors:
@@ -259,10 +293,10 @@ def main():
     
     # 2. Validazione MENU
     print("\n🔍 CHECK 2: Menu Items Consistency")
-    main_pages = [p for p in all_pages if 'equipe/' not in p or p.endswith('index.html')]
+    main_pages = [p for p in all_pages if is_main_page(p)]
     for page in main_pages:
         rel_path = os.path.relpath(page, SITE_ROOT)
-        ok, errors = validate_menu_items(page)
+        ok, errors = page_results[page]['menu']
         if not ok:
             print(f"   ❌ {rel_path}")
             for e in errors:
@@ -286,10 +320,10 @@ def main():
     
     # 4. Validazione LINK MEDICI
     print("\n🔍 CHECK 4: Physician Links")
-    specialty_pages = [p for p in all_pages if any(x in p for x in ['cardiologia', 'ginecologia', 'endocrinologia', 'dermatologia', 'slim-care', 'chi-siamo'])]
+    specialty_pages = [p for p in all_pages if is_specialty_page(p)]
     for page in specialty_pages:
         rel_path = os.path.relpath(page, SITE_ROOT)
-        ok, errors = validate_physician_links(page)
+        ok, errors = page_results[page]['physicians']
         if not ok:
             print(f"   ❌ {rel_path}")
             for e in errors:
@@ -304,7 +338,7 @@ def main():
     print("\n🔍 CHECK 5: Path Validation")
     for page in all_pages:
         rel_path = os.path.relpath(page, SITE_ROOT)
-        ok, errors = validate_paths(page)
+        ok, errors = page_results[page]['paths']
         if not ok:
             print(f"   ❌ {rel_path}")
             for e in errors:
@@ -341,4 +375,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    exit(main(jobs=parse_jobs()))
@@ -0,0 +1,52 @@
+"""
+Test della pipeline di build (scripts/build.py) su un sito sintetico.
+
+Ogni test lavora su una copia del sito (bioclinic/synthetic.py) in una
+cartella temporanea: il sito reale non viene mai modificato.
+
+Uso: python3 -m pytest site/tests
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SITE_ROOT / 'scripts'))
+
+from bioclinic.synthetic import build_synthetic_site  # noqa: E402
+
+# Dipendenze della build (come in .github/workflows)
+pytest.importorskip('yaml')
+pytest.importorskip('jinja2')
+
+
+@pytest.fixture(scope='module')
+def site(tmp_path_factory):
+    target = tmp_path_factory.mktemp('build') / 'site'
+    build_synthetic_site(SITE_ROOT, target, 1)
+    return target
+
+
+def run_build(site, *args):
+    return subprocess.run(
+        [sys.executable, 'scripts/build.py', '--no-snapshot', *args],
+        cwd=site, capture_output=True, text=True, timeout=600,
+    )
+
+
+def critical_errors(output):
+    return [line for line in output.splitlines() if 'Errori critici' in line]
+
+
+def test_validate_with_jobs(site):
+    """--validate --jobs 2: i worker del validatore caricato da build.py sono serializzabili"""
+    serial = run_build(site, '--validate', '--jobs', '1')
+    parallel = run_build(site, '--validate', '--jobs', '2')
+    assert 'Traceback' not in parallel.stderr + parallel.stdout, parallel.stderr
+    assert 'su 2 processi' in parallel.stdout
+    assert critical_errors(parallel.stdout)
+    assert critical_errors(parallel.stdout) == critical_errors(serial.stdout)
+    assert parallel.returncode == serial.returncode
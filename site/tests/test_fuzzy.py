@@ -0,0 +1,30 @@
+"""
+Test di bioclinic/fuzzy.py: doppioni nel listino (near_duplicates).
+
+Uso: python3 -m pytest site/tests
+"""
+
+import sys
+from pathlib import Path
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SITE_ROOT / 'scripts'))
+
+from bioclinic.fuzzy import near_duplicates  # noqa: E402
+
+
+def test_typo_is_duplicate():
+    names = ['ANEXINA V IGG', 'Annexina V IgG', 'Emocromo', 'EMOCROMO']
+    assert near_duplicates(names) == [('ANEXINA V IGG', 'Annexina V IgG'),
+                                      ('Emocromo', 'EMOCROMO')]
+
+
+def test_different_tests_are_not_duplicates():
+    """Esami diversi del listino reale segnalati in passato come doppioni"""
+    names = [
+        'ETANOLO URINE F.T.', 'METANOLO URINE F.T.',
+        'IODIO URINE 24H', 'SODIO URINE 24H',
+        'FATTORE VIII', 'FATTORE XIII',
+        'FT3 LIBERO', 'FT4 LIBERO',
+    ]
+    assert near_duplicates(names) == []